@@ -1,10 +1,47 @@
 """Entry point for the EdgeLake Operator."""
 
+import argparse
+import json
 import subprocess
 import sys
+import urllib.parse
+import urllib.request
+
+from .constants import DEFAULT_FLEET_PAGE_SIZE, FLEET_API_PORT
+
+_FLEET_COLUMNS = [
+    "NAMESPACE", "NAME", "TYPE", "CLUSTER", "PHASE", "HEALTH", "IMAGE", "REST", "ROLLOUT"
+]
 
 
 def main():
+    """Run the operator using kopf, or query a running operator."""
+    parser = argparse.ArgumentParser(prog="edgelake-operator")
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.add_parser("run", help="Run the operator (default)")
+
+    fleet = subparsers.add_parser("fleet", help="Show the fleet status cached by the operator")
+    fleet.add_argument(
+        "--url",
+        default=f"http://localhost:{FLEET_API_PORT}",
+        help="Fleet API of the operator (e.g. via kubectl port-forward)",
+    )
+    fleet.add_argument("--cluster", help="Only nodes of this EdgeLake cluster")
+    fleet.add_argument("-n", "--namespace", help="Only nodes in this namespace")
+    fleet.add_argument("--phase", help="Only nodes in this phase (e.g. Failed)")
+    fleet.add_argument("--health", help="Only nodes with this health (e.g. Degraded)")
+    fleet.add_argument("--limit", type=int, default=DEFAULT_FLEET_PAGE_SIZE, help="Page size")
+    fleet.add_argument("--all", action="store_true", help="Fetch all pages")
+    fleet.add_argument("-o", "--output", choices=["table", "json"], default="table")
+
+    args = parser.parse_args()
+    if args.command == "fleet":
+        show_fleet(args)
+    else:
+        run_operator()
+
+
+def run_operator():
     """Run the operator using kopf."""
     subprocess.run(
         [
@@ -20,5 +57,56 @@ def main():
     )
 
 
+def show_fleet(args: argparse.Namespace) -> None:
+    """Print the fleet status from the operator's /fleet endpoint."""
+    params = {
+        key: value
+        for key, value in [
+            ("cluster", args.cluster),
+            ("namespace", args.namespace),
+            ("phase", args.phase),
+            ("health", args.health),
+            ("limit", args.limit),
+        ]
+        if value is not None
+    }
+
+    items = []
+    while True:
+        url = f"{args.url.rstrip('/')}/fleet?{urllib.parse.urlencode(params)}"
+        with urllib.request.urlopen(url, timeout=10) as response:
+            page = json.load(response)
+        items.extend(page["items"])
+        if not args.all or not page["continue"]:
+            break
+        params["continue"] = page["continue"]
+
+    if args.output == "json":
+        print(json.dumps(items, indent=2))
+        return
+
+    rows = [_FLEET_COLUMNS]
+    for item in items:
+        rollout = item.get("lastRollout") or {}
+        rows.append(
+            [
+                item["namespace"],
+                item["name"],
+                item.get("nodeType") or "",
+                item.get("cluster") or "",
+                item.get("phase") or "",
+                item.get("health") or "",
+                item.get("image") or "",
+                (item.get("endpoints") or {}).get("rest") or "",
+                f"{rollout['totalSeconds']}s" if rollout.get("totalSeconds") is not None else "",
+            ]
+        )
+    widths = [max(len(str(row[i])) for row in rows) for i in range(len(_FLEET_COLUMNS))]
+    for row in rows:
+        print("  ".join(str(cell).ljust(width) for cell, width in zip(row, widths)).rstrip())
+    if not args.all and page["continue"]:
+        print(f"... {page['remaining']} more, use --all to list them")
+
+
 if __name__ == "__main__":
     main()
@@ -6,17 +6,63 @@ API_VERSION = "v1alpha1"
 PLURAL = "edgelakeoperators"
 SINGULAR = "edgelakeoperator"
 KIND = "EdgeLakeOperator"
+PROFILE_PLURAL = "edgelakeprofiles"
+PROFILE_KIND = "EdgeLakeProfile"
 
 # Labels
 LABEL_APP_NAME = "app.kubernetes.io/name"
 LABEL_INSTANCE = "app.kubernetes.io/instance"
 LABEL_COMPONENT = "app.kubernetes.io/component"
 LABEL_MANAGED_BY = "app.kubernetes.io/managed-by"
+MANAGED_BY = "edgelake-kube-operator"
+
+# Server-side selector for the pod watch (pods carry the selector labels only)
+POD_LABEL_SELECTOR = f"{LABEL_APP_NAME}=edgelake-operator,{LABEL_INSTANCE}"
+
+LABEL_SEED_SNAPSHOT = "edgelake.io/seed-snapshot"
+# Secrets holding credentials of CRs that roll on rotation; the Secret watch selects on it
+LABEL_CREDENTIALS = "edgelake.io/credentials"
+LABEL_PERFORMANCE_PROFILE = "edgelake.io/performance-profile"
 
 # Annotations
+# kopf stores handler progress in annotations with this prefix (default persistence)
+KOPF_ANNOTATION_PREFIX = "kopf.zalando.org/"
 ANNOTATION_CONFIG_HASH = "edgelake.io/config-hash"
+ANNOTATION_PROFILE_HASH = "edgelake.io/profile-hash"
+# Pod template annotation: digest of the credentials (secrets.rolloutOnRotation)
+ANNOTATION_CREDENTIALS_HASH = "edgelake.io/credentials-hash"
+# Set on PVCs and seed snapshots kept by retainOnDelete; the orphan sweeper skips them
+ANNOTATION_RETAINED = "edgelake.io/retained"
+# Topology-aware routing (EndpointSlice hints) for a Service, Kubernetes 1.27+
+ANNOTATION_TOPOLOGY_MODE = "service.kubernetes.io/topology-mode"
+
+# VolumeSnapshot API (CSI external-snapshotter)
+SNAPSHOT_API_GROUP = "snapshot.storage.k8s.io"
+SNAPSHOT_API_VERSION = "v1"
+SNAPSHOT_PLURAL = "volumesnapshots"
+
+# Node types
+NODE_TYPE_OPERATOR = "operator"
+NODE_TYPE_QUERY = "query"
+NODE_TYPE_MASTER = "master"
+NODE_TYPES = [NODE_TYPE_OPERATOR, NODE_TYPE_QUERY, NODE_TYPE_MASTER]
 
 # Default values
+DEFAULT_NODE_TYPE = NODE_TYPE_OPERATOR
+DEFAULT_REPLICAS = 1
+
+# Query node autoscaling
+DEFAULT_AUTOSCALING_MAX_REPLICAS = 10
+DEFAULT_AUTOSCALING_TARGET_P95 = "2 seconds"
+DEFAULT_AUTOSCALING_TARGET_IN_FLIGHT = 4
+DEFAULT_AUTOSCALING_TOLERANCE = 0.1
+DEFAULT_AUTOSCALING_SCALE_UP_COOLDOWN = "1 minute"
+DEFAULT_AUTOSCALING_SCALE_DOWN_COOLDOWN = "10 minutes"
+
+# Coalescing of bursty CR writes (spec.reconcile); a zero window applies every write
+DEFAULT_DEBOUNCE_WINDOW = "0 seconds"
+DEFAULT_DEBOUNCE_MAX_DELAY = "1 minute"
+
 DEFAULT_IMAGE_REPOSITORY = "anylogco/edgelake-network"
 DEFAULT_IMAGE_TAG = "1.3.2500"
 DEFAULT_IMAGE_PULL_POLICY = "IfNotPresent"
@@ -26,10 +72,22 @@ DEFAULT_MEMORY_LIMIT = "4Gi"
 DEFAULT_CPU_REQUEST = "500m"
 DEFAULT_MEMORY_REQUEST = "1Gi"
 
+DEFAULT_PERFORMANCE_PROFILE = "shared"
+
 DEFAULT_SERVER_PORT = 32148
 DEFAULT_REST_PORT = 32149
 DEFAULT_SERVICE_TYPE = "NodePort"
 
+# Service routing defaults (the Kubernetes defaults)
+DEFAULT_INTERNAL_TRAFFIC_POLICY = "Cluster"
+DEFAULT_SESSION_AFFINITY = "None"
+DEFAULT_SESSION_AFFINITY_TIMEOUT = "3 hours"
+MAX_SESSION_AFFINITY_TIMEOUT_SECONDS = 86400
+
+# Kubernetes default --service-node-port-range
+NODEPORT_RANGE_START = 30000
+NODEPORT_RANGE_END = 32767
+
 DEFAULT_DB_TYPE = "sqlite"
 DEFAULT_DB_HOST = "127.0.0.1"
 DEFAULT_DB_PORT = 5432
@@ -57,14 +115,81 @@ DEFAULT_REST_THREADS = 6
 DEFAULT_REST_TIMEOUT = 30
 DEFAULT_BROKER_THREADS = 6
 
+DEFAULT_MQTT_QOS = 0
+DEFAULT_MQTT_SUBSCRIPTION_THREADS = 1
+# Members of a shared MQTT group that have not reported for this long are dropped
+SHARED_GROUP_STALE_SECONDS = 300
+DEFAULT_OPCUA_FREQUENCY = "10 seconds"
+DEFAULT_ETHERIP_FREQUENCY = "1 second"
+ETHERIP_SIMULATOR_URL = "127.0.0.1"
+DEFAULT_AGGREGATION_INTERVAL = "1 minute"
+DEFAULT_AGGREGATION_BUCKETS = 10
+AGGREGATION_FUNCTIONS = ["min", "max", "avg", "count"]
+
 DEFAULT_QUERY_POOL = 6
 DEFAULT_THRESHOLD_TIME = "60 seconds"
 DEFAULT_THRESHOLD_VOLUME = "100KB"
 
+# Adaptive buffer flush defaults
+DEFAULT_ADAPTIVE_INTERVAL = "5 minutes"
+DEFAULT_ADAPTIVE_MIN_TIME = "5 seconds"
+DEFAULT_ADAPTIVE_MAX_TIME = "60 seconds"
+DEFAULT_ADAPTIVE_TARGET_FILE_SIZE = "1MB"
+DEFAULT_ADAPTIVE_MAX_VOLUME = "64MB"
+DEFAULT_ADAPTIVE_ROW_BYTES = 200
+
+# EdgeLake REST API
+REST_USER_AGENT = "AnyLog/1.23"
+
+# Health probes
+DEFAULT_PROBE_TYPE = "http"
+DEFAULT_PROBE_TIMEOUT = 10
+DEFAULT_STARTUP_PERIOD = 10
+DEFAULT_STARTUP_BUDGET = 600
+DEFAULT_READINESS_PERIOD = 10
+DEFAULT_READINESS_FAILURE_THRESHOLD = 3
+DEFAULT_LIVENESS_PERIOD = 30
+DEFAULT_LIVENESS_FAILURE_THRESHOLD = 5
+
+# Operator metrics
+METRICS_PORT = 8081
+
+# Fleet status API
+FLEET_API_PORT = 8082
+DEFAULT_FLEET_PAGE_SIZE = 100
+MAX_FLEET_PAGE_SIZE = 1000
+
+# Admission webhooks
+WEBHOOK_PORT = 9443
+WEBHOOK_CONFIGURATION = "edgelake.io"
+WEBHOOK_CERT_DIR = "/etc/edgelake-operator/webhook"
+
+# Orphaned PVC/Secret sweeper
+ORPHAN_SWEEP_INTERVAL = 600  # seconds; also the minimum age of an orphan
+ORPHAN_SWEEP_MAX_DELETES = 20  # per sweep, when ORPHAN_SWEEP_DELETE=true
+ORPHAN_SWEEP_DELETE_PAUSE = 1.0  # seconds between deletes
+
 # Container paths
 ANYLOG_PATH = "/app"
 LOCAL_SCRIPTS_PATH = "/app/deployment-scripts/node-deployment"
 TEST_DIR_PATH = "/app/deployment-scripts/tests"
+GENERATED_SCRIPTS_PATH = "/app/deployment-scripts/generated"
+LOCAL_SCRIPT_NAME = "local_script.al"
+
+# Hex digits of the content hash in immutable ConfigMap names (<name>-<hash>)
+CONFIGMAP_HASH_LENGTH = 10
+
+# Shared configuration profiles (EdgeLakeProfile): sections a CR can inherit
+PROFILE_FIELDS = ("database", "blockchain", "advanced", "image")
+# Profile changes reach the CRs using it in batches of this size, this far apart
+DEFAULT_PROFILE_BATCH_SIZE = 10
+DEFAULT_PROFILE_BATCH_INTERVAL = "30 seconds"
+
+# CRs sharing a rotated Secret roll in batches of this size, this far apart
+# (CREDENTIAL_ROLLOUT_BATCH_SIZE / CREDENTIAL_ROLLOUT_INTERVAL env vars)
+DEFAULT_CREDENTIAL_BATCH_SIZE = 1
+DEFAULT_CREDENTIAL_BATCH_INTERVAL = "30 seconds"
+CREDENTIAL_ROLLOUT_TICK = 10  # seconds between checks of the rotations in progress
 
 # Volume mount paths
 VOLUME_MOUNT_ANYLOG = "/app/EdgeLake/anylog"
@@ -78,3 +203,7 @@ DEFAULT_PVC_BLOCKCHAIN_SIZE = "1Gi"
 DEFAULT_PVC_DATA_SIZE = "10Gi"
 DEFAULT_PVC_SCRIPTS_SIZE = "1Gi"
 DEFAULT_ACCESS_MODE = "ReadWriteOnce"
+
+# Seed snapshot defaults
+DEFAULT_SEED_SNAPSHOT_INTERVAL = "6 hours"
+DEFAULT_SEED_SNAPSHOT_KEEP = 3
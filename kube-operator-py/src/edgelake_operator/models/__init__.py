@@ -1,6 +1,14 @@
 """Models for EdgeLake Operator CRD spec and status."""
 
+from .profile import EdgeLakeProfileSpec, ProfilePhase, ProfileStatus
 from .spec import EdgeLakeOperatorSpec
 from .status import OperatorPhase, OperatorStatus
 
-__all__ = ["EdgeLakeOperatorSpec", "OperatorPhase", "OperatorStatus"]
+__all__ = [
+    "EdgeLakeOperatorSpec",
+    "EdgeLakeProfileSpec",
+    "OperatorPhase",
+    "OperatorStatus",
+    "ProfilePhase",
+    "ProfileStatus",
+]
@@ -0,0 +1,64 @@
+"""Models for the EdgeLakeProfile CRD (shared configuration profiles)."""
+
+from enum import Enum
+from typing import Any, Optional
+
+from pydantic import BaseModel, Field
+
+from ..constants import DEFAULT_PROFILE_BATCH_INTERVAL, DEFAULT_PROFILE_BATCH_SIZE
+
+
+class ProfilePhase(str, Enum):
+    """Phases of a profile change rolling across the CRs that use it."""
+
+    IDLE = "Idle"
+    ROLLING = "Rolling"
+    PAUSED = "Paused"
+    COMPLETE = "Complete"
+
+
+class ProfileRolloutSpec(BaseModel):
+    """How a profile change is fanned out to the CRs that use it."""
+
+    batchSize: int = Field(default=DEFAULT_PROFILE_BATCH_SIZE, alias="batch_size", ge=1)
+    interval: str = DEFAULT_PROFILE_BATCH_INTERVAL
+
+    class Config:
+        populate_by_name = True
+
+
+class EdgeLakeProfileSpec(BaseModel):
+    """EdgeLakeProfile spec: partial EdgeLakeOperator sections shared by many CRs.
+
+    Each section uses the EdgeLakeOperator schema; a CR referencing the profile
+    inherits the sections and overrides them field by field.
+    """
+
+    database: Optional[dict[str, Any]] = None
+    blockchain: Optional[dict[str, Any]] = None
+    advanced: Optional[dict[str, Any]] = None
+    image: Optional[dict[str, Any]] = None
+    rollout: ProfileRolloutSpec = Field(default_factory=ProfileRolloutSpec)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "EdgeLakeProfileSpec":
+        """Create spec from dictionary (from K8s CR)."""
+        return cls.model_validate(data)
+
+
+class ProfileStatus(BaseModel):
+    """Status of an EdgeLakeProfile: progress of the last change across its CRs."""
+
+    phase: str = ProfilePhase.IDLE.value
+    profileHash: Optional[str] = Field(default=None, alias="profile_hash")
+    total: int = 0
+    updated: int = 0
+    pending: list[str] = Field(default_factory=list)
+    failed: list[str] = Field(default_factory=list)
+    lastBatch: list[str] = Field(default_factory=list, alias="last_batch")
+    startedAt: Optional[str] = Field(default=None, alias="started_at")
+    lastBatchAt: Optional[str] = Field(default=None, alias="last_batch_at")
+    completedAt: Optional[str] = Field(default=None, alias="completed_at")
+
+    class Config:
+        populate_by_name = True
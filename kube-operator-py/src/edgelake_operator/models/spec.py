@@ -1,11 +1,26 @@
 """Pydantic models for EdgeLakeOperator CRD spec."""
 
-from typing import Optional
+from typing import Any, Optional
 
 from pydantic import BaseModel, Field
 
 from ..constants import (
+    AGGREGATION_FUNCTIONS,
     DEFAULT_ACCESS_MODE,
+    DEFAULT_ADAPTIVE_INTERVAL,
+    DEFAULT_ADAPTIVE_MAX_TIME,
+    DEFAULT_ADAPTIVE_MAX_VOLUME,
+    DEFAULT_ADAPTIVE_MIN_TIME,
+    DEFAULT_ADAPTIVE_ROW_BYTES,
+    DEFAULT_ADAPTIVE_TARGET_FILE_SIZE,
+    DEFAULT_AGGREGATION_BUCKETS,
+    DEFAULT_AGGREGATION_INTERVAL,
+    DEFAULT_AUTOSCALING_MAX_REPLICAS,
+    DEFAULT_AUTOSCALING_SCALE_DOWN_COOLDOWN,
+    DEFAULT_AUTOSCALING_SCALE_UP_COOLDOWN,
+    DEFAULT_AUTOSCALING_TARGET_IN_FLIGHT,
+    DEFAULT_AUTOSCALING_TARGET_P95,
+    DEFAULT_AUTOSCALING_TOLERANCE,
     DEFAULT_BLOCKCHAIN_DESTINATION,
     DEFAULT_BLOCKCHAIN_SOURCE,
     DEFAULT_BROKER_THREADS,
@@ -14,14 +29,22 @@ from ..constants import (
     DEFAULT_DB_HOST,
     DEFAULT_DB_PORT,
     DEFAULT_DB_TYPE,
+    DEFAULT_DEBOUNCE_MAX_DELAY,
+    DEFAULT_DEBOUNCE_WINDOW,
+    DEFAULT_ETHERIP_FREQUENCY,
     DEFAULT_IMAGE_PULL_POLICY,
     DEFAULT_IMAGE_REPOSITORY,
     DEFAULT_IMAGE_TAG,
+    DEFAULT_INTERNAL_TRAFFIC_POLICY,
     DEFAULT_MEMORY_LIMIT,
     DEFAULT_MEMORY_REQUEST,
+    DEFAULT_MQTT_QOS,
+    DEFAULT_MQTT_SUBSCRIPTION_THREADS,
+    DEFAULT_NODE_TYPE,
     DEFAULT_NOSQL_HOST,
     DEFAULT_NOSQL_PORT,
     DEFAULT_NOSQL_TYPE,
+    DEFAULT_OPCUA_FREQUENCY,
     DEFAULT_OPERATOR_THREADS,
     DEFAULT_PARTITION_COLUMN,
     DEFAULT_PARTITION_ENABLED,
@@ -29,21 +52,30 @@ from ..constants import (
     DEFAULT_PARTITION_KEEP,
     DEFAULT_PARTITION_SYNC,
     DEFAULT_PARTITION_TABLE,
+    DEFAULT_PERFORMANCE_PROFILE,
+    DEFAULT_PROBE_TYPE,
     DEFAULT_PVC_ANYLOG_SIZE,
     DEFAULT_PVC_BLOCKCHAIN_SIZE,
     DEFAULT_PVC_DATA_SIZE,
     DEFAULT_PVC_SCRIPTS_SIZE,
     DEFAULT_QUERY_POOL,
+    DEFAULT_REPLICAS,
     DEFAULT_REST_PORT,
     DEFAULT_REST_THREADS,
     DEFAULT_REST_TIMEOUT,
+    DEFAULT_SEED_SNAPSHOT_INTERVAL,
+    DEFAULT_SEED_SNAPSHOT_KEEP,
     DEFAULT_SERVER_PORT,
     DEFAULT_SERVICE_TYPE,
+    DEFAULT_SESSION_AFFINITY,
+    DEFAULT_SESSION_AFFINITY_TIMEOUT,
     DEFAULT_START_DATE,
     DEFAULT_SYNC_TIME,
     DEFAULT_TCP_THREADS,
     DEFAULT_THRESHOLD_TIME,
     DEFAULT_THRESHOLD_VOLUME,
+    NODE_TYPE_OPERATOR,
+    NODE_TYPE_QUERY,
 )
 
 
@@ -87,10 +119,42 @@ class ResourcesSpec(BaseModel):
     requests: ResourceRequirements = Field(default_factory=ResourceRequirements)
 
 
+class SchedulingSpec(BaseModel):
+    """Pod placement and priority."""
+
+    priorityClassName: Optional[str] = Field(default=None, alias="priority_class_name")
+    nodeSelector: dict[str, str] = Field(default_factory=dict, alias="node_selector")
+    tolerations: list[dict[str, Any]] = Field(default_factory=list)
+
+    class Config:
+        populate_by_name = True
+
+
 class VolumeSize(BaseModel):
-    """Volume size configuration."""
+    """Volume size and optional data source configuration."""
 
     size: str = "1Gi"
+    fromSnapshot: Optional[str] = Field(default=None, alias="from_snapshot")
+    # Seed node (EdgeLakeOperator in the same namespace) whose newest ready snapshot to restore
+    fromSeed: Optional[str] = Field(default=None, alias="from_seed")
+    cloneFrom: Optional[str] = Field(default=None, alias="clone_from")
+
+    class Config:
+        populate_by_name = True
+
+
+class SeedSnapshotSpec(BaseModel):
+    """Scheduled VolumeSnapshot of the blockchain volume (seed node)."""
+
+    enabled: bool = False
+    volumeSnapshotClassName: Optional[str] = Field(
+        default=None, alias="volume_snapshot_class_name"
+    )
+    interval: str = DEFAULT_SEED_SNAPSHOT_INTERVAL
+    keep: int = DEFAULT_SEED_SNAPSHOT_KEEP
+
+    class Config:
+        populate_by_name = True
 
 
 class PersistenceSpec(BaseModel):
@@ -106,6 +170,7 @@ class PersistenceSpec(BaseModel):
     )
     data: VolumeSize = Field(default_factory=lambda: VolumeSize(size=DEFAULT_PVC_DATA_SIZE))
     scripts: VolumeSize = Field(default_factory=lambda: VolumeSize(size=DEFAULT_PVC_SCRIPTS_SIZE))
+    seedSnapshot: SeedSnapshotSpec = Field(default_factory=SeedSnapshotSpec, alias="seed_snapshot")
 
     class Config:
         populate_by_name = True
@@ -134,6 +199,27 @@ class GeolocationSpec(BaseModel):
     city: Optional[str] = None
 
 
+class RoutingSpec(BaseModel):
+    """How the Services route REST queries and TCP peer traffic to pods."""
+
+    # "Local" keeps in-cluster traffic on the client's node
+    internalTrafficPolicy: str = Field(
+        default=DEFAULT_INTERNAL_TRAFFIC_POLICY, alias="internal_traffic_policy"
+    )
+    # Prefer endpoints in the client's zone (topology-aware routing hints)
+    topologyAware: bool = Field(default=False, alias="topology_aware")
+    # "ClientIP" keeps a client's queries on one pod
+    sessionAffinity: str = Field(default=DEFAULT_SESSION_AFFINITY, alias="session_affinity")
+    sessionAffinityTimeout: str = Field(
+        default=DEFAULT_SESSION_AFFINITY_TIMEOUT, alias="session_affinity_timeout"
+    )
+    # Headless Service resolving to the pod IPs, for direct pod-to-pod TCP
+    peerService: bool = Field(default=False, alias="peer_service")
+
+    class Config:
+        populate_by_name = True
+
+
 class NetworkingSpec(BaseModel):
     """Network and port configuration."""
 
@@ -142,6 +228,9 @@ class NetworkingSpec(BaseModel):
     serverPort: int = Field(default=DEFAULT_SERVER_PORT, alias="server_port", ge=1, le=65535)
     restPort: int = Field(default=DEFAULT_REST_PORT, alias="rest_port", ge=1, le=65535)
     brokerPort: Optional[int] = Field(default=None, alias="broker_port", ge=1, le=65535)
+    # Let the operator pick free NodePorts on create instead of the ports above
+    autoAllocatePorts: bool = Field(default=False, alias="auto_allocate_ports")
+    routing: RoutingSpec = Field(default_factory=RoutingSpec)
     tcpBind: bool = Field(default=False, alias="tcp_bind")
     restBind: bool = Field(default=False, alias="rest_bind")
     brokerBind: bool = Field(default=False, alias="broker_bind")
@@ -156,6 +245,28 @@ class NetworkingSpec(BaseModel):
         populate_by_name = True
 
 
+class ProbeSpec(BaseModel):
+    """Timing overrides for a single probe (unset values are derived from the spec)."""
+
+    enabled: bool = True
+    initialDelaySeconds: Optional[int] = Field(default=None, alias="initial_delay_seconds", ge=0)
+    periodSeconds: Optional[int] = Field(default=None, alias="period_seconds", ge=1)
+    timeoutSeconds: Optional[int] = Field(default=None, alias="timeout_seconds", ge=1)
+    failureThreshold: Optional[int] = Field(default=None, alias="failure_threshold", ge=1)
+
+    class Config:
+        populate_by_name = True
+
+
+class ProbesSpec(BaseModel):
+    """Startup, readiness and liveness probes against the REST port."""
+
+    type: str = DEFAULT_PROBE_TYPE
+    startup: ProbeSpec = Field(default_factory=ProbeSpec)
+    readiness: ProbeSpec = Field(default_factory=ProbeSpec)
+    liveness: ProbeSpec = Field(default_factory=ProbeSpec)
+
+
 class NoSqlSpec(BaseModel):
     """NoSQL (MongoDB) configuration."""
 
@@ -194,7 +305,10 @@ class DatabaseSpec(BaseModel):
 class BlockchainSpec(BaseModel):
     """Blockchain/Master node configuration."""
 
-    ledgerConn: str = Field(..., alias="ledger_conn", pattern=r"^[a-zA-Z0-9.-]+:[0-9]+$")
+    # Optional here so a CR can inherit it from its profile; validate_spec requires it
+    ledgerConn: Optional[str] = Field(
+        default=None, alias="ledger_conn", pattern=r"^[a-zA-Z0-9.-]+:[0-9]+$"
+    )
     syncTime: str = Field(default=DEFAULT_SYNC_TIME, alias="sync_time")
     source: str = DEFAULT_BLOCKCHAIN_SOURCE
     destination: str = DEFAULT_BLOCKCHAIN_DESTINATION
@@ -203,6 +317,31 @@ class BlockchainSpec(BaseModel):
         populate_by_name = True
 
 
+class PartitionPolicySpec(BaseModel):
+    """Partitioning and retention policy for one table (or * for all tables)."""
+
+    table: str = Field(..., min_length=1)
+    dbms: Optional[str] = None  # Defaults to operator.defaultDbms
+    column: str = DEFAULT_PARTITION_COLUMN
+    interval: str = DEFAULT_PARTITION_INTERVAL
+    keep: int = Field(default=DEFAULT_PARTITION_KEEP, ge=1)
+    sync: str = DEFAULT_PARTITION_SYNC
+
+    class Config:
+        populate_by_name = True
+
+
+class PartitionMaintenanceSpec(BaseModel):
+    """Staggering of partition drops across a fleet."""
+
+    stagger: bool = False
+    offset: Optional[str] = None  # Explicit offset; default derived from the CR UID
+    window: Optional[str] = None  # Defaults to the shortest sync period
+
+    class Config:
+        populate_by_name = True
+
+
 class PartitioningSpec(BaseModel):
     """Data partitioning configuration."""
 
@@ -212,6 +351,9 @@ class PartitioningSpec(BaseModel):
     interval: str = DEFAULT_PARTITION_INTERVAL
     keep: int = DEFAULT_PARTITION_KEEP
     sync: str = DEFAULT_PARTITION_SYNC
+    # Per-table policies; when set they replace the single policy above
+    policies: list[PartitionPolicySpec] = Field(default_factory=list)
+    maintenance: PartitionMaintenanceSpec = Field(default_factory=PartitionMaintenanceSpec)
 
     class Config:
         populate_by_name = True
@@ -246,6 +388,31 @@ class MqttMessageSpec(BaseModel):
         populate_by_name = True
 
 
+class MqttColumnSpec(BaseModel):
+    """Mapping of one table column to a value in the MQTT message."""
+
+    name: str = Field(..., min_length=1)
+    type: str = "float"
+    value: str = Field(..., min_length=1)
+
+
+class MqttSubscriptionSpec(BaseModel):
+    """One MQTT topic-to-table mapping with its own client threads."""
+
+    topic: str = Field(..., min_length=1)
+    dbms: Optional[str] = None
+    table: str = "bring [table]"
+    timestampColumn: str = Field(default="bring [timestamp]", alias="timestamp_column")
+    columns: list[MqttColumnSpec] = Field(
+        default_factory=lambda: [MqttColumnSpec(name="value", type="float", value="bring [value]")]
+    )
+    qos: int = Field(default=DEFAULT_MQTT_QOS, ge=0, le=2)
+    threads: int = Field(default=DEFAULT_MQTT_SUBSCRIPTION_THREADS, ge=1)
+
+    class Config:
+        populate_by_name = True
+
+
 class MqttSpec(BaseModel):
     """MQTT data ingestion configuration."""
 
@@ -257,6 +424,23 @@ class MqttSpec(BaseModel):
     passwordSecretRef: Optional[SecretRef] = Field(default=None, alias="password_secret_ref")
     log: bool = False
     message: MqttMessageSpec = Field(default_factory=MqttMessageSpec)
+    subscriptions: list[MqttSubscriptionSpec] = Field(default_factory=list)
+    sharedGroup: Optional[str] = Field(default=None, alias="shared_group")
+
+    class Config:
+        populate_by_name = True
+
+
+class OpcuaGroupSpec(BaseModel):
+    """A set of OPC-UA nodes on one server, read in a single batched request."""
+
+    name: str = Field(..., min_length=1, pattern=r"^[a-zA-Z0-9_-]+$")
+    url: str = Field(..., min_length=1)
+    nodes: list[str] = Field(default_factory=list)
+    browseRoot: Optional[str] = Field(default=None, alias="browse_root")
+    frequency: str = DEFAULT_OPCUA_FREQUENCY
+    dbms: Optional[str] = None  # Defaults to operator.defaultDbms
+    table: str = Field(..., min_length=1)
 
     class Config:
         populate_by_name = True
@@ -269,6 +453,25 @@ class OpcuaSpec(BaseModel):
     url: Optional[str] = None
     node: Optional[str] = None
     frequency: Optional[str] = None
+    # Polling groups; when set they replace url/node/frequency
+    groups: list[OpcuaGroupSpec] = Field(default_factory=list)
+
+    class Config:
+        populate_by_name = True
+
+
+class EtheripPlcSpec(BaseModel):
+    """One Allen-Bradley PLC and the tag group polled from it."""
+
+    name: str = Field(..., min_length=1, pattern=r"^[a-zA-Z0-9_-]+$")
+    url: Optional[str] = None  # Defaults to the local simulator in simulatorMode
+    tags: list[str] = Field(..., min_length=1)
+    frequency: str = DEFAULT_ETHERIP_FREQUENCY
+    dbms: Optional[str] = None  # Defaults to operator.defaultDbms
+    table: str = Field(..., min_length=1)
+
+    class Config:
+        populate_by_name = True
 
 
 class EtheripSpec(BaseModel):
@@ -278,6 +481,23 @@ class EtheripSpec(BaseModel):
     simulatorMode: bool = Field(default=False, alias="simulator_mode")
     url: Optional[str] = None
     frequency: Optional[str] = None
+    # Multiple PLCs polled from this node; when set they replace url/frequency
+    plcs: list[EtheripPlcSpec] = Field(default_factory=list)
+
+    class Config:
+        populate_by_name = True
+
+
+class AggregationRuleSpec(BaseModel):
+    """Rollup of one table's value column into fixed time buckets."""
+
+    table: str = Field(..., min_length=1)
+    dbms: Optional[str] = None  # Defaults to operator.defaultDbms
+    timeColumn: str = Field(default="insert_timestamp", alias="time_column")
+    valueColumn: str = Field(default="value", alias="value_column")
+    functions: list[str] = Field(default_factory=lambda: list(AGGREGATION_FUNCTIONS))
+    interval: str = DEFAULT_AGGREGATION_INTERVAL  # Bucket size
+    buckets: int = Field(default=DEFAULT_AGGREGATION_BUCKETS, ge=1)  # Buckets kept in memory
 
     class Config:
         populate_by_name = True
@@ -289,6 +509,8 @@ class AggregationsSpec(BaseModel):
     enabled: bool = False
     timeColumn: str = Field(default="insert_timestamp", alias="time_column")
     valueColumn: str = Field(default="value", alias="value_column")
+    # Per-table rollups; when set they replace timeColumn/valueColumn
+    rules: list[AggregationRuleSpec] = Field(default_factory=list)
 
     class Config:
         populate_by_name = True
@@ -311,6 +533,21 @@ class McpSpec(BaseModel):
     autostart: bool = False
 
 
+class AdaptiveBuffersSpec(BaseModel):
+    """Per-table buffer flush thresholds derived from observed ingest rates."""
+
+    enabled: bool = False
+    interval: str = DEFAULT_ADAPTIVE_INTERVAL
+    minTime: str = Field(default=DEFAULT_ADAPTIVE_MIN_TIME, alias="min_time")
+    maxTime: str = Field(default=DEFAULT_ADAPTIVE_MAX_TIME, alias="max_time")
+    targetFileSize: str = Field(default=DEFAULT_ADAPTIVE_TARGET_FILE_SIZE, alias="target_file_size")
+    maxVolume: str = Field(default=DEFAULT_ADAPTIVE_MAX_VOLUME, alias="max_volume")
+    avgRowBytes: int = Field(default=DEFAULT_ADAPTIVE_ROW_BYTES, alias="avg_row_bytes", ge=1)
+
+    class Config:
+        populate_by_name = True
+
+
 class AdvancedSpec(BaseModel):
     """Advanced configuration options."""
 
@@ -321,6 +558,11 @@ class AdvancedSpec(BaseModel):
     writeImmediate: bool = Field(default=False, alias="write_immediate")
     thresholdTime: str = Field(default=DEFAULT_THRESHOLD_TIME, alias="threshold_time")
     thresholdVolume: str = Field(default=DEFAULT_THRESHOLD_VOLUME, alias="threshold_volume")
+    adaptiveBuffers: AdaptiveBuffersSpec = Field(
+        default_factory=AdaptiveBuffersSpec, alias="adaptive_buffers"
+    )
+    # Immutable ConfigMaps named by content hash, replaced (not edited) on config changes
+    immutableConfigMaps: bool = Field(default=False, alias="immutable_config_maps")
 
     class Config:
         populate_by_name = True
@@ -340,18 +582,78 @@ class NebulaSpec(BaseModel):
         populate_by_name = True
 
 
+class SecretsSpec(BaseModel):
+    """Handling of rotated credentials."""
+
+    # Roll the pods, a batch of CRs at a time, when a referenced Secret's credentials change
+    rolloutOnRotation: bool = Field(default=False, alias="rollout_on_rotation")
+
+    class Config:
+        populate_by_name = True
+
+
+class AutoscalingSpec(BaseModel):
+    """Latency-driven autoscaling of query node replicas."""
+
+    enabled: bool = False
+    minReplicas: int = Field(default=DEFAULT_REPLICAS, alias="min_replicas", ge=1)
+    maxReplicas: int = Field(default=DEFAULT_AUTOSCALING_MAX_REPLICAS, alias="max_replicas", ge=1)
+    targetP95Latency: str = Field(default=DEFAULT_AUTOSCALING_TARGET_P95, alias="target_p95_latency")
+    targetInFlightPerReplica: int = Field(
+        default=DEFAULT_AUTOSCALING_TARGET_IN_FLIGHT, alias="target_in_flight_per_replica", ge=1
+    )
+    tolerance: float = Field(default=DEFAULT_AUTOSCALING_TOLERANCE, ge=0)
+    scaleUpCooldown: str = Field(
+        default=DEFAULT_AUTOSCALING_SCALE_UP_COOLDOWN, alias="scale_up_cooldown"
+    )
+    scaleDownCooldown: str = Field(
+        default=DEFAULT_AUTOSCALING_SCALE_DOWN_COOLDOWN, alias="scale_down_cooldown"
+    )
+
+    class Config:
+        populate_by_name = True
+
+
+class ReconcileSpec(BaseModel):
+    """How bursts of writes to the CR are reconciled."""
+
+    # Quiet period before an update is applied; writes within it are merged
+    debounce: str = DEFAULT_DEBOUNCE_WINDOW
+    # Longest an update is held back after the first write of a burst
+    maxDelay: str = Field(default=DEFAULT_DEBOUNCE_MAX_DELAY, alias="max_delay")
+
+    class Config:
+        populate_by_name = True
+
+
+class ProfileRef(BaseModel):
+    """Reference to an EdgeLakeProfile in the same namespace."""
+
+    name: str
+
+
 class EdgeLakeOperatorSpec(BaseModel):
     """Complete EdgeLakeOperator CRD spec."""
 
+    nodeType: str = Field(default=DEFAULT_NODE_TYPE, alias="node_type")
+    # Shared sections inherited from an EdgeLakeProfile (resolved by the operator)
+    profileRef: Optional[ProfileRef] = Field(default=None, alias="profile_ref")
+    replicas: int = Field(default=DEFAULT_REPLICAS, ge=1)  # Query nodes only
+    autoscaling: AutoscalingSpec = Field(default_factory=AutoscalingSpec)  # Query nodes only
     image: ImageSpec = Field(default_factory=ImageSpec)
     resources: ResourcesSpec = Field(default_factory=ResourcesSpec)
+    performanceProfile: str = Field(
+        default=DEFAULT_PERFORMANCE_PROFILE, alias="performance_profile"
+    )
+    scheduling: SchedulingSpec = Field(default_factory=SchedulingSpec)
     persistence: PersistenceSpec = Field(default_factory=PersistenceSpec)
     general: GeneralSpec
     geolocation: GeolocationSpec = Field(default_factory=GeolocationSpec)
     networking: NetworkingSpec = Field(default_factory=NetworkingSpec)
+    probes: ProbesSpec = Field(default_factory=ProbesSpec)
     database: DatabaseSpec = Field(default_factory=DatabaseSpec)
-    blockchain: BlockchainSpec
-    operator: OperatorSpec
+    blockchain: BlockchainSpec = Field(default_factory=BlockchainSpec)
+    operator: Optional[OperatorSpec] = None  # Required for operator nodes
     mqtt: MqttSpec = Field(default_factory=MqttSpec)
     opcua: OpcuaSpec = Field(default_factory=OpcuaSpec)
     etherip: EtheripSpec = Field(default_factory=EtheripSpec)
@@ -360,6 +662,8 @@ class EdgeLakeOperatorSpec(BaseModel):
     mcp: McpSpec = Field(default_factory=McpSpec)
     advanced: AdvancedSpec = Field(default_factory=AdvancedSpec)
     nebula: NebulaSpec = Field(default_factory=NebulaSpec)
+    secrets: SecretsSpec = Field(default_factory=SecretsSpec)
+    reconcile: ReconcileSpec = Field(default_factory=ReconcileSpec)
 
     class Config:
         populate_by_name = True
@@ -369,6 +673,18 @@ class EdgeLakeOperatorSpec(BaseModel):
         """Create spec from dictionary (handles both camelCase and snake_case)."""
         return cls.model_validate(data)
 
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the spec with all defaults filled in (camelCase, no nulls)."""
+        return self.model_dump(mode="json", exclude_none=True)
+
+    def is_operator_node(self) -> bool:
+        """Check if this is an operator (data ingestion) node."""
+        return self.nodeType == NODE_TYPE_OPERATOR
+
+    def uses_persistence(self) -> bool:
+        """Check if the node keeps state on PVCs (query nodes are always stateless)."""
+        return self.persistence.enabled and self.nodeType != NODE_TYPE_QUERY
+
     def has_inline_secrets(self) -> bool:
         """Check if any inline secrets are defined that need to be stored in a Secret."""
         return any(
@@ -67,12 +67,192 @@ class Condition(BaseModel):
         )
 
 
+class ZoneEndpoints(BaseModel):
+    """Ready pod endpoints in one zone."""
+
+    zone: str
+    tcp: list[str] = Field(default_factory=list)
+    rest: list[str] = Field(default_factory=list)
+
+
 class Endpoints(BaseModel):
     """Service endpoints for the operator."""
 
     tcp: Optional[str] = None
     rest: Optional[str] = None
     broker: Optional[str] = None
+    peers: Optional[str] = None
+    zones: list[ZoneEndpoints] = Field(default_factory=list)
+
+
+class SeedSnapshotStatus(BaseModel):
+    """Most recent seed snapshot of the blockchain volume."""
+
+    name: Optional[str] = None
+    createdAt: Optional[str] = Field(default=None, alias="created_at")
+    snapshots: list[str] = Field(default_factory=list)
+
+    class Config:
+        populate_by_name = True
+
+
+class RolloutTimeline(BaseModel):
+    """Time-to-ready breakdown of the most recent pod rollout."""
+
+    configHash: Optional[str] = Field(default=None, alias="config_hash")
+    image: Optional[str] = None
+    podName: Optional[str] = Field(default=None, alias="pod_name")
+    startedAt: Optional[str] = Field(default=None, alias="started_at")
+    readyAt: Optional[str] = Field(default=None, alias="ready_at")
+    totalSeconds: Optional[float] = Field(default=None, alias="total_seconds")
+    phases: dict[str, float] = Field(default_factory=dict)
+
+    class Config:
+        populate_by_name = True
+
+
+class MqttReplicaStats(BaseModel):
+    """MQTT message counters of one EdgeLake pod."""
+
+    pod: str
+    count: int = 0
+    ratePerSecond: Optional[float] = Field(default=None, alias="rate_per_second")
+    sampledAt: Optional[str] = Field(default=None, alias="sampled_at")
+
+    class Config:
+        populate_by_name = True
+
+
+class MqttGroupMember(BaseModel):
+    """MQTT message rate of one EdgeLakeOperator in a shared group."""
+
+    instance: str
+    replicas: int = 0
+    ratePerSecond: float = Field(default=0, alias="rate_per_second")
+
+    class Config:
+        populate_by_name = True
+
+
+class MqttIngestionStatus(BaseModel):
+    """Per-replica and per-group MQTT ingestion rates for shared subscriptions."""
+
+    sharedGroup: Optional[str] = Field(default=None, alias="shared_group")
+    totalRatePerSecond: float = Field(default=0, alias="total_rate_per_second")
+    replicas: list[MqttReplicaStats] = Field(default_factory=list)
+    groupRatePerSecond: float = Field(default=0, alias="group_rate_per_second")
+    groupShare: Optional[float] = Field(default=None, alias="group_share")
+    groupMembers: list[MqttGroupMember] = Field(default_factory=list, alias="group_members")
+
+    class Config:
+        populate_by_name = True
+
+
+class TableBufferThreshold(BaseModel):
+    """Observed ingest rate and applied flush thresholds of one table."""
+
+    pod: str
+    table: str
+    count: int = 0
+    sampledAt: Optional[str] = Field(default=None, alias="sampled_at")
+    rowsPerSecond: Optional[float] = Field(default=None, alias="rows_per_second")
+    timeSeconds: Optional[int] = Field(default=None, alias="time_seconds")
+    volumeBytes: Optional[int] = Field(default=None, alias="volume_bytes")
+    appliedAt: Optional[str] = Field(default=None, alias="applied_at")
+
+    class Config:
+        populate_by_name = True
+
+
+class BufferThresholdsStatus(BaseModel):
+    """Adaptive buffer thresholds applied to the node."""
+
+    sampledAt: Optional[str] = Field(default=None, alias="sampled_at")
+    tables: list[TableBufferThreshold] = Field(default_factory=list)
+
+    class Config:
+        populate_by_name = True
+
+
+class PartitionMaintenanceStatus(BaseModel):
+    """Partition drop offset assigned to the node."""
+
+    offset: str
+    window: str
+    source: str  # "uid" or "explicit"
+
+
+class AggregationStatus(BaseModel):
+    """Rollup published by an aggregation rule."""
+
+    table: str
+    interval: str
+    query: str
+
+
+class QueryPodSample(BaseModel):
+    """Last cumulative query time histogram read from a query pod."""
+
+    pod: str
+    buckets: dict[str, int] = Field(default_factory=dict)
+    sampledAt: Optional[str] = Field(default=None, alias="sampled_at")
+
+    class Config:
+        populate_by_name = True
+
+
+class AutoscalingStatus(BaseModel):
+    """Query node autoscaler state."""
+
+    currentReplicas: int = Field(default=1, alias="current_replicas")
+    desiredReplicas: int = Field(default=1, alias="desired_replicas")
+    p95Seconds: Optional[float] = Field(default=None, alias="p95_seconds")
+    inFlight: int = Field(default=0, alias="in_flight")
+    lastScaleTime: Optional[str] = Field(default=None, alias="last_scale_time")
+    samples: list[QueryPodSample] = Field(default_factory=list)
+
+    class Config:
+        populate_by_name = True
+
+
+class LiveTuningPod(BaseModel):
+    """Outcome of a live settings push on one pod."""
+
+    pod: str
+    applied: bool
+    error: Optional[str] = None
+
+
+class LiveTuningStatus(BaseModel):
+    """Last push of live-tunable settings to running pods."""
+
+    appliedAt: str = Field(alias="applied_at")
+    fields: list[str] = Field(default_factory=list)
+    pods: list[LiveTuningPod] = Field(default_factory=list)
+
+    class Config:
+        populate_by_name = True
+
+
+class CredentialRotationStatus(BaseModel):
+    """Last rollout caused by rotated credentials."""
+
+    secret: str
+    credentialsHash: str = Field(alias="credentials_hash")
+    # Queued until its batch is due (see _roll_credential_batch)
+    queuedAt: Optional[str] = Field(default=None, alias="queued_at")
+    rolledAt: Optional[str] = Field(default=None, alias="rolled_at")
+
+    class Config:
+        populate_by_name = True
+
+
+class AllocatedPorts(BaseModel):
+    """NodePorts assigned to the CR by the automatic allocator."""
+
+    server: int
+    rest: int
+    broker: Optional[int] = None
 
 
 class OperatorStatus(BaseModel):
@@ -81,12 +261,40 @@ class OperatorStatus(BaseModel):
     phase: str = OperatorPhase.PENDING.value
     conditions: list[Condition] = Field(default_factory=list)
     observedGeneration: Optional[int] = Field(default=None, alias="observed_generation")
+    # Profile hash annotation (edgelake.io/profile-hash) applied by the last reconcile
+    profileHash: Optional[str] = Field(default=None, alias="profile_hash")
     deploymentName: Optional[str] = Field(default=None, alias="deployment_name")
     serviceName: Optional[str] = Field(default=None, alias="service_name")
     configMapName: Optional[str] = Field(default=None, alias="config_map_name")
+    # Hashed ConfigMap revisions left to delete after immutableConfigMaps was turned off
+    staleConfigMapRevisions: Optional[bool] = Field(
+        default=None, alias="stale_config_map_revisions"
+    )
     secretName: Optional[str] = Field(default=None, alias="secret_name")
     pvcNames: list[str] = Field(default_factory=list, alias="pvc_names")
     endpoints: Endpoints = Field(default_factory=Endpoints)
+    seedSnapshot: Optional[SeedSnapshotStatus] = Field(default=None, alias="seed_snapshot")
+    # Seed snapshot persistence.blockchain.fromSeed resolved to when the PVC was created
+    restoredSnapshot: Optional[str] = Field(default=None, alias="restored_snapshot")
+    lastRollout: Optional[RolloutTimeline] = Field(default=None, alias="last_rollout")
+    mqttIngestion: Optional[MqttIngestionStatus] = Field(default=None, alias="mqtt_ingestion")
+    bufferThresholds: Optional[BufferThresholdsStatus] = Field(
+        default=None, alias="buffer_thresholds"
+    )
+    partitionMaintenance: Optional[PartitionMaintenanceStatus] = Field(
+        default=None, alias="partition_maintenance"
+    )
+    aggregations: list[AggregationStatus] = Field(default_factory=list)
+    replicas: Optional[int] = None
+    selector: Optional[str] = None
+    autoscaling: Optional[AutoscalingStatus] = None
+    liveTuning: Optional[LiveTuningStatus] = Field(default=None, alias="live_tuning")
+    credentialRotation: Optional[CredentialRotationStatus] = Field(
+        default=None, alias="credential_rotation"
+    )
+    allocatedPorts: Optional[AllocatedPorts] = Field(default=None, alias="allocated_ports")
+    # Create steps applied so far (step name -> manifest hash); cleared once created
+    journal: dict[str, str] = Field(default_factory=dict)
 
     class Config:
         populate_by_name = True
@@ -98,12 +306,17 @@ class OperatorStatus(BaseModel):
         reason: str,
         message: str,
     ) -> None:
-        """Set or update a condition."""
+        """Set or update a condition.
+
+        The last transition time is kept while the condition's status does not change.
+        """
         new_condition = Condition.create(condition_type, status, reason, message)
 
         # Find and replace existing condition of same type
         for i, cond in enumerate(self.conditions):
             if cond.type == condition_type.value:
+                if cond.status == new_condition.status:
+                    new_condition.lastTransitionTime = cond.lastTransitionTime
                 self.conditions[i] = new_condition
                 return
 
@@ -4,18 +4,121 @@ This module contains the main operator logic for managing EdgeLake operator node
 via Kubernetes Custom Resources.
 """
 
+import asyncio
 import logging
-from typing import Any
+import math
+import os
+from datetime import datetime, timezone
+from typing import Any, Optional
 
 import kopf
 import kubernetes
+from kubernetes.client.rest import ApiException
+from pydantic import ValidationError
 
-from .constants import API_GROUP, API_VERSION, PLURAL
+from .constants import (
+    ANNOTATION_CREDENTIALS_HASH,
+    ANNOTATION_PROFILE_HASH,
+    ANNOTATION_RETAINED,
+    API_GROUP,
+    API_VERSION,
+    CREDENTIAL_ROLLOUT_TICK,
+    DEFAULT_CREDENTIAL_BATCH_INTERVAL,
+    DEFAULT_CREDENTIAL_BATCH_SIZE,
+    DEFAULT_DEBOUNCE_MAX_DELAY,
+    DEFAULT_DEBOUNCE_WINDOW,
+    DEFAULT_REST_PORT,
+    FLEET_API_PORT,
+    LABEL_CREDENTIALS,
+    LABEL_SEED_SNAPSHOT,
+    METRICS_PORT,
+    NODE_TYPE_QUERY,
+    ORPHAN_SWEEP_INTERVAL,
+    PLURAL,
+    POD_LABEL_SELECTOR,
+    PROFILE_FIELDS,
+    PROFILE_PLURAL,
+    WEBHOOK_CERT_DIR,
+    WEBHOOK_CONFIGURATION,
+    WEBHOOK_PORT,
+)
+from .models.profile import EdgeLakeProfileSpec, ProfilePhase
 from .models.spec import EdgeLakeOperatorSpec
-from .models.status import ConditionStatus, ConditionType, OperatorPhase
-from .resources import configmap, deployment, pvc, secret, service
-from .utils.hashing import compute_config_hash
-from .utils.kubernetes import apply_resource, check_deployment_ready, delete_resource
+from .models.status import ConditionStatus, ConditionType, OperatorPhase, OperatorStatus
+from .resources import configmap, deployment, pvc, scripts, secret, service, snapshot
+from .utils.autoscaling import (
+    cooldown_elapsed,
+    desired_replicas,
+    histogram_delta,
+    histogram_percentile,
+    merge_histograms,
+)
+from .utils.batches import batch_due, batch_progress
+from .utils.buffers import compute_thresholds, thresholds_changed
+from .utils.credentials import (
+    Rotation,
+    credential_rollout,
+    credentials_hash,
+    rotation_status,
+)
+from .utils.debounce import update_debouncer, write_digest
+from .utils.fleet import fleet_cache, start_fleet_server
+from .utils.hashing import UNHASHED_FIELDS, compute_config_hash
+from .utils.journal import apply_step
+from .utils.kubernetes import (
+    annotate_collection,
+    annotate_edgelake_operator,
+    annotate_pod_template,
+    apply_resource,
+    check_deployment_ready,
+    delete_collection,
+    delete_pod,
+    delete_resource,
+    get_edgelake_operator,
+    get_pod_template_annotations,
+    instance_selector,
+    label_secret,
+    list_endpoint_zones,
+    list_instance_pods,
+    list_pod_events,
+    list_volume_snapshots,
+    patch_edgelake_operator_status,
+    prune_config_maps,
+    read_secret_data,
+    scale_edgelake_operator,
+)
+from .utils.maintenance import drop_offset_seconds, is_staggered, maintenance_window_seconds
+from .utils.metrics import (
+    MQTT_GROUP_MESSAGE_RATE,
+    MQTT_MESSAGE_RATE,
+    NODEPORTS_FREE,
+    ROLLOUT_DURATION_SECONDS,
+    ROLLOUT_PHASE_SECONDS,
+    UPDATE_DEBOUNCE_SECONDS,
+    UPDATE_WRITES_COALESCED,
+    start_metrics_server,
+)
+from .utils.node_stats import (
+    compute_rate,
+    parse_in_flight_queries,
+    parse_msg_client_messages,
+    parse_query_times,
+    parse_streaming_rows,
+)
+from .utils.nodeports import node_port_allocator, rejected_node_ports, with_allocated_ports
+from .utils.orphans import sweep_orphans
+from .utils.profiles import (
+    missing_profile,
+    profile_hash,
+    profile_name,
+    profile_store,
+    resolve_profile,
+)
+from .utils.rest import RestCommandError, is_node_ready, run_command
+from .utils.rollout import build_timeline, container_started_at, rollout_tracker
+from .utils.shared_groups import shared_group_rates
+from .utils.tunables import LIVE_TUNABLE_FIELDS, live_tuning_status, push_live_tunables
+from .utils.units import format_duration, format_size, parse_duration
 from .utils.validation import validate_spec
 
 logger = logging.getLogger(__name__)
@@ -28,19 +131,223 @@ def configure(settings: kopf.OperatorSettings, **_: Any) -> None:
     settings.watching.connect_timeout = 60
     settings.watching.server_timeout = 300
     settings.persistence.finalizer = "edgelake.io/cleanup"
+    # Watch only EdgeLake pods; handler label filters are applied client-side
+    settings.watching.label_selectors["", "v1", "pods"] = POD_LABEL_SELECTOR
+    # Watch only the Secrets holding credentials of CRs that roll on rotation
+    settings.watching.label_selectors["", "v1", "secrets"] = LABEL_CREDENTIALS
+    start_metrics_server(METRICS_PORT)
+    _configure_admission(settings)
     logger.info("EdgeLake Operator started")
 
 
+@kopf.on.startup()
+async def start_orphan_sweeper(memo: kopf.Memo, **_: Any) -> None:
+    """Start the periodic sweep for orphaned PVCs and Secrets."""
+    memo.orphan_sweeper = asyncio.create_task(_run_orphan_sweeper())
+
+
+@kopf.on.cleanup()
+async def stop_orphan_sweeper(memo: kopf.Memo, **_: Any) -> None:
+    """Stop the orphan sweeper when the operator exits."""
+    memo.orphan_sweeper.cancel()
+
+
+@kopf.on.startup()
+async def start_credential_rollout(memo: kopf.Memo, **_: Any) -> None:
+    """Start rolling the CRs queued for rotated credentials, a batch at a time."""
+    memo.credential_rollout = asyncio.create_task(_run_credential_rollout())
+
+
+@kopf.on.cleanup()
+async def stop_credential_rollout(memo: kopf.Memo, **_: Any) -> None:
+    """Stop the credential rollout when the operator exits."""
+    memo.credential_rollout.cancel()
+
+
+@kopf.on.startup()
+async def start_fleet_api(memo: kopf.Memo, **_: Any) -> None:
+    """Serve the cached fleet status over HTTP."""
+    memo.fleet_runner = await start_fleet_server(FLEET_API_PORT)
+
+
+@kopf.on.cleanup()
+async def stop_fleet_api(memo: kopf.Memo, **_: Any) -> None:
+    """Stop the fleet status HTTP server."""
+    await memo.fleet_runner.cleanup()
+
+
+@kopf.on.event(API_GROUP, API_VERSION, PLURAL)
+def cache_fleet_status(event: dict[str, Any], body: dict[str, Any], **_: Any) -> None:
+    """Keep the fleet cache in sync with every EdgeLakeOperator watch event."""
+    if event.get("type") == "DELETED":
+        fleet_cache.remove(body["metadata"].get("namespace"), body["metadata"].get("name"))
+    else:
+        fleet_cache.update(body)
+
+
+@kopf.on.event(API_GROUP, API_VERSION, PLURAL)
+def track_allocated_ports(
+    event: dict[str, Any], body: dict[str, Any], name: str, namespace: str, **_: Any
+) -> None:
+    """Keep the ports in every CR's status.allocatedPorts reserved, e.g. after a restart.
+
+    The ports of a CR that is deleted or turned autoAllocatePorts off are freed.
+    """
+    auto_allocate = ((body.get("spec") or {}).get("networking") or {}).get("autoAllocatePorts")
+    allocated = _allocated_ports(body.get("status") or {})
+    if event.get("type") == "DELETED" or not auto_allocate:
+        if node_port_allocator.release(namespace, name):
+            NODEPORTS_FREE.set(node_port_allocator.free())
+    elif allocated:
+        node_port_allocator.reserve(namespace, name, allocated)
+        NODEPORTS_FREE.set(node_port_allocator.free())
+
+
+@kopf.on.event("", "v1", "services")
+def track_node_ports(
+    event: dict[str, Any], body: dict[str, Any], name: str, namespace: str, **_: Any
+) -> None:
+    """Keep the NodePort bitmap in sync with the node ports of every Service."""
+    if event.get("type") == "DELETED":
+        node_port_allocator.forget_service(namespace, name)
+    else:
+        ports = [port.get("nodePort") for port in (body.get("spec") or {}).get("ports") or []]
+        node_port_allocator.observe_service(namespace, name, [port for port in ports if port])
+    NODEPORTS_FREE.set(node_port_allocator.free())
+
+
+@kopf.on.event(API_GROUP, API_VERSION, PLURAL)
+def record_debounced_write(
+    event: dict[str, Any], body: dict[str, Any], name: str, namespace: str, **_: Any
+) -> None:
+    """Count every write to a CR whose update is held back by reconcile.debounce."""
+    if event.get("type") != "DELETED":
+        update_debouncer.record(namespace, name, write_digest(body), datetime.now(timezone.utc))
+
+
+async def _run_orphan_sweeper() -> None:
+    """Sweep orphaned PVCs, Secrets and seed snapshots every ORPHAN_SWEEP_INTERVAL seconds."""
+    delete = os.environ.get("ORPHAN_SWEEP_DELETE", "false").lower() == "true"
+    while True:
+        await asyncio.sleep(ORPHAN_SWEEP_INTERVAL)
+        try:
+            await sweep_orphans(delete)
+        except Exception as e:
+            logger.warning(f"Orphan sweep failed: {e}")
+
+
+async def _run_credential_rollout() -> None:
+    """Send the next batch of every credential rotation every CREDENTIAL_ROLLOUT_TICK seconds."""
+    batch_size = int(
+        os.environ.get("CREDENTIAL_ROLLOUT_BATCH_SIZE", DEFAULT_CREDENTIAL_BATCH_SIZE)
+    )
+    interval = os.environ.get("CREDENTIAL_ROLLOUT_INTERVAL", DEFAULT_CREDENTIAL_BATCH_INTERVAL)
+    while True:
+        await asyncio.sleep(CREDENTIAL_ROLLOUT_TICK)
+        for namespace, secret_name, rotation in credential_rollout.rotations():
+            try:
+                _roll_credential_batch(namespace, secret_name, rotation, batch_size, interval)
+            except Exception as e:
+                logger.warning(f"Credential rollout of {namespace}/{secret_name} failed: {e}")
+
+
+def _configure_admission(settings: kopf.OperatorSettings) -> None:
+    """Serve the admission webhooks when the operator runs behind its webhook Service.
+
+    WEBHOOK_HOST is the DNS name of the Service. If a certificate is mounted in
+    WEBHOOK_CERT_DIR (e.g. by cert-manager) it is used, otherwise kopf generates a
+    self-signed one. kopf keeps the webhook configurations and their caBundle in sync.
+    """
+    host = os.environ.get("WEBHOOK_HOST")
+    if not host:
+        logger.info("WEBHOOK_HOST not set, admission webhooks disabled")
+        return
+
+    certfile = os.path.join(WEBHOOK_CERT_DIR, "tls.crt")
+    cafile = os.path.join(WEBHOOK_CERT_DIR, "ca.crt")
+    has_cert = os.path.exists(certfile)
+    settings.admission.server = kopf.WebhookServer(
+        addr="0.0.0.0",
+        port=WEBHOOK_PORT,
+        host=host,
+        certfile=certfile if has_cert else None,
+        pkeyfile=os.path.join(WEBHOOK_CERT_DIR, "tls.key") if has_cert else None,
+        cafile=cafile if has_cert and os.path.exists(cafile) else None,
+    )
+    settings.admission.managed = WEBHOOK_CONFIGURATION
+    logger.info(f"Serving admission webhooks for {host} on port {WEBHOOK_PORT}")
+
+
+@kopf.on.mutate(API_GROUP, API_VERSION, PLURAL, operations=["CREATE", "UPDATE"])
+def default_edgelake_operator(
+    spec: dict[str, Any], namespace: str, patch: kopf.Patch, **_: Any
+) -> None:
+    """Store every EdgeLakeOperator with all defaults filled in.
+
+    The config hash is computed from the stored spec, so a fully defaulted spec
+    keeps the hash stable when defaults change in a new operator release. Only
+    fields missing from the spec are patched; values the user set are left as
+    written.
+    """
+    if missing_profile(spec, namespace):
+        return  # Left as written until its profile exists, like validation
+    try:
+        operator_spec = EdgeLakeOperatorSpec.from_dict(resolve_profile(spec, namespace))
+    except ValidationError:
+        return  # Rejected by the validating webhook
+    for field, value in _missing_fields(spec, operator_spec.to_dict()).items():
+        # Sections layered over a profile are resolved at reconcile time, not stored
+        if profile_name(spec) and field in PROFILE_FIELDS:
+            continue
+        patch.spec[field] = value
+
+
+def _missing_fields(stored: dict[str, Any], defaulted: dict[str, Any]) -> dict[str, Any]:
+    """Return the fields of the defaulted spec that the stored spec does not set.
+
+    Nested sections are compared field by field, so the result can be merged
+    into the stored spec. Lists are kept whole as the user wrote them.
+    """
+    missing = {}
+    for field, value in defaulted.items():
+        if field not in stored:
+            missing[field] = value
+        elif isinstance(value, dict) and isinstance(stored[field], dict):
+            nested = _missing_fields(stored[field], value)
+            if nested:
+                missing[field] = nested
+    return missing
+
+
+@kopf.on.validate(API_GROUP, API_VERSION, PLURAL, operations=["CREATE", "UPDATE"])
+def validate_edgelake_operator(spec: dict[str, Any], namespace: str, **_: Any) -> None:
+    """Reject invalid specs at admission time instead of in the create handler."""
+    if missing_profile(spec, namespace):
+        return  # Validated once the profile exists (the handlers wait for it)
+    try:
+        operator_spec = EdgeLakeOperatorSpec.from_dict(resolve_profile(spec, namespace))
+    except ValidationError as e:
+        model_errors = [
+            f"spec.{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+            for error in e.errors()
+        ]
+        raise kopf.AdmissionError(f"Invalid spec: {'; '.join(model_errors)}", code=422)
+    validation_errors = validate_spec(operator_spec)
+    if validation_errors:
+        raise kopf.AdmissionError(f"Validation failed: {'; '.join(validation_errors)}", code=422)
+
+
 @kopf.on.create(API_GROUP, API_VERSION, PLURAL)
 async def create_edgelake_operator(
     body: dict[str, Any],
     spec: dict[str, Any],
     name: str,
     namespace: str,
+    status: dict[str, Any],
     logger: logging.Logger,
     patch: kopf.Patch,
     **_: Any,
-) -> dict[str, Any]:
+) -> None:
     """Handle creation of EdgeLakeOperator resource.
 
     Creates all required Kubernetes resources:
@@ -49,15 +356,28 @@ async def create_edgelake_operator(
     - PersistentVolumeClaims (if persistence enabled)
     - Service
     - Deployment
+
+    Each step is journaled in status.journal as soon as it is applied, so a
+    retry resumes from the first step that has not been applied yet.
+
+    Status is written through the patch: kopf would store a returned value
+    under status.create_edgelake_operator, which the status schema prunes.
     """
     logger.info(f"Creating EdgeLakeOperator: {namespace}/{name}")
 
+    if missing := missing_profile(spec, namespace):
+        raise kopf.TemporaryError(f"EdgeLakeProfile {namespace}/{missing} not found", delay=30)
+    spec = resolve_profile(spec, namespace)
+
     # Update status to Creating
     patch.status["phase"] = OperatorPhase.CREATING.value
 
     try:
         # Parse and validate spec
         operator_spec = EdgeLakeOperatorSpec.from_dict(spec)
+        if operator_spec.networking.autoAllocatePorts:
+            spec = _allocate_node_ports(name, namespace, spec, status, patch, logger)
+            operator_spec = EdgeLakeOperatorSpec.from_dict(spec)
         validation_errors = validate_spec(operator_spec)
         if validation_errors:
             error_msg = "; ".join(validation_errors)
@@ -68,68 +388,106 @@ async def create_edgelake_operator(
         resource_names = _generate_resource_names(name)
 
         created_resources: dict[str, Any] = {}
+        journal = dict(status.get("journal") or {})
 
         # 1. Create Secret (if using inline secrets)
         if operator_spec.has_inline_secrets():
             secret_resource = secret.build_secret(name, namespace, operator_spec, resource_names)
             if secret_resource:
                 kopf.adopt(secret_resource, owner=body)
-                await apply_resource(secret_resource, namespace)
+                await apply_step(name, namespace, journal, "secret", secret_resource)
                 created_resources["secret"] = resource_names["secret"]
                 logger.info(f"Created Secret: {resource_names['secret']}")
 
         # 2. Create ConfigMap
-        configmap_resource = configmap.build_configmap(
-            name, namespace, operator_spec, resource_names
+        configmap_resource, scripts_resource = _build_configmaps(
+            name, namespace, operator_spec, resource_names, body
         )
         kopf.adopt(configmap_resource, owner=body)
-        await apply_resource(configmap_resource, namespace)
+        await apply_step(name, namespace, journal, "configmap", configmap_resource)
         created_resources["configmap"] = resource_names["configmap"]
         logger.info(f"Created ConfigMap: {resource_names['configmap']}")
 
+        # 2b. Create generated scripts ConfigMap (if any scripts are needed)
+        if scripts_resource:
+            kopf.adopt(scripts_resource, owner=body)
+            await apply_step(name, namespace, journal, "scripts", scripts_resource)
+            logger.info(f"Created scripts ConfigMap: {resource_names['scripts_configmap']}")
+        _set_partition_maintenance_status(operator_spec, body, patch)
+        _set_aggregations_status(operator_spec, patch)
+
         # 3. Create PVCs (if persistence enabled)
-        if operator_spec.persistence.enabled:
-            pvc_resources = pvc.build_pvcs(name, namespace, operator_spec, resource_names)
+        if operator_spec.uses_persistence():
+            seed_snapshot = _resolve_seed_snapshot(namespace, operator_spec, status, patch)
+            pvc_resources = pvc.build_pvcs(
+                name, namespace, operator_spec, resource_names, seed_snapshot
+            )
             pvc_names = []
             for pvc_resource in pvc_resources:
                 # Don't adopt PVCs if we want to retain them on delete
                 if not operator_spec.persistence.retainOnDelete:
                     kopf.adopt(pvc_resource, owner=body)
-                await apply_resource(pvc_resource, namespace)
-                pvc_names.append(pvc_resource["metadata"]["name"])
+                pvc_name = pvc_resource["metadata"]["name"]
+                await apply_step(name, namespace, journal, f"pvc/{pvc_name}", pvc_resource)
+                pvc_names.append(pvc_name)
             created_resources["pvcs"] = pvc_names
             logger.info(f"Created PVCs: {pvc_names}")
 
         # 4. Create Service
         service_resource = service.build_service(name, namespace, operator_spec, resource_names)
         kopf.adopt(service_resource, owner=body)
-        await apply_resource(service_resource, namespace)
+        try:
+            await apply_step(name, namespace, journal, "service", service_resource)
+        except ApiException as e:
+            _reallocate_rejected_ports(e, name, namespace, operator_spec, patch)
         created_resources["service"] = resource_names["service"]
         logger.info(f"Created Service: {resource_names['service']}")
 
+        # 4b. Create headless peer Service (if enabled)
+        if operator_spec.networking.routing.peerService:
+            peer_resource = service.build_peer_service(
+                name, namespace, operator_spec, resource_names
+            )
+            kopf.adopt(peer_resource, owner=body)
+            await apply_step(name, namespace, journal, "peer-service", peer_resource)
+            logger.info(f"Created peer Service: {resource_names['peer_service']}")
+
         # 5. Create Deployment
         config_hash = compute_config_hash(spec)
+        _label_credential_secrets(namespace, operator_spec, resource_names)
         deployment_resource = deployment.build_deployment(
-            name, namespace, operator_spec, resource_names, config_hash=config_hash
+            name,
+            namespace,
+            operator_spec,
+            resource_names,
+            config_hash=config_hash,
+            credentials_hash=_credentials_hash(namespace, operator_spec, resource_names),
         )
         kopf.adopt(deployment_resource, owner=body)
-        await apply_resource(deployment_resource, namespace)
+        if await apply_step(name, namespace, journal, "deployment", deployment_resource):
+            _begin_rollout(namespace, name, operator_spec, config_hash)
         created_resources["deployment"] = resource_names["deployment"]
         logger.info(f"Created Deployment: {resource_names['deployment']}")
 
-        # Build status response
-        return {
-            "phase": OperatorPhase.RUNNING.value,
-            "deploymentName": resource_names["deployment"],
-            "serviceName": resource_names["service"],
-            "configMapName": resource_names["configmap"],
-            "secretName": created_resources.get("secret"),
-            "pvcNames": created_resources.get("pvcs", []),
-            "endpoints": _build_endpoints(operator_spec, namespace, resource_names),
-            "observedGeneration": body["metadata"].get("generation", 1),
-        }
+        # Scale subresource (kubectl scale, HPA and the query autoscaler)
+        selector_labels = deployment_resource["spec"]["selector"]["matchLabels"]
+        patch.status["replicas"] = operator_spec.replicas
+        patch.status["selector"] = ",".join(f"{k}={v}" for k, v in selector_labels.items())
+
+        # All steps done; the journal is only needed to resume an interrupted create
+        patch.status["journal"] = None
 
-    except kopf.PermanentError:
+        patch.status["phase"] = OperatorPhase.RUNNING.value
+        patch.status["deploymentName"] = resource_names["deployment"]
+        patch.status["serviceName"] = resource_names["service"]
+        patch.status["configMapName"] = resource_names["configmap"]
+        patch.status["secretName"] = created_resources.get("secret")
+        patch.status["pvcNames"] = created_resources.get("pvcs", [])
+        patch.status["endpoints"] = _build_endpoints(operator_spec, namespace, resource_names)
+        patch.status["observedGeneration"] = body["metadata"].get("generation", 1)
+        patch.status["profileHash"] = _annotated_profile_hash(body)
+
+    except (kopf.PermanentError, kopf.TemporaryError):
         raise
     except Exception as e:
         logger.error(f"Failed to create EdgeLakeOperator: {e}")
@@ -150,27 +508,58 @@ async def update_edgelake_operator(
     logger: logging.Logger,
     patch: kopf.Patch,
     **_: Any,
-) -> dict[str, Any]:
+) -> None:
     """Handle updates to EdgeLakeOperator resource.
 
     Updates ConfigMap and triggers rolling restart if configuration changed.
     """
     logger.info(f"Updating EdgeLakeOperator: {namespace}/{name}")
 
+    if missing := missing_profile(spec, namespace):
+        raise kopf.TemporaryError(f"EdgeLakeProfile {namespace}/{missing} not found", delay=30)
+    spec = resolve_profile(spec, namespace)
+
+    # Hold the update back until the burst of writes is over; the retry's diff covers them all
+    wait = _debounce_wait(spec, namespace, name, body)
+    if wait:
+        raise kopf.TemporaryError(f"Coalescing writes, applying in {wait:.1f}s", delay=wait)
+    writes, held_back = update_debouncer.finish(namespace, name, datetime.now(timezone.utc))
+    if writes > 1:
+        UPDATE_WRITES_COALESCED.labels(namespace, name).inc(writes - 1)
+        UPDATE_DEBOUNCE_SECONDS.observe(held_back)
+        logger.info(f"Applying {writes} coalesced writes after {held_back:.1f}s")
+
     patch.status["phase"] = OperatorPhase.UPDATING.value
 
     try:
         operator_spec = EdgeLakeOperatorSpec.from_dict(spec)
+        # Turning autoAllocatePorts on (or adding a broker) allocates; turning it off frees
+        if operator_spec.networking.autoAllocatePorts:
+            spec = _allocate_node_ports(name, namespace, spec, status, patch, logger)
+            operator_spec = EdgeLakeOperatorSpec.from_dict(spec)
+        else:
+            _release_node_ports(name, namespace, status, patch, logger)
         validation_errors = validate_spec(operator_spec)
         if validation_errors:
             error_msg = "; ".join(validation_errors)
             raise kopf.PermanentError(f"Validation failed: {error_msg}")
 
         resource_names = _generate_resource_names(name)
+        # Resolves the names of immutable ConfigMaps, which the Deployment references
+        configmap_resources = _build_configmaps(
+            name, namespace, operator_spec, resource_names, body
+        )
 
-        # Determine what changed
-        config_changed = _config_fields_changed(diff)
+        # Determine what changed (a profile change arrives as a new profile hash annotation)
+        profile_changed = _profile_changed(diff)
+        config_changed = _config_fields_changed(diff) or profile_changed
         secrets_changed = _secrets_changed(diff)
+        # Routing options only change the Services
+        if _only_routing_changed(diff):
+            config_changed = False
+
+        # A new *SecretRef target is only seen by the Secret watch once labelled
+        _label_credential_secrets(namespace, operator_spec, resource_names)
 
         # Update Secret if secrets changed
         if secrets_changed and operator_spec.has_inline_secrets():
@@ -180,40 +569,97 @@ async def update_edgelake_operator(
                 await apply_resource(secret_resource, namespace)
                 logger.info(f"Updated Secret: {resource_names['secret']}")
 
+        # Only live-tunable fields changed: push them to the running pods, no rollout.
+        # An immutable ConfigMap cannot be updated for later pods, so it always rolls out.
+        immutable_configmaps = operator_spec.advanced.immutableConfigMaps
+        live_fields = (
+            _live_tunable_changes(diff)
+            if config_changed and not profile_changed and not immutable_configmaps
+            else []
+        )
+        if live_fields:
+            await _apply_configmaps(
+                namespace, operator_spec, resource_names, configmap_resources, body, patch
+            )
+            await _push_live_tunables(name, namespace, operator_spec, live_fields, patch)
+
         # Update ConfigMap if configuration changed
-        if config_changed:
-            configmap_resource = configmap.build_configmap(
-                name, namespace, operator_spec, resource_names
+        elif config_changed:
+            await _apply_configmaps(
+                namespace, operator_spec, resource_names, configmap_resources, body, patch
             )
-            kopf.adopt(configmap_resource, owner=body)
-            await apply_resource(configmap_resource, namespace)
-            logger.info(f"Updated ConfigMap: {resource_names['configmap']}")
 
             # Trigger rolling restart by updating deployment with new config hash
             config_hash = compute_config_hash(spec)
             deployment_resource = deployment.build_deployment(
-                name, namespace, operator_spec, resource_names, config_hash=config_hash
+                name,
+                namespace,
+                operator_spec,
+                resource_names,
+                config_hash=config_hash,
+                credentials_hash=_credentials_hash(namespace, operator_spec, resource_names),
             )
             kopf.adopt(deployment_resource, owner=body)
             await apply_resource(deployment_resource, namespace)
+            _begin_rollout(namespace, name, operator_spec, config_hash)
             logger.info(f"Updated Deployment (config hash: {config_hash})")
 
+            # Live-tunable fields are not in the config hash; push the profile's values
+            profile_live_fields = _profile_live_tunables(spec, namespace)
+            if profile_changed and profile_live_fields and not immutable_configmaps:
+                await _push_live_tunables(
+                    name, namespace, operator_spec, profile_live_fields, patch
+                )
+
+        if (live_fields or not config_changed) and _replicas_changed(diff):
+            # Same config hash, so only the replica count changes; no restart
+            deployment_resource = deployment.build_deployment(
+                name,
+                namespace,
+                operator_spec,
+                resource_names,
+                config_hash=compute_config_hash(spec),
+                credentials_hash=_credentials_hash(namespace, operator_spec, resource_names),
+            )
+            kopf.adopt(deployment_resource, owner=body)
+            await apply_resource(deployment_resource, namespace)
+            logger.info(f"Scaled Deployment to {operator_spec.replicas} replicas")
+        patch.status["replicas"] = operator_spec.replicas
+
         # Update Service if networking changed
         if _networking_changed(diff):
             service_resource = service.build_service(
                 name, namespace, operator_spec, resource_names
             )
             kopf.adopt(service_resource, owner=body)
-            await apply_resource(service_resource, namespace)
+            try:
+                await apply_resource(service_resource, namespace)
+            except ApiException as e:
+                _reallocate_rejected_ports(e, name, namespace, operator_spec, patch)
             logger.info(f"Updated Service: {resource_names['service']}")
 
-        return {
-            "phase": OperatorPhase.RUNNING.value,
-            "observedGeneration": body["metadata"].get("generation", 1),
-            "endpoints": _build_endpoints(operator_spec, namespace, resource_names),
-        }
+            if operator_spec.networking.routing.peerService:
+                peer_resource = service.build_peer_service(
+                    name, namespace, operator_spec, resource_names
+                )
+                kopf.adopt(peer_resource, owner=body)
+                await apply_resource(peer_resource, namespace)
+                logger.info(f"Updated peer Service: {resource_names['peer_service']}")
+            elif await delete_resource("Service", resource_names["peer_service"], namespace):
+                logger.info(f"Deleted peer Service: {resource_names['peer_service']}")
+
+        patch.status["phase"] = OperatorPhase.RUNNING.value
+        patch.status["observedGeneration"] = body["metadata"].get("generation", 1)
+        # roll_profile's batch is done once each CR reports the annotated hash as applied
+        patch.status["profileHash"] = _annotated_profile_hash(body)
+        # Switched off immutableConfigMaps: the hashed revisions are pruned once rolled out
+        previous_config_map = status.get("configMapName") or resource_names["configmap"]
+        if not immutable_configmaps and previous_config_map != resource_names["configmap"]:
+            patch.status["staleConfigMapRevisions"] = True
+        patch.status["configMapName"] = resource_names["configmap"]
+        patch.status["endpoints"] = _build_endpoints(operator_spec, namespace, resource_names)
 
-    except kopf.PermanentError:
+    except (kopf.PermanentError, kopf.TemporaryError):
         raise
     except Exception as e:
         logger.error(f"Failed to update EdgeLakeOperator: {e}")
@@ -226,38 +672,43 @@ async def delete_edgelake_operator(
     body: dict[str, Any],
     name: str,
     namespace: str,
-    status: dict[str, Any],
     logger: logging.Logger,
     **_: Any,
 ) -> None:
     """Handle deletion of EdgeLakeOperator resource.
 
-    Resources with owner references are automatically garbage collected.
-    PVCs may be retained based on retainOnDelete setting.
+    Owned resources are deleted by label selector, one deletecollection call per
+    kind, rather than waiting for garbage collection. Selecting by label also
+    catches resources of a create that failed before its status was written.
+    With retainOnDelete, PVCs and seed snapshots are kept and annotated so
+    the orphan sweeper leaves them alone.
     """
     logger.info(f"Deleting EdgeLakeOperator: {namespace}/{name}")
+    update_debouncer.forget(namespace, name)
+    shared_group_rates.forget(namespace, name)
+    if released := node_port_allocator.release(namespace, name):
+        logger.info(f"Released NodePorts {sorted(released.values())}")
 
-    resource_names = _generate_resource_names(name)
-
-    # Most resources are deleted automatically via owner references
-    # But we may want to explicitly delete PVCs if they weren't adopted
+    selector = instance_selector(name)
+    for kind in ["Deployment", "Service", "ConfigMap", "Secret"]:
+        await delete_collection(kind, namespace, selector)
 
-    # Check if PVCs should be deleted
     spec = body.get("spec", {})
     persistence = spec.get("persistence", {})
     retain_on_delete = persistence.get("retainOnDelete", True)
 
     if not retain_on_delete:
-        # Delete PVCs explicitly
-        pvc_names = status.get("pvcNames", [])
-        for pvc_name in pvc_names:
-            try:
-                await delete_resource("PersistentVolumeClaim", pvc_name, namespace)
-                logger.info(f"Deleted PVC: {pvc_name}")
-            except Exception as e:
-                logger.warning(f"Failed to delete PVC {pvc_name}: {e}")
+        await delete_collection("PersistentVolumeClaim", namespace, selector)
+        await delete_collection("VolumeSnapshot", namespace, selector)
+        logger.info("Deleted PVCs and seed snapshots")
     else:
-        logger.info("Retaining PVCs (retainOnDelete=true)")
+        retained_at = datetime.now(timezone.utc).isoformat()
+        for kind in ["PersistentVolumeClaim", "VolumeSnapshot"]:
+            retained = annotate_collection(
+                kind, namespace, selector, {ANNOTATION_RETAINED: retained_at}
+            )
+            if retained:
+                logger.info(f"Retaining {kind} {', '.join(retained)} (retainOnDelete=true)")
 
     logger.info(f"EdgeLakeOperator {namespace}/{name} deleted successfully")
 
@@ -273,28 +724,978 @@ async def monitor_edgelake_operator(
     patch: kopf.Patch,
     **_: Any,
 ) -> None:
-    """Periodic health check of EdgeLake deployment."""
-    current_phase = status.get("phase")
+    """Periodic health check of EdgeLake deployment.
 
-    if current_phase != OperatorPhase.RUNNING.value:
+    The Deployment's readiness is recorded in the Ready and Degraded conditions,
+    which the fleet view reports per node.
+    """
+    deployment_name = status.get("deploymentName")
+    if not deployment_name:
         return
 
     try:
-        deployment_name = status.get("deploymentName")
-        if deployment_name:
-            is_ready = check_deployment_ready(deployment_name, namespace)
-            if not is_ready:
-                logger.warning(f"Deployment {deployment_name} not fully ready")
+        is_ready = check_deployment_ready(deployment_name, namespace)
+        _set_health_conditions(deployment_name, is_ready, status, patch)
+        # Not gated on the phase: a CR whose last update failed still has revisions to
+        # remove, and its ready pods still serve clients reading the zone endpoints
+        if is_ready:
+            _prune_config_map_revisions(body, spec, name, namespace, status, patch, logger)
+        # Ready endpoints only; a pod that turns unready leaves its zone's list
+        _publish_zone_endpoints(name, namespace, spec, status, patch)
+
+        if status.get("phase") != OperatorPhase.RUNNING.value:
+            return
+        if not is_ready:
+            logger.warning(f"Deployment {deployment_name} not fully ready")
     except Exception as e:
         logger.error(f"Health check failed: {e}")
 
 
+@kopf.timer(
+    API_GROUP,
+    API_VERSION,
+    PLURAL,
+    interval=300,
+    initial_delay=60,
+    when=lambda spec, **_: spec.get("persistence", {}).get("seedSnapshot", {}).get("enabled", False),
+)
+async def snapshot_seed_volume(
+    body: dict[str, Any],
+    spec: dict[str, Any],
+    name: str,
+    namespace: str,
+    status: dict[str, Any],
+    logger: logging.Logger,
+    patch: kopf.Patch,
+    **_: Any,
+) -> None:
+    """Take scheduled VolumeSnapshots of a seed node's blockchain PVC.
+
+    New nodes restore from the newest ready snapshot (persistence.blockchain.fromSeed)
+    and start with a synced ledger instead of pulling everything from the master.
+    """
+    if status.get("phase") != OperatorPhase.RUNNING.value:
+        return
+
+    try:
+        operator_spec = EdgeLakeOperatorSpec.from_dict(resolve_profile(spec, namespace))
+        seed_spec = operator_spec.persistence.seedSnapshot
+        seed_status = status.get("seedSnapshot", {})
+
+        now = datetime.now(timezone.utc)
+        last_created = seed_status.get("createdAt")
+        if last_created:
+            elapsed = (now - datetime.fromisoformat(last_created)).total_seconds()
+            if elapsed < parse_duration(seed_spec.interval):
+                return
+
+        resource_names = _generate_resource_names(name)
+        snapshot_resource = snapshot.build_seed_snapshot(
+            name, namespace, operator_spec, resource_names, now.strftime("%Y%m%d%H%M%S")
+        )
+        await apply_resource(snapshot_resource, namespace)
+        snapshot_name = snapshot_resource["metadata"]["name"]
+        logger.info(f"Created seed VolumeSnapshot: {snapshot_name}")
+
+        # Prune old snapshots beyond the retention count
+        snapshots = list_volume_snapshots(namespace, f"{LABEL_SEED_SNAPSHOT}={name}")
+        while len(snapshots) > seed_spec.keep:
+            expired = snapshots.pop(0)["metadata"]["name"]
+            await delete_resource("VolumeSnapshot", expired, namespace)
+            logger.info(f"Pruned seed VolumeSnapshot: {expired}")
+
+        patch.status["seedSnapshot"] = {
+            "name": snapshot_name,
+            "createdAt": now.isoformat(),
+            "snapshots": [s["metadata"]["name"] for s in snapshots],
+        }
+    except Exception as e:
+        logger.error(f"Seed snapshot failed: {e}")
+
+
+@kopf.index(API_GROUP, API_VERSION, PLURAL)
+def credential_secrets(
+    spec: dict[str, Any], name: str, namespace: str, **_: Any
+) -> dict[tuple[str, str], str]:
+    """Index the Secrets holding credentials of CRs that roll on rotation."""
+    if not (spec.get("secrets") or {}).get("rolloutOnRotation"):
+        return {}
+    operator_spec = EdgeLakeOperatorSpec.from_dict(resolve_profile(spec, namespace))
+    refs = secret.credential_refs(operator_spec, _generate_resource_names(name))
+    return {(namespace, secret_name): name for secret_name, _key in refs.values()}
+
+
+@kopf.on.event(
+    "",
+    "v1",
+    "secrets",
+    when=lambda name, namespace, credential_secrets, **_: (
+        (namespace, name) in credential_secrets
+    ),
+)
+async def queue_rotated_credentials(
+    event: dict[str, Any],
+    name: str,
+    namespace: str,
+    credential_secrets: kopf.Index,
+    **_: Any,
+) -> None:
+    """Queue every CR whose credentials changed in the Secret for a rolling restart.
+
+    The digest in the pod template is compared with the Secret's contents, so
+    the initial listing after an operator restart also catches rotations that
+    happened while it was down, and a resync without changes does nothing. The
+    queued CRs are rolled in batches by _roll_credential_batch.
+    """
+    if event.get("type") == "DELETED":
+        return
+
+    for cr_name in sorted(set(credential_secrets[(namespace, name)])):
+        digest = _stale_credentials_hash(cr_name, namespace)
+        if digest and credential_rollout.queue(namespace, name, cr_name):
+            logger.info(f"Credentials in Secret {namespace}/{name} rotated, queued {cr_name}")
+            now = datetime.now(timezone.utc).isoformat()
+            queued = {"secret": name, "credentialsHash": digest, "queuedAt": now}
+            patch_edgelake_operator_status(cr_name, namespace, {"credentialRotation": queued})
+
+
+def _roll_credential_batch(
+    namespace: str, secret_name: str, rotation: Rotation, batch_size: int, interval: str
+) -> None:
+    """Roll the next batch of CRs queued for a rotated Secret.
+
+    Uses the gating of the profile rollout: a batch is sent once the interval
+    has passed since the previous one and the Deployments of the previous batch
+    are ready again. A CR of the previous batch that failed holds the rest back
+    until it recovers.
+    """
+    now = datetime.now(timezone.utc)
+    if not batch_due(rotation.last_batch_at, interval, now):
+        return
+
+    def unfinished_phase(cr_name: str) -> Optional[str]:
+        summary = fleet_cache.get(namespace, cr_name)
+        deployment_name = _generate_resource_names(cr_name)["deployment"]
+        if summary is None or check_deployment_ready(deployment_name, namespace):
+            return None
+        return summary["phase"]
+
+    unfinished, failed = batch_progress(rotation.last_batch, unfinished_phase)
+    if failed:
+        logger.warning(f"Credential rollout of Secret {namespace}/{secret_name} held by {failed}")
+        return
+    if unfinished:
+        return
+
+    if not rotation.pending:
+        credential_rollout.finish(namespace, secret_name)
+        logger.info(f"Credential rollout of Secret {namespace}/{secret_name} complete")
+        return
+
+    batch, rotation.pending = rotation.pending[:batch_size], rotation.pending[batch_size:]
+    rotation.last_batch = []
+    for cr_name in batch:
+        # Rotated again, or rolled by an update since it was queued: take the current digest
+        digest = _stale_credentials_hash(cr_name, namespace)
+        if digest is None:
+            continue
+        annotate_pod_template(
+            _generate_resource_names(cr_name)["deployment"],
+            namespace,
+            {ANNOTATION_CREDENTIALS_HASH: digest},
+        )
+        rotation.last_batch.append(cr_name)
+        logger.info(f"Rolling {namespace}/{cr_name} for rotated Secret {secret_name}")
+        patch_edgelake_operator_status(
+            cr_name,
+            namespace,
+            {"credentialRotation": rotation_status(secret_name, digest, now.isoformat())},
+        )
+    rotation.last_batch_at = now.isoformat()
+
+
+def _stale_credentials_hash(cr_name: str, namespace: str) -> Optional[str]:
+    """Return the CR's current credentials hash if its pod template has an older one."""
+    cr = get_edgelake_operator(cr_name, namespace)
+    if cr is None:
+        return None
+    operator_spec = EdgeLakeOperatorSpec.from_dict(resolve_profile(cr["spec"], namespace))
+    resource_names = _generate_resource_names(cr_name)
+    annotations = get_pod_template_annotations(resource_names["deployment"], namespace)
+    # No Deployment yet, or one created before rotation was enabled: the next apply sets it
+    current = (annotations or {}).get(ANNOTATION_CREDENTIALS_HASH)
+    digest = _credentials_hash(namespace, operator_spec, resource_names)
+    if current is None or digest is None or digest == current:
+        return None
+    return digest
+
+
+@kopf.on.event(API_GROUP, API_VERSION, PROFILE_PLURAL)
+def cache_profile(event: dict[str, Any], body: dict[str, Any], **_: Any) -> None:
+    """Keep the profile store in sync with every EdgeLakeProfile watch event."""
+    if event.get("type") == "DELETED":
+        profile_store.remove(body["metadata"].get("namespace"), body["metadata"].get("name"))
+    else:
+        profile_store.update(body)
+
+
+@kopf.index(API_GROUP, API_VERSION, PLURAL)
+def profile_users(
+    spec: dict[str, Any], name: str, namespace: str, **_: Any
+) -> dict[tuple[str, str], str]:
+    """Index the EdgeLakeOperators using each profile."""
+    profile = profile_name(spec)
+    return {(namespace, profile): name} if profile else {}
+
+
+@kopf.on.create(API_GROUP, API_VERSION, PROFILE_PLURAL)
+@kopf.on.update(API_GROUP, API_VERSION, PROFILE_PLURAL)
+def start_profile_rollout(
+    spec: dict[str, Any],
+    name: str,
+    namespace: str,
+    status: dict[str, Any],
+    profile_users: kopf.Index,
+    logger: logging.Logger,
+    patch: kopf.Patch,
+    **_: Any,
+) -> None:
+    """Queue the CRs using a changed profile; roll_profile reconciles them in batches."""
+    try:
+        EdgeLakeProfileSpec.from_dict(spec)
+    except ValidationError as e:
+        raise kopf.PermanentError(f"Invalid profile: {e}") from None
+
+    digest = profile_hash(spec)
+    if status.get("profileHash") == digest:
+        return  # Only the rollout settings changed
+
+    targets = sorted(set(profile_users.get((namespace, name), [])))
+    now = datetime.now(timezone.utc).isoformat()
+    patch.status["profileHash"] = digest
+    patch.status["phase"] = (
+        ProfilePhase.ROLLING.value if targets else ProfilePhase.COMPLETE.value
+    )
+    patch.status["total"] = len(targets)
+    patch.status["updated"] = 0
+    patch.status["pending"] = targets
+    patch.status["failed"] = []
+    patch.status["lastBatch"] = []
+    patch.status["startedAt"] = now
+    patch.status["lastBatchAt"] = None
+    patch.status["completedAt"] = None if targets else now
+    logger.info(f"Profile {namespace}/{name} changed ({digest}), rolling to {len(targets)} CRs")
+
+
+@kopf.timer(
+    API_GROUP,
+    API_VERSION,
+    PROFILE_PLURAL,
+    interval=10,
+    when=lambda status, **_: status.get("phase") == ProfilePhase.ROLLING.value,
+)
+def roll_profile(
+    spec: dict[str, Any],
+    name: str,
+    namespace: str,
+    status: dict[str, Any],
+    logger: logging.Logger,
+    patch: kopf.Patch,
+    **_: Any,
+) -> None:
+    """Reconcile the next batch of CRs using a changed profile.
+
+    A batch is sent once rollout.interval has passed since the previous one and
+    every CR of the previous batch has applied the profile hash (its
+    status.profileHash). If any CR of the previous batch failed before applying
+    it, the rollout is paused until the profile changes again.
+    """
+    rollout = EdgeLakeProfileSpec.from_dict(spec).rollout
+    now = datetime.now(timezone.utc)
+    if not batch_due(status.get("lastBatchAt"), rollout.interval, now):
+        return
+
+    # CRs of the last batch that have not applied the profile hash yet (deleted CRs are done)
+    digest = status.get("profileHash")
+
+    def unapplied_phase(cr_name: str) -> Optional[str]:
+        summary = fleet_cache.get(namespace, cr_name)
+        if summary is None or summary["profileHash"] == digest:
+            return None
+        return summary["phase"]
+
+    unapplied, failed = batch_progress(status.get("lastBatch", []), unapplied_phase)
+    if failed:
+        patch.status["failed"] = failed
+        patch.status["phase"] = ProfilePhase.PAUSED.value
+        logger.warning(f"Profile rollout of {namespace}/{name} paused, failed: {failed}")
+        return
+    if unapplied:
+        return
+
+    pending = list(status.get("pending", []))
+    if not pending:
+        patch.status["phase"] = ProfilePhase.COMPLETE.value
+        patch.status["completedAt"] = now.isoformat()
+        logger.info(f"Profile rollout of {namespace}/{name} complete")
+        return
+
+    batch, pending = pending[: rollout.batchSize], pending[rollout.batchSize :]
+    updated = []
+    for cr_name in batch:
+        # The annotation change triggers the CR's update handler
+        if annotate_edgelake_operator(
+            cr_name, namespace, {ANNOTATION_PROFILE_HASH: status.get("profileHash")}
+        ):
+            updated.append(cr_name)
+
+    patch.status["pending"] = pending
+    patch.status["lastBatch"] = updated
+    patch.status["updated"] = status.get("updated", 0) + len(updated)
+    patch.status["lastBatchAt"] = now.isoformat()
+    logger.info(f"Profile rollout of {namespace}/{name}: {updated}, {len(pending)} pending")
+
+
+@kopf.on.event(
+    "",
+    "v1",
+    "pods",
+    labels={"app.kubernetes.io/name": "edgelake-operator", "app.kubernetes.io/instance": kopf.PRESENT},
+)
+async def watch_edgelake_pod(
+    body: dict[str, Any],
+    namespace: str,
+    labels: dict[str, str],
+    **_: Any,
+) -> None:
+    """Feed EdgeLake pod state changes into the rollout tracker."""
+    rollout_tracker.observe_pod(namespace, labels["app.kubernetes.io/instance"], dict(body))
+
+
+@kopf.timer(
+    API_GROUP,
+    API_VERSION,
+    PLURAL,
+    interval=10,
+    when=lambda name, namespace, **_: rollout_tracker.is_pending(namespace, name),
+)
+async def track_rollout(
+    body: dict[str, Any],
+    spec: dict[str, Any],
+    name: str,
+    namespace: str,
+    status: dict[str, Any],
+    logger: logging.Logger,
+    patch: kopf.Patch,
+    **_: Any,
+) -> None:
+    """Finish the rollout timeline once the new pod answers 'get status'."""
+    rollout = rollout_tracker.get(namespace, name)
+    if rollout is None or rollout.pod is None:
+        return
+
+    pod_ip = rollout.pod.get("status", {}).get("podIP")
+    if not pod_ip or container_started_at(rollout.pod) is None:
+        return
+
+    networking = with_allocated_ports(spec, status.get("allocatedPorts")).get("networking", {})
+    rest_port = networking.get("restPort", DEFAULT_REST_PORT)
+    if not await is_node_ready(pod_ip, rest_port):
+        return
+
+    ready_at = datetime.now(timezone.utc)
+    pod_name = rollout.pod["metadata"]["name"]
+    try:
+        events = list_pod_events(pod_name, namespace)
+    except Exception as e:
+        logger.warning(f"Failed to read events for pod {pod_name}: {e}")
+        events = []
+
+    timeline = build_timeline(rollout, ready_at, events)
+    rollout_tracker.complete(namespace, name)
+
+    image_tag = rollout.image.rsplit(":", 1)[-1]
+    for phase, seconds in timeline["phases"].items():
+        ROLLOUT_PHASE_SECONDS.labels(phase, image_tag, rollout.storage_class).observe(seconds)
+    ROLLOUT_DURATION_SECONDS.labels(image_tag, rollout.storage_class).observe(
+        timeline["totalSeconds"]
+    )
+
+    patch.status["lastRollout"] = timeline
+    logger.info(f"Rollout of {pod_name} ready after {timeline['totalSeconds']}s: {timeline['phases']}")
+
+    # With more replicas to roll, monitor_edgelake_operator prunes once all are ready
+    deployment_name = status.get("deploymentName")
+    if deployment_name and check_deployment_ready(deployment_name, namespace):
+        _prune_config_map_revisions(body, spec, name, namespace, status, patch, logger)
+
+
+@kopf.timer(
+    API_GROUP,
+    API_VERSION,
+    PLURAL,
+    interval=60,
+    initial_delay=60,
+    when=lambda spec, **_: bool(spec.get("mqtt", {}).get("sharedGroup")),
+)
+async def sample_mqtt_rates(
+    spec: dict[str, Any],
+    name: str,
+    namespace: str,
+    status: dict[str, Any],
+    logger: logging.Logger,
+    patch: kopf.Patch,
+    **_: Any,
+) -> None:
+    """Track MQTT message rates for shared-subscription nodes.
+
+    With a shared group the broker balances messages across subscribers, so
+    per-pod rates, and the rate of each CR against the whole group (all CRs
+    with the same broker and sharedGroup), show whether load is actually
+    spread evenly.
+    """
+    if status.get("phase") != OperatorPhase.RUNNING.value:
+        return
+
+    networking = with_allocated_ports(spec, status.get("allocatedPorts")).get("networking", {})
+    rest_port = networking.get("restPort", DEFAULT_REST_PORT)
+    previous = {
+        replica["pod"]: replica
+        for replica in status.get("mqttIngestion", {}).get("replicas", [])
+    }
+
+    replicas = []
+    for pod in list_instance_pods(name, namespace):
+        if not pod["ip"]:
+            continue
+        try:
+            output = await run_command(pod["ip"], rest_port, "get msg client")
+        except RestCommandError as e:
+            logger.warning(f"Failed to read MQTT statistics from {pod['name']}: {e}")
+            continue
+
+        now = datetime.now(timezone.utc)
+        count = parse_msg_client_messages(output)
+        rate = compute_rate(previous.get(pod["name"]), count, now)
+        if rate is not None:
+            MQTT_MESSAGE_RATE.labels(namespace, name, pod["name"]).set(rate)
+        replicas.append(
+            {"pod": pod["name"], "count": count, "ratePerSecond": rate, "sampledAt": now.isoformat()}
+        )
+
+    # Aggregate with the other CRs subscribed to the same group on the same broker
+    now = datetime.now(timezone.utc)
+    mqtt = spec["mqtt"]
+    broker = f"{mqtt.get('broker') or ''}:{mqtt.get('port', 1883)}"
+    group = (broker, mqtt["sharedGroup"])
+    total = round(sum(r["ratePerSecond"] or 0 for r in replicas), 3)
+    shared_group_rates.record(group, namespace, name, total, len(replicas), now)
+    members = shared_group_rates.members(group, now)
+    group_total = round(sum(m["ratePerSecond"] for m in members), 3)
+    MQTT_GROUP_MESSAGE_RATE.labels(*group).set(group_total)
+
+    patch.status["mqttIngestion"] = {
+        "sharedGroup": mqtt["sharedGroup"],
+        "totalRatePerSecond": total,
+        "replicas": replicas,
+        "groupRatePerSecond": group_total,
+        "groupShare": round(total / group_total, 3) if group_total else None,
+        "groupMembers": members,
+    }
+
+
+@kopf.timer(
+    API_GROUP,
+    API_VERSION,
+    PLURAL,
+    interval=60,
+    initial_delay=120,
+    when=lambda spec, namespace, **_: (
+        resolve_profile(spec, namespace)
+        .get("advanced", {})
+        .get("adaptiveBuffers", {})
+        .get("enabled", False)
+    ),
+)
+async def tune_buffer_thresholds(
+    spec: dict[str, Any],
+    name: str,
+    namespace: str,
+    status: dict[str, Any],
+    logger: logging.Logger,
+    patch: kopf.Patch,
+    **_: Any,
+) -> None:
+    """Adapt per-table buffer flush thresholds to observed ingest rates.
+
+    Rates are read from 'get streaming' on each pod and thresholds are applied
+    live with 'set buffer threshold', so no restart is needed.
+    """
+    if status.get("phase") != OperatorPhase.RUNNING.value:
+        return
+
+    operator_spec = EdgeLakeOperatorSpec.from_dict(_effective_spec(spec, namespace, status))
+    policy = operator_spec.advanced.adaptiveBuffers
+    buffer_status = status.get("bufferThresholds", {})
+
+    now = datetime.now(timezone.utc)
+    last_sampled = buffer_status.get("sampledAt")
+    if last_sampled:
+        elapsed = (now - datetime.fromisoformat(last_sampled)).total_seconds()
+        if elapsed < parse_duration(policy.interval):
+            return
+
+    previous = {(t["pod"], t["table"]): t for t in buffer_status.get("tables", [])}
+    tables = []
+    for pod in list_instance_pods(name, namespace):
+        if not pod["ip"]:
+            continue
+        try:
+            output = await run_command(
+                pod["ip"], operator_spec.networking.restPort, "get streaming where format = json"
+            )
+        except RestCommandError as e:
+            logger.warning(f"Failed to read streaming statistics from {pod['name']}: {e}")
+            continue
+
+        for table, count in parse_streaming_rows(output).items():
+            prev = previous.get((pod["name"], table), {})
+            entry = {
+                "pod": pod["name"],
+                "table": table,
+                "count": count,
+                "sampledAt": now.isoformat(),
+                "rowsPerSecond": compute_rate(prev, count, now),
+            }
+            for key in ("timeSeconds", "volumeBytes", "appliedAt"):
+                if key in prev:
+                    entry[key] = prev[key]
+
+            if entry["rowsPerSecond"] is not None:
+                time_seconds, volume_bytes = compute_thresholds(entry["rowsPerSecond"], policy)
+                if thresholds_changed(prev, time_seconds, volume_bytes):
+                    dbms, table_name = table.split(".", 1)
+                    command = (
+                        f"set buffer threshold where dbms = {dbms} and table = {table_name} "
+                        f"and time = {format_duration(time_seconds)} "
+                        f"and volume = {format_size(volume_bytes)}"
+                    )
+                    try:
+                        await run_command(
+                            pod["ip"], operator_spec.networking.restPort, command, method="POST"
+                        )
+                        entry.update(
+                            timeSeconds=round(time_seconds),
+                            volumeBytes=volume_bytes,
+                            appliedAt=now.isoformat(),
+                        )
+                        logger.info(f"Applied buffer threshold on {pod['name']}: {command}")
+                    except RestCommandError as e:
+                        logger.warning(f"Failed to apply buffer threshold on {pod['name']}: {e}")
+            tables.append(entry)
+
+    patch.status["bufferThresholds"] = {"sampledAt": now.isoformat(), "tables": tables}
+
+
+def _set_partition_maintenance_status(
+    operator_spec: EdgeLakeOperatorSpec, body: dict[str, Any], patch: kopf.Patch
+) -> None:
+    """Publish the partition drop offset assigned to the CR."""
+    if not is_staggered(operator_spec):
+        patch.status["partitionMaintenance"] = None
+        return
+    metadata = body["metadata"]
+    instance_key = metadata.get("uid") or f"{metadata['namespace']}/{metadata['name']}"
+    maintenance = operator_spec.operator.partitioning.maintenance
+    patch.status["partitionMaintenance"] = {
+        "offset": format_duration(drop_offset_seconds(operator_spec, instance_key)),
+        "window": format_duration(maintenance_window_seconds(operator_spec)),
+        "source": "explicit" if maintenance.offset else "uid",
+    }
+
+
+def _set_aggregations_status(operator_spec: EdgeLakeOperatorSpec, patch: kopf.Patch) -> None:
+    """Publish the rollup query of each aggregation rule for dashboards."""
+    rules = operator_spec.aggregations.rules if operator_spec.aggregations.enabled else []
+    patch.status["aggregations"] = [
+        {
+            "table": f"{rule.dbms or operator_spec.operator.defaultDbms}.{rule.table}",
+            "interval": rule.interval,
+            "query": scripts.aggregation_query(operator_spec, rule),
+        }
+        for rule in rules
+    ]
+
+
+@kopf.timer(
+    API_GROUP,
+    API_VERSION,
+    PLURAL,
+    interval=30,
+    initial_delay=60,
+    when=lambda spec, **_: (
+        spec.get("nodeType") == NODE_TYPE_QUERY
+        and spec.get("autoscaling", {}).get("enabled", False)
+    ),
+)
+async def autoscale_query_nodes(
+    spec: dict[str, Any],
+    name: str,
+    namespace: str,
+    status: dict[str, Any],
+    logger: logging.Logger,
+    patch: kopf.Patch,
+    **_: Any,
+) -> None:
+    """Scale query nodes on p95 query latency and in-flight queries.
+
+    Each pod's 'get queries time' histogram is diffed against the previous
+    sample to get the latency of recently completed queries; 'query status'
+    gives the queries still running.
+    """
+    if status.get("phase") != OperatorPhase.RUNNING.value:
+        return
+
+    operator_spec = EdgeLakeOperatorSpec.from_dict(_effective_spec(spec, namespace, status))
+    policy = operator_spec.autoscaling
+    autoscaling_status = status.get("autoscaling", {})
+    previous = {s["pod"]: s.get("buckets") for s in autoscaling_status.get("samples", [])}
+    now = datetime.now(timezone.utc)
+
+    samples = []
+    deltas = []
+    in_flight = 0
+    for pod in list_instance_pods(name, namespace):
+        if not pod["ip"] or not pod["ready"]:
+            continue
+        try:
+            times = await run_command(pod["ip"], operator_spec.networking.restPort, "get queries time")
+            running = await run_command(pod["ip"], operator_spec.networking.restPort, "query status")
+        except RestCommandError as e:
+            logger.warning(f"Failed to read query statistics from {pod['name']}: {e}")
+            continue
+        buckets = parse_query_times(times)
+        deltas.append(histogram_delta(previous.get(pod["name"]), buckets))
+        in_flight += parse_in_flight_queries(running)
+        samples.append({"pod": pod["name"], "buckets": buckets, "sampledAt": now.isoformat()})
+
+    p95 = histogram_percentile(merge_histograms(deltas), 0.95)
+    current = operator_spec.replicas
+    desired = desired_replicas(current, p95, in_flight, policy)
+    last_scale_time = autoscaling_status.get("lastScaleTime")
+
+    if desired != current and cooldown_elapsed(last_scale_time, now, desired > current, policy):
+        scale_edgelake_operator(name, namespace, desired)
+        last_scale_time = now.isoformat()
+        logger.info(
+            f"Scaling query nodes {current} -> {desired} "
+            f"(p95={p95}s, in-flight={in_flight})"
+        )
+
+    patch.status["autoscaling"] = {
+        "currentReplicas": current,
+        "desiredReplicas": desired,
+        "p95Seconds": None if p95 is None or math.isinf(p95) else p95,
+        "inFlight": in_flight,
+        "lastScaleTime": last_scale_time,
+        "samples": samples,
+    }
+
+
+def _build_configmaps(
+    name: str,
+    namespace: str,
+    operator_spec: EdgeLakeOperatorSpec,
+    resource_names: dict[str, str],
+    body: dict[str, Any],
+) -> tuple[dict[str, Any], dict[str, Any] | None]:
+    """Build the environment and generated scripts ConfigMaps.
+
+    With advanced.immutableConfigMaps both are immutable and named by content
+    hash, and resource_names is updated with those names for the Deployment.
+    """
+    configmap_resource = configmap.build_configmap(name, namespace, operator_spec, resource_names)
+    scripts_resource = scripts.build_scripts_configmap(
+        name, namespace, operator_spec, resource_names, uid=body["metadata"].get("uid")
+    )
+    if operator_spec.advanced.immutableConfigMaps:
+        configmap.make_immutable(configmap_resource)
+        resource_names["configmap"] = configmap_resource["metadata"]["name"]
+        if scripts_resource:
+            configmap.make_immutable(scripts_resource)
+            resource_names["scripts_configmap"] = scripts_resource["metadata"]["name"]
+    return configmap_resource, scripts_resource
+
+
+async def _apply_configmaps(
+    namespace: str,
+    operator_spec: EdgeLakeOperatorSpec,
+    resource_names: dict[str, str],
+    configmap_resources: tuple[dict[str, Any], dict[str, Any] | None],
+    body: dict[str, Any],
+    patch: kopf.Patch,
+) -> None:
+    """Apply the environment and generated scripts ConfigMaps after a config change."""
+    configmap_resource, scripts_resource = configmap_resources
+    kopf.adopt(configmap_resource, owner=body)
+    await apply_resource(configmap_resource, namespace)
+    logger.info(f"Updated ConfigMap: {resource_names['configmap']}")
+
+    if scripts_resource:
+        kopf.adopt(scripts_resource, owner=body)
+        await apply_resource(scripts_resource, namespace)
+        logger.info(f"Updated scripts ConfigMap: {resource_names['scripts_configmap']}")
+    elif not operator_spec.advanced.immutableConfigMaps:
+        # Immutable revisions stay until the rollout is done (see monitor_edgelake_operator)
+        await delete_resource("ConfigMap", resource_names["scripts_configmap"], namespace)
+    _set_partition_maintenance_status(operator_spec, body, patch)
+    _set_aggregations_status(operator_spec, patch)
+
+
+async def _push_live_tunables(
+    name: str,
+    namespace: str,
+    operator_spec: EdgeLakeOperatorSpec,
+    fields: list[str],
+    patch: kopf.Patch,
+) -> None:
+    """Push changed live-tunable fields to every running pod over REST.
+
+    A pod that rejects a change is deleted, so the Deployment replaces it with a
+    pod started from the updated ConfigMap; the other pods keep running.
+    """
+    port = operator_spec.networking.restPort
+    results: dict[str, Any] = {}
+    for pod in list_instance_pods(name, namespace):
+        if not pod["ip"]:
+            continue
+        error = await push_live_tunables(operator_spec, fields, pod["ip"], port)
+        results[pod["name"]] = error
+        if error:
+            logger.warning(f"Live update of {fields} failed on {pod['name']}, restarting: {error}")
+            delete_pod(pod["name"], namespace)
+        else:
+            logger.info(f"Applied {fields} live on {pod['name']}")
+
+    now = datetime.now(timezone.utc).isoformat()
+    patch.status["liveTuning"] = live_tuning_status(fields, results, now)
+
+
+def _prune_config_map_revisions(
+    body: dict[str, Any],
+    spec: dict[str, Any],
+    name: str,
+    namespace: str,
+    status: dict[str, Any],
+    patch: kopf.Patch,
+    logger: logging.Logger,
+) -> None:
+    """Delete the ConfigMap revisions the old pods used, once their Deployment has rolled.
+
+    With advanced.immutableConfigMaps, on every call; without it, once after the
+    flag was turned off (status.staleConfigMapRevisions), which removes every hashed
+    revision. Only when the current generation is applied: until then the update
+    handler may have created a revision for a Deployment it has not applied yet.
+    The caller checks that the Deployment is ready.
+    """
+    immutable = resolve_profile(spec, namespace).get("advanced", {}).get("immutableConfigMaps")
+    if not immutable and not status.get("staleConfigMapRevisions"):
+        return
+    if status.get("observedGeneration") != body["metadata"].get("generation"):
+        return
+
+    resource_names = _generate_resource_names(name)
+    try:
+        deleted = prune_config_maps(
+            name,
+            namespace,
+            status["deploymentName"],
+            [resource_names["configmap"], resource_names["scripts_configmap"]],
+        )
+    except Exception as e:
+        logger.warning(f"Failed to prune old ConfigMap revisions: {e}")
+        return
+    if deleted:
+        logger.info(f"Deleted old ConfigMap revisions: {deleted}")
+    if not immutable:
+        patch.status["staleConfigMapRevisions"] = None
+
+
+def _begin_rollout(
+    namespace: str, name: str, spec: EdgeLakeOperatorSpec, config_hash: str
+) -> None:
+    """Start tracking the time-to-ready of a Deployment rollout."""
+    rollout_tracker.begin(
+        namespace,
+        name,
+        config_hash,
+        f"{spec.image.repository}:{spec.image.tag}",
+        (spec.persistence.storageClassName or "default") if spec.uses_persistence() else "none",
+    )
+
+
+def _credentials_hash(
+    namespace: str, spec: EdgeLakeOperatorSpec, resource_names: dict[str, str]
+) -> Optional[str]:
+    """Digest the credentials of a CR that rolls on rotation (see queue_rotated_credentials)."""
+    refs = secret.credential_refs(spec, resource_names)
+    if not spec.secrets.rolloutOnRotation or not refs:
+        return None
+    secrets = {
+        secret_name: read_secret_data(secret_name, namespace)
+        for secret_name in {secret_name for secret_name, _key in refs.values()}
+    }
+    return credentials_hash(refs, secrets)
+
+
+def _resolve_seed_snapshot(
+    namespace: str, spec: EdgeLakeOperatorSpec, status: dict[str, Any], patch: kopf.Patch
+) -> Optional[str]:
+    """Resolve persistence.blockchain.fromSeed to the seed's newest ready snapshot.
+
+    Seed snapshots are pruned down to seedSnapshot.keep, so the name is looked
+    up when the PVC is built rather than pinned in the spec. It is recorded in
+    status.restoredSnapshot, so a retried create builds the same PVC manifest.
+    """
+    seed = spec.persistence.blockchain.fromSeed
+    if not seed:
+        return None
+    if status.get("restoredSnapshot"):
+        return status["restoredSnapshot"]
+
+    snapshots = list_volume_snapshots(namespace, f"{LABEL_SEED_SNAPSHOT}={seed}")
+    ready = [
+        snapshot["metadata"]["name"]
+        for snapshot in snapshots
+        if (snapshot.get("status") or {}).get("readyToUse")
+    ]
+    if not ready:
+        raise kopf.TemporaryError(f"No ready seed snapshot of {namespace}/{seed} yet", delay=60)
+    patch.status["restoredSnapshot"] = ready[-1]
+    return ready[-1]
+
+
+def _label_credential_secrets(
+    namespace: str, spec: EdgeLakeOperatorSpec, resource_names: dict[str, str]
+) -> None:
+    """Label the Secrets holding the credentials of a CR that rolls on rotation.
+
+    The Secret watch only sees labelled Secrets. *SecretRef targets are created
+    by users, and the operator-created Secret may predate rolloutOnRotation.
+    """
+    if not spec.secrets.rolloutOnRotation:
+        return
+    refs = secret.credential_refs(spec, resource_names)
+    for secret_name in sorted({secret_name for secret_name, _key in refs.values()}):
+        label_secret(secret_name, namespace, {LABEL_CREDENTIALS: "true"})
+
+
+def _allocate_node_ports(
+    name: str,
+    namespace: str,
+    spec: dict[str, Any],
+    status: dict[str, Any],
+    patch: kopf.Patch,
+    logger: logging.Logger,
+) -> dict[str, Any]:
+    """Assign free NodePorts to a CR with networking.autoAllocatePorts.
+
+    The ports are recorded in status.allocatedPorts only; the spec is never
+    rewritten. A CR keeps the ports recorded in its status across retries and
+    updates. Only kinds it does not hold yet are allocated, and a broker port
+    that is no longer wanted is freed.
+
+    Args:
+        name: EdgeLakeOperator name
+        namespace: Namespace
+        spec: The (profile-resolved) spec dictionary
+        status: Current status of the CR
+        patch: Patch of the CR
+        logger: Handler logger
+
+    Returns:
+        Spec dictionary with the allocated ports
+    """
+    networking = spec.get("networking") or {}
+    kinds = ["server", "rest"]
+    # A broker is enabled by setting brokerPort; its value is replaced like the others
+    if networking.get("brokerPort") or networking.get("broker_port"):
+        kinds.append("broker")
+
+    # The bitmap is kept current by track_node_ports and track_allocated_ports
+    recorded = _allocated_ports(status)
+    allocated = {kind: port for kind, port in recorded.items() if kind in kinds}
+    node_port_allocator.reserve(namespace, name, allocated)
+    ports = node_port_allocator.allocate(namespace, name, kinds)
+    NODEPORTS_FREE.set(node_port_allocator.free())
+    if ports != recorded:
+        logger.info(f"Allocated NodePorts {ports}")
+        # Kinds no longer wanted are removed from the status by the merge patch
+        patch.status["allocatedPorts"] = {
+            **{kind: None for kind in recorded if kind not in ports},
+            **ports,
+        }
+    return with_allocated_ports(spec, ports)
+
+
+def _release_node_ports(
+    name: str,
+    namespace: str,
+    status: dict[str, Any],
+    patch: kopf.Patch,
+    logger: logging.Logger,
+) -> None:
+    """Free the NodePorts of a CR that turned networking.autoAllocatePorts off."""
+    released = node_port_allocator.release(namespace, name)
+    if released:
+        NODEPORTS_FREE.set(node_port_allocator.free())
+        logger.info(f"Released NodePorts {sorted(released.values())}")
+    if status.get("allocatedPorts"):
+        patch.status["allocatedPorts"] = None
+
+
+def _reallocate_rejected_ports(
+    error: ApiException,
+    name: str,
+    namespace: str,
+    spec: EdgeLakeOperatorSpec,
+    patch: kopf.Patch,
+) -> None:
+    """Handle a Service rejected because another client took an allocated port first.
+
+    Raises:
+        kopf.TemporaryError: The ports were given up; the retry allocates new ones
+        ApiException: The error is not about allocated NodePorts
+    """
+    rejected = rejected_node_ports(str(error.body)) if error.status == 422 else []
+    if not spec.networking.autoAllocatePorts or not rejected:
+        raise error
+    patch.status["allocatedPorts"] = node_port_allocator.reject(namespace, name, rejected)
+    raise kopf.TemporaryError(
+        f"NodePorts {rejected} are already allocated, reallocating", delay=1
+    ) from None
+
+
+def _allocated_ports(status: dict[str, Any]) -> dict[str, int]:
+    """Return the ports recorded in status.allocatedPorts, by kind."""
+    return {kind: port for kind, port in (status.get("allocatedPorts") or {}).items() if port}
+
+
+def _effective_spec(
+    spec: dict[str, Any], namespace: str, status: dict[str, Any]
+) -> dict[str, Any]:
+    """Resolve a CR's profile and overlay the NodePorts allocated to it."""
+    return with_allocated_ports(resolve_profile(spec, namespace), status.get("allocatedPorts"))
+
+
 def _generate_resource_names(name: str) -> dict[str, str]:
     """Generate consistent resource names based on CR name."""
     return {
         "deployment": f"{name}-deployment",
         "service": f"{name}-service",
+        "peer_service": f"{name}-peers",
         "configmap": f"{name}-config",
+        "scripts_configmap": f"{name}-scripts",
         "secret": f"{name}-secrets",
         "pvc_anylog": f"{name}-anylog-pvc",
         "pvc_blockchain": f"{name}-blockchain-pvc",
@@ -307,10 +1708,16 @@ def _build_endpoints(
     spec: EdgeLakeOperatorSpec,
     namespace: str,
     resource_names: dict[str, str],
-) -> dict[str, str | None]:
-    """Build service endpoint URLs for status."""
+    zones: dict[str, list[str]] | None = None,
+) -> dict[str, Any]:
+    """Build service endpoint URLs for status.
+
+    Zone-local endpoints are only included when the ready pod IPs by zone are
+    given (see _publish_zone_endpoints), so other status updates keep them.
+    """
     service_name = resource_names["service"]
-    return {
+    peer_service_name = resource_names["peer_service"]
+    endpoints: dict[str, Any] = {
         "tcp": f"{service_name}.{namespace}.svc.cluster.local:{spec.networking.serverPort}",
         "rest": f"{service_name}.{namespace}.svc.cluster.local:{spec.networking.restPort}",
         "broker": (
@@ -318,7 +1725,74 @@ def _build_endpoints(
             if spec.networking.brokerPort
             else None
         ),
+        "peers": (
+            f"{peer_service_name}.{namespace}.svc.cluster.local:{spec.networking.serverPort}"
+            if spec.networking.routing.peerService
+            else None
+        ),
     }
+    if zones is not None:
+        endpoints["zones"] = [
+            {
+                "zone": zone,
+                "tcp": [f"{ip}:{spec.networking.serverPort}" for ip in addresses],
+                "rest": [f"{ip}:{spec.networking.restPort}" for ip in addresses],
+            }
+            for zone, addresses in zones.items()
+        ]
+    return endpoints
+
+
+def _set_health_conditions(
+    deployment_name: str, is_ready: bool, status: dict[str, Any], patch: kopf.Patch
+) -> None:
+    """Set the Ready and Degraded conditions from the Deployment's readiness.
+
+    Unready pods while the operator creates or updates the CR are expected, so
+    only a Deployment that is not ready outside of a reconcile counts as degraded.
+    """
+    health = OperatorStatus(conditions=status.get("conditions") or [])
+    reconciling = status.get("phase") in (
+        OperatorPhase.CREATING.value,
+        OperatorPhase.UPDATING.value,
+    )
+    if is_ready:
+        reason, message = "DeploymentReady", f"All pods of {deployment_name} are ready"
+    elif reconciling:
+        reason, message = "Reconciling", f"Pods of {deployment_name} are being rolled out"
+    else:
+        reason, message = "DeploymentNotReady", f"Pods of {deployment_name} are not ready"
+    health.set_condition(
+        ConditionType.READY,
+        ConditionStatus.TRUE if is_ready else ConditionStatus.FALSE,
+        reason,
+        message,
+    )
+    health.set_condition(
+        ConditionType.DEGRADED,
+        ConditionStatus.FALSE if is_ready or reconciling else ConditionStatus.TRUE,
+        reason,
+        message,
+    )
+    conditions = [condition.model_dump() for condition in health.conditions]
+    if conditions != (status.get("conditions") or []):
+        patch.status["conditions"] = conditions
+
+
+def _publish_zone_endpoints(
+    name: str,
+    namespace: str,
+    spec: dict[str, Any],
+    status: dict[str, Any],
+    patch: kopf.Patch,
+) -> None:
+    """Publish the ready pod endpoints of each zone in status.endpoints.zones."""
+    operator_spec = EdgeLakeOperatorSpec.from_dict(_effective_spec(spec, namespace, status))
+    resource_names = _generate_resource_names(name)
+    zones = list_endpoint_zones(resource_names["service"], namespace)
+    zone_endpoints = _build_endpoints(operator_spec, namespace, resource_names, zones)["zones"]
+    if zone_endpoints != ((status.get("endpoints") or {}).get("zones") or []):
+        patch.status["endpoints"] = {"zones": zone_endpoints}
 
 
 def _config_fields_changed(diff: kopf.Diff) -> bool:
@@ -338,6 +1812,13 @@ def _config_fields_changed(diff: kopf.Diff) -> bool:
         "mcp",
         "nebula",
         "aggregations",
+        "probes",
+        "resources",
+        "performanceProfile",
+        "scheduling",
+        "nodeType",
+        "secrets",
+        "profileRef",
     ]
     for op, path, old, new in diff:
         path_str = ".".join(str(p) for p in path)
@@ -346,6 +1827,27 @@ def _config_fields_changed(diff: kopf.Diff) -> bool:
     return False
 
 
+def _live_tunable_changes(diff: kopf.Diff) -> list[str]:
+    """Return the changed live-tunable fields if no other config field changed.
+
+    Scaling fields may change alongside; any other config change returns [] so
+    the regular rollout handles the update.
+    """
+    fields = []
+    for op, path, old, new in diff:
+        path = [str(p) for p in path]
+        if path and path[0] == "metadata":
+            continue
+        if path and path[0] == "spec":
+            path = path[1:]
+        field = ".".join(path)
+        if field in LIVE_TUNABLE_FIELDS:
+            fields.append(field)
+        elif not path or path[0] not in UNHASHED_FIELDS:
+            return []
+    return fields
+
+
 def _secrets_changed(diff: kopf.Diff) -> bool:
     """Check if secret-related fields changed."""
     secret_paths = ["password", "licenseKey"]
@@ -356,6 +1858,77 @@ def _secrets_changed(diff: kopf.Diff) -> bool:
     return False
 
 
+def _debounce_wait(
+    spec: dict[str, Any], namespace: str, name: str, body: dict[str, Any]
+) -> float | None:
+    """Return how long to hold back an update to coalesce writes, or None to apply it."""
+    reconcile = spec.get("reconcile") or {}
+    try:
+        window = parse_duration(reconcile.get("debounce", DEFAULT_DEBOUNCE_WINDOW))
+        max_delay = parse_duration(reconcile.get("maxDelay", DEFAULT_DEBOUNCE_MAX_DELAY))
+    except ValueError:
+        return None  # Reported by validation
+    if window <= 0:
+        return None
+    now = datetime.now(timezone.utc)
+    return update_debouncer.observe(
+        namespace, name, write_digest(body), window, max_delay, now
+    )
+
+
+def _profile_changed(diff: kopf.Diff) -> bool:
+    """Check if a profile change reached this CR (see roll_profile)."""
+    for op, path, old, new in diff:
+        if tuple(str(p) for p in path) == ("metadata", "annotations", ANNOTATION_PROFILE_HASH):
+            return True
+        if [str(p) for p in path] == ["metadata", "annotations"] and (
+            (old or {}).get(ANNOTATION_PROFILE_HASH) != (new or {}).get(ANNOTATION_PROFILE_HASH)
+        ):
+            return True
+    return False
+
+
+def _annotated_profile_hash(body: dict[str, Any]) -> Optional[str]:
+    """Return the profile hash roll_profile annotated the CR with, if any."""
+    return (body["metadata"].get("annotations") or {}).get(ANNOTATION_PROFILE_HASH)
+
+
+def _profile_live_tunables(spec: dict[str, Any], namespace: str) -> list[str]:
+    """Return the live-tunable fields set by the profile a CR references."""
+    name = profile_name(spec)
+    profile = (profile_store.get(namespace, name) if name else None) or {}
+    fields = []
+    for field in LIVE_TUNABLE_FIELDS:
+        section, key = field.split(".")
+        if key in (profile.get(section) or {}):
+            fields.append(field)
+    return fields
+
+
+def _only_routing_changed(diff: kopf.Diff) -> bool:
+    """Check if only Service routing options (networking.routing) changed."""
+    changed = False
+    for op, path, old, new in diff:
+        path = [str(p) for p in path]
+        if path and path[0] == "metadata":
+            continue
+        if path and path[0] == "spec":
+            path = path[1:]
+        if path[:2] != ["networking", "routing"]:
+            return False
+        changed = True
+    return changed
+
+
+def _replicas_changed(diff: kopf.Diff) -> bool:
+    """Check if the replica count changed (manually, by an HPA or the autoscaler)."""
+    for op, path, old, new in diff:
+        path_str = ".".join(str(p) for p in path)
+        if path_str.endswith("replicas"):
+            return True
+    return False
+
+
 def _networking_changed(diff: kopf.Diff) -> bool:
     """Check if networking configuration changed."""
     for op, path, old, new in diff:
@@ -1,5 +1,5 @@
 """Resource builders for Kubernetes objects."""
 
-from . import configmap, deployment, pvc, secret, service
+from . import configmap, deployment, pvc, scripts, secret, service, snapshot
 
-__all__ = ["configmap", "deployment", "service", "pvc", "secret"]
+__all__ = ["configmap", "deployment", "service", "pvc", "scripts", "secret", "snapshot"]
@@ -1,9 +1,20 @@
 """ConfigMap builder for EdgeLake Operator configuration."""
 
+import hashlib
+import json
 from typing import Any
 
-from ..constants import ANYLOG_PATH, LOCAL_SCRIPTS_PATH, TEST_DIR_PATH
+from ..constants import (
+    ANYLOG_PATH,
+    CONFIGMAP_HASH_LENGTH,
+    LOCAL_SCRIPTS_PATH,
+    NODE_TYPE_QUERY,
+    TEST_DIR_PATH,
+)
 from ..models.spec import EdgeLakeOperatorSpec
+from ..utils.maintenance import is_staggered
+from ..utils.performance import thread_counts
+from .scripts import has_generated_scripts, shared_topic
 
 
 def build_configmap(
@@ -23,6 +34,8 @@ def build_configmap(
     Returns:
         ConfigMap manifest as dictionary
     """
+    is_query_node = spec.nodeType == NODE_TYPE_QUERY
+
     data = {
         # Kubernetes indicator
         "IS_KUBERNETES": "true",
@@ -32,7 +45,7 @@ def build_configmap(
         "LOCAL_SCRIPTS": LOCAL_SCRIPTS_PATH,
         "TEST_DIR": TEST_DIR_PATH,
         # General
-        "NODE_TYPE": "operator",
+        "NODE_TYPE": spec.nodeType,
         "NODE_NAME": spec.general.nodeName,
         "COMPANY_NAME": spec.general.companyName,
         "DISABLE_CLI": str(spec.general.disableCli).lower(),
@@ -43,17 +56,15 @@ def build_configmap(
         "TCP_BIND": str(spec.networking.tcpBind).lower(),
         "REST_BIND": str(spec.networking.restBind).lower(),
         "BROKER_BIND": str(spec.networking.brokerBind).lower(),
-        "TCP_THREADS": str(spec.networking.tcpThreads),
         "REST_TIMEOUT": str(spec.networking.restTimeout),
-        "REST_THREADS": str(spec.networking.restThreads),
-        "BROKER_THREADS": str(spec.networking.brokerThreads),
         # Database
         "DB_TYPE": spec.database.type,
         "DB_IP": spec.database.host,
         "DB_PORT": str(spec.database.port),
         "AUTOCOMMIT": str(spec.database.autocommit).lower(),
-        "SYSTEM_QUERY": str(spec.database.systemQuery).lower(),
-        "MEMORY": str(spec.database.memory).lower(),
+        # Query nodes always need the system_query database to merge results
+        "SYSTEM_QUERY": str(spec.database.systemQuery or is_query_node).lower(),
+        "MEMORY": str(spec.database.memory or is_query_node).lower(),
         # NoSQL
         "ENABLE_NOSQL": str(spec.database.nosql.enabled).lower(),
         "NOSQL_TYPE": spec.database.nosql.type,
@@ -67,30 +78,20 @@ def build_configmap(
         "BLOCKCHAIN_SYNC": spec.blockchain.syncTime,
         "BLOCKCHAIN_SOURCE": spec.blockchain.source,
         "BLOCKCHAIN_DESTINATION": spec.blockchain.destination,
-        # Operator
-        "CLUSTER_NAME": spec.operator.clusterName,
-        "DEFAULT_DBMS": spec.operator.defaultDbms,
-        "ENABLE_HA": str(spec.operator.enableHa).lower(),
-        "START_DATE": str(spec.operator.startDate),
-        "OPERATOR_THREADS": str(spec.operator.threads),
-        # Partitioning
-        "ENABLE_PARTITIONS": str(spec.operator.partitioning.enabled).lower(),
-        "TABLE_NAME": spec.operator.partitioning.tableName,
-        "PARTITION_COLUMN": spec.operator.partitioning.column,
-        "PARTITION_INTERVAL": spec.operator.partitioning.interval,
-        "PARTITION_KEEP": str(spec.operator.partitioning.keep),
-        "PARTITION_SYNC": spec.operator.partitioning.sync,
         # MQTT
-        "ENABLE_MQTT": str(spec.mqtt.enabled).lower(),
+        # Subscriptions are started by the generated mqtt.al script instead
+        "ENABLE_MQTT": str(spec.mqtt.enabled and not spec.mqtt.subscriptions).lower(),
         "MQTT_PORT": str(spec.mqtt.port),
         "MQTT_LOG": str(spec.mqtt.log).lower(),
         # OPC-UA
-        "ENABLE_OPCUA": str(spec.opcua.enabled).lower(),
+        "ENABLE_OPCUA": str(spec.opcua.enabled and not spec.opcua.groups).lower(),
         # EtherNet/IP
-        "ENABLE_ETHERIP": str(spec.etherip.enabled).lower(),
+        "ENABLE_ETHERIP": str(spec.etherip.enabled and not spec.etherip.plcs).lower(),
         "SIMULATOR_MODE": str(spec.etherip.simulatorMode).lower(),
         # Aggregations
-        "ENABLE_AGGREGATIONS": str(spec.aggregations.enabled).lower(),
+        "ENABLE_AGGREGATIONS": str(
+            spec.aggregations.enabled and not spec.aggregations.rules
+        ).lower(),
         "AGGREGATION_TIME_COLUMN": spec.aggregations.timeColumn,
         "AGGREGATION_VALUE_COLUMN": spec.aggregations.valueColumn,
         # Monitoring
@@ -100,10 +101,11 @@ def build_configmap(
         # MCP
         "MCP_AUTOSTART": str(spec.mcp.autostart).lower(),
         # Advanced
-        "DEPLOY_LOCAL_SCRIPT": str(spec.advanced.deployLocalScript).lower(),
+        "DEPLOY_LOCAL_SCRIPT": str(
+            spec.advanced.deployLocalScript or has_generated_scripts(spec)
+        ).lower(),
         "DEBUG_MODE": str(spec.advanced.debugMode).lower(),
         "COMPRESS_FILE": str(spec.advanced.compressFile).lower(),
-        "QUERY_POOL": str(spec.advanced.queryPool),
         "WRITE_IMMEDIATE": str(spec.advanced.writeImmediate).lower(),
         "THRESHOLD_TIME": spec.advanced.thresholdTime,
         "THRESHOLD_VOLUME": spec.advanced.thresholdVolume,
@@ -113,6 +115,13 @@ def build_configmap(
         "IS_LIGHTHOUSE": str(spec.nebula.isLighthouse).lower(),
     }
 
+    # Thread pools (sized to pinned cores for the dedicated performance profile)
+    data.update(thread_counts(spec))
+
+    # Operator (only operator nodes ingest data)
+    if spec.operator is not None:
+        data.update(_build_operator_data(spec))
+
     # Optional fields - only add if set
     if spec.general.licenseKey and not spec.general.licenseKeySecretRef:
         # If using inline license and no secret ref, it will be in the secret
@@ -154,7 +163,7 @@ def build_configmap(
     if spec.mqtt.user:
         data["MQTT_USER"] = spec.mqtt.user
     if spec.mqtt.message.topic:
-        data["MSG_TOPIC"] = spec.mqtt.message.topic
+        data["MSG_TOPIC"] = shared_topic(spec, spec.mqtt.message.topic)
         data["MSG_DBMS"] = spec.mqtt.message.dbms or spec.operator.defaultDbms
         data["MSG_TABLE"] = spec.mqtt.message.table
         data["MSG_TIMESTAMP_COLUMN"] = spec.mqtt.message.timestampColumn
@@ -175,10 +184,6 @@ def build_configmap(
     if spec.etherip.frequency:
         data["ETHERIP_FREQUENCY"] = spec.etherip.frequency
 
-    # Operator member
-    if spec.operator.member:
-        data["MEMBER"] = spec.operator.member
-
     # Nebula
     if spec.nebula.cidrOverlayAddress:
         data["CIDR_OVERLAY_ADDRESS"] = spec.nebula.cidrOverlayAddress
@@ -203,6 +208,52 @@ def build_configmap(
     }
 
 
+def _build_operator_data(spec: EdgeLakeOperatorSpec) -> dict[str, str]:
+    """Build the operator node settings (cluster membership and partitioning)."""
+    operator = spec.operator
+    data = {
+        "CLUSTER_NAME": operator.clusterName,
+        "DEFAULT_DBMS": operator.defaultDbms,
+        "ENABLE_HA": str(operator.enableHa).lower(),
+        "START_DATE": str(operator.startDate),
+        # Partitioning
+        # Per-table and staggered policies are rendered into partitions.al instead
+        "ENABLE_PARTITIONS": str(
+            operator.partitioning.enabled
+            and not operator.partitioning.policies
+            and not is_staggered(spec)
+        ).lower(),
+        "TABLE_NAME": operator.partitioning.tableName,
+        "PARTITION_COLUMN": operator.partitioning.column,
+        "PARTITION_INTERVAL": operator.partitioning.interval,
+        "PARTITION_KEEP": str(operator.partitioning.keep),
+        "PARTITION_SYNC": operator.partitioning.sync,
+    }
+    if operator.member:
+        data["MEMBER"] = operator.member
+    return data
+
+
+def make_immutable(resource: dict[str, Any]) -> dict[str, Any]:
+    """Make a ConfigMap immutable and name it by the hash of its data.
+
+    Kubelets do not watch immutable ConfigMaps. A config change creates a new
+    ConfigMap instead of editing the one the running pods use, so pods switch to
+    it together with the Deployment rollout.
+
+    Args:
+        resource: ConfigMap manifest, updated in place
+
+    Returns:
+        The manifest, named "<name>-<hash>"
+    """
+    data_json = json.dumps(resource.get("data", {}), sort_keys=True)
+    digest = hashlib.sha256(data_json.encode()).hexdigest()[:CONFIGMAP_HASH_LENGTH]
+    resource["metadata"]["name"] = f"{resource['metadata']['name']}-{digest}"
+    resource["immutable"] = True
+    return resource
+
+
 def _build_labels(name: str) -> dict[str, str]:
     """Build standard labels for resources."""
     return {
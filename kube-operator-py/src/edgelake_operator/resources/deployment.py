@@ -1,14 +1,31 @@
 """Deployment builder for EdgeLake Operator pods."""
 
+import math
 from typing import Any, Optional
 
 from ..constants import (
+    ANNOTATION_CREDENTIALS_HASH,
+    DEFAULT_LIVENESS_FAILURE_THRESHOLD,
+    DEFAULT_LIVENESS_PERIOD,
+    DEFAULT_PROBE_TIMEOUT,
+    DEFAULT_READINESS_FAILURE_THRESHOLD,
+    DEFAULT_READINESS_PERIOD,
+    DEFAULT_STARTUP_BUDGET,
+    DEFAULT_STARTUP_PERIOD,
+    GENERATED_SCRIPTS_PATH,
+    LOCAL_SCRIPT_NAME,
+    LOCAL_SCRIPTS_PATH,
+    REST_USER_AGENT,
     VOLUME_MOUNT_ANYLOG,
     VOLUME_MOUNT_BLOCKCHAIN,
     VOLUME_MOUNT_DATA,
     VOLUME_MOUNT_SCRIPTS,
 )
-from ..models.spec import EdgeLakeOperatorSpec
+from ..models.spec import EdgeLakeOperatorSpec, ProbeSpec
+from ..utils.performance import build_resources, build_scheduling
+from ..utils.units import parse_duration
+from .scripts import has_generated_scripts
+from .secret import credential_refs
 
 
 def build_deployment(
@@ -17,6 +34,7 @@ def build_deployment(
     spec: EdgeLakeOperatorSpec,
     resource_names: dict[str, str],
     config_hash: Optional[str] = None,
+    credentials_hash: Optional[str] = None,
 ) -> dict[str, Any]:
     """Build Deployment resource from EdgeLakeOperator spec.
 
@@ -26,6 +44,7 @@ def build_deployment(
         spec: Parsed spec from the CR
         resource_names: Generated resource names
         config_hash: Optional config hash for triggering rolling updates
+        credentials_hash: Optional digest of the credentials, rolls the pods on rotation
 
     Returns:
         Deployment manifest as dictionary
@@ -36,6 +55,8 @@ def build_deployment(
     annotations = {}
     if config_hash:
         annotations["edgelake.io/config-hash"] = config_hash
+    if credentials_hash:
+        annotations[ANNOTATION_CREDENTIALS_HASH] = credentials_hash
 
     # Container ports
     ports = [
@@ -70,6 +91,25 @@ def build_deployment(
     # Volumes (PVC or emptyDir)
     volumes = _build_volumes(spec, resource_names)
 
+    # Generated scripts, mounted on top of the scripts volume
+    if has_generated_scripts(spec):
+        volume_mounts.extend(
+            [
+                {"name": "generated-scripts", "mountPath": GENERATED_SCRIPTS_PATH},
+                {
+                    "name": "generated-scripts",
+                    "mountPath": f"{LOCAL_SCRIPTS_PATH}/{LOCAL_SCRIPT_NAME}",
+                    "subPath": LOCAL_SCRIPT_NAME,
+                },
+            ]
+        )
+        volumes.append(
+            {
+                "name": "generated-scripts",
+                "configMap": {"name": resource_names["scripts_configmap"]},
+            }
+        )
+
     # Environment from ConfigMap
     env_from = [{"configMapRef": {"name": resource_names["configmap"]}}]
 
@@ -90,24 +130,18 @@ def build_deployment(
         "tty": True,
         "stdin": True,
         "volumeMounts": volume_mounts,
-        "resources": {
-            "limits": {
-                "cpu": spec.resources.limits.cpu,
-                "memory": spec.resources.limits.memory,
-            },
-            "requests": {
-                "cpu": spec.resources.requests.cpu,
-                "memory": spec.resources.requests.memory,
-            },
-        },
+        "resources": build_resources(spec),
     }
 
     if env:
         container["env"] = env
 
+    container.update(_build_probes(spec))
+
     pod_spec: dict[str, Any] = {
         "containers": [container],
         "volumes": volumes,
+        **build_scheduling(spec, selector_labels),
     }
 
     if image_pull_secrets:
@@ -122,7 +156,8 @@ def build_deployment(
             "labels": labels,
         },
         "spec": {
-            "replicas": 1,
+            "replicas": spec.replicas,
+            "progressDeadlineSeconds": startup_budget_seconds(spec) + 60,
             "selector": {"matchLabels": selector_labels},
             "template": {
                 "metadata": {
@@ -135,11 +170,101 @@ def build_deployment(
     }
 
 
+def startup_budget_seconds(spec: EdgeLakeOperatorSpec) -> int:
+    """Time a node may take to start before it is considered stuck.
+
+    The first start syncs the blockchain from the master, which takes several
+    sync cycles, so the budget grows with blockchain.syncTime.
+    """
+    try:
+        sync_seconds = parse_duration(spec.blockchain.syncTime)
+    except ValueError:
+        sync_seconds = 0
+    return int(max(DEFAULT_STARTUP_BUDGET, 20 * sync_seconds))
+
+
+def _build_probes(spec: EdgeLakeOperatorSpec) -> dict[str, Any]:
+    """Build startup, readiness and liveness probes against the REST port.
+
+    The startup probe covers the initial blockchain sync so slow syncs do not
+    trigger restarts; liveness only starts counting once startup succeeded.
+    """
+    probes_spec = spec.probes
+    timeout = min(spec.networking.restTimeout, DEFAULT_PROBE_TIMEOUT)
+    probes: dict[str, Any] = {}
+
+    if probes_spec.startup.enabled:
+        period = _override(probes_spec.startup.periodSeconds, DEFAULT_STARTUP_PERIOD)
+        probes["startupProbe"] = _build_probe(
+            spec,
+            probes_spec.startup,
+            period=period,
+            timeout=timeout,
+            failure_threshold=math.ceil(startup_budget_seconds(spec) / period),
+        )
+
+    if probes_spec.readiness.enabled:
+        probes["readinessProbe"] = _build_probe(
+            spec,
+            probes_spec.readiness,
+            period=DEFAULT_READINESS_PERIOD,
+            timeout=timeout,
+            failure_threshold=DEFAULT_READINESS_FAILURE_THRESHOLD,
+        )
+
+    if probes_spec.liveness.enabled:
+        probes["livenessProbe"] = _build_probe(
+            spec,
+            probes_spec.liveness,
+            period=DEFAULT_LIVENESS_PERIOD,
+            timeout=timeout,
+            failure_threshold=DEFAULT_LIVENESS_FAILURE_THRESHOLD,
+        )
+
+    return probes
+
+
+def _build_probe(
+    spec: EdgeLakeOperatorSpec,
+    probe: ProbeSpec,
+    period: int,
+    timeout: int,
+    failure_threshold: int,
+) -> dict[str, Any]:
+    """Build a single probe, applying explicit overrides over derived timings."""
+    if spec.probes.type == "tcp":
+        handler: dict[str, Any] = {"tcpSocket": {"port": "rest-api"}}
+    else:
+        handler = {
+            "httpGet": {
+                "path": "/",
+                "port": "rest-api",
+                "httpHeaders": [
+                    {"name": "command", "value": "get status"},
+                    {"name": "User-Agent", "value": REST_USER_AGENT},
+                ],
+            }
+        }
+
+    return {
+        **handler,
+        "initialDelaySeconds": _override(probe.initialDelaySeconds, 0),
+        "periodSeconds": _override(probe.periodSeconds, period),
+        "timeoutSeconds": _override(probe.timeoutSeconds, timeout),
+        "failureThreshold": _override(probe.failureThreshold, failure_threshold),
+    }
+
+
+def _override(value: Optional[int], default: int) -> int:
+    """Use an explicit probe setting, including 0, over the derived default."""
+    return default if value is None else value
+
+
 def _build_volumes(
     spec: EdgeLakeOperatorSpec, resource_names: dict[str, str]
 ) -> list[dict[str, Any]]:
     """Build volume definitions."""
-    if spec.persistence.enabled:
+    if spec.uses_persistence():
         return [
             {
                 "name": "anylog-volume",
@@ -171,113 +296,13 @@ def _build_secret_env_vars(
     spec: EdgeLakeOperatorSpec, resource_names: dict[str, str]
 ) -> list[dict[str, Any]]:
     """Build env vars that reference secrets."""
-    env = []
-
-    # Database password
-    if spec.database.passwordSecretRef:
-        env.append(
-            {
-                "name": "DB_PASSWD",
-                "valueFrom": {
-                    "secretKeyRef": {
-                        "name": spec.database.passwordSecretRef.name,
-                        "key": spec.database.passwordSecretRef.key,
-                    }
-                },
-            }
-        )
-    elif spec.database.password:
-        env.append(
-            {
-                "name": "DB_PASSWD",
-                "valueFrom": {
-                    "secretKeyRef": {
-                        "name": resource_names["secret"],
-                        "key": "db-password",
-                    }
-                },
-            }
-        )
-
-    # NoSQL password
-    if spec.database.nosql.passwordSecretRef:
-        env.append(
-            {
-                "name": "NOSQL_PASSWD",
-                "valueFrom": {
-                    "secretKeyRef": {
-                        "name": spec.database.nosql.passwordSecretRef.name,
-                        "key": spec.database.nosql.passwordSecretRef.key,
-                    }
-                },
-            }
-        )
-    elif spec.database.nosql.password:
-        env.append(
-            {
-                "name": "NOSQL_PASSWD",
-                "valueFrom": {
-                    "secretKeyRef": {
-                        "name": resource_names["secret"],
-                        "key": "nosql-password",
-                    }
-                },
-            }
-        )
-
-    # MQTT password
-    if spec.mqtt.passwordSecretRef:
-        env.append(
-            {
-                "name": "MQTT_PASSWD",
-                "valueFrom": {
-                    "secretKeyRef": {
-                        "name": spec.mqtt.passwordSecretRef.name,
-                        "key": spec.mqtt.passwordSecretRef.key,
-                    }
-                },
-            }
-        )
-    elif spec.mqtt.password:
-        env.append(
-            {
-                "name": "MQTT_PASSWD",
-                "valueFrom": {
-                    "secretKeyRef": {
-                        "name": resource_names["secret"],
-                        "key": "mqtt-password",
-                    }
-                },
-            }
-        )
-
-    # License key
-    if spec.general.licenseKeySecretRef:
-        env.append(
-            {
-                "name": "LICENSE_KEY",
-                "valueFrom": {
-                    "secretKeyRef": {
-                        "name": spec.general.licenseKeySecretRef.name,
-                        "key": spec.general.licenseKeySecretRef.key,
-                    }
-                },
-            }
-        )
-    elif spec.general.licenseKey:
-        env.append(
-            {
-                "name": "LICENSE_KEY",
-                "valueFrom": {
-                    "secretKeyRef": {
-                        "name": resource_names["secret"],
-                        "key": "license-key",
-                    }
-                },
-            }
-        )
-
-    return env
+    return [
+        {
+            "name": env_name,
+            "valueFrom": {"secretKeyRef": {"name": secret_name, "key": key}},
+        }
+        for env_name, (secret_name, key) in credential_refs(spec, resource_names).items()
+    ]
 
 
 def _build_labels(name: str) -> dict[str, str]:
@@ -2,7 +2,8 @@
 
 from typing import Any
 
-from ..models.spec import EdgeLakeOperatorSpec
+from ..constants import SNAPSHOT_API_GROUP
+from ..models.spec import EdgeLakeOperatorSpec, VolumeSize
 
 
 def build_pvcs(
@@ -10,6 +11,7 @@ def build_pvcs(
     namespace: str,
     spec: EdgeLakeOperatorSpec,
     resource_names: dict[str, str],
+    seed_snapshot: str | None = None,
 ) -> list[dict[str, Any]]:
     """Build PVC resources from EdgeLakeOperator spec.
 
@@ -18,11 +20,12 @@ def build_pvcs(
         namespace: Namespace of the CR
         spec: Parsed spec from the CR
         resource_names: Generated resource names
+        seed_snapshot: Snapshot persistence.blockchain.fromSeed resolved to
 
     Returns:
         List of PVC manifests as dictionaries
     """
-    if not spec.persistence.enabled:
+    if not spec.uses_persistence():
         return []
 
     labels = _build_labels(name)
@@ -35,6 +38,7 @@ def build_pvcs(
             spec.persistence.anylog.size,
             spec.persistence.storageClassName,
             spec.persistence.accessMode,
+            _build_data_source(spec.persistence.anylog),
         ),
         _build_pvc(
             resource_names["pvc_blockchain"],
@@ -43,6 +47,7 @@ def build_pvcs(
             spec.persistence.blockchain.size,
             spec.persistence.storageClassName,
             spec.persistence.accessMode,
+            _build_data_source(spec.persistence.blockchain, seed_snapshot),
         ),
         _build_pvc(
             resource_names["pvc_data"],
@@ -51,6 +56,7 @@ def build_pvcs(
             spec.persistence.data.size,
             spec.persistence.storageClassName,
             spec.persistence.accessMode,
+            _build_data_source(spec.persistence.data),
         ),
         _build_pvc(
             resource_names["pvc_scripts"],
@@ -59,6 +65,7 @@ def build_pvcs(
             spec.persistence.scripts.size,
             spec.persistence.storageClassName,
             spec.persistence.accessMode,
+            _build_data_source(spec.persistence.scripts),
         ),
     ]
 
@@ -72,6 +79,7 @@ def _build_pvc(
     size: str,
     storage_class: str | None,
     access_mode: str,
+    data_source: dict[str, str] | None = None,
 ) -> dict[str, Any]:
     """Build a single PVC manifest."""
     pvc: dict[str, Any] = {
@@ -95,9 +103,36 @@ def _build_pvc(
     if storage_class:
         pvc["spec"]["storageClassName"] = storage_class
 
+    if data_source:
+        pvc["spec"]["dataSource"] = data_source
+
     return pvc
 
 
+def _build_data_source(
+    volume: VolumeSize, seed_snapshot: str | None = None
+) -> dict[str, str] | None:
+    """Build the PVC dataSource for a volume pre-populated from a snapshot or clone.
+
+    A VolumeSnapshot source restores a point-in-time copy (e.g. a seed node's
+    blockchain); a PersistentVolumeClaim source clones an existing volume in the
+    same namespace. Both require a CSI driver that supports the operation.
+    """
+    snapshot_name = volume.fromSnapshot or seed_snapshot
+    if snapshot_name:
+        return {
+            "apiGroup": SNAPSHOT_API_GROUP,
+            "kind": "VolumeSnapshot",
+            "name": snapshot_name,
+        }
+    if volume.cloneFrom:
+        return {
+            "kind": "PersistentVolumeClaim",
+            "name": volume.cloneFrom,
+        }
+    return None
+
+
 def _build_labels(name: str) -> dict[str, str]:
     """Build standard labels for resources."""
     return {
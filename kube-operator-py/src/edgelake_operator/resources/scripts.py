@@ -0,0 +1,298 @@
+"""Generated EdgeLake script builder.
+
+Settings that do not fit the flat environment variables consumed by the
+EdgeLake deployment scripts (lists of MQTT subscriptions, etc.) are rendered
+into EdgeLake command scripts. The scripts are stored in a ConfigMap mounted
+on the scripts volume, and ``local_script.al`` processes each of them when
+the node starts (DEPLOY_LOCAL_SCRIPT=true).
+"""
+
+from functools import partial
+from typing import Any, Optional
+
+from ..constants import ETHERIP_SIMULATOR_URL, GENERATED_SCRIPTS_PATH, LOCAL_SCRIPT_NAME
+from ..models.spec import (
+    AggregationRuleSpec,
+    EdgeLakeOperatorSpec,
+    EtheripPlcSpec,
+    MqttSubscriptionSpec,
+    OpcuaGroupSpec,
+    PartitionPolicySpec,
+)
+from ..utils.maintenance import drop_offset_seconds, is_staggered, partition_policies
+
+_HEADER = "#" + "-" * 79
+
+
+def build_scripts_configmap(
+    name: str,
+    namespace: str,
+    spec: EdgeLakeOperatorSpec,
+    resource_names: dict[str, str],
+    uid: Optional[str] = None,
+) -> dict[str, Any] | None:
+    """Build the ConfigMap holding generated EdgeLake scripts.
+
+    Args:
+        name: Name of the EdgeLakeOperator CR
+        namespace: Namespace of the CR
+        spec: Parsed spec from the CR
+        resource_names: Generated resource names
+        uid: UID of the CR, used to derive the partition drop offset
+
+    Returns:
+        ConfigMap manifest as dictionary, or None if no scripts are needed
+    """
+    scripts = render_scripts(spec, uid or f"{namespace}/{name}")
+    if not scripts:
+        return None
+
+    data = dict(scripts)
+    data[LOCAL_SCRIPT_NAME] = _render_local_script(scripts)
+
+    return {
+        "apiVersion": "v1",
+        "kind": "ConfigMap",
+        "metadata": {
+            "name": resource_names["scripts_configmap"],
+            "namespace": namespace,
+            "labels": _build_labels(name),
+        },
+        "data": data,
+    }
+
+
+def has_generated_scripts(spec: EdgeLakeOperatorSpec) -> bool:
+    """Check if the spec needs any generated scripts."""
+    return bool(render_scripts(spec))
+
+
+def render_scripts(spec: EdgeLakeOperatorSpec, instance_key: str = "") -> dict[str, str]:
+    """Render all generated scripts for the spec.
+
+    Args:
+        spec: Parsed spec from the CR
+        instance_key: Stable identity of the CR, used for per-instance scheduling
+
+    Returns:
+        Mapping of script file name to script content
+    """
+    # Scripts are processed in this order, so partitions exist before data arrives
+    renderers = {
+        "partitions.al": partial(_render_partitions_script, instance_key=instance_key),
+        "mqtt.al": _render_mqtt_script,
+        "opcua.al": _render_opcua_script,
+        "etherip.al": _render_etherip_script,
+        "aggregations.al": _render_aggregations_script,
+    }
+
+    scripts = {}
+    for file_name, renderer in renderers.items():
+        content = renderer(spec)
+        if content:
+            scripts[file_name] = content
+    return scripts
+
+
+def _render_local_script(scripts: dict[str, str]) -> str:
+    """Render local_script.al, which processes every generated script."""
+    lines = [_HEADER, "# Generated by edgelake-kube-operator - do not edit", _HEADER]
+    for file_name in scripts:
+        lines.append(f"process {GENERATED_SCRIPTS_PATH}/{file_name}")
+    return "\n".join(lines) + "\n"
+
+
+def _render_partitions_script(spec: EdgeLakeOperatorSpec, instance_key: str) -> Optional[str]:
+    """Render a partition declaration and a retention job per partitioning policy."""
+    if spec.operator is None:
+        return None
+    partitioning = spec.operator.partitioning
+    if not partitioning.enabled or not (partitioning.policies or is_staggered(spec)):
+        return None
+
+    offset = drop_offset_seconds(spec, instance_key) if is_staggered(spec) else 0
+    lines = [_HEADER, "# Partitioning policies", _HEADER, "on error ignore", ""]
+    for policy in partition_policies(spec):
+        lines.extend(_render_partition_policy(spec, policy, offset))
+        lines.append("")
+    return "\n".join(lines)
+
+
+def _render_partition_policy(
+    spec: EdgeLakeOperatorSpec, policy: PartitionPolicySpec, offset: int
+) -> list[str]:
+    """Render the 'partition' and 'drop partition' schedule commands for one policy."""
+    dbms = policy.dbms or spec.operator.defaultDbms
+    job_name = f"Drop Partitions {dbms}.{policy.table}"
+    start = f" and start = +{offset}s" if offset else ""
+    return [
+        f"partition {dbms} {policy.table} using {policy.column} by {policy.interval}",
+        f'schedule time = {policy.sync}{start} and name = "{job_name}" '
+        f"task drop partition where dbms = {dbms} and table = {policy.table} "
+        f"and keep = {policy.keep}",
+    ]
+
+
+def _render_mqtt_script(spec: EdgeLakeOperatorSpec) -> Optional[str]:
+    """Render one 'run msg client' per MQTT subscription."""
+    if not spec.mqtt.enabled or not spec.mqtt.subscriptions:
+        return None
+
+    lines = [_HEADER, "# MQTT subscriptions", _HEADER, "on error ignore", ""]
+    for subscription in spec.mqtt.subscriptions:
+        lines.append(_render_msg_client(spec, subscription))
+        lines.append("")
+    return "\n".join(lines)
+
+
+def _render_msg_client(spec: EdgeLakeOperatorSpec, subscription: MqttSubscriptionSpec) -> str:
+    """Render a 'run msg client' command for a single subscription."""
+    mqtt = spec.mqtt
+    client_params = [f"broker={mqtt.broker}", f"port={mqtt.port}"]
+    if mqtt.user:
+        client_params.append(f"user={mqtt.user}")
+    if mqtt.password or mqtt.passwordSecretRef:
+        client_params.append("password=!mqtt_passwd")
+    client_params.append(f"log={str(mqtt.log).lower()}")
+    client_params.append(f"qos={subscription.qos}")
+    client_params.append(f"threads={subscription.threads}")
+
+    topic_params = [
+        f"name={shared_topic(spec, subscription.topic)}",
+        f"dbms={subscription.dbms or spec.operator.defaultDbms}",
+        f"table={subscription.table}",
+        f"column.timestamp.timestamp={subscription.timestampColumn}",
+    ]
+    for column in subscription.columns:
+        topic_params.append(f"column.{column.name}=(type={column.type} and value={column.value})")
+
+    topic = " and\n    ".join(topic_params)
+    return f"<run msg client where {' and '.join(client_params)} and topic=(\n    {topic}\n)>"
+
+
+def _render_opcua_script(spec: EdgeLakeOperatorSpec) -> Optional[str]:
+    """Render one OPC-UA client per polling group."""
+    if not spec.opcua.enabled or not spec.opcua.groups:
+        return None
+
+    lines = [_HEADER, "# OPC-UA polling groups", _HEADER, "on error ignore", ""]
+    for group in spec.opcua.groups:
+        lines.extend(_render_opcua_group(spec, group))
+        lines.append("")
+    return "\n".join(lines)
+
+
+def _render_opcua_group(spec: EdgeLakeOperatorSpec, group: OpcuaGroupSpec) -> list[str]:
+    """Render the commands polling one OPC-UA group.
+
+    An explicit node list becomes a single 'run opcua client' that reads all
+    nodes in one request per cycle. A browse root is expanded on the node with
+    'get opcua struct ... format = run_client', which writes the equivalent
+    client command for every variable below the root, and is then processed.
+    """
+    params = [
+        f"name = {group.name}",
+        f"url = {group.url}",
+        f"frequency = {group.frequency}",
+        f"dbms = {group.dbms or spec.operator.defaultDbms}",
+        f"table = {group.table}",
+    ]
+    if group.browseRoot:
+        output = f"!tmp_dir/opcua_{group.name}.al"
+        params.extend(
+            [
+                f'node = "{group.browseRoot}"',
+                "class = variable",
+                "format = run_client",
+                f"output = {output}",
+            ]
+        )
+        return [_render_where("get opcua struct", params), f"process {output}"]
+
+    params.extend(f'node = "{node}"' for node in group.nodes)
+    return [_render_where("run opcua client", params)]
+
+
+def _render_etherip_script(spec: EdgeLakeOperatorSpec) -> Optional[str]:
+    """Render one PLC client per EtherNet/IP PLC, all polled from this node."""
+    if not spec.etherip.enabled or not spec.etherip.plcs:
+        return None
+
+    lines = [_HEADER, "# EtherNet/IP PLCs", _HEADER, "on error ignore", ""]
+    for plc in spec.etherip.plcs:
+        lines.append(_render_plc_client(spec, plc))
+        lines.append("")
+    return "\n".join(lines)
+
+
+def _render_plc_client(spec: EdgeLakeOperatorSpec, plc: EtheripPlcSpec) -> str:
+    """Render a 'run plc client' reading the PLC's whole tag group per cycle."""
+    url = plc.url or ETHERIP_SIMULATOR_URL
+    params = [
+        "type = etherip",
+        f"name = {plc.name}",
+        f"url = {url}",
+        f"frequency = {plc.frequency}",
+        f"dbms = {plc.dbms or spec.operator.defaultDbms}",
+        f"table = {plc.table}",
+    ]
+    params.extend(f'node = "{tag}"' for tag in plc.tags)
+    return _render_where("run plc client", params)
+
+
+def _render_aggregations_script(spec: EdgeLakeOperatorSpec) -> Optional[str]:
+    """Render one 'set aggregation' per aggregation rule."""
+    if not spec.aggregations.enabled or not spec.aggregations.rules:
+        return None
+
+    lines = [_HEADER, "# Aggregation rules", _HEADER, "on error ignore", ""]
+    for rule in spec.aggregations.rules:
+        params = [
+            f"dbms = {rule.dbms or spec.operator.defaultDbms}",
+            f"table = {rule.table}",
+            f"intervals = {rule.buckets}",
+            f"time = {rule.interval}",
+            f"time_column = {rule.timeColumn}",
+            f"value_column = {rule.valueColumn}",
+        ]
+        lines.append(_render_where("set aggregation", params))
+        lines.append("")
+    return "\n".join(lines)
+
+
+def aggregation_query(spec: EdgeLakeOperatorSpec, rule: AggregationRuleSpec) -> str:
+    """Build the 'get aggregation' command returning the rule's rollup.
+
+    EdgeLake computes every function for each bucket; the rule's functions
+    select which of them dashboards read back.
+    """
+    params = [f"dbms = {rule.dbms or spec.operator.defaultDbms}", f"table = {rule.table}"]
+    params.extend(f"function = {function}" for function in rule.functions)
+    return f"get aggregation where {' and '.join(params)}"
+
+
+def _render_where(command: str, params: list[str]) -> str:
+    """Render a multi-line '<command where a and b ...>' block."""
+    where = " and\n    ".join(params)
+    return f"<{command} where\n    {where}\n>"
+
+
+def shared_topic(spec: EdgeLakeOperatorSpec, topic: str) -> str:
+    """Prefix a topic with the MQTT v5 shared subscription group, if configured.
+
+    Every node subscribing to ``$share/<group>/<topic>`` receives a share of the
+    messages instead of a full copy, so ingestion scales with the node count.
+    """
+    if spec.mqtt.sharedGroup:
+        return f"$share/{spec.mqtt.sharedGroup}/{topic}"
+    return topic
+
+
+def _build_labels(name: str) -> dict[str, str]:
+    """Build standard labels for resources."""
+    return {
+        "app.kubernetes.io/name": "edgelake-operator",
+        "app.kubernetes.io/instance": name,
+        "app.kubernetes.io/component": "operator",
+        "app.kubernetes.io/managed-by": "edgelake-kube-operator",
+    }
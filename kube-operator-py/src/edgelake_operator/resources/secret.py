@@ -3,6 +3,7 @@
 import base64
 from typing import Any
 
+from ..constants import LABEL_CREDENTIALS
 from ..models.spec import EdgeLakeOperatorSpec
 
 
@@ -47,19 +48,60 @@ def build_secret(
     if not data:
         return None
 
+    labels = _build_labels(name)
+    if spec.secrets.rolloutOnRotation:
+        # Selected by the operator's Secret watch
+        labels[LABEL_CREDENTIALS] = "true"
+
     return {
         "apiVersion": "v1",
         "kind": "Secret",
         "metadata": {
             "name": resource_names["secret"],
             "namespace": namespace,
-            "labels": _build_labels(name),
+            "labels": labels,
         },
         "type": "Opaque",
         "data": data,
     }
 
 
+def credential_refs(
+    spec: EdgeLakeOperatorSpec, resource_names: dict[str, str]
+) -> dict[str, tuple[str, str]]:
+    """Resolve where each credential of the spec is stored.
+
+    Secret references win over inline values, which are stored in the
+    operator-created Secret.
+
+    Args:
+        spec: Parsed spec from the CR
+        resource_names: Generated resource names
+
+    Returns:
+        Mapping of env var name to (Secret name, key)
+    """
+    credentials = [
+        ("DB_PASSWD", spec.database.passwordSecretRef, spec.database.password, "db-password"),
+        (
+            "NOSQL_PASSWD",
+            spec.database.nosql.passwordSecretRef,
+            spec.database.nosql.password,
+            "nosql-password",
+        ),
+        ("MQTT_PASSWD", spec.mqtt.passwordSecretRef, spec.mqtt.password, "mqtt-password"),
+        ("LICENSE_KEY", spec.general.licenseKeySecretRef, spec.general.licenseKey, "license-key"),
+    ]
+
+    refs = {}
+    for env_name, secret_ref, inline_value, inline_key in credentials:
+        if secret_ref:
+            refs[env_name] = (secret_ref.name, secret_ref.key)
+        elif inline_value:
+            refs[env_name] = (resource_names["secret"], inline_key)
+    return refs
+
+
 def _encode(value: str) -> str:
     """Base64 encode a string for Kubernetes secret."""
     return base64.b64encode(value.encode()).decode()
@@ -2,7 +2,9 @@
 
 from typing import Any
 
+from ..constants import ANNOTATION_TOPOLOGY_MODE
 from ..models.spec import EdgeLakeOperatorSpec
+from ..utils.units import parse_duration
 
 
 def build_service(
@@ -58,18 +60,75 @@ def build_service(
             broker_port["nodePort"] = spec.networking.brokerPort
         ports.append(broker_port)
 
+    routing = spec.networking.routing
+    service_spec: dict[str, Any] = {
+        "type": spec.networking.serviceType,
+        "selector": selector_labels,
+        "ports": ports,
+        "internalTrafficPolicy": routing.internalTrafficPolicy,
+        "sessionAffinity": routing.sessionAffinity,
+    }
+    if routing.sessionAffinity == "ClientIP":
+        service_spec["sessionAffinityConfig"] = {
+            "clientIP": {"timeoutSeconds": int(parse_duration(routing.sessionAffinityTimeout))}
+        }
+
+    metadata: dict[str, Any] = {
+        "name": resource_names["service"],
+        "namespace": namespace,
+        "labels": labels,
+    }
+    # Topology-aware routing: EndpointSlice hints steer clients to endpoints in their zone
+    if routing.topologyAware:
+        metadata["annotations"] = {ANNOTATION_TOPOLOGY_MODE: "Auto"}
+
+    return {
+        "apiVersion": "v1",
+        "kind": "Service",
+        "metadata": metadata,
+        "spec": service_spec,
+    }
+
+
+def build_peer_service(
+    name: str,
+    namespace: str,
+    spec: EdgeLakeOperatorSpec,
+    resource_names: dict[str, str],
+) -> dict[str, Any]:
+    """Build the headless Service for direct pod-to-pod EdgeLake TCP traffic.
+
+    Its DNS name resolves to the IPs of the ready pods, so peers connect to a
+    pod directly instead of through the load-balanced Service.
+
+    Args:
+        name: Name of the EdgeLakeOperator CR
+        namespace: Namespace of the CR
+        spec: Parsed spec from the CR
+        resource_names: Generated resource names
+
+    Returns:
+        Service manifest as dictionary
+    """
     return {
         "apiVersion": "v1",
         "kind": "Service",
         "metadata": {
-            "name": resource_names["service"],
+            "name": resource_names["peer_service"],
             "namespace": namespace,
-            "labels": labels,
+            "labels": _build_labels(name),
         },
         "spec": {
-            "type": spec.networking.serviceType,
-            "selector": selector_labels,
-            "ports": ports,
+            "clusterIP": "None",
+            "selector": _build_selector_labels(name),
+            "ports": [
+                {
+                    "name": "tcp-server",
+                    "port": spec.networking.serverPort,
+                    "targetPort": spec.networking.serverPort,
+                    "protocol": "TCP",
+                }
+            ],
         },
     }
 
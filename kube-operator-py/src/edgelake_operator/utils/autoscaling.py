@@ -0,0 +1,113 @@
+"""Latency-driven replica calculation for query nodes.
+
+Each query pod reports a cumulative histogram of query execution times. The
+difference between two samples gives the histogram of the queries completed in
+between, from which the p95 latency is estimated. Together with the number of
+in-flight queries this yields a desired replica count, damped by a tolerance
+band and separate scale-up and scale-down cooldowns (as the HPA does).
+"""
+
+import math
+from datetime import datetime
+from typing import Optional
+
+from ..models.spec import AutoscalingSpec
+from .units import parse_duration
+
+
+def histogram_delta(previous: Optional[dict[str, int]], current: dict[str, int]) -> dict[str, int]:
+    """Return the queries counted between two cumulative histogram samples.
+
+    If any bucket went backwards the node restarted, and the current sample
+    is used as is.
+    """
+    if not previous:
+        return {}
+    delta = {bucket: count - previous.get(bucket, 0) for bucket, count in current.items()}
+    if any(count < 0 for count in delta.values()):
+        return dict(current)
+    return delta
+
+
+def merge_histograms(histograms: list[dict[str, int]]) -> dict[str, int]:
+    """Sum histograms bucket by bucket."""
+    merged: dict[str, int] = {}
+    for histogram in histograms:
+        for bucket, count in histogram.items():
+            merged[bucket] = merged.get(bucket, 0) + count
+    return merged
+
+
+def histogram_percentile(histogram: dict[str, int], quantile: float) -> Optional[float]:
+    """Estimate a latency percentile as the upper bound of the bucket that reaches it.
+
+    Args:
+        histogram: Query counts keyed by bucket upper bound in seconds ("inf" last)
+        quantile: Percentile as a fraction (0.95 for p95)
+
+    Returns:
+        Latency in seconds (``math.inf`` if it falls in the overflow bucket),
+        or None if no queries were counted
+    """
+    total = sum(histogram.values())
+    if total <= 0:
+        return None
+
+    threshold = quantile * total
+    cumulative = 0
+    for bucket in sorted(histogram, key=lambda b: math.inf if b == "inf" else float(b)):
+        cumulative += histogram[bucket]
+        if cumulative >= threshold:
+            return math.inf if bucket == "inf" else float(bucket)
+    return math.inf
+
+
+def desired_replicas(
+    current: int,
+    p95_seconds: Optional[float],
+    in_flight: int,
+    policy: AutoscalingSpec,
+) -> int:
+    """Compute the replica count that brings latency and concurrency back to target.
+
+    Args:
+        current: Current number of replicas
+        p95_seconds: Observed p95 query latency, or None if no queries completed
+        in_flight: Queries currently executing across all replicas
+        policy: Autoscaling policy from the spec
+
+    Returns:
+        Desired replica count within [minReplicas, maxReplicas]
+    """
+    ratios = [in_flight / (policy.targetInFlightPerReplica * max(current, 1))]
+    if p95_seconds is not None:
+        ratios.append(p95_seconds / parse_duration(policy.targetP95Latency))
+    ratio = max(ratios)
+
+    # Tolerance band around the target avoids flapping on small fluctuations
+    if abs(ratio - 1.0) <= policy.tolerance:
+        desired = current
+    elif math.isinf(ratio):
+        desired = policy.maxReplicas
+    else:
+        desired = math.ceil(current * ratio)
+
+    return max(policy.minReplicas, min(policy.maxReplicas, desired))
+
+
+def cooldown_elapsed(
+    last_scale_time: Optional[str],
+    now: datetime,
+    scale_up: bool,
+    policy: AutoscalingSpec,
+) -> bool:
+    """Check whether enough time passed since the last scaling action.
+
+    Scaling up uses a short cooldown so peaks are absorbed quickly; scaling
+    down uses a long one so capacity is not released between bursts.
+    """
+    if not last_scale_time:
+        return True
+    cooldown = policy.scaleUpCooldown if scale_up else policy.scaleDownCooldown
+    elapsed = (now - datetime.fromisoformat(last_scale_time)).total_seconds()
+    return elapsed >= parse_duration(cooldown)
@@ -0,0 +1,52 @@
+"""Batch gating shared by the rollouts that fan out across many CRs.
+
+A change that reaches many CRs (a profile change, rotated credentials) is
+applied to a few CRs at a time. The next batch is sent once the interval has
+passed since the previous one and every CR of the previous batch is done; a
+CR of the previous batch that failed holds the rollout back.
+"""
+
+from datetime import datetime
+from typing import Callable, Optional
+
+from ..models.status import OperatorPhase
+from .units import parse_duration
+
+
+def batch_due(last_batch_at: Optional[str], interval: str, now: datetime) -> bool:
+    """Check if the interval has passed since the previous batch was sent.
+
+    Args:
+        last_batch_at: When the previous batch was sent (ISO 8601), None for the first
+        interval: Minimum time between batches (e.g. "30 seconds")
+        now: Current time
+
+    Returns:
+        True if the next batch may be sent
+    """
+    if not last_batch_at:
+        return True
+    elapsed = (now - datetime.fromisoformat(last_batch_at)).total_seconds()
+    return elapsed >= parse_duration(interval)
+
+
+def batch_progress(
+    last_batch: list[str], unfinished_phase: Callable[[str], Optional[str]]
+) -> tuple[list[str], list[str]]:
+    """Find the CRs of the previous batch that are not done yet.
+
+    Args:
+        last_batch: CR names of the previous batch
+        unfinished_phase: Returns the phase of a CR that is not done yet, or None
+            once it is done (or no longer exists)
+
+    Returns:
+        (CRs not done yet, the sorted subset of them that failed)
+    """
+    unfinished = {}
+    for cr_name in last_batch:
+        phase = unfinished_phase(cr_name)
+        if phase is not None:
+            unfinished[cr_name] = phase
+    failed = sorted(cr for cr, phase in unfinished.items() if phase == OperatorPhase.FAILED.value)
+    return list(unfinished), failed
@@ -0,0 +1,54 @@
+"""Adaptive buffer flush thresholds for EdgeLake operator nodes.
+
+EdgeLake buffers streamed rows per table and writes a file when either the
+time or the volume threshold is reached. A single global setting is a poor fit
+for mixed workloads: high-rate tables produce many small files and trickle
+tables wait the full time threshold. The thresholds here are derived from each
+table's observed row rate so files approach a target size while latency stays
+within [minTime, maxTime].
+"""
+
+from ..models.spec import AdaptiveBuffersSpec
+from .units import parse_duration, parse_size
+
+# Smallest volume threshold worth setting; below this the time threshold flushes first
+MIN_VOLUME_BYTES = 10 * 1024
+
+
+def compute_thresholds(rows_per_second: float, policy: AdaptiveBuffersSpec) -> tuple[float, int]:
+    """Compute (time seconds, volume bytes) flush thresholds for one table.
+
+    Args:
+        rows_per_second: Observed ingest rate of the table
+        policy: Adaptive buffer policy from the spec
+
+    Returns:
+        Tuple of time threshold in seconds and volume threshold in bytes
+    """
+    min_time = parse_duration(policy.minTime)
+    max_time = parse_duration(policy.maxTime)
+    target_size = parse_size(policy.targetFileSize)
+    max_volume = parse_size(policy.maxVolume)
+
+    bytes_per_second = rows_per_second * policy.avgRowBytes
+    if bytes_per_second <= 0:
+        return max_time, target_size
+
+    # Time to fill a target-sized file, bounded by the latency limits
+    time_threshold = min(max(target_size / bytes_per_second, min_time), max_time)
+
+    # High-rate tables hit min_time first: let their batches grow past the target
+    volume_threshold = min(max(bytes_per_second * time_threshold, MIN_VOLUME_BYTES), max_volume)
+
+    return time_threshold, int(volume_threshold)
+
+
+def thresholds_changed(current: dict, time_seconds: float, volume_bytes: int) -> bool:
+    """Check if new thresholds differ enough (>20%) from the applied ones to re-apply."""
+    if not current:
+        return True
+    for key, new in (("timeSeconds", time_seconds), ("volumeBytes", volume_bytes)):
+        old = current.get(key)
+        if not old or abs(new - old) / old > 0.2:
+            return True
+    return False
@@ -0,0 +1,94 @@
+"""Credential rotation for running EdgeLake nodes.
+
+EdgeLake reads its credentials from the environment once at startup, so a
+rotated Secret only reaches a node through a restart. With
+``secrets.rolloutOnRotation`` the Deployment's pod template carries a digest of
+every credential the CR references; when the contents of one of those Secrets
+change, the CRs using it are queued and rolled a batch at a time, so a Secret
+shared by a fleet does not restart the whole fleet at once.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+
+def credentials_hash(
+    refs: dict[str, tuple[str, str]], secrets: dict[str, Optional[dict[str, str]]]
+) -> str:
+    """Compute a digest of the credentials a CR references.
+
+    Only the referenced keys count, so unrelated changes to a shared Secret do
+    not roll the pods.
+
+    Args:
+        refs: Mapping of env var name to (Secret name, key)
+        secrets: Data of each referenced Secret by name (None if it does not exist)
+
+    Returns:
+        Short hex digest
+    """
+    values = {
+        env_name: (secrets.get(secret_name) or {}).get(key)
+        for env_name, (secret_name, key) in refs.items()
+    }
+    values_json = json.dumps(values, sort_keys=True)
+    return hashlib.sha256(values_json.encode()).hexdigest()[:16]
+
+
+def rotation_status(secret_name: str, digest: str, now: str) -> dict[str, Any]:
+    """Build status.credentialRotation for one rollout.
+
+    Args:
+        secret_name: Name of the rotated Secret
+        digest: New credentials hash of the pod template
+        now: Timestamp of the rollout (ISO 8601)
+
+    Returns:
+        Status dictionary
+    """
+    return {"secret": secret_name, "credentialsHash": digest, "rolledAt": now}
+
+
+@dataclass
+class Rotation:
+    """CRs still to roll for one rotated Secret."""
+
+    pending: list[str] = field(default_factory=list)
+    last_batch: list[str] = field(default_factory=list)
+    last_batch_at: Optional[str] = None
+
+
+class CredentialRollout:
+    """In-memory queue of the CRs to roll for rotated Secrets, by Secret.
+
+    Not persisted: after an operator restart the initial Secret listing finds
+    the pod templates whose digest is stale and queues their CRs again.
+    """
+
+    def __init__(self) -> None:
+        self._rotations: dict[tuple[str, str], Rotation] = {}
+
+    def queue(self, namespace: str, secret_name: str, cr_name: str) -> bool:
+        """Queue a CR to roll for a rotated Secret.
+
+        Returns:
+            False if the CR is already queued
+        """
+        rotation = self._rotations.setdefault((namespace, secret_name), Rotation())
+        if cr_name in rotation.pending:
+            return False
+        rotation.pending.append(cr_name)
+        return True
+
+    def rotations(self) -> list[tuple[str, str, Rotation]]:
+        """Return (namespace, Secret name, rotation) of every rotation in progress."""
+        return [(*key, rotation) for key, rotation in self._rotations.items()]
+
+    def finish(self, namespace: str, secret_name: str) -> None:
+        """Forget a rotation whose CRs have all rolled."""
+        self._rotations.pop((namespace, secret_name), None)
+
+
+credential_rollout = CredentialRollout()
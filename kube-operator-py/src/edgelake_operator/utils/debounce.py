@@ -0,0 +1,128 @@
+"""Coalescing of bursty EdgeLakeOperator writes.
+
+GitOps tools often write a CR several times within seconds (a spec change, then
+a label, then an annotation). With ``reconcile.debounce`` set, the update
+handler holds an update back until the CR has been quiet for the debounce
+window, but no longer than ``reconcile.maxDelay`` after the first write. It does
+so by raising kopf.TemporaryError; kopf diffs the CR against the last handled
+state on every retry, so the retry sees all writes of the burst as one diff and
+applies them with a single rollout.
+
+kopf does not run the update handler for writes that arrive while it waits for
+the retry, so every watch event is also recorded (see ``record``); otherwise
+the writes of a burst would be under-counted and the quiet period measured
+from the wrong write.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional
+
+from ..constants import KOPF_ANNOTATION_PREFIX
+
+
+@dataclass
+class PendingUpdate:
+    """Writes to one CR that have not been applied yet."""
+
+    first_seen: datetime
+    last_seen: datetime
+    digest: str
+    writes: int = 1
+
+
+def write_digest(body: dict[str, Any]) -> str:
+    """Compute a digest of a CR's spec, labels and annotations, to detect new writes.
+
+    kopf's own annotations are left out: it writes handler progress to them on
+    every retry.
+    """
+    metadata = body.get("metadata") or {}
+    annotations = {
+        key: value
+        for key, value in (metadata.get("annotations") or {}).items()
+        if not key.startswith(KOPF_ANNOTATION_PREFIX)
+    }
+    essence = {
+        "spec": body.get("spec"),
+        "labels": metadata.get("labels") or {},
+        "annotations": annotations,
+    }
+    essence_json = json.dumps(essence, sort_keys=True, default=str)
+    return hashlib.sha256(essence_json.encode()).hexdigest()[:16]
+
+
+class UpdateDebouncer:
+    """In-memory registry of CR updates held back by the debounce window."""
+
+    def __init__(self) -> None:
+        self._pending: dict[tuple[str, str], PendingUpdate] = {}
+
+    def observe(
+        self,
+        namespace: str,
+        name: str,
+        digest: str,
+        window: float,
+        max_delay: float,
+        now: datetime,
+    ) -> Optional[float]:
+        """Record the current state of a CR and decide whether to apply it yet.
+
+        Args:
+            namespace: Namespace
+            name: EdgeLakeOperator name
+            digest: Digest of the CR's current spec, labels and annotations
+            window: Quiet period in seconds before the update is applied
+            max_delay: Longest time in seconds since the first write to hold the update back
+            now: Current time
+
+        Returns:
+            Seconds to wait before applying, or None to apply now
+        """
+        pending = self._pending.get((namespace, name))
+        if pending is None:
+            pending = self._pending[(namespace, name)] = PendingUpdate(now, now, digest)
+        else:
+            self.record(namespace, name, digest, now)
+
+        quiet_until = pending.last_seen.timestamp() + window
+        deadline = min(quiet_until, pending.first_seen.timestamp() + max_delay)
+        wait = deadline - now.timestamp()
+        return wait if wait > 0 else None
+
+    def record(self, namespace: str, name: str, digest: str, now: datetime) -> None:
+        """Count a write seen on the watch while the update of a CR is held back.
+
+        Args:
+            namespace: Namespace
+            name: EdgeLakeOperator name
+            digest: Digest of the CR's spec, labels and annotations after the write
+            now: Time the write was seen
+        """
+        pending = self._pending.get((namespace, name))
+        if pending is None or pending.digest == digest:
+            return  # Not held back, or not a new write (e.g. a status change)
+        pending.last_seen = now
+        pending.digest = digest
+        pending.writes += 1
+
+    def finish(self, namespace: str, name: str, now: datetime) -> tuple[int, float]:
+        """Stop holding back the update of a CR, which is applied now.
+
+        Returns:
+            Number of writes merged into the update and seconds since the first one
+        """
+        pending = self._pending.pop((namespace, name), None)
+        if pending is None:
+            return 1, 0.0
+        return pending.writes, (now - pending.first_seen).total_seconds()
+
+    def forget(self, namespace: str, name: str) -> None:
+        """Forget a deleted CR."""
+        self._pending.pop((namespace, name), None)
+
+
+update_debouncer = UpdateDebouncer()
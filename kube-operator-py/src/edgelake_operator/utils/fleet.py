@@ -0,0 +1,190 @@
+"""In-memory fleet status served over HTTP.
+
+Every EdgeLakeOperator the operator watches is summarized in a cache that is
+updated from watch events, so fleet-wide questions ("which nodes are degraded
+and where are their endpoints?") are answered without calls to the API server.
+The cache is exposed read-only at ``GET /fleet`` on FLEET_API_PORT and is what
+``edgelake-operator fleet`` queries.
+"""
+
+import logging
+from typing import Any, Optional
+
+from aiohttp import web
+
+from ..constants import DEFAULT_FLEET_PAGE_SIZE, MAX_FLEET_PAGE_SIZE
+from ..models.status import ConditionStatus, ConditionType
+from .hashing import compute_config_hash
+from .nodeports import with_allocated_ports
+from .profiles import resolve_profile
+
+logger = logging.getLogger(__name__)
+
+
+def summarize(body: dict[str, Any]) -> dict[str, Any]:
+    """Summarize an EdgeLakeOperator for the fleet view.
+
+    Args:
+        body: EdgeLakeOperator object
+
+    Returns:
+        Summary with identity, phase, health and conditions, reconcile progress,
+        Service endpoints, image and rollout timing
+    """
+    metadata = body.get("metadata", {})
+    status = body.get("status") or {}
+    spec = with_allocated_ports(
+        resolve_profile(body.get("spec") or {}, metadata.get("namespace")),
+        status.get("allocatedPorts"),
+    )
+    image = spec.get("image") or {}
+    last_rollout = status.get("lastRollout") or {}
+    endpoints = status.get("endpoints") or {}
+    observed = status.get("observedGeneration")
+    conditions = status.get("conditions") or []
+
+    return {
+        "namespace": metadata.get("namespace"),
+        "name": metadata.get("name"),
+        "nodeType": spec.get("nodeType"),
+        "cluster": (spec.get("operator") or {}).get("clusterName"),
+        "phase": status.get("phase"),
+        "health": _health(conditions),
+        # Ready and Degraded with reason, message and transition time
+        "conditions": conditions,
+        # False while a spec change has not been applied yet
+        "upToDate": observed is not None and observed == metadata.get("generation"),
+        # Profile hash the CR has applied (see roll_profile)
+        "profileHash": status.get("profileHash"),
+        "endpoints": {
+            kind: endpoints[kind] for kind in ("tcp", "rest", "broker") if endpoints.get(kind)
+        },
+        "image": f"{image.get('repository')}:{image.get('tag')}" if image else None,
+        "configHash": compute_config_hash(spec),
+        "lastRollout": {
+            "readyAt": last_rollout.get("readyAt"),
+            "totalSeconds": last_rollout.get("totalSeconds"),
+        }
+        if last_rollout
+        else None,
+    }
+
+
+def _health(conditions: list[dict[str, Any]]) -> str:
+    """Derive a node's health from the conditions monitor_edgelake_operator writes.
+
+    Returns:
+        "Degraded", "Healthy", or "Unknown" before the first health check
+        (and while pods are rolled out by a reconcile)
+    """
+    statuses = {condition.get("type"): condition.get("status") for condition in conditions}
+    if statuses.get(ConditionType.DEGRADED.value) == ConditionStatus.TRUE.value:
+        return "Degraded"
+    if statuses.get(ConditionType.READY.value) == ConditionStatus.TRUE.value:
+        return "Healthy"
+    return "Unknown"
+
+
+class FleetCache:
+    """Summaries of all watched EdgeLakeOperators, keyed by namespace and name."""
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[str, str], dict[str, Any]] = {}
+
+    def update(self, body: dict[str, Any]) -> None:
+        """Store the latest state of a CR."""
+        metadata = body.get("metadata", {})
+        self._entries[(metadata.get("namespace"), metadata.get("name"))] = summarize(body)
+
+    def remove(self, namespace: str, name: str) -> None:
+        """Forget a deleted CR."""
+        self._entries.pop((namespace, name), None)
+
+    def get(self, namespace: str, name: str) -> Optional[dict[str, Any]]:
+        """Get the summary of a CR, or None if it is not known."""
+        return self._entries.get((namespace, name))
+
+    def query(
+        self,
+        cluster: Optional[str] = None,
+        namespace: Optional[str] = None,
+        phase: Optional[str] = None,
+        health: Optional[str] = None,
+        limit: int = DEFAULT_FLEET_PAGE_SIZE,
+        continue_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Return one page of CR summaries, ordered by namespace and name.
+
+        Args:
+            cluster: Only CRs of this EdgeLake cluster
+            namespace: Only CRs in this namespace
+            phase: Only CRs in this phase
+            health: Only CRs with this health (Healthy, Degraded, Unknown)
+            limit: Maximum number of items in the page
+            continue_token: Token from the previous page ("<namespace>/<name>")
+
+        Returns:
+            Dictionary with "items", "remaining" (matches after this page) and
+            "continue" (token for the next page, or None)
+        """
+        matches = [
+            (key, entry)
+            for key, entry in sorted(self._entries.items())
+            if (cluster is None or entry["cluster"] == cluster)
+            and (namespace is None or key[0] == namespace)
+            and (phase is None or entry["phase"] == phase)
+            and (health is None or entry["health"] == health)
+        ]
+        # Resume after the last item returned, so pages stay stable while CRs come and go
+        if continue_token:
+            after = tuple(continue_token.split("/", 1))
+            matches = [(key, entry) for key, entry in matches if key > after]
+        page = [entry for _, entry in matches[:limit]]
+        has_more = len(matches) > limit
+        return {
+            "items": page,
+            "remaining": len(matches) - len(page),
+            "continue": f"{page[-1]['namespace']}/{page[-1]['name']}" if has_more else None,
+        }
+
+
+async def _handle_fleet(request: web.Request) -> web.Response:
+    """Serve GET /fleet?cluster=&namespace=&phase=&health=&limit=&continue=."""
+    params = request.query
+    try:
+        limit = int(params.get("limit", DEFAULT_FLEET_PAGE_SIZE))
+    except ValueError:
+        raise web.HTTPBadRequest(text="limit must be an integer") from None
+    if not 1 <= limit <= MAX_FLEET_PAGE_SIZE:
+        raise web.HTTPBadRequest(text=f"limit must be 1-{MAX_FLEET_PAGE_SIZE}")
+
+    page = fleet_cache.query(
+        cluster=params.get("cluster"),
+        namespace=params.get("namespace"),
+        phase=params.get("phase"),
+        health=params.get("health"),
+        limit=limit,
+        continue_token=params.get("continue"),
+    )
+    return web.json_response(page)
+
+
+async def start_fleet_server(port: int) -> web.AppRunner:
+    """Start the read-only fleet status HTTP server.
+
+    Args:
+        port: Port to serve /fleet on
+
+    Returns:
+        The runner, to be cleaned up on shutdown
+    """
+    app = web.Application()
+    app.router.add_get("/fleet", _handle_fleet)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "0.0.0.0", port).start()
+    logger.info(f"Serving fleet status on port {port}")
+    return runner
+
+
+fleet_cache = FleetCache()
@@ -1,15 +1,26 @@
 """Hashing utilities for configuration change detection."""
 
+import copy
 import hashlib
 import json
 from typing import Any
 
+from .tunables import LIVE_TUNABLE_FIELDS
+
+# Spec fields that are rolled out without restarting pods
+UNHASHED_FIELDS = ("replicas", "autoscaling", "reconcile")
+
+# Nested spec fields that only affect the Services, not the pods
+SERVICE_ONLY_FIELDS = ("networking.routing",)
+
 
 def compute_config_hash(spec: dict[str, Any]) -> str:
     """Compute a hash of the spec for change detection.
 
     This is used to trigger rolling updates when configuration changes.
-    The hash is stored as an annotation on the Deployment.
+    The hash is stored as an annotation on the Deployment. Scaling fields and
+    live-tunable fields (pushed to running pods over REST) are excluded so that
+    changing them does not restart pods, and so are Service routing options.
 
     Args:
         spec: The EdgeLakeOperator spec dictionary
@@ -18,7 +29,17 @@ def compute_config_hash(spec: dict[str, Any]) -> str:
         SHA256 hash of the spec (first 16 characters)
     """
     # Create a normalized JSON string (sorted keys for consistency)
-    spec_json = json.dumps(spec, sort_keys=True, default=str)
+    hashed = {
+        key: copy.deepcopy(value) for key, value in spec.items() if key not in UNHASHED_FIELDS
+    }
+    for field in LIVE_TUNABLE_FIELDS + SERVICE_ONLY_FIELDS:
+        section, key = field.split(".")
+        if isinstance(hashed.get(section), dict):
+            hashed[section].pop(key, None)
+            # A section holding only unhashed fields hashes like an absent one
+            if not hashed[section]:
+                del hashed[section]
+    spec_json = json.dumps(hashed, sort_keys=True, default=str)
 
     # Compute SHA256 hash
     hash_obj = hashlib.sha256(spec_json.encode())
@@ -0,0 +1,68 @@
+"""Reconcile step journal for crash-safe creates.
+
+The create handler applies its resources in a fixed order (Secret, ConfigMaps,
+PVCs, Service, Deployment). After each step the hash of the applied manifest is
+written to ``status.journal`` right away, instead of with the handler's final
+status patch, so a retry after an error or an operator restart skips every step
+whose manifest is unchanged and continues from the first incomplete one.
+"""
+
+import hashlib
+import json
+import logging
+from typing import Any
+
+from kubernetes import client
+
+from ..constants import API_GROUP, API_VERSION, PLURAL
+from .kubernetes import apply_resource
+
+logger = logging.getLogger(__name__)
+
+
+def manifest_hash(resource: dict[str, Any]) -> str:
+    """Compute a hash of a manifest for the journal.
+
+    Args:
+        resource: Resource manifest as dictionary, before it is applied
+
+    Returns:
+        SHA256 hash of the manifest (first 16 characters)
+    """
+    resource_json = json.dumps(resource, sort_keys=True, default=str)
+    return hashlib.sha256(resource_json.encode()).hexdigest()[:16]
+
+
+async def apply_step(
+    name: str, namespace: str, journal: dict[str, str], step: str, resource: dict[str, Any]
+) -> bool:
+    """Apply a create step unless the journal shows the same manifest was applied.
+
+    Args:
+        name: EdgeLakeOperator name
+        namespace: Namespace
+        journal: Journal from the CR status, updated in place
+        step: Step name, e.g. "configmap" or "pvc/<name>"
+        resource: Resource manifest to apply
+
+    Returns:
+        True if the resource was applied, False if the step was skipped
+    """
+    # Hash before applying: apply_resource adds the resourceVersion to the manifest
+    digest = manifest_hash(resource)
+    if journal.get(step) == digest:
+        logger.info(f"Skipping step {step} for {namespace}/{name}: already applied")
+        return False
+
+    await apply_resource(resource, namespace)
+    journal[step] = digest
+    api = client.CustomObjectsApi()
+    api.patch_namespaced_custom_object_status(
+        API_GROUP,
+        API_VERSION,
+        namespace,
+        PLURAL,
+        name,
+        {"status": {"journal": {step: digest}}},
+    )
+    return True
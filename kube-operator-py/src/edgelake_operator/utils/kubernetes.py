@@ -1,12 +1,26 @@
 """Kubernetes client utilities for the EdgeLake Operator."""
 
 import logging
-from typing import Any
+import re
+from typing import Any, Optional
 
 import kubernetes
 from kubernetes import client
 from kubernetes.client.rest import ApiException
 
+from ..constants import (
+    API_GROUP,
+    API_VERSION,
+    CONFIGMAP_HASH_LENGTH,
+    LABEL_INSTANCE,
+    LABEL_MANAGED_BY,
+    MANAGED_BY,
+    PLURAL,
+    SNAPSHOT_API_GROUP,
+    SNAPSHOT_API_VERSION,
+    SNAPSHOT_PLURAL,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -52,6 +66,8 @@ async def apply_resource(resource: dict[str, Any], namespace: str) -> dict[str,
             return await _apply_deployment(resource, namespace)
         elif kind == "PersistentVolumeClaim":
             return await _apply_pvc(resource, namespace)
+        elif kind == "VolumeSnapshot":
+            return await _apply_volume_snapshot(resource, namespace)
         else:
             raise ValueError(f"Unsupported resource kind: {kind}")
     except ApiException as e:
@@ -88,6 +104,11 @@ async def delete_resource(kind: str, name: str, namespace: str) -> bool:
         elif kind == "PersistentVolumeClaim":
             api = client.CoreV1Api()
             api.delete_namespaced_persistent_volume_claim(name, namespace)
+        elif kind == "VolumeSnapshot":
+            api = client.CustomObjectsApi()
+            api.delete_namespaced_custom_object(
+                SNAPSHOT_API_GROUP, SNAPSHOT_API_VERSION, namespace, SNAPSHOT_PLURAL, name
+            )
         else:
             logger.warning(f"Unknown resource kind: {kind}")
             return False
@@ -102,6 +123,194 @@ async def delete_resource(kind: str, name: str, namespace: str) -> bool:
         raise
 
 
+async def delete_collection(kind: str, namespace: str, label_selector: str) -> None:
+    """Delete all resources of a kind matching a label selector in one call.
+
+    Args:
+        kind: Resource kind
+        namespace: Namespace
+        label_selector: Kubernetes label selector string
+    """
+    logger.info(f"Deleting {kind} collection ({label_selector}) from namespace {namespace}")
+
+    if kind == "ConfigMap":
+        client.CoreV1Api().delete_collection_namespaced_config_map(
+            namespace, label_selector=label_selector
+        )
+    elif kind == "Secret":
+        client.CoreV1Api().delete_collection_namespaced_secret(
+            namespace, label_selector=label_selector
+        )
+    elif kind == "Service":
+        client.CoreV1Api().delete_collection_namespaced_service(
+            namespace, label_selector=label_selector
+        )
+    elif kind == "Deployment":
+        client.AppsV1Api().delete_collection_namespaced_deployment(
+            namespace, label_selector=label_selector
+        )
+    elif kind == "PersistentVolumeClaim":
+        client.CoreV1Api().delete_collection_namespaced_persistent_volume_claim(
+            namespace, label_selector=label_selector
+        )
+    elif kind == "VolumeSnapshot":
+        try:
+            client.CustomObjectsApi().delete_collection_namespaced_custom_object(
+                SNAPSHOT_API_GROUP,
+                SNAPSHOT_API_VERSION,
+                namespace,
+                SNAPSHOT_PLURAL,
+                label_selector=label_selector,
+            )
+        except ApiException as e:
+            # The snapshot CRDs are optional (CSI external-snapshotter)
+            if e.status != 404:
+                raise
+    else:
+        raise ValueError(f"Unsupported resource kind: {kind}")
+
+
+def annotate_collection(
+    kind: str, namespace: str, label_selector: str, annotations: dict[str, str]
+) -> list[str]:
+    """Set annotations on all resources of a kind matching a label selector.
+
+    Args:
+        kind: "PersistentVolumeClaim" or "VolumeSnapshot"
+        namespace: Namespace
+        label_selector: Kubernetes label selector string
+        annotations: Annotations to set
+
+    Returns:
+        Names of the annotated resources
+    """
+    body = {"metadata": {"annotations": annotations}}
+    if kind == "PersistentVolumeClaim":
+        core_api = client.CoreV1Api()
+        items = core_api.list_namespaced_persistent_volume_claim(
+            namespace, label_selector=label_selector
+        ).items
+        names = [item.metadata.name for item in items]
+        for pvc_name in names:
+            core_api.patch_namespaced_persistent_volume_claim(pvc_name, namespace, body)
+        return names
+    if kind == "VolumeSnapshot":
+        custom_api = client.CustomObjectsApi()
+        try:
+            items = list_volume_snapshots(namespace, label_selector)
+        except ApiException as e:
+            if e.status == 404:
+                return []
+            raise
+        names = [item["metadata"]["name"] for item in items]
+        for snapshot_name in names:
+            custom_api.patch_namespaced_custom_object(
+                SNAPSHOT_API_GROUP,
+                SNAPSHOT_API_VERSION,
+                namespace,
+                SNAPSHOT_PLURAL,
+                snapshot_name,
+                body,
+            )
+        return names
+    raise ValueError(f"Unsupported resource kind: {kind}")
+
+
+def instance_selector(name: str) -> str:
+    """Build the label selector matching all resources created for a CR."""
+    return f"{LABEL_INSTANCE}={name},{LABEL_MANAGED_BY}={MANAGED_BY}"
+
+
+def prune_config_maps(
+    name: str, namespace: str, deployment_name: str, base_names: list[str]
+) -> list[str]:
+    """Delete ConfigMap revisions of a CR that its Deployment no longer references.
+
+    Args:
+        name: EdgeLakeOperator name
+        namespace: Namespace
+        deployment_name: Deployment whose pod template references the current revisions
+        base_names: ConfigMap names without the content hash suffix
+
+    Returns:
+        Names of the deleted ConfigMaps
+    """
+    apps_api = client.AppsV1Api()
+    core_api = client.CoreV1Api()
+
+    pod_spec = apps_api.read_namespaced_deployment(deployment_name, namespace).spec.template.spec
+    referenced = {
+        source.config_map_ref.name
+        for container in pod_spec.containers
+        for source in container.env_from or []
+        if source.config_map_ref
+    }
+    referenced.update(
+        volume.config_map.name for volume in pod_spec.volumes or [] if volume.config_map
+    )
+
+    # The base name (mutable ConfigMap) or a content-addressed revision of it
+    bases = "|".join(re.escape(base) for base in base_names)
+    revision = re.compile(rf"({bases})(-[0-9a-f]{{{CONFIGMAP_HASH_LENGTH}}})?")
+    deleted = []
+    for config_map in core_api.list_namespaced_config_map(
+        namespace, label_selector=instance_selector(name)
+    ).items:
+        cm_name = config_map.metadata.name
+        if cm_name in referenced or not revision.fullmatch(cm_name):
+            continue
+        try:
+            core_api.delete_namespaced_config_map(cm_name, namespace)
+            deleted.append(cm_name)
+        except ApiException as e:
+            if e.status != 404:
+                raise
+    return deleted
+
+
+def list_managed_resources(kind: str) -> list[Any]:
+    """List resources of a kind created by the operator, across all namespaces.
+
+    Args:
+        kind: "PersistentVolumeClaim", "Secret" or "VolumeSnapshot"
+
+    Returns:
+        Kubernetes client objects (plain dicts for VolumeSnapshots)
+    """
+    api = client.CoreV1Api()
+    label_selector = f"{LABEL_MANAGED_BY}={MANAGED_BY}"
+    if kind == "PersistentVolumeClaim":
+        return api.list_persistent_volume_claim_for_all_namespaces(
+            label_selector=label_selector
+        ).items
+    if kind == "Secret":
+        return api.list_secret_for_all_namespaces(label_selector=label_selector).items
+    if kind == "VolumeSnapshot":
+        try:
+            result = client.CustomObjectsApi().list_cluster_custom_object(
+                SNAPSHOT_API_GROUP,
+                SNAPSHOT_API_VERSION,
+                SNAPSHOT_PLURAL,
+                label_selector=label_selector,
+            )
+        except ApiException as e:
+            if e.status == 404:
+                return []
+            raise
+        return result.get("items", [])
+    raise ValueError(f"Unsupported resource kind: {kind}")
+
+
+def list_edgelake_operator_keys() -> set[tuple[str, str]]:
+    """List the (namespace, name) of every EdgeLakeOperator in the cluster."""
+    api = client.CustomObjectsApi()
+    result = api.list_cluster_custom_object(API_GROUP, API_VERSION, PLURAL)
+    return {
+        (item["metadata"]["namespace"], item["metadata"]["name"])
+        for item in result.get("items", [])
+    }
+
+
 async def _apply_configmap(resource: dict[str, Any], namespace: str) -> dict[str, Any]:
     """Apply a ConfigMap resource."""
     api = client.CoreV1Api()
@@ -109,6 +318,9 @@ async def _apply_configmap(resource: dict[str, Any], namespace: str) -> dict[str
 
     try:
         existing = api.read_namespaced_config_map(name, namespace)
+        if existing.immutable:
+            # Immutable ConfigMaps are named by content hash: same name, same data
+            return existing.to_dict()
         resource["metadata"]["resourceVersion"] = existing.metadata.resource_version
         result = api.replace_namespaced_config_map(name, namespace, resource)
         logger.debug(f"Updated ConfigMap/{name}")
@@ -204,8 +416,291 @@ async def _apply_pvc(resource: dict[str, Any], namespace: str) -> dict[str, Any]
         raise
 
 
+async def _apply_volume_snapshot(resource: dict[str, Any], namespace: str) -> dict[str, Any]:
+    """Apply a VolumeSnapshot resource.
+
+    Note: Snapshots are point-in-time copies, so we only create, never update.
+    """
+    api = client.CustomObjectsApi()
+    name = resource["metadata"]["name"]
+
+    try:
+        existing = api.get_namespaced_custom_object(
+            SNAPSHOT_API_GROUP, SNAPSHOT_API_VERSION, namespace, SNAPSHOT_PLURAL, name
+        )
+        logger.debug(f"VolumeSnapshot/{name} already exists, skipping")
+        return existing
+    except ApiException as e:
+        if e.status == 404:
+            result = api.create_namespaced_custom_object(
+                SNAPSHOT_API_GROUP, SNAPSHOT_API_VERSION, namespace, SNAPSHOT_PLURAL, resource
+            )
+            logger.debug(f"Created VolumeSnapshot/{name}")
+            return result
+        raise
+
+
+def list_volume_snapshots(namespace: str, label_selector: str) -> list[dict[str, Any]]:
+    """List VolumeSnapshots matching a label selector, oldest first.
+
+    Args:
+        namespace: Namespace
+        label_selector: Kubernetes label selector string
+
+    Returns:
+        VolumeSnapshot objects sorted by creation timestamp
+    """
+    api = client.CustomObjectsApi()
+    result = api.list_namespaced_custom_object(
+        SNAPSHOT_API_GROUP,
+        SNAPSHOT_API_VERSION,
+        namespace,
+        SNAPSHOT_PLURAL,
+        label_selector=label_selector,
+    )
+    items = result.get("items", [])
+    return sorted(items, key=lambda item: item["metadata"].get("creationTimestamp", ""))
+
+
+def scale_edgelake_operator(name: str, namespace: str, replicas: int) -> None:
+    """Set spec.replicas of an EdgeLakeOperator through its scale subresource.
+
+    Args:
+        name: EdgeLakeOperator name
+        namespace: Namespace
+        replicas: Desired number of replicas
+    """
+    api = client.CustomObjectsApi()
+    api.patch_namespaced_custom_object_scale(
+        API_GROUP, API_VERSION, namespace, PLURAL, name, {"spec": {"replicas": replicas}}
+    )
+
+
+def get_edgelake_operator(name: str, namespace: str) -> Optional[dict[str, Any]]:
+    """Get an EdgeLakeOperator CR.
+
+    Args:
+        name: EdgeLakeOperator name
+        namespace: Namespace
+
+    Returns:
+        The CR, or None if it does not exist
+    """
+    api = client.CustomObjectsApi()
+    try:
+        return api.get_namespaced_custom_object(API_GROUP, API_VERSION, namespace, PLURAL, name)
+    except ApiException as e:
+        if e.status == 404:
+            return None
+        raise
+
+
+def patch_edgelake_operator_status(name: str, namespace: str, status: dict[str, Any]) -> None:
+    """Merge fields into the status of an EdgeLakeOperator outside of its handlers.
+
+    Args:
+        name: EdgeLakeOperator name
+        namespace: Namespace
+        status: Status fields to set
+    """
+    api = client.CustomObjectsApi()
+    api.patch_namespaced_custom_object_status(
+        API_GROUP, API_VERSION, namespace, PLURAL, name, {"status": status}
+    )
+
+
+def annotate_edgelake_operator(name: str, namespace: str, annotations: dict[str, str]) -> bool:
+    """Set annotations on an EdgeLakeOperator.
+
+    Args:
+        name: EdgeLakeOperator name
+        namespace: Namespace
+        annotations: Annotations to set
+
+    Returns:
+        True if the CR was annotated, False if it no longer exists
+    """
+    api = client.CustomObjectsApi()
+    body = {"metadata": {"annotations": annotations}}
+    try:
+        api.patch_namespaced_custom_object(API_GROUP, API_VERSION, namespace, PLURAL, name, body)
+    except ApiException as e:
+        if e.status == 404:
+            return False
+        raise
+    return True
+
+
+def list_instance_pods(name: str, namespace: str) -> list[dict[str, Any]]:
+    """List the running pods of an EdgeLakeOperator CR.
+
+    Args:
+        name: EdgeLakeOperator CR name
+        namespace: Namespace
+
+    Returns:
+        Pods as dicts with "name", "ip" and "ready"
+    """
+    api = client.CoreV1Api()
+    result = api.list_namespaced_pod(
+        namespace,
+        label_selector=f"app.kubernetes.io/name=edgelake-operator,app.kubernetes.io/instance={name}",
+        field_selector="status.phase=Running",
+    )
+    pods = []
+    for pod in result.items:
+        conditions = pod.status.conditions or []
+        pods.append(
+            {
+                "name": pod.metadata.name,
+                "ip": pod.status.pod_ip,
+                "ready": any(c.type == "Ready" and c.status == "True" for c in conditions),
+            }
+        )
+    return pods
+
+
+def list_endpoint_zones(service_name: str, namespace: str) -> dict[str, list[str]]:
+    """List the ready endpoints of a Service by zone, from its EndpointSlices.
+
+    Args:
+        service_name: Service name
+        namespace: Namespace
+
+    Returns:
+        Sorted pod IPs by zone; endpoints on nodes without a zone label are left out
+    """
+    api = client.DiscoveryV1Api()
+    result = api.list_namespaced_endpoint_slice(
+        namespace, label_selector=f"kubernetes.io/service-name={service_name}"
+    )
+    zones: dict[str, set[str]] = {}
+    for endpoint_slice in result.items:
+        for endpoint in endpoint_slice.endpoints or []:
+            # An unknown ready condition counts as ready (discovery.k8s.io/v1)
+            ready = endpoint.conditions is None or endpoint.conditions.ready is not False
+            if ready and endpoint.zone:
+                zones.setdefault(endpoint.zone, set()).update(endpoint.addresses)
+    return {zone: sorted(addresses) for zone, addresses in sorted(zones.items())}
+
+
+def delete_pod(pod_name: str, namespace: str) -> None:
+    """Delete a pod so its controller replaces it.
+
+    Args:
+        pod_name: Pod name
+        namespace: Namespace
+    """
+    api = client.CoreV1Api()
+    try:
+        api.delete_namespaced_pod(pod_name, namespace)
+    except ApiException as e:
+        if e.status != 404:
+            raise
+
+
+def read_secret_data(name: str, namespace: str) -> Optional[dict[str, str]]:
+    """Read the (base64-encoded) data of a Secret.
+
+    Args:
+        name: Secret name
+        namespace: Namespace
+
+    Returns:
+        The Secret's data, or None if it does not exist
+    """
+    api = client.CoreV1Api()
+    try:
+        return api.read_namespaced_secret(name, namespace).data or {}
+    except ApiException as e:
+        if e.status == 404:
+            return None
+        raise
+
+
+def label_secret(name: str, namespace: str, labels: dict[str, str]) -> bool:
+    """Set labels on a Secret.
+
+    Args:
+        name: Secret name
+        namespace: Namespace
+        labels: Labels to set
+
+    Returns:
+        True if the Secret was labelled, False if it does not exist
+    """
+    api = client.CoreV1Api()
+    try:
+        api.patch_namespaced_secret(name, namespace, {"metadata": {"labels": labels}})
+    except ApiException as e:
+        if e.status == 404:
+            return False
+        raise
+    return True
+
+
+def get_pod_template_annotations(name: str, namespace: str) -> Optional[dict[str, str]]:
+    """Get the pod template annotations of a Deployment.
+
+    Args:
+        name: Deployment name
+        namespace: Namespace
+
+    Returns:
+        The annotations, or None if the Deployment does not exist
+    """
+    api = client.AppsV1Api()
+    try:
+        dep = api.read_namespaced_deployment(name, namespace)
+    except ApiException as e:
+        if e.status == 404:
+            return None
+        raise
+    return dep.spec.template.metadata.annotations or {}
+
+
+def annotate_pod_template(name: str, namespace: str, annotations: dict[str, str]) -> None:
+    """Set pod template annotations of a Deployment, which rolls its pods.
+
+    Args:
+        name: Deployment name
+        namespace: Namespace
+        annotations: Annotations to set
+    """
+    api = client.AppsV1Api()
+    body = {"spec": {"template": {"metadata": {"annotations": annotations}}}}
+    api.patch_namespaced_deployment(name, namespace, body)
+
+
+def list_pod_events(pod_name: str, namespace: str) -> list[dict[str, Any]]:
+    """List events for a pod.
+
+    Args:
+        pod_name: Pod name
+        namespace: Namespace
+
+    Returns:
+        Events as dicts with "reason", "message" and "time" (datetime)
+    """
+    api = client.CoreV1Api()
+    result = api.list_namespaced_event(
+        namespace, field_selector=f"involvedObject.kind=Pod,involvedObject.name={pod_name}"
+    )
+    return [
+        {
+            "reason": event.reason,
+            "message": event.message,
+            "time": event.first_timestamp or event.event_time or event.last_timestamp,
+        }
+        for event in result.items
+    ]
+
+
 def check_deployment_ready(name: str, namespace: str) -> bool:
-    """Check if a Deployment is ready.
+    """Check if a Deployment has finished rolling out and its pods are ready.
+
+    Pod readiness comes from the EdgeLake REST probes, so old pods still count
+    until the new ones answer; a rollout in progress is reported as not ready.
 
     Args:
         name: Deployment name
@@ -218,8 +713,16 @@ def check_deployment_ready(name: str, namespace: str) -> bool:
 
     try:
         dep = api.read_namespaced_deployment(name, namespace)
+        desired_replicas = dep.spec.replicas if dep.spec.replicas is not None else 1
+        if (dep.status.observed_generation or 0) < (dep.metadata.generation or 0):
+            return False
+        updated_replicas = dep.status.updated_replicas or 0
         ready_replicas = dep.status.ready_replicas or 0
-        desired_replicas = dep.spec.replicas or 1
-        return ready_replicas >= desired_replicas
+        available_replicas = dep.status.available_replicas or 0
+        return (
+            updated_replicas >= desired_replicas
+            and ready_replicas >= desired_replicas
+            and available_replicas >= desired_replicas
+        )
     except ApiException:
         return False
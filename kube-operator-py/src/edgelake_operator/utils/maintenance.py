@@ -0,0 +1,64 @@
+"""Partition maintenance scheduling.
+
+Dropping old partitions is I/O heavy. Nodes that start together (for example
+after a fleet-wide rollout) and share the same ``sync`` period all drop at the
+same moment, which shows up as load spikes on shared storage. With staggering
+enabled, each CR gets a deterministic offset within a maintenance window, and
+the first drop is delayed by that offset.
+"""
+
+import hashlib
+
+from ..models.spec import EdgeLakeOperatorSpec, PartitionPolicySpec
+from .units import parse_duration
+
+
+def partition_policies(spec: EdgeLakeOperatorSpec) -> list[PartitionPolicySpec]:
+    """Return the partitioning policies, with the single global policy as a fallback."""
+    partitioning = spec.operator.partitioning
+    if partitioning.policies:
+        return partitioning.policies
+    return [
+        PartitionPolicySpec(
+            table=partitioning.tableName,
+            column=partitioning.column,
+            interval=partitioning.interval,
+            keep=partitioning.keep,
+            sync=partitioning.sync,
+        )
+    ]
+
+
+def is_staggered(spec: EdgeLakeOperatorSpec) -> bool:
+    """Check if partition drops are offset for this CR."""
+    if spec.operator is None:
+        return False
+    maintenance = spec.operator.partitioning.maintenance
+    return spec.operator.partitioning.enabled and (maintenance.stagger or bool(maintenance.offset))
+
+
+def maintenance_window_seconds(spec: EdgeLakeOperatorSpec) -> float:
+    """Window the offset is spread across: explicit, or the shortest sync period."""
+    maintenance = spec.operator.partitioning.maintenance
+    if maintenance.window:
+        return parse_duration(maintenance.window)
+    return min(parse_duration(policy.sync) for policy in partition_policies(spec))
+
+
+def drop_offset_seconds(spec: EdgeLakeOperatorSpec, key: str) -> int:
+    """Return the partition drop offset for the CR.
+
+    Args:
+        spec: Parsed spec from the CR
+        key: Stable identity of the CR (its UID)
+
+    Returns:
+        Explicit ``maintenance.offset`` if set, otherwise a hash of the key
+        spread uniformly across the maintenance window
+    """
+    maintenance = spec.operator.partitioning.maintenance
+    if maintenance.offset:
+        return int(parse_duration(maintenance.offset))
+    window = max(1, int(maintenance_window_seconds(spec)))
+    digest = hashlib.sha256(key.encode()).digest()
+    return int.from_bytes(digest[:8], "big") % window
@@ -0,0 +1,74 @@
+"""Prometheus metrics exported by the EdgeLake Operator."""
+
+import logging
+
+from prometheus_client import Counter, Gauge, Histogram, start_http_server
+
+logger = logging.getLogger(__name__)
+
+# Startup phases of an EdgeLake pod rollout take seconds to tens of minutes
+ROLLOUT_BUCKETS = (1, 2, 5, 10, 20, 30, 60, 120, 300, 600, 1200, 1800, 3600)
+
+ROLLOUT_PHASE_SECONDS = Histogram(
+    "edgelake_rollout_phase_seconds",
+    "Time spent in each startup phase of an EdgeLake pod rollout",
+    ["phase", "image_tag", "storage_class"],
+    buckets=ROLLOUT_BUCKETS,
+)
+
+ROLLOUT_DURATION_SECONDS = Histogram(
+    "edgelake_rollout_duration_seconds",
+    "Time from Deployment apply until the EdgeLake node answers 'get status'",
+    ["image_tag", "storage_class"],
+    buckets=ROLLOUT_BUCKETS,
+)
+
+UPDATE_WRITES_COALESCED = Counter(
+    "edgelake_update_writes_coalesced_total",
+    "CR writes merged into an update applied for an earlier or later write",
+    ["namespace", "name"],
+)
+
+UPDATE_DEBOUNCE_SECONDS = Histogram(
+    "edgelake_update_debounce_seconds",
+    "Time an update was held back to coalesce writes, from the first write to the apply",
+    buckets=(1, 2, 5, 10, 20, 30, 60, 120, 300),
+)
+
+NODEPORTS_FREE = Gauge(
+    "edgelake_nodeports_free",
+    "NodePorts left for automatic allocation after the last allocation",
+)
+
+MQTT_MESSAGE_RATE = Gauge(
+    "edgelake_mqtt_messages_per_second",
+    "MQTT messages received per second by each EdgeLake pod",
+    ["namespace", "name", "pod"],
+)
+
+MQTT_GROUP_MESSAGE_RATE = Gauge(
+    "edgelake_mqtt_group_messages_per_second",
+    "MQTT messages received per second by all nodes of a shared-subscription group",
+    ["broker", "group"],
+)
+
+ORPHANED_RESOURCES = Gauge(
+    "edgelake_orphaned_resources",
+    "Operator-managed PVCs, Secrets and seed snapshots whose EdgeLakeOperator no longer exists",
+    ["kind"],
+)
+
+ORPHANED_STORAGE_BYTES = Gauge(
+    "edgelake_orphaned_storage_bytes",
+    "Storage requested by orphaned PVCs that could be reclaimed",
+)
+
+
+def start_metrics_server(port: int) -> None:
+    """Start the Prometheus metrics HTTP server.
+
+    Args:
+        port: Port to serve /metrics on
+    """
+    start_http_server(port)
+    logger.info(f"Serving metrics on port {port}")
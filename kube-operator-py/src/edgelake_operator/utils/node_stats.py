@@ -0,0 +1,109 @@
+"""Parsers for EdgeLake node statistics returned over the REST API."""
+
+import json
+import re
+from datetime import datetime
+from typing import Any, Optional
+
+# Counter rows of 'get msg client': Messages, Success, Errors, [timestamps...]
+_MSG_CLIENT_COUNTERS = re.compile(r"^\s*(\d+)\s+(\d+)\s+(\d+)(?:\s|$)")
+
+# Rows of 'get queries time': "Up to 2 seconds: 15" ... "Over 10 seconds: 0"
+_QUERY_TIME_BUCKET = re.compile(
+    r"(up\s+to|over)\s+(\d+(?:\.\d+)?)\s*sec\w*\s*[:|]?\s*(\d+)", re.IGNORECASE
+)
+
+# Queries still executing in 'query status' output
+_QUERY_IN_FLIGHT = re.compile(r"\bprocessing\b", re.IGNORECASE)
+
+
+def parse_msg_client_messages(output: str) -> int:
+    """Sum the message counters of all subscriptions in 'get msg client' output.
+
+    Args:
+        output: Text returned by the 'get msg client' command
+
+    Returns:
+        Total number of messages received by the node's MQTT clients
+    """
+    total = 0
+    for line in output.splitlines():
+        match = _MSG_CLIENT_COUNTERS.match(line)
+        if match:
+            total += int(match.group(1))
+    return total
+
+
+def parse_streaming_rows(output: str) -> dict[str, int]:
+    """Extract cumulative rows ingested per table from 'get streaming where format = json'.
+
+    Args:
+        output: JSON text returned by the command, keyed by "dbms.table"
+
+    Returns:
+        Mapping of "dbms.table" to the cumulative number of streamed rows
+    """
+    try:
+        stats = json.loads(output)
+    except ValueError:
+        return {}
+    if not isinstance(stats, dict):
+        return {}
+
+    rows = {}
+    for key, table_stats in stats.items():
+        if "." not in key or not isinstance(table_stats, dict):
+            continue
+        for counter in ("Streaming Rows", "Put Rows"):
+            value = table_stats.get(counter)
+            if value is not None:
+                rows[key] = int(str(value).replace(",", ""))
+                break
+    return rows
+
+
+def parse_query_times(output: str) -> dict[str, int]:
+    """Extract the query execution time histogram from 'get queries time'.
+
+    Args:
+        output: Text returned by the 'get queries time' command
+
+    Returns:
+        Mapping of bucket upper bound in seconds ("inf" for the overflow
+        bucket) to the cumulative number of queries in that bucket
+    """
+    buckets = {}
+    for kind, bound, count in _QUERY_TIME_BUCKET.findall(output):
+        key = "inf" if kind.lower() == "over" else str(float(bound))
+        buckets[key] = int(count)
+    return buckets
+
+
+def parse_in_flight_queries(output: str) -> int:
+    """Count the queries still being processed in 'query status' output."""
+    return sum(1 for line in output.splitlines() if _QUERY_IN_FLIGHT.search(line))
+
+
+def compute_rate(
+    previous: Optional[dict[str, Any]],
+    count: int,
+    now: datetime,
+) -> Optional[float]:
+    """Compute a per-second rate from two cumulative counter samples.
+
+    Args:
+        previous: Previous sample with "count" and "sampledAt" (ISO timestamp)
+        count: Current cumulative counter value
+        now: Time of the current sample
+
+    Returns:
+        Rate per second, or None if there is no usable previous sample
+        (first sample, or the counter reset because the node restarted)
+    """
+    if not previous or previous.get("count") is None or not previous.get("sampledAt"):
+        return None
+    elapsed = (now - datetime.fromisoformat(previous["sampledAt"])).total_seconds()
+    delta = count - previous["count"]
+    if elapsed <= 0 or delta < 0:
+        return None
+    return round(delta / elapsed, 3)
@@ -0,0 +1,199 @@
+"""Automatic NodePort allocation for EdgeLakeOperators.
+
+With ``networking.autoAllocatePorts`` the operator picks the server and REST
+ports (and the broker port, if the CR enables a broker) of a new CR instead of
+using the ports in its spec. NodePort services expose these ports on every
+node, so they must be unique across the cluster.
+
+Free ports are found in a bitmap over the NodePort range. It is kept up to
+date from watch events instead of listing the cluster on every allocation: the
+node ports of every Service (including those created outside the operator) and
+the ports recorded in every CR's ``status.allocatedPorts`` (so allocations made
+before a restart count). Ports handed out by this process but not yet visible
+as a Service stay reserved in memory until the CR is deleted or turns
+``autoAllocatePorts`` off.
+
+The allocated ports are only recorded in the status, never written into the
+spec; ``with_allocated_ports`` overlays them on the spec wherever the CR's
+effective ports are needed.
+
+Another client can still take a port between allocation and the creation of
+the CR's Service. The API server then rejects the Service ("provided port is
+already allocated"); the handler marks the port as taken and allocates another
+one (see ``reject``).
+"""
+
+import re
+from typing import Any, Iterable, Optional
+
+from ..constants import NODEPORT_RANGE_END, NODEPORT_RANGE_START
+
+# Port kinds in allocation order, as used in status.allocatedPorts
+PORT_KINDS = ("server", "rest", "broker")
+
+
+class NodePortsExhaustedError(Exception):
+    """Raised when the NodePort range has too few free ports left."""
+
+
+class NodePortAllocator:
+    """Bitmap index of the NodePorts in use, with the reservations of each CR.
+
+    A port can be held by several owners at once (a CR's reservation and the
+    Service created for it), so the bitmap counts the owners of each port and
+    a port is free when its count is zero.
+    """
+
+    def __init__(self, start: int = NODEPORT_RANGE_START, end: int = NODEPORT_RANGE_END) -> None:
+        self._start = start
+        self._end = end
+        # One byte per port in the range: number of owners, 0 if free
+        self._used = bytearray(end - start + 1)
+        self._reserved: dict[tuple[str, str], dict[str, int]] = {}
+        self._services: dict[tuple[str, str], set[int]] = {}
+        # Ports a Service create was rejected for, until the watch shows their Service
+        self._rejected: set[int] = set()
+
+    def _count(self, ports: Iterable[int], delta: int) -> None:
+        for port in ports:
+            if self._start <= port <= self._end:
+                offset = port - self._start
+                self._used[offset] = max(self._used[offset] + delta, 0)
+
+    def observe_service(self, namespace: str, name: str, ports: Iterable[int]) -> None:
+        """Record the node ports of a Service from a watch event.
+
+        Args:
+            namespace: Namespace of the Service
+            name: Service name
+            ports: Its node ports (none for a ClusterIP Service)
+        """
+        ports = set(ports)
+        self._count(self._services.pop((namespace, name), set()), -1)
+        self._count(self._rejected & ports, -1)
+        self._rejected -= ports
+        if ports:
+            self._services[(namespace, name)] = ports
+            self._count(ports, 1)
+
+    def forget_service(self, namespace: str, name: str) -> None:
+        """Free the node ports of a deleted Service."""
+        self._count(self._services.pop((namespace, name), set()), -1)
+
+    def reserve(self, namespace: str, name: str, ports: dict[str, int]) -> None:
+        """Record ports already assigned to a CR (e.g. read back from its status)."""
+        self._count(self._reserved.get((namespace, name), {}).values(), -1)
+        self._reserved[(namespace, name)] = dict(ports)
+        self._count(ports.values(), 1)
+
+    def allocate(self, namespace: str, name: str, kinds: Iterable[str]) -> dict[str, int]:
+        """Assign free ports to a CR.
+
+        A CR that already holds a reservation keeps its ports; only kinds it
+        does not have yet are allocated.
+
+        Args:
+            namespace: Namespace
+            name: EdgeLakeOperator name
+            kinds: Port kinds to assign (see PORT_KINDS)
+
+        Returns:
+            Port by kind
+
+        Raises:
+            NodePortsExhaustedError: If the range has too few free ports
+        """
+        ports = dict(self._reserved.get((namespace, name), {}))
+        offset = 0
+        for kind in kinds:
+            if kind in ports:
+                continue
+            offset = self._used.find(0, offset)
+            if offset < 0:
+                raise NodePortsExhaustedError(
+                    f"No free NodePort left in {self._start}-{self._end}"
+                )
+            self._used[offset] = 1
+            ports[kind] = self._start + offset
+        self._reserved[(namespace, name)] = ports
+        return ports
+
+    def reject(self, namespace: str, name: str, ports: Iterable[int]) -> dict[str, int]:
+        """Give up ports of a CR that turned out to be taken by another Service.
+
+        The ports stay marked as in use; the CR keeps its other ports, and the
+        next allocate() assigns new ones for the rejected kinds.
+
+        Args:
+            namespace: Namespace
+            name: EdgeLakeOperator name
+            ports: Ports the API server reported as already allocated
+
+        Returns:
+            The ports the CR keeps, by kind
+        """
+        taken = set(ports) - self._rejected
+        self._rejected |= taken
+        self._count(taken, 1)
+        kept = {
+            kind: port
+            for kind, port in self._reserved.get((namespace, name), {}).items()
+            if port not in taken
+        }
+        self.reserve(namespace, name, kept)
+        return kept
+
+    def release(self, namespace: str, name: str) -> dict[str, int]:
+        """Free the ports of a deleted CR.
+
+        Returns:
+            The released ports by kind
+        """
+        ports = self._reserved.pop((namespace, name), {})
+        self._count(ports.values(), -1)
+        return ports
+
+    def free(self) -> int:
+        """Number of free ports in the range."""
+        return self._used.count(0)
+
+
+def with_allocated_ports(
+    spec: dict[str, Any], allocated: Optional[dict[str, Optional[int]]]
+) -> dict[str, Any]:
+    """Overlay the ports recorded in status.allocatedPorts on a CR spec.
+
+    Args:
+        spec: Spec dictionary of the CR
+        allocated: status.allocatedPorts of the CR (port by kind)
+
+    Returns:
+        The spec with the allocated ports in ``networking``, or the spec as is
+        if the CR does not use automatic allocation
+    """
+    networking = dict(spec.get("networking") or {})
+    if not (networking.get("autoAllocatePorts") or networking.get("auto_allocate_ports")):
+        return spec
+    for kind, port in (allocated or {}).items():
+        if port:
+            networking.pop(f"{kind}_port", None)
+            networking[f"{kind}Port"] = port
+    return {**spec, "networking": networking}
+
+
+def rejected_node_ports(message: str) -> list[int]:
+    """Extract the node ports a Service create was rejected for.
+
+    Args:
+        message: Body of the API server's 422 response
+
+    Returns:
+        Ports reported as "provided port is already allocated"
+    """
+    return [
+        int(port)
+        for port in re.findall(r"Invalid value: (\d+): provided port is already allocated", message)
+    ]
+
+
+node_port_allocator = NodePortAllocator()
@@ -0,0 +1,142 @@
+"""Sweeper for PVCs, Secrets and seed snapshots left behind by deleted EdgeLakeOperators.
+
+A create that failed before its status was written, or a delete that failed
+part-way, leaves resources that the delete handler never removed. The sweeper
+lists every resource labelled ``app.kubernetes.io/managed-by=edgelake-kube-operator``
+whose instance has no EdgeLakeOperator anymore, reports them and the
+reclaimable storage, and only deletes them when ORPHAN_SWEEP_DELETE=true.
+
+PVCs and seed snapshots kept on purpose by ``persistence.retainOnDelete`` are
+annotated ``edgelake.io/retained`` by the delete handler and are never swept.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any
+
+from ..constants import (
+    ANNOTATION_RETAINED,
+    LABEL_INSTANCE,
+    ORPHAN_SWEEP_DELETE_PAUSE,
+    ORPHAN_SWEEP_INTERVAL,
+    ORPHAN_SWEEP_MAX_DELETES,
+)
+from .kubernetes import delete_resource, list_edgelake_operator_keys, list_managed_resources
+from .metrics import ORPHANED_RESOURCES, ORPHANED_STORAGE_BYTES
+from .units import parse_storage
+
+logger = logging.getLogger(__name__)
+
+SWEPT_KINDS = ["PersistentVolumeClaim", "Secret", "VolumeSnapshot"]
+
+
+def _metadata(item: Any) -> dict[str, Any]:
+    """Return the metadata fields the sweeper needs from a client object or dict."""
+    if isinstance(item, dict):
+        metadata = item.get("metadata", {})
+        created = metadata.get("creationTimestamp")
+        return {
+            "name": metadata.get("name"),
+            "namespace": metadata.get("namespace"),
+            "labels": metadata.get("labels") or {},
+            "annotations": metadata.get("annotations") or {},
+            "created": datetime.fromisoformat(created) if created else None,
+        }
+    metadata = item.metadata
+    return {
+        "name": metadata.name,
+        "namespace": metadata.namespace,
+        "labels": metadata.labels or {},
+        "annotations": metadata.annotations or {},
+        "created": metadata.creation_timestamp,
+    }
+
+
+def find_orphans(
+    items: list[Any], instances: set[tuple[str, str]], now: datetime, min_age: float
+) -> list[Any]:
+    """Select resources whose owning EdgeLakeOperator no longer exists.
+
+    Resources annotated as retained by ``retainOnDelete`` are not orphans.
+
+    Args:
+        items: Resources labelled as managed by the operator (client objects,
+            or dicts for custom resources)
+        instances: (namespace, name) of every existing EdgeLakeOperator
+        now: Current time
+        min_age: Minimum age in seconds, so resources of a CR that is being
+            created concurrently with the sweep are not reported
+
+    Returns:
+        The orphaned resources
+    """
+    orphans = []
+    for item in items:
+        metadata = _metadata(item)
+        if ANNOTATION_RETAINED in metadata["annotations"]:
+            continue
+        instance = metadata["labels"].get(LABEL_INSTANCE)
+        if not instance or (metadata["namespace"], instance) in instances:
+            continue
+        created = metadata["created"]
+        if created and (now - created).total_seconds() < min_age:
+            continue
+        orphans.append(item)
+    return orphans
+
+
+def pvc_storage_bytes(pvc: Any) -> int:
+    """Return the storage held by a PVC (bound capacity, else the request)."""
+    capacity = (pvc.status.capacity or {}) if pvc.status else {}
+    requests = (pvc.spec.resources.requests or {}) if pvc.spec.resources else {}
+    storage = capacity.get("storage") or requests.get("storage")
+    try:
+        return parse_storage(storage) if storage else 0
+    except ValueError:
+        return 0
+
+
+async def sweep_orphans(delete: bool) -> dict[str, list[Any]]:
+    """Find, report and optionally delete orphaned PVCs, Secrets and seed snapshots.
+
+    Deletes are capped at ORPHAN_SWEEP_MAX_DELETES per sweep and spaced by
+    ORPHAN_SWEEP_DELETE_PAUSE, so a large teardown does not flood the API server.
+
+    Args:
+        delete: Delete the orphans instead of only reporting them
+
+    Returns:
+        Orphaned resources by kind
+    """
+    instances = list_edgelake_operator_keys()
+    now = datetime.now(timezone.utc)
+
+    orphans = {}
+    for kind in SWEPT_KINDS:
+        orphans[kind] = find_orphans(
+            list_managed_resources(kind), instances, now, ORPHAN_SWEEP_INTERVAL
+        )
+        ORPHANED_RESOURCES.labels(kind=kind).set(len(orphans[kind]))
+
+    reclaimable = sum(pvc_storage_bytes(pvc) for pvc in orphans["PersistentVolumeClaim"])
+    ORPHANED_STORAGE_BYTES.set(reclaimable)
+    for kind, items in orphans.items():
+        for item in items:
+            metadata = _metadata(item)
+            logger.info(f"Orphaned {kind}: {metadata['namespace']}/{metadata['name']}")
+    if any(orphans.values()):
+        logger.info(
+            f"Found {len(orphans['PersistentVolumeClaim'])} orphaned PVCs "
+            f"({reclaimable} bytes reclaimable), {len(orphans['Secret'])} orphaned Secrets "
+            f"and {len(orphans['VolumeSnapshot'])} orphaned VolumeSnapshots"
+        )
+
+    if delete:
+        deletes = [(kind, item) for kind, items in orphans.items() for item in items]
+        for kind, item in deletes[:ORPHAN_SWEEP_MAX_DELETES]:
+            metadata = _metadata(item)
+            await delete_resource(kind, metadata["name"], metadata["namespace"])
+            await asyncio.sleep(ORPHAN_SWEEP_DELETE_PAUSE)
+
+    return orphans
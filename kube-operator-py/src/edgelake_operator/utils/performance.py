@@ -0,0 +1,174 @@
+"""Performance profile helpers for EdgeLake pods.
+
+The ``dedicated`` profile targets nodes running the kubelet static CPU manager:
+integer CPU requests equal to limits put the pod in the Guaranteed QoS class so
+it receives exclusive cores, and EdgeLake thread pools are sized to those cores.
+validate_spec rejects dedicated specs that would not get Guaranteed QoS; the
+requested resources are never rewritten.
+"""
+
+import math
+from typing import Any
+
+from ..constants import LABEL_PERFORMANCE_PROFILE
+from ..models.spec import EdgeLakeOperatorSpec
+from .units import parse_cpu
+
+PROFILE_SHARED = "shared"
+PROFILE_DEDICATED = "dedicated"
+
+
+def is_dedicated(spec: EdgeLakeOperatorSpec) -> bool:
+    """Check if the spec uses the dedicated (CPU-pinned) profile."""
+    return spec.performanceProfile == PROFILE_DEDICATED
+
+
+def dedicated_cpu_cores(spec: EdgeLakeOperatorSpec) -> int:
+    """Number of exclusive cores: the CPU limit (whole cores, see validate_spec)."""
+    return max(1, math.ceil(parse_cpu(spec.resources.limits.cpu)))
+
+
+def build_resources(spec: EdgeLakeOperatorSpec) -> dict[str, Any]:
+    """Build container resources as specified in the CR."""
+    return {
+        "limits": {
+            "cpu": spec.resources.limits.cpu,
+            "memory": spec.resources.limits.memory,
+        },
+        "requests": {
+            "cpu": spec.resources.requests.cpu,
+            "memory": spec.resources.requests.memory,
+        },
+    }
+
+
+def guaranteed_qos_errors(spec: EdgeLakeOperatorSpec) -> list[str]:
+    """Check that a dedicated spec gets Guaranteed QoS and exclusive cores.
+
+    Args:
+        spec: Parsed spec of the CR
+
+    Returns:
+        List of validation error messages (empty if valid)
+    """
+    errors = []
+    limits, requests = spec.resources.limits, spec.resources.requests
+    try:
+        limit_cpu = parse_cpu(limits.cpu)
+        request_cpu = parse_cpu(requests.cpu)
+    except ValueError:
+        return errors  # Reported as an invalid quantity
+    if limit_cpu < 1 or not limit_cpu.is_integer():
+        errors.append(
+            f"spec.resources.limits.cpu must be a whole number of cores for the dedicated "
+            f"performance profile, got '{limits.cpu}'"
+        )
+    if request_cpu != limit_cpu:
+        errors.append(
+            f"spec.resources.requests.cpu must equal limits.cpu for the dedicated "
+            f"performance profile, got '{requests.cpu}' and '{limits.cpu}'"
+        )
+    if requests.memory != limits.memory:
+        errors.append(
+            f"spec.resources.requests.memory must equal limits.memory for the dedicated "
+            f"performance profile, got '{requests.memory}' and '{limits.memory}'"
+        )
+    return errors
+
+
+def query_pool(spec: EdgeLakeOperatorSpec) -> int:
+    """Effective query pool size: the pinned cores when dedicated, else advanced.queryPool.
+
+    Both the ConfigMap and the live 'set query pool' push use this, so a running
+    node is never tuned to a pool size it would not start with.
+    """
+    if is_dedicated(spec):
+        return dedicated_cpu_cores(spec)
+    return spec.advanced.queryPool
+
+
+def thread_counts(spec: EdgeLakeOperatorSpec) -> dict[str, str]:
+    """EdgeLake thread pool sizes, matched to the pinned cores when dedicated."""
+    if is_dedicated(spec):
+        cores = str(dedicated_cpu_cores(spec))
+        counts = {
+            "QUERY_POOL": str(query_pool(spec)),
+            "TCP_THREADS": cores,
+            "REST_THREADS": cores,
+            "BROKER_THREADS": cores,
+        }
+        if spec.operator is not None:
+            counts["OPERATOR_THREADS"] = cores
+        return counts
+
+    counts = {
+        "QUERY_POOL": str(query_pool(spec)),
+        "TCP_THREADS": str(spec.networking.tcpThreads),
+        "REST_THREADS": str(spec.networking.restThreads),
+        "BROKER_THREADS": str(spec.networking.brokerThreads),
+    }
+    if spec.operator is not None:
+        counts["OPERATOR_THREADS"] = str(spec.operator.threads)
+    return counts
+
+
+def build_scheduling(
+    spec: EdgeLakeOperatorSpec, selector_labels: dict[str, str]
+) -> dict[str, Any]:
+    """Build pod spec placement fields (priority, affinity, tolerations, spread).
+
+    Dedicated pods are steered to nodes labelled and tainted with
+    ``edgelake.io/performance-profile=dedicated`` and spread one per host.
+    """
+    scheduling = spec.scheduling
+    pod_fields: dict[str, Any] = {}
+
+    if scheduling.priorityClassName:
+        pod_fields["priorityClassName"] = scheduling.priorityClassName
+
+    node_selector = dict(scheduling.nodeSelector)
+    tolerations = list(scheduling.tolerations)
+
+    if is_dedicated(spec):
+        node_selector.setdefault(LABEL_PERFORMANCE_PROFILE, PROFILE_DEDICATED)
+        tolerations.append(
+            {
+                "key": LABEL_PERFORMANCE_PROFILE,
+                "operator": "Equal",
+                "value": PROFILE_DEDICATED,
+                "effect": "NoSchedule",
+            }
+        )
+        pod_fields["topologySpreadConstraints"] = [
+            {
+                "maxSkew": 1,
+                "topologyKey": "kubernetes.io/hostname",
+                "whenUnsatisfiable": "ScheduleAnyway",
+                "labelSelector": {
+                    "matchLabels": {
+                        "app.kubernetes.io/name": selector_labels["app.kubernetes.io/name"]
+                    }
+                },
+            }
+        ]
+
+    if node_selector:
+        pod_fields["affinity"] = {
+            "nodeAffinity": {
+                "requiredDuringSchedulingIgnoredDuringExecution": {
+                    "nodeSelectorTerms": [
+                        {
+                            "matchExpressions": [
+                                {"key": key, "operator": "In", "values": [value]}
+                                for key, value in sorted(node_selector.items())
+                            ]
+                        }
+                    ]
+                }
+            }
+        }
+
+    if tolerations:
+        pod_fields["tolerations"] = tolerations
+
+    return pod_fields
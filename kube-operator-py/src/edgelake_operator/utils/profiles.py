@@ -0,0 +1,120 @@
+"""Shared configuration profiles (EdgeLakeProfile).
+
+A profile holds ``database``, ``blockchain``, ``advanced`` and ``image``
+sections that many EdgeLakeOperators have in common. A CR references it with
+``profileRef`` and its own sections are layered over the profile's, field by
+field. Profiles are kept in memory from watch events, so resolving a CR's
+effective spec needs no call to the API server.
+
+When a profile changes, the CRs using it are not reconciled all at once: the
+new profile hash is written to their ``edgelake.io/profile-hash`` annotation in
+batches (see ``roll_profile`` in the operator), which triggers their update
+handler one batch at a time.
+"""
+
+import copy
+import hashlib
+import json
+from typing import Any, Optional
+
+from ..constants import PROFILE_FIELDS
+
+
+def merge_sections(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
+    """Layer a CR section over a profile section.
+
+    Nested objects are merged recursively; any other value set in the override
+    (including lists) replaces the profile's value.
+
+    Args:
+        base: Section from the profile
+        override: Same section from the CR
+
+    Returns:
+        New merged section
+    """
+    merged = copy.deepcopy(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = merge_sections(merged[key], value)
+        else:
+            merged[key] = copy.deepcopy(value)
+    return merged
+
+
+def profile_hash(spec: dict[str, Any]) -> str:
+    """Compute a hash of the shared sections of a profile.
+
+    Rollout settings are excluded, so changing them does not start a new rollout.
+
+    Args:
+        spec: The EdgeLakeProfile spec dictionary
+
+    Returns:
+        SHA256 hash of the shared sections (first 16 characters)
+    """
+    shared = {field: spec.get(field) for field in PROFILE_FIELDS if spec.get(field) is not None}
+    shared_json = json.dumps(shared, sort_keys=True, default=str)
+    return hashlib.sha256(shared_json.encode()).hexdigest()[:16]
+
+
+class ProfileStore:
+    """Specs of all watched EdgeLakeProfiles, keyed by namespace and name."""
+
+    def __init__(self) -> None:
+        self._profiles: dict[tuple[str, str], dict[str, Any]] = {}
+
+    def update(self, body: dict[str, Any]) -> None:
+        """Store the latest spec of a profile."""
+        metadata = body.get("metadata", {})
+        spec = copy.deepcopy(dict(body.get("spec") or {}))
+        self._profiles[(metadata.get("namespace"), metadata.get("name"))] = spec
+
+    def remove(self, namespace: str, name: str) -> None:
+        """Forget a deleted profile."""
+        self._profiles.pop((namespace, name), None)
+
+    def get(self, namespace: str, name: str) -> Optional[dict[str, Any]]:
+        """Get the spec of a profile, or None if it is not known."""
+        return self._profiles.get((namespace, name))
+
+
+def profile_name(spec: dict[str, Any]) -> Optional[str]:
+    """Get the name of the profile a CR spec references, if any."""
+    return (spec.get("profileRef") or {}).get("name")
+
+
+def missing_profile(spec: dict[str, Any], namespace: str) -> Optional[str]:
+    """Get the name of the referenced profile if it does not exist (yet)."""
+    name = profile_name(spec)
+    if name and profile_store.get(namespace, name) is None:
+        return name
+    return None
+
+
+def resolve_profile(spec: dict[str, Any], namespace: str) -> dict[str, Any]:
+    """Build the effective spec of a CR by layering it over its profile.
+
+    A CR without profileRef, or whose profile is not known, is returned as is
+    (see missing_profile).
+
+    Args:
+        spec: The EdgeLakeOperator spec dictionary
+        namespace: Namespace of the CR (profiles are namespaced)
+
+    Returns:
+        Effective spec dictionary
+    """
+    name = profile_name(spec)
+    profile = profile_store.get(namespace, name) if name else None
+    if not profile:
+        return spec
+
+    resolved = dict(spec)
+    for field in PROFILE_FIELDS:
+        if profile.get(field) is not None:
+            resolved[field] = merge_sections(profile[field], spec.get(field) or {})
+    return resolved
+
+
+profile_store = ProfileStore()
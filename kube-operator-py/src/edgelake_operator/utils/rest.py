@@ -0,0 +1,76 @@
+"""Client for the EdgeLake node REST API.
+
+EdgeLake accepts node commands over HTTP: the command travels in the
+``command`` header, ``GET`` is used for queries/reads and ``POST`` for
+commands that change node state.
+"""
+
+import asyncio
+import logging
+
+import aiohttp
+
+from ..constants import DEFAULT_REST_TIMEOUT, REST_USER_AGENT
+
+logger = logging.getLogger(__name__)
+
+
+class RestCommandError(Exception):
+    """Raised when an EdgeLake REST command fails or cannot be reached."""
+
+
+async def run_command(
+    host: str,
+    port: int,
+    command: str,
+    method: str = "GET",
+    timeout: float = DEFAULT_REST_TIMEOUT,
+) -> str:
+    """Run a command on an EdgeLake node through its REST API.
+
+    Args:
+        host: Pod IP or DNS name of the node
+        port: REST port (networking.restPort)
+        command: EdgeLake command, e.g. "get status"
+        method: "GET" for reads, "POST" for state changes
+        timeout: Request timeout in seconds
+
+    Returns:
+        Response body as text
+
+    Raises:
+        RestCommandError: On connection failure or non-2xx response
+    """
+    url = f"http://{host}:{port}"
+    headers = {"command": command, "User-Agent": REST_USER_AGENT}
+
+    try:
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=timeout)) as session:
+            async with session.request(method, url, headers=headers) as response:
+                body = await response.text()
+                if response.status >= 300:
+                    raise RestCommandError(
+                        f"'{command}' on {host}:{port} returned {response.status}: {body.strip()}"
+                    )
+                return body
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        raise RestCommandError(f"'{command}' on {host}:{port} failed: {e}") from e
+
+
+async def is_node_ready(host: str, port: int, timeout: float = 5) -> bool:
+    """Check whether an EdgeLake node answers ``get status`` as running.
+
+    Args:
+        host: Pod IP or DNS name of the node
+        port: REST port
+        timeout: Request timeout in seconds
+
+    Returns:
+        True if the node reports it is running
+    """
+    try:
+        body = await run_command(host, port, "get status", timeout=timeout)
+    except RestCommandError as e:
+        logger.debug(f"Node {host}:{port} not ready: {e}")
+        return False
+    return "running" in body.lower()
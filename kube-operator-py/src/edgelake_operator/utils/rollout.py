@@ -0,0 +1,148 @@
+"""Rollout timeline tracking for EdgeLake pods.
+
+A rollout starts when the operator applies a Deployment with a new config hash
+and ends when the new pod answers ``get status`` on its REST port. The time in
+between is split into phases so regressions can be attributed to scheduling,
+volume attach/mount, image pulls, container start or EdgeLake itself.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from ..constants import ANNOTATION_CONFIG_HASH
+
+# Phase names in the order they occur
+ROLLOUT_PHASES = ["scheduling", "volumeBinding", "imagePull", "containerStart", "edgelakeReady"]
+
+
+@dataclass
+class Rollout:
+    """A rollout in progress for one EdgeLakeOperator CR."""
+
+    config_hash: str
+    image: str
+    storage_class: str
+    started_at: datetime
+    pod: Optional[dict[str, Any]] = None
+
+
+class RolloutTracker:
+    """In-memory registry of rollouts that have not reached readiness yet."""
+
+    def __init__(self) -> None:
+        self._rollouts: dict[tuple[str, str], Rollout] = {}
+
+    def begin(
+        self, namespace: str, name: str, config_hash: str, image: str, storage_class: str
+    ) -> None:
+        """Start tracking a rollout after the Deployment was applied."""
+        self._rollouts[(namespace, name)] = Rollout(
+            config_hash=config_hash,
+            image=image,
+            storage_class=storage_class,
+            started_at=datetime.now(timezone.utc),
+        )
+
+    def is_pending(self, namespace: str, name: str) -> bool:
+        """Check whether a rollout is being tracked for the CR."""
+        return (namespace, name) in self._rollouts
+
+    def get(self, namespace: str, name: str) -> Optional[Rollout]:
+        """Return the tracked rollout for the CR, if any."""
+        return self._rollouts.get((namespace, name))
+
+    def observe_pod(self, namespace: str, name: str, pod: dict[str, Any]) -> None:
+        """Record the latest state of a pod belonging to the tracked rollout.
+
+        Pods from the previous rollout are ignored by comparing the config hash
+        annotation on the pod template.
+        """
+        rollout = self._rollouts.get((namespace, name))
+        if rollout is None:
+            return
+        annotations = pod.get("metadata", {}).get("annotations") or {}
+        if annotations.get(ANNOTATION_CONFIG_HASH) != rollout.config_hash:
+            return
+        rollout.pod = pod
+
+    def complete(self, namespace: str, name: str) -> None:
+        """Stop tracking the rollout of the CR."""
+        self._rollouts.pop((namespace, name), None)
+
+
+def container_started_at(pod: dict[str, Any]) -> Optional[datetime]:
+    """Return the start time of the pod's EdgeLake container, if running."""
+    for container_status in pod.get("status", {}).get("containerStatuses") or []:
+        running = (container_status.get("state") or {}).get("running")
+        if running and running.get("startedAt"):
+            return _parse_time(running["startedAt"])
+    return None
+
+
+def build_timeline(
+    rollout: Rollout,
+    ready_at: datetime,
+    events: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """Build the status.lastRollout timeline for a finished rollout.
+
+    Args:
+        rollout: The tracked rollout, with the latest pod state
+        ready_at: When the node first answered ``get status``
+        events: Pod events as dicts with "reason" and "time" (datetime)
+
+    Returns:
+        Timeline dictionary with per-phase durations in seconds
+    """
+    pod = rollout.pod or {}
+    scheduled_at = _condition_time(pod, "PodScheduled")
+    pulling_at = _first_event_time(events, "Pulling")
+    pulled_at = _first_event_time(events, "Pulled")
+    started_at = container_started_at(pod)
+
+    # Each phase ends where the next one starts; missing marks collapse to the previous one
+    marks = [rollout.started_at]
+    for mark in [scheduled_at, pulling_at or pulled_at, pulled_at, started_at, ready_at]:
+        marks.append(max(mark or marks[-1], marks[-1]))
+
+    phases = {
+        phase: round((marks[i + 1] - marks[i]).total_seconds(), 3)
+        for i, phase in enumerate(ROLLOUT_PHASES)
+    }
+
+    return {
+        "configHash": rollout.config_hash,
+        "image": rollout.image,
+        "podName": pod.get("metadata", {}).get("name"),
+        "startedAt": rollout.started_at.isoformat(),
+        "readyAt": ready_at.isoformat(),
+        "totalSeconds": round((ready_at - rollout.started_at).total_seconds(), 3),
+        "phases": phases,
+    }
+
+
+def _condition_time(pod: dict[str, Any], condition_type: str) -> Optional[datetime]:
+    """Return the transition time of a True pod condition."""
+    for condition in pod.get("status", {}).get("conditions") or []:
+        if condition.get("type") == condition_type and condition.get("status") == "True":
+            return _parse_time(condition.get("lastTransitionTime"))
+    return None
+
+
+def _first_event_time(events: list[dict[str, Any]], reason: str) -> Optional[datetime]:
+    """Return the earliest time of an event with the given reason."""
+    times = [e["time"] for e in events if e.get("reason") == reason and e.get("time")]
+    return min(times) if times else None
+
+
+def _parse_time(value: Any) -> Optional[datetime]:
+    """Parse a Kubernetes timestamp (RFC 3339 string or datetime)."""
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+rollout_tracker = RolloutTracker()
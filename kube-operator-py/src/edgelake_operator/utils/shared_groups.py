@@ -0,0 +1,77 @@
+"""MQTT message rates aggregated per shared-subscription group.
+
+The nodes of one ``mqtt.sharedGroup`` usually belong to different
+EdgeLakeOperators (operator nodes run a single replica), and the broker
+balances the stream across all of them. Each CR's rate timer records its own
+rate here, so the status of every member can report the rate of the whole
+group and its share of it. A group is identified by broker address and group
+name: the same group name on another broker is an unrelated stream.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+from ..constants import SHARED_GROUP_STALE_SECONDS
+
+GroupKey = tuple[str, str]
+
+
+class SharedGroupRates:
+    """Latest MQTT message rate of each CR in each shared-subscription group."""
+
+    def __init__(self, stale_after: float = SHARED_GROUP_STALE_SECONDS) -> None:
+        self._stale_after = timedelta(seconds=stale_after)
+        self._groups: dict[GroupKey, dict[tuple[str, str], dict[str, Any]]] = {}
+
+    def record(
+        self,
+        group: GroupKey,
+        namespace: str,
+        name: str,
+        rate: float,
+        replicas: int,
+        now: datetime,
+    ) -> None:
+        """Record the latest rate of a CR, moving it out of any other group."""
+        self.forget(namespace, name, keep=group)
+        self._groups.setdefault(group, {})[(namespace, name)] = {
+            "rate": rate,
+            "replicas": replicas,
+            "sampledAt": now,
+        }
+
+    def forget(self, namespace: str, name: str, keep: Optional[GroupKey] = None) -> None:
+        """Drop a CR from every group (except ``keep``)."""
+        for key in list(self._groups):
+            if key == keep:
+                continue
+            self._groups[key].pop((namespace, name), None)
+            if not self._groups[key]:
+                del self._groups[key]
+
+    def members(self, group: GroupKey, now: datetime) -> list[dict[str, Any]]:
+        """Members of a group that reported within the staleness window.
+
+        Args:
+            group: (broker address, group name)
+            now: Current time, to expire members whose timer stopped
+
+        Returns:
+            One entry per member CR, sorted by namespace and name
+        """
+        members = self._groups.get(group, {})
+        for key, entry in list(members.items()):
+            if now - entry["sampledAt"] > self._stale_after:
+                del members[key]
+
+        return [
+            {
+                "instance": f"{namespace}/{name}",
+                "replicas": entry["replicas"],
+                "ratePerSecond": entry["rate"],
+            }
+            for (namespace, name), entry in sorted(members.items())
+        ]
+
+
+shared_group_rates = SharedGroupRates()
@@ -0,0 +1,131 @@
+"""Runtime settings that are applied to running EdgeLake nodes without a restart.
+
+EdgeLake reads most settings once at startup from the environment, but some can
+be changed on a running node with a REST command. When only such "live-tunable"
+fields change, the operator updates the ConfigMap (for pods started later) and
+pushes the new values to the running pods instead of rolling the Deployment.
+Where EdgeLake can report the value back, the change is verified with a read
+command. A pod that rejects a command or fails verification is restarted.
+"""
+
+import logging
+from typing import Any, Callable, Optional
+
+from ..models.spec import EdgeLakeOperatorSpec
+from .performance import query_pool
+from .rest import RestCommandError, run_command
+
+logger = logging.getLogger(__name__)
+
+
+def _on_off(value: bool) -> str:
+    return "on" if value else "off"
+
+
+def _buffer_threshold(spec: EdgeLakeOperatorSpec) -> list[str]:
+    advanced = spec.advanced
+    return [
+        f"set buffer threshold where time = {advanced.thresholdTime} "
+        f"and volume = {advanced.thresholdVolume} "
+        f"and write_immediate = {str(advanced.writeImmediate).lower()}"
+    ]
+
+
+def _blockchain_sync(spec: EdgeLakeOperatorSpec) -> list[str]:
+    blockchain = spec.blockchain
+    return [
+        "exit synchronizer",
+        f"run blockchain sync where source = {blockchain.source} "
+        f"and time = {blockchain.syncTime} and dest = {blockchain.destination} "
+        f"and connection = {blockchain.ledgerConn}",
+    ]
+
+
+# Live-tunable spec fields: (commands to apply, read-back command, expected value)
+LiveTunable = tuple[
+    Callable[[EdgeLakeOperatorSpec], list[str]],
+    Optional[str],
+    Optional[Callable[[EdgeLakeOperatorSpec], str]],
+]
+
+LIVE_TUNABLES: dict[str, LiveTunable] = {
+    "networking.restTimeout": (
+        lambda spec: [f"set rest timeout {spec.networking.restTimeout}"],
+        None,
+        None,
+    ),
+    "advanced.thresholdTime": (_buffer_threshold, None, None),
+    "advanced.thresholdVolume": (_buffer_threshold, None, None),
+    "advanced.writeImmediate": (_buffer_threshold, None, None),
+    "advanced.queryPool": (
+        lambda spec: [f"set query pool {query_pool(spec)}"],
+        "get query pool",
+        lambda spec: str(query_pool(spec)),
+    ),
+    "blockchain.syncTime": (
+        _blockchain_sync,
+        "get synchronizer",
+        lambda spec: spec.blockchain.syncTime,
+    ),
+    "mqtt.log": (lambda spec: [f"set mqtt debug {_on_off(spec.mqtt.log)}"], None, None),
+}
+
+LIVE_TUNABLE_FIELDS = tuple(LIVE_TUNABLES)
+
+
+async def push_live_tunables(
+    spec: EdgeLakeOperatorSpec, fields: list[str], host: str, port: int
+) -> Optional[str]:
+    """Apply changed live-tunable fields to one running EdgeLake node.
+
+    Args:
+        spec: Parsed spec with the new values
+        fields: Changed live-tunable fields (dotted spec paths)
+        host: Pod IP
+        port: REST port
+
+    Returns:
+        None if every change was applied and verified, otherwise the error
+    """
+    commands: list[str] = []
+    checks: list[tuple[str, str]] = []
+    for field in fields:
+        build, read_command, expected = LIVE_TUNABLES[field]
+        # Fields sharing one command (buffer thresholds) are applied once
+        commands.extend(c for c in build(spec) if c not in commands)
+        if read_command and expected:
+            checks.append((read_command, expected(spec)))
+
+    try:
+        for command in commands:
+            await run_command(host, port, command, method="POST")
+        for read_command, value in checks:
+            output = await run_command(host, port, read_command)
+            if value not in output:
+                return f"'{read_command}' does not report {value}"
+    except RestCommandError as e:
+        return str(e)
+    return None
+
+
+def live_tuning_status(
+    fields: list[str], results: dict[str, Optional[str]], now: str
+) -> dict[str, Any]:
+    """Build status.liveTuning for one push.
+
+    Args:
+        fields: Changed live-tunable fields
+        results: Error per pod name (None if applied)
+        now: Timestamp of the push (ISO 8601)
+
+    Returns:
+        Status dictionary
+    """
+    return {
+        "appliedAt": now,
+        "fields": fields,
+        "pods": [
+            {"pod": pod, "applied": error is None, **({"error": error} if error else {})}
+            for pod, error in sorted(results.items())
+        ],
+    }
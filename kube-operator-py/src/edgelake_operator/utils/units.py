@@ -0,0 +1,145 @@
+"""Parsing helpers for durations, sizes and Kubernetes quantities used in EdgeLake configs."""
+
+import re
+
+_DURATION_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([a-zA-Z]+)\s*$")
+
+_SIZE_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([a-zA-Z]*)\s*$")
+
+_SIZE_UNITS = {
+    "": 1,
+    "b": 1,
+    "kb": 1024,
+    "mb": 1024**2,
+    "gb": 1024**3,
+}
+
+# Kubernetes quantity suffixes (decimal and binary)
+_QUANTITY_SUFFIXES = {
+    "": 1,
+    "k": 1000,
+    "M": 1000**2,
+    "G": 1000**3,
+    "T": 1000**4,
+    "Ki": 1024,
+    "Mi": 1024**2,
+    "Gi": 1024**3,
+    "Ti": 1024**4,
+}
+
+_DURATION_UNITS = {
+    "s": 1,
+    "sec": 1,
+    "secs": 1,
+    "second": 1,
+    "seconds": 1,
+    "m": 60,
+    "min": 60,
+    "mins": 60,
+    "minute": 60,
+    "minutes": 60,
+    "h": 3600,
+    "hour": 3600,
+    "hours": 3600,
+    "d": 86400,
+    "day": 86400,
+    "days": 86400,
+    "w": 604800,
+    "week": 604800,
+    "weeks": 604800,
+}
+
+
+def parse_duration(value: str) -> float:
+    """Parse an EdgeLake style duration (e.g. "30 second", "14 days") into seconds.
+
+    Args:
+        value: Duration string made of a number and a unit
+
+    Returns:
+        Duration in seconds
+
+    Raises:
+        ValueError: If the string is not a recognised duration
+    """
+    match = _DURATION_PATTERN.match(value or "")
+    if not match:
+        raise ValueError(f"Invalid duration: '{value}'")
+
+    unit = match.group(2).lower()
+    if unit not in _DURATION_UNITS:
+        raise ValueError(f"Invalid duration unit in '{value}'")
+
+    return float(match.group(1)) * _DURATION_UNITS[unit]
+
+
+def format_duration(seconds: float) -> str:
+    """Format seconds as an EdgeLake duration string (e.g. "45 seconds")."""
+    return f"{max(1, round(seconds))} seconds"
+
+
+def parse_size(value: str) -> int:
+    """Parse an EdgeLake style size (e.g. "100KB", "2 MB") into bytes.
+
+    Args:
+        value: Size string made of a number and an optional B/KB/MB/GB unit
+
+    Returns:
+        Size in bytes
+
+    Raises:
+        ValueError: If the string is not a recognised size
+    """
+    match = _SIZE_PATTERN.match(value or "")
+    if not match:
+        raise ValueError(f"Invalid size: '{value}'")
+
+    unit = match.group(2).lower()
+    if unit not in _SIZE_UNITS:
+        raise ValueError(f"Invalid size unit in '{value}'")
+
+    return int(float(match.group(1)) * _SIZE_UNITS[unit])
+
+
+def format_size(size: int) -> str:
+    """Format bytes as an EdgeLake size string in KB (e.g. "512KB")."""
+    return f"{max(1, round(size / 1024))}KB"
+
+
+def parse_cpu(value: str) -> float:
+    """Parse a Kubernetes CPU quantity (e.g. "2000m", "1.5", "4") into cores.
+
+    Args:
+        value: CPU quantity string
+
+    Returns:
+        Number of cores
+
+    Raises:
+        ValueError: If the string is not a valid CPU quantity
+    """
+    value = str(value).strip()
+    try:
+        if value.endswith("m"):
+            return float(value[:-1]) / 1000
+        return float(value)
+    except ValueError:
+        raise ValueError(f"Invalid CPU quantity: '{value}'") from None
+
+
+def parse_storage(value: str) -> int:
+    """Parse a Kubernetes storage quantity (e.g. "10Gi", "500M") into bytes.
+
+    Args:
+        value: Storage quantity string
+
+    Returns:
+        Size in bytes
+
+    Raises:
+        ValueError: If the string is not a valid storage quantity
+    """
+    match = _SIZE_PATTERN.match(str(value))
+    if not match or match.group(2) not in _QUANTITY_SUFFIXES:
+        raise ValueError(f"Invalid storage quantity: '{value}'")
+    return int(float(match.group(1)) * _QUANTITY_SUFFIXES[match.group(2)])
@@ -3,12 +3,28 @@
 import re
 from typing import Optional
 
-from ..models.spec import EdgeLakeOperatorSpec
+from ..constants import (
+    AGGREGATION_FUNCTIONS,
+    MAX_SESSION_AFFINITY_TIMEOUT_SECONDS,
+    NODE_TYPE_QUERY,
+    NODE_TYPES,
+)
+from ..models.spec import EdgeLakeOperatorSpec, PartitionPolicySpec
+from ..resources.scripts import has_generated_scripts
+from .performance import guaranteed_qos_errors, is_dedicated
+from .units import parse_cpu, parse_duration, parse_size
+
+# EdgeLake partition intervals, e.g. "14 days", "1 hour", "month"
+_PARTITION_INTERVAL_PATTERN = r"^([0-9]+\s*)?(year|month|week|day|hour)s?$"
 
 
 def validate_spec(spec: EdgeLakeOperatorSpec) -> list[str]:
     """Validate EdgeLakeOperator spec for semantic correctness.
 
+    Fields a profile can provide (such as blockchain.ledgerConn) are optional in
+    the CRD and required here, so spec must be parsed from the profile-resolved
+    spec (see resolve_profile).
+
     Args:
         spec: Parsed spec to validate
 
@@ -23,11 +39,52 @@ def validate_spec(spec: EdgeLakeOperatorSpec) -> list[str]:
     if not spec.general.companyName:
         errors.append("spec.general.companyName is required")
     if not spec.blockchain.ledgerConn:
-        errors.append("spec.blockchain.ledgerConn is required")
-    if not spec.operator.clusterName:
-        errors.append("spec.operator.clusterName is required")
-    if not spec.operator.defaultDbms:
-        errors.append("spec.operator.defaultDbms is required")
+        errors.append("spec.blockchain.ledgerConn is required (in the CR or its profile)")
+
+    # Node type validation
+    if spec.nodeType not in NODE_TYPES:
+        errors.append(f"spec.nodeType must be one of {NODE_TYPES}, got '{spec.nodeType}'")
+    if spec.is_operator_node():
+        if spec.operator is None:
+            errors.append("spec.operator is required for operator nodes")
+        else:
+            if not spec.operator.clusterName:
+                errors.append("spec.operator.clusterName is required")
+            if not spec.operator.defaultDbms:
+                errors.append("spec.operator.defaultDbms is required")
+    else:
+        if spec.operator is not None:
+            errors.append(f"spec.operator is only valid for operator nodes, not {spec.nodeType}")
+        for section in ["mqtt", "opcua", "etherip", "aggregations"]:
+            if getattr(spec, section).enabled:
+                errors.append(f"spec.{section} is only supported on operator nodes")
+    if spec.replicas > 1 and spec.nodeType != NODE_TYPE_QUERY:
+        errors.append(
+            f"spec.replicas > 1 is only supported for query nodes; "
+            f"{spec.nodeType} nodes keep local state"
+        )
+    if spec.nodeType == NODE_TYPE_QUERY and spec.advanced.queryPool < 1:
+        errors.append("spec.advanced.queryPool must be at least 1")
+
+    # Autoscaling validation
+    autoscaling = spec.autoscaling
+    if autoscaling.enabled:
+        if spec.nodeType != NODE_TYPE_QUERY:
+            errors.append("spec.autoscaling is only supported for query nodes")
+        if autoscaling.minReplicas > autoscaling.maxReplicas:
+            errors.append("spec.autoscaling.minReplicas must not exceed maxReplicas")
+        for field_name in ["targetP95Latency", "scaleUpCooldown", "scaleDownCooldown"]:
+            try:
+                parse_duration(getattr(autoscaling, field_name))
+            except ValueError as e:
+                errors.append(f"spec.autoscaling.{field_name}: {e}")
+
+    # Update coalescing validation
+    try:
+        if parse_duration(spec.reconcile.debounce) > parse_duration(spec.reconcile.maxDelay):
+            errors.append("spec.reconcile.debounce must not exceed maxDelay")
+    except ValueError as e:
+        errors.append(f"spec.reconcile: {e}")
 
     # Port validation
     if not (1 <= spec.networking.serverPort <= 65535):
@@ -46,7 +103,7 @@ def validate_spec(spec: EdgeLakeOperatorSpec) -> list[str]:
 
     # Blockchain ledger connection format
     ledger_pattern = r"^[a-zA-Z0-9.-]+:[0-9]+$"
-    if not re.match(ledger_pattern, spec.blockchain.ledgerConn):
+    if spec.blockchain.ledgerConn and not re.match(ledger_pattern, spec.blockchain.ledgerConn):
         errors.append(
             f"spec.blockchain.ledgerConn must be in format 'host:port', got '{spec.blockchain.ledgerConn}'"
         )
@@ -69,17 +126,91 @@ def validate_spec(spec: EdgeLakeOperatorSpec) -> list[str]:
         if not spec.mqtt.broker:
             errors.append("spec.mqtt.broker is required when MQTT is enabled")
 
+    # MQTT shared subscription group
+    if spec.mqtt.sharedGroup and not re.match(r"^[^/+#$]+$", spec.mqtt.sharedGroup):
+        errors.append(
+            f"spec.mqtt.sharedGroup must not contain '/', '+', '#' or '$', "
+            f"got '{spec.mqtt.sharedGroup}'"
+        )
+
+    # MQTT subscriptions
+    if spec.mqtt.subscriptions:
+        if spec.mqtt.message.topic:
+            errors.append("spec.mqtt.message.topic and spec.mqtt.subscriptions are mutually exclusive")
+        topics = [subscription.topic for subscription in spec.mqtt.subscriptions]
+        for i, topic in enumerate(topics):
+            for other in topics[i + 1 :]:
+                if _mqtt_topics_overlap(topic, other):
+                    errors.append(
+                        f"spec.mqtt.subscriptions topics '{topic}' and '{other}' overlap; "
+                        f"messages would be ingested twice"
+                    )
+
     # OPC-UA validation
     if spec.opcua.enabled:
-        if not spec.opcua.url:
-            errors.append("spec.opcua.url is required when OPC-UA is enabled")
+        if not spec.opcua.url and not spec.opcua.groups:
+            errors.append("spec.opcua.url or spec.opcua.groups is required when OPC-UA is enabled")
+        if spec.opcua.url and spec.opcua.groups:
+            errors.append("spec.opcua.url and spec.opcua.groups are mutually exclusive")
+        group_names = set()
+        for i, group in enumerate(spec.opcua.groups):
+            field = f"spec.opcua.groups[{i}]"
+            if group.name in group_names:
+                errors.append(f"{field}.name '{group.name}' is not unique")
+            group_names.add(group.name)
+            if not group.url.startswith("opc.tcp://"):
+                errors.append(f"{field}.url must start with opc.tcp://, got '{group.url}'")
+            if bool(group.nodes) == bool(group.browseRoot):
+                errors.append(f"{field} must set exactly one of nodes or browseRoot")
+            if any('"' in node for node in group.nodes):
+                errors.append(f"{field}.nodes must not contain double quotes")
+            try:
+                parse_duration(group.frequency)
+            except ValueError as e:
+                errors.append(f"{field}.frequency: {e}")
 
     # EtherNet/IP validation
     if spec.etherip.enabled:
-        if not spec.etherip.url and not spec.etherip.simulatorMode:
+        if not spec.etherip.url and not spec.etherip.plcs and not spec.etherip.simulatorMode:
             errors.append(
                 "spec.etherip.url is required when EtherNet/IP is enabled (unless simulatorMode is true)"
             )
+        if spec.etherip.url and spec.etherip.plcs:
+            errors.append("spec.etherip.url and spec.etherip.plcs are mutually exclusive")
+        plc_names = set()
+        for i, plc in enumerate(spec.etherip.plcs):
+            field = f"spec.etherip.plcs[{i}]"
+            if plc.name in plc_names:
+                errors.append(f"{field}.name '{plc.name}' is not unique")
+            plc_names.add(plc.name)
+            if not plc.url and not spec.etherip.simulatorMode:
+                errors.append(f"{field}.url is required unless simulatorMode is true")
+            if any('"' in tag for tag in plc.tags):
+                errors.append(f"{field}.tags must not contain double quotes")
+            try:
+                parse_duration(plc.frequency)
+            except ValueError as e:
+                errors.append(f"{field}.frequency: {e}")
+
+    # Aggregation validation
+    if spec.aggregations.enabled and spec.operator is not None:
+        aggregated_tables = set()
+        for i, rule in enumerate(spec.aggregations.rules):
+            field = f"spec.aggregations.rules[{i}]"
+            key = (rule.dbms or spec.operator.defaultDbms, rule.table)
+            if key in aggregated_tables:
+                errors.append(f"{field}: duplicate aggregation rule for {key[0]}.{key[1]}")
+            aggregated_tables.add(key)
+            invalid = [f for f in rule.functions if f not in AGGREGATION_FUNCTIONS]
+            if invalid or not rule.functions:
+                errors.append(
+                    f"{field}.functions must be a non-empty subset of {AGGREGATION_FUNCTIONS}, "
+                    f"got {rule.functions}"
+                )
+            try:
+                parse_duration(rule.interval)
+            except ValueError as e:
+                errors.append(f"{field}.interval: {e}")
 
     # Service type validation
     valid_service_types = ["ClusterIP", "NodePort", "LoadBalancer"]
@@ -89,6 +220,35 @@ def validate_spec(spec: EdgeLakeOperatorSpec) -> list[str]:
             f"got '{spec.networking.serviceType}'"
         )
 
+    # Service routing validation
+    routing = spec.networking.routing
+    if routing.internalTrafficPolicy not in ("Cluster", "Local"):
+        errors.append(
+            "spec.networking.routing.internalTrafficPolicy must be Cluster or Local, "
+            f"got '{routing.internalTrafficPolicy}'"
+        )
+    elif routing.internalTrafficPolicy == "Local" and routing.topologyAware:
+        errors.append(
+            "spec.networking.routing.topologyAware has no effect with internalTrafficPolicy Local"
+        )
+    if routing.sessionAffinity not in ("None", "ClientIP"):
+        errors.append(
+            "spec.networking.routing.sessionAffinity must be None or ClientIP, "
+            f"got '{routing.sessionAffinity}'"
+        )
+    try:
+        timeout = parse_duration(routing.sessionAffinityTimeout)
+        if not (1 <= timeout <= MAX_SESSION_AFFINITY_TIMEOUT_SECONDS):
+            errors.append(
+                "spec.networking.routing.sessionAffinityTimeout must be between 1 second "
+                f"and {MAX_SESSION_AFFINITY_TIMEOUT_SECONDS // 3600} hours"
+            )
+    except ValueError as e:
+        errors.append(f"spec.networking.routing.sessionAffinityTimeout: {e}")
+
+    if spec.networking.autoAllocatePorts and spec.networking.serviceType != "NodePort":
+        errors.append("spec.networking.autoAllocatePorts requires serviceType NodePort")
+
     # NodePort range validation
     if spec.networking.serviceType == "NodePort":
         for port_name, port in [
@@ -102,13 +262,184 @@ def validate_spec(spec: EdgeLakeOperatorSpec) -> list[str]:
                 )
 
     # Partition validation
-    if spec.operator.partitioning.enabled:
+    if spec.operator is not None and spec.operator.partitioning.enabled:
         if spec.operator.partitioning.keep < 1:
             errors.append("spec.operator.partitioning.keep must be at least 1")
+        errors.extend(_validate_partition_policies(spec))
+        maintenance = spec.operator.partitioning.maintenance
+        for field_name, value in [("offset", maintenance.offset), ("window", maintenance.window)]:
+            if value:
+                try:
+                    parse_duration(value)
+                except ValueError as e:
+                    errors.append(f"spec.operator.partitioning.maintenance.{field_name}: {e}")
+        if maintenance.stagger and not spec.operator.partitioning.policies:
+            try:
+                parse_duration(spec.operator.partitioning.sync)
+            except ValueError as e:
+                errors.append(f"spec.operator.partitioning.sync: {e}")
+
+    # Performance profile validation
+    if spec.performanceProfile not in ["shared", "dedicated"]:
+        errors.append(
+            f"spec.performanceProfile must be 'shared' or 'dedicated', "
+            f"got '{spec.performanceProfile}'"
+        )
+    for field_name, quantity in [
+        ("limits.cpu", spec.resources.limits.cpu),
+        ("requests.cpu", spec.resources.requests.cpu),
+    ]:
+        try:
+            parse_cpu(quantity)
+        except ValueError:
+            errors.append(f"spec.resources.{field_name} is not a valid CPU quantity: '{quantity}'")
+    if is_dedicated(spec):
+        errors.extend(guaranteed_qos_errors(spec))
+
+    # Probe validation
+    if spec.probes.type not in ["tcp", "http"]:
+        errors.append(f"spec.probes.type must be 'tcp' or 'http', got '{spec.probes.type}'")
+
+    # The generated local_script.al is mounted over the hand-written one
+    if spec.advanced.deployLocalScript and has_generated_scripts(spec):
+        errors.append(
+            "spec.advanced.deployLocalScript cannot be combined with settings rendered "
+            "into generated scripts; its local_script.al would be shadowed"
+        )
+
+    # Buffer thresholds
+    for field_name, value, parser in [
+        ("advanced.thresholdTime", spec.advanced.thresholdTime, parse_duration),
+        ("advanced.thresholdVolume", spec.advanced.thresholdVolume, parse_size),
+    ]:
+        try:
+            parser(value)
+        except ValueError as e:
+            errors.append(f"spec.{field_name}: {e}")
+
+    adaptive = spec.advanced.adaptiveBuffers
+    if adaptive.enabled:
+        parsed = {}
+        for field_name, value, parser in [
+            ("interval", adaptive.interval, parse_duration),
+            ("minTime", adaptive.minTime, parse_duration),
+            ("maxTime", adaptive.maxTime, parse_duration),
+            ("targetFileSize", adaptive.targetFileSize, parse_size),
+            ("maxVolume", adaptive.maxVolume, parse_size),
+        ]:
+            try:
+                parsed[field_name] = parser(value)
+            except ValueError as e:
+                errors.append(f"spec.advanced.adaptiveBuffers.{field_name}: {e}")
+        if len(parsed) == 5:
+            if parsed["minTime"] > parsed["maxTime"]:
+                errors.append("spec.advanced.adaptiveBuffers.minTime must not exceed maxTime")
+            if parsed["targetFileSize"] > parsed["maxVolume"]:
+                errors.append(
+                    "spec.advanced.adaptiveBuffers.targetFileSize must not exceed maxVolume"
+                )
+
+    # Volume data sources (snapshot restore / clone)
+    for volume_name in ["anylog", "blockchain", "data", "scripts"]:
+        volume = getattr(spec.persistence, volume_name)
+        sources = [
+            source
+            for source in ("fromSnapshot", "fromSeed", "cloneFrom")
+            if getattr(volume, source)
+        ]
+        if not sources:
+            continue
+        if len(sources) > 1:
+            errors.append(
+                f"spec.persistence.{volume_name}: {' and '.join(sources)} are mutually exclusive"
+            )
+        if volume.fromSeed and volume_name != "blockchain":
+            # Seed snapshots are taken of the blockchain volume only
+            errors.append(
+                f"spec.persistence.{volume_name}.fromSeed is only supported for blockchain"
+            )
+        if not spec.uses_persistence():
+            errors.append(
+                f"spec.persistence.{volume_name} data source requires persistence to be enabled"
+            )
+
+    # Seed snapshot validation
+    seed_snapshot = spec.persistence.seedSnapshot
+    if seed_snapshot.enabled:
+        if not spec.uses_persistence():
+            errors.append("spec.persistence.seedSnapshot requires persistence to be enabled")
+        try:
+            parse_duration(seed_snapshot.interval)
+        except ValueError:
+            errors.append(
+                f"spec.persistence.seedSnapshot.interval must be a duration like '6 hours', "
+                f"got '{seed_snapshot.interval}'"
+            )
+        if seed_snapshot.keep < 1:
+            errors.append("spec.persistence.seedSnapshot.keep must be at least 1")
 
     return errors
 
 
+def _validate_partition_policies(spec: EdgeLakeOperatorSpec) -> list[str]:
+    """Validate per-table partitioning policies and detect conflicts between them.
+
+    A '*' policy applies to every table of its database, including tables with
+    their own policy. Its retention job therefore also drops partitions of those
+    tables, so its keep must not be lower than theirs.
+    """
+    errors: list[str] = []
+    policies: dict[tuple[str, str], PartitionPolicySpec] = {}
+
+    for i, policy in enumerate(spec.operator.partitioning.policies):
+        field = f"spec.operator.partitioning.policies[{i}]"
+        dbms = policy.dbms or spec.operator.defaultDbms
+        if policy.table != "*" and not re.match(r"^[A-Za-z0-9_]+$", policy.table):
+            errors.append(
+                f"{field}.table must be a table name or '*' (partial wildcards are not "
+                f"supported by EdgeLake), got '{policy.table}'"
+            )
+        if not re.match(_PARTITION_INTERVAL_PATTERN, policy.interval.strip(), re.IGNORECASE):
+            errors.append(f"{field}.interval: Invalid partition interval: '{policy.interval}'")
+        try:
+            parse_duration(policy.sync)
+        except ValueError as e:
+            errors.append(f"{field}.sync: {e}")
+
+        key = (dbms, policy.table)
+        if key in policies:
+            errors.append(f"{field}: duplicate partitioning policy for {dbms}.{policy.table}")
+            continue
+        policies[key] = policy
+
+    for (dbms, table), policy in policies.items():
+        wildcard = policies.get((dbms, "*"))
+        if table != "*" and wildcard is not None and wildcard.keep < policy.keep:
+            errors.append(
+                f"spec.operator.partitioning.policies: '*' policy for {dbms} keeps "
+                f"{wildcard.keep} partitions per table, fewer than the {policy.keep} "
+                f"kept for {dbms}.{table}"
+            )
+
+    return errors
+
+
+def _mqtt_topics_overlap(first: str, second: str) -> bool:
+    """Check if two MQTT topic filters can match the same topic ('+' and '#' wildcards)."""
+    first_levels = first.split("/")
+    second_levels = second.split("/")
+    for i in range(max(len(first_levels), len(second_levels))):
+        a = first_levels[i] if i < len(first_levels) else None
+        b = second_levels[i] if i < len(second_levels) else None
+        if a == "#" or b == "#":
+            return True
+        if a is None or b is None:
+            return False
+        if a != b and a != "+" and b != "+":
+            return False
+    return True
+
+
 def validate_ledger_connection(ledger_conn: str) -> Optional[str]:
     """Validate and parse ledger connection string.
 
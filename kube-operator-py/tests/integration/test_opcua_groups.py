@@ -0,0 +1,132 @@
+"""OPC-UA polling groups against a local OPC-UA simulator.
+
+The generated opcua.al script is executed the way the node does it: each
+'run opcua client' connects to the group's server and reads all of its nodes,
+and a 'get opcua struct' browse root is first expanded into the variables
+below it. The simulator is an asyncua server on a free local port.
+"""
+
+import re
+import socket
+from unittest import mock
+
+import pytest
+
+from edgelake_operator.models.spec import EdgeLakeOperatorSpec
+from edgelake_operator.resources.scripts import render_scripts
+from edgelake_operator.utils.validation import validate_spec
+
+from ..unit.conftest import load_sample
+
+asyncua = pytest.importorskip("asyncua")
+ua = asyncua.ua
+
+NAMESPACE_URI = "urn:edgelake:simulator"
+
+PRESS_TAGS = {"Temperature": 71.5, "Pressure": 3.2, "Speed": 1450.0}
+
+_COMMAND = re.compile(r"<(?P<command>[a-z ]+?) where\n(?P<params>.*?)\n>", re.DOTALL)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _parse_script(script: str) -> list[tuple[str, dict[str, list[str]]]]:
+    """Split a rendered script into (command, {param: [values]}) pairs."""
+    commands = []
+    for match in _COMMAND.finditer(script):
+        params: dict[str, list[str]] = {}
+        for param in match.group("params").split(" and\n"):
+            key, value = (part.strip() for part in param.split("=", 1))
+            params.setdefault(key, []).append(value.strip('"'))
+        commands.append((match.group("command"), params))
+    return commands
+
+
+@pytest.fixture
+async def simulator():
+    """OPC-UA server with one press object and its tags as string node ids."""
+    url = f"opc.tcp://127.0.0.1:{_free_port()}/edgelake/simulator/"
+    server = asyncua.Server()
+    await server.init()
+    server.set_endpoint(url)
+    idx = await server.register_namespace(NAMESPACE_URI)
+    press = await server.nodes.objects.add_object(ua.NodeId("Press1", idx), "Press1")
+    for tag, value in PRESS_TAGS.items():
+        await press.add_variable(ua.NodeId(f"Press1.{tag}", idx), tag, value)
+    async with server:
+        yield url, idx
+
+
+async def _run_opcua_client(url: str, nodes: list[str]) -> tuple[dict[str, object], int]:
+    """Read a group's nodes like 'run opcua client' and count the read requests."""
+    async with asyncua.Client(url) as client:
+        read = mock.AsyncMock(wraps=client.uaclient.read_attributes)
+        with mock.patch.object(client.uaclient, "read_attributes", read):
+            values = await client.read_values([client.get_node(node) for node in nodes])
+        return dict(zip(nodes, values)), read.await_count
+
+
+async def _browse_variables(url: str, root: str) -> list[str]:
+    """Expand a browse root like 'get opcua struct ... class = variable'."""
+    async with asyncua.Client(url) as client:
+        pending = [client.get_node(root)]
+        variables = []
+        while pending:
+            node = pending.pop(0)
+            for child in await node.get_children():
+                if await child.read_node_class() == ua.NodeClass.Variable:
+                    variables.append(child.nodeid.to_string())
+                else:
+                    pending.append(child)
+        return sorted(variables)
+
+
+def _spec(groups: list[dict]) -> EdgeLakeOperatorSpec:
+    spec = load_sample("basic-operator.yaml")["spec"]
+    spec["opcua"] = {"enabled": True, "groups": groups}
+    return EdgeLakeOperatorSpec.from_dict(spec)
+
+
+async def test_node_group_read_in_one_request(simulator):
+    url, idx = simulator
+    nodes = [f"ns={idx};s=Press1.{tag}" for tag in PRESS_TAGS]
+    spec = _spec(
+        [{"name": "press-1", "url": url, "nodes": nodes, "frequency": "1 second", "table": "press"}]
+    )
+    assert validate_spec(spec) == []
+
+    [(command, params)] = _parse_script(render_scripts(spec)["opcua.al"])
+    assert command == "run opcua client"
+    assert params["url"] == [url]
+    assert params["table"] == ["press"]
+
+    values, requests = await _run_opcua_client(params["url"][0], params["node"])
+
+    assert requests == 1
+    assert list(values.values()) == list(PRESS_TAGS.values())
+
+
+async def test_browse_root_group_expands_to_variables(simulator):
+    url, idx = simulator
+    spec = _spec(
+        [{"name": "press-all", "url": url, "browseRoot": f"ns={idx};s=Press1", "table": "press"}]
+    )
+    assert validate_spec(spec) == []
+
+    script = render_scripts(spec)["opcua.al"]
+    [(command, params)] = _parse_script(script)
+    assert command == "get opcua struct"
+    assert params["class"] == ["variable"]
+    assert params["format"] == ["run_client"]
+    assert f"process {params['output'][0]}" in script
+
+    nodes = await _browse_variables(params["url"][0], params["node"][0])
+    values, requests = await _run_opcua_client(url, nodes)
+
+    assert nodes == sorted(f"ns={idx};s=Press1.{tag}" for tag in PRESS_TAGS)
+    assert requests == 1
+    assert sorted(values.values()) == sorted(PRESS_TAGS.values())
@@ -0,0 +1,170 @@
+"""Shared fixtures for unit tests."""
+
+import copy
+import logging
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+from unittest import mock
+
+import kopf
+import pytest
+import yaml
+from aiohttp import web
+
+from edgelake_operator import operator
+
+CONFIG_DIR = Path(__file__).parents[2] / "config"
+SAMPLES_DIR = CONFIG_DIR / "samples"
+
+
+def load_sample(filename: str) -> dict[str, Any]:
+    """Load an EdgeLakeOperator sample manifest from config/samples."""
+    with open(SAMPLES_DIR / filename) as f:
+        return yaml.safe_load(f)
+
+
+def prune(value: Any, schema: dict[str, Any]) -> Any:
+    """Drop fields a structural schema does not declare, as the API server does."""
+    if schema.get("x-kubernetes-preserve-unknown-fields"):
+        return value
+    if isinstance(value, dict):
+        if "properties" in schema:
+            return {
+                key: prune(item, schema["properties"][key])
+                for key, item in value.items()
+                if key in schema["properties"]
+            }
+        if isinstance(schema.get("additionalProperties"), dict):
+            return {key: prune(item, schema["additionalProperties"]) for key, item in value.items()}
+        return {}
+    if isinstance(value, list) and "items" in schema:
+        return [prune(item, schema["items"]) for item in value]
+    return value
+
+
+def status_schema() -> dict[str, Any]:
+    """Status schema of the EdgeLakeOperator CRD."""
+    with open(CONFIG_DIR / "crd" / "edgelakeoperator-crd.yaml") as f:
+        crd = yaml.safe_load(f)
+    return crd["spec"]["versions"][0]["schema"]["openAPIV3Schema"]["properties"]["status"]
+
+
+@pytest.fixture
+def basic_body() -> dict[str, Any]:
+    """Body of the basic operator sample as the API server would send it."""
+    body = copy.deepcopy(load_sample("basic-operator.yaml"))
+    body["metadata"].update(uid="0b6e5d3c-uid", generation=1)
+    body["status"] = {}
+    return body
+
+
+@pytest.fixture
+def query_body() -> dict[str, Any]:
+    """Body of the query node sample as the API server would send it."""
+    body = copy.deepcopy(load_sample("query-node.yaml"))
+    body["metadata"].update(uid="5f1c0a7e-uid", generation=1)
+    body["status"] = {}
+    return body
+
+
+@pytest.fixture
+def patch() -> kopf.Patch:
+    """Empty kopf patch, as passed to a handler."""
+    return kopf.Patch()
+
+
+@pytest.fixture
+def handler_logger() -> logging.Logger:
+    """Logger passed to handlers."""
+    return logging.getLogger("edgelake_operator.tests")
+
+
+@pytest.fixture
+def create_cr(handler_logger) -> Callable[[dict[str, Any]], Awaitable[dict[str, Any]]]:
+    """Run the create handler on a CR body and return the status it writes.
+
+    Timers are gated on status.phase, so tests run them with this status to
+    cover what they see on a real Running CR. Fields the CRD status schema
+    does not declare are pruned, as the API server would.
+    """
+
+    async def create(body: dict[str, Any]) -> dict[str, Any]:
+        patch = kopf.Patch()
+        with mock.patch.object(operator, "apply_step", mock.AsyncMock(return_value=True)):
+            await operator.create_edgelake_operator(
+                body=body,
+                spec=body["spec"],
+                name=body["metadata"]["name"],
+                namespace=body["metadata"]["namespace"],
+                status=body["status"],
+                logger=handler_logger,
+                patch=patch,
+            )
+        status = {key: value for key, value in patch.status.items() if value is not None}
+        return prune(status, status_schema())
+
+    return create
+
+
+class NodeStandIn:
+    """Local stand-in for the REST API of one EdgeLake node.
+
+    Answers the ``command`` header from ``responses`` (text, or a callable
+    taking the command and returning text), looked up by the exact command
+    and then by the longest matching command prefix. A callable can reject a
+    command by raising an aiohttp HTTP error. Every request is recorded as
+    (method, command).
+    """
+
+    def __init__(self, responses: dict[str, Any]) -> None:
+        self.responses = responses
+        self.requests: list[tuple[str, str]] = []
+        self.port = 0
+        self._runner: web.AppRunner | None = None
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        command = request.headers.get("command", "")
+        self.requests.append((request.method, command))
+        response = self.responses.get(command)
+        if response is None:
+            prefixes = [key for key in self.responses if command.startswith(key)]
+            if prefixes:
+                response = self.responses[max(prefixes, key=len)]
+        if response is None:
+            return web.Response(status=400, text=f"Unknown command: {command}")
+        return web.Response(text=response(command) if callable(response) else response)
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> "NodeStandIn":
+        app = web.Application()
+        app.router.add_route("*", "/", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+        return self
+
+    async def stop(self) -> None:
+        if self._runner:
+            await self._runner.cleanup()
+
+
+@pytest.fixture
+async def node_stand_in():
+    """Start EdgeLake REST stand-ins on local addresses; stopped after the test.
+
+    Pods of one CR share the REST port, so each pod's stand-in can be bound
+    to its own loopback address (127.0.0.x) on the same port.
+    """
+    started: list[NodeStandIn] = []
+
+    async def start(
+        responses: dict[str, Any], host: str = "127.0.0.1", port: int = 0
+    ) -> NodeStandIn:
+        node = await NodeStandIn(responses).start(host, port)
+        started.append(node)
+        return node
+
+    yield start
+    for node in started:
+        await node.stop()
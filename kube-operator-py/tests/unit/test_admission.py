@@ -0,0 +1,203 @@
+"""Tests for the defaulting and validating admission webhooks."""
+
+import copy
+from unittest import mock
+
+import kopf
+import pytest
+
+from edgelake_operator import operator
+from edgelake_operator.constants import PROFILE_FIELDS
+from edgelake_operator.models.spec import EdgeLakeOperatorSpec
+from edgelake_operator.utils.profiles import profile_store
+
+
+def _merge(stored, patch):
+    """Apply a JSON merge patch, as the API server does with the mutating webhook's patch."""
+    merged = copy.deepcopy(stored)
+    for key, value in patch.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def _leaves(spec, prefix=()):
+    """Paths of every value set in a spec."""
+    for key, value in spec.items():
+        if isinstance(value, dict) and value:
+            yield from _leaves(value, (*prefix, key))
+        else:
+            yield (*prefix, key)
+
+
+def _default(spec):
+    patch = kopf.Patch()
+    operator.default_edgelake_operator(spec=spec, namespace="default", patch=patch)
+    return dict(patch.spec)
+
+
+def test_defaulting_fills_only_missing_fields(basic_body):
+    spec = basic_body["spec"]
+    spec["advanced"] = {"queryPool": 8}
+
+    patch = _default(spec)
+
+    # Nothing the user wrote is in the patch, so nothing of it is rewritten
+    assert set(_leaves(patch)).isdisjoint(_leaves(spec))
+    assert patch["networking"]["restThreads"] == 6
+    assert "restPort" not in patch["networking"]
+    assert "queryPool" not in patch["advanced"]
+    assert patch["advanced"]["debugMode"] is False
+
+    # The stored spec is the fully defaulted one, with the user's values
+    stored = _merge(spec, patch)
+    assert stored == EdgeLakeOperatorSpec.from_dict(spec).to_dict()
+    assert stored["advanced"]["queryPool"] == 8
+
+
+def test_defaulting_a_complete_spec_patches_nothing(basic_body):
+    stored = _merge(basic_body["spec"], _default(basic_body["spec"]))
+
+    assert _default(stored) == {}
+
+
+def test_defaulting_leaves_invalid_specs_to_validation(basic_body):
+    basic_body["spec"]["replicas"] = "many"
+
+    assert _default(basic_body["spec"]) == {}
+
+
+def test_valid_spec_is_admitted(basic_body):
+    operator.validate_edgelake_operator(spec=basic_body["spec"], namespace="default")
+
+
+@pytest.mark.parametrize(
+    "changes, message",
+    [
+        (
+            {"database": {"type": "psql"}},
+            "Validation failed: spec.database.user is required when using PostgreSQL; "
+            "spec.database.password or passwordSecretRef is required when using PostgreSQL",
+        ),
+        (
+            {"networking": {"serverPort": 32148, "restPort": 32148}},
+            "Validation failed: Ports must be unique (serverPort, restPort, brokerPort)",
+        ),
+        (
+            {"replicas": "many"},
+            "Invalid spec: spec.replicas: Input should be a valid integer, "
+            "unable to parse string as an integer",
+        ),
+    ],
+)
+def test_invalid_spec_is_rejected(basic_body, changes, message):
+    spec = _merge(basic_body["spec"], changes)
+
+    with pytest.raises(kopf.AdmissionError) as rejected:
+        operator.validate_edgelake_operator(spec=spec, namespace="default")
+
+    assert str(rejected.value) == message
+    assert rejected.value.code == 422
+
+
+@pytest.fixture
+def profile():
+    """Profile the basic sample can reference, known to the operator."""
+    body = {
+        "metadata": {"name": "site-defaults", "namespace": "default"},
+        "spec": {"blockchain": {"ledgerConn": "10.0.0.1:32048"}, "advanced": {"queryPool": 6}},
+    }
+    profile_store.update(body)
+    yield body
+    profile_store.remove("default", "site-defaults")
+
+
+def test_profile_sections_are_not_stored(basic_body, profile):
+    spec = basic_body["spec"]
+    del spec["blockchain"]
+    spec["profileRef"] = {"name": "site-defaults"}
+
+    patch = _default(spec)
+
+    # Inherited sections stay unset, so later profile changes still reach the CR
+    assert not set(PROFILE_FIELDS) & set(patch)
+    assert patch["networking"]["restThreads"] == 6
+    operator.validate_edgelake_operator(spec=spec, namespace="default")
+
+
+def test_ledger_connection_can_come_from_the_profile(basic_body, profile):
+    spec = basic_body["spec"]
+    spec["blockchain"] = {"syncTime": "10 second"}
+    spec["profileRef"] = {"name": "site-defaults"}
+
+    operator.validate_edgelake_operator(spec=spec, namespace="default")
+
+
+@pytest.mark.parametrize("blockchain", [None, {"syncTime": "10 second"}])
+def test_ledger_connection_is_required(basic_body, blockchain):
+    spec = basic_body["spec"]
+    spec.pop("blockchain")
+    if blockchain:
+        spec["blockchain"] = blockchain
+
+    with pytest.raises(kopf.AdmissionError) as rejected:
+        operator.validate_edgelake_operator(spec=spec, namespace="default")
+
+    assert str(rejected.value) == (
+        "Validation failed: spec.blockchain.ledgerConn is required (in the CR or its profile)"
+    )
+
+
+def test_spec_waiting_for_its_profile_is_admitted(basic_body):
+    spec = basic_body["spec"]
+    del spec["blockchain"]
+    spec["profileRef"] = {"name": "not-created-yet"}
+
+    operator.validate_edgelake_operator(spec=spec, namespace="default")
+    assert _default(spec) == {}
+
+
+async def test_defaulted_spec_creates_the_same_node(basic_body, create_cr):
+    defaulted = copy.deepcopy(basic_body)
+    defaulted["spec"] = _merge(basic_body["spec"], _default(basic_body["spec"]))
+
+    assert await create_cr(defaulted) == await create_cr(basic_body)
+
+
+def _admission(environ, cert_dir):
+    settings = kopf.OperatorSettings()
+    with (
+        mock.patch.dict("os.environ", environ, clear=True),
+        mock.patch.object(operator, "WEBHOOK_CERT_DIR", str(cert_dir)),
+    ):
+        operator._configure_admission(settings)
+    return settings.admission
+
+
+def test_webhooks_disabled_without_host(tmp_path):
+    admission = _admission({}, tmp_path)
+
+    assert admission.server is None
+    assert admission.managed is None
+
+
+def test_webhooks_use_a_self_signed_certificate_by_default(tmp_path):
+    admission = _admission({"WEBHOOK_HOST": "edgelake-operator-webhook.ops.svc"}, tmp_path)
+
+    assert admission.server.host == "edgelake-operator-webhook.ops.svc"
+    assert admission.server.port == 9443
+    assert admission.server.certfile is None
+    assert admission.managed == "edgelake.io"
+
+
+def test_webhooks_use_the_mounted_certificate(tmp_path):
+    for file_name in ["tls.crt", "tls.key", "ca.crt"]:
+        (tmp_path / file_name).write_text("PEM")
+
+    admission = _admission({"WEBHOOK_HOST": "edgelake-operator-webhook.ops.svc"}, tmp_path)
+
+    assert admission.server.certfile == str(tmp_path / "tls.crt")
+    assert admission.server.pkeyfile == str(tmp_path / "tls.key")
+    assert admission.server.cafile == str(tmp_path / "ca.crt")
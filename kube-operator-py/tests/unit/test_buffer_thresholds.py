@@ -0,0 +1,82 @@
+"""Tests for adaptive buffer thresholds on a running node."""
+
+import json
+from datetime import datetime, timedelta
+from unittest import mock
+
+import kopf
+import pytest
+
+from edgelake_operator import operator
+
+
+@pytest.fixture
+def adaptive_body(basic_body):
+    """Basic operator sample with adaptive buffer thresholds enabled."""
+    basic_body["spec"].setdefault("advanced", {})["adaptiveBuffers"] = {"enabled": True}
+    return basic_body
+
+
+async def _tune(body, handler_logger):
+    patch = kopf.Patch()
+    pods = [{"name": "basic-0", "ip": "127.0.0.1", "ready": True}]
+    with mock.patch.object(operator, "list_instance_pods", return_value=pods):
+        await operator.tune_buffer_thresholds(
+            spec=body["spec"],
+            name=body["metadata"]["name"],
+            namespace=body["metadata"]["namespace"],
+            status=body["status"],
+            logger=handler_logger,
+            patch=patch,
+        )
+    return patch.status.get("bufferThresholds")
+
+
+async def test_thresholds_applied_on_running_cr(
+    adaptive_body, create_cr, node_stand_in, handler_logger
+):
+    rows = {"iot.press": 0}
+    node = await node_stand_in(
+        {
+            "get streaming where format = json": lambda _: json.dumps(
+                {table: {"Streaming Rows": f"{count:,}"} for table, count in rows.items()}
+            ),
+            "set buffer threshold": "Buffer threshold set",
+        }
+    )
+    adaptive_body["status"] = await create_cr(adaptive_body)
+    adaptive_body["spec"]["networking"]["restPort"] = node.port
+
+    # First sample has no rate yet
+    adaptive_body["status"]["bufferThresholds"] = await _tune(adaptive_body, handler_logger)
+    assert node.requests == [("GET", "get streaming where format = json")]
+
+    # One policy interval later, 1000 rows/s were streamed
+    status = adaptive_body["status"]["bufferThresholds"]
+    earlier = (datetime.fromisoformat(status["sampledAt"]) - timedelta(seconds=300)).isoformat()
+    status["sampledAt"] = earlier
+    status["tables"][0]["sampledAt"] = earlier
+    rows["iot.press"] = 300_000
+
+    result = await _tune(adaptive_body, handler_logger)
+
+    method, command = node.requests[-1]
+    assert method == "POST"
+    assert command.startswith("set buffer threshold where dbms = iot and table = press")
+    table = result["tables"][0]
+    assert table["rowsPerSecond"] == pytest.approx(1000, rel=0.01)
+    assert table["timeSeconds"] == 5
+    assert table["appliedAt"] == result["sampledAt"]
+
+
+async def test_interval_not_elapsed(adaptive_body, create_cr, node_stand_in, handler_logger):
+    node = await node_stand_in({"get streaming where format = json": "{}"})
+    adaptive_body["status"] = await create_cr(adaptive_body)
+    adaptive_body["spec"]["networking"]["restPort"] = node.port
+    adaptive_body["status"]["bufferThresholds"] = {
+        "sampledAt": datetime.now().astimezone().isoformat(),
+        "tables": [],
+    }
+
+    assert await _tune(adaptive_body, handler_logger) is None
+    assert node.requests == []
@@ -0,0 +1,166 @@
+"""Tests for deleting old immutable ConfigMap revisions after a rollout."""
+
+from unittest import mock
+
+import kopf
+import pytest
+
+from edgelake_operator import operator
+from edgelake_operator.constants import ANNOTATION_CONFIG_HASH
+from edgelake_operator.utils.rollout import rollout_tracker
+
+
+@pytest.fixture
+async def immutable_body(basic_body, create_cr):
+    """Running basic sample with immutable ConfigMaps."""
+    basic_body["spec"].setdefault("advanced", {})["immutableConfigMaps"] = True
+    basic_body["status"] = await create_cr(basic_body)
+    yield basic_body
+    rollout_tracker.complete("default", basic_body["metadata"]["name"])
+
+
+async def _update_company(body, handler_logger):
+    """Change a config field and run the update handler, as after 'kubectl apply'."""
+    await _update(body, handler_logger, "general", "companyName", "New Company")
+
+
+async def _update(body, handler_logger, section, field, value):
+    """Set spec.<section>.<field> and run the update handler."""
+    old = {"spec": dict(body["spec"]), "metadata": {}}
+    previous = body["spec"][section].get(field)
+    body["spec"][section] = dict(body["spec"][section], **{field: value})
+    body["metadata"]["generation"] += 1
+    new = {"spec": body["spec"], "metadata": {}}
+    diff = [("change", ("spec", section, field), previous, value)]
+    patch = kopf.Patch()
+    with (
+        mock.patch.object(operator, "apply_resource", mock.AsyncMock()),
+        mock.patch.object(operator, "delete_resource", mock.AsyncMock()),
+    ):
+        await operator.update_edgelake_operator(
+            body=body,
+            spec=body["spec"],
+            old=old,
+            new=new,
+            diff=diff,
+            name=body["metadata"]["name"],
+            namespace=body["metadata"]["namespace"],
+            status=body["status"],
+            logger=handler_logger,
+            patch=patch,
+        )
+    body["status"].update(patch.status)
+
+
+def _new_pod(config_hash):
+    return {
+        "metadata": {"name": "basic-new", "annotations": {ANNOTATION_CONFIG_HASH: config_hash}},
+        "status": {
+            "podIP": "127.0.0.1",
+            "containerStatuses": [{"state": {"running": {"startedAt": "2026-10-19T10:00:00Z"}}}],
+        },
+    }
+
+
+async def test_rollout_completion_prunes(immutable_body, node_stand_in, handler_logger):
+    await _update_company(immutable_body, handler_logger)
+    name = immutable_body["metadata"]["name"]
+    assert rollout_tracker.is_pending("default", name)
+
+    # The new pod starts and answers 'get status'
+    node = await node_stand_in({"get status": "EdgeLake node is running"})
+    immutable_body["spec"]["networking"]["restPort"] = node.port
+    config_hash = rollout_tracker.get("default", name).config_hash
+    rollout_tracker.observe_pod("default", name, _new_pod(config_hash))
+
+    prune = mock.Mock(return_value=["edgelake-operator-basic-config-0123456789"])
+    with (
+        mock.patch.object(operator, "check_deployment_ready", return_value=True),
+        mock.patch.object(operator, "list_pod_events", return_value=[]),
+        mock.patch.object(operator, "prune_config_maps", prune),
+    ):
+        await operator.track_rollout(
+            body=immutable_body,
+            spec=immutable_body["spec"],
+            name=name,
+            namespace="default",
+            status=immutable_body["status"],
+            logger=handler_logger,
+            patch=kopf.Patch(),
+        )
+
+    assert not rollout_tracker.is_pending("default", name)
+    prune.assert_called_once()
+    assert prune.call_args.args[2] == immutable_body["status"]["deploymentName"]
+
+
+async def _monitor(body, handler_logger, prune):
+    """Run the health check with a ready Deployment; returns the status patch."""
+    patch = kopf.Patch()
+    with (
+        mock.patch.object(operator, "check_deployment_ready", return_value=True),
+        mock.patch.object(operator, "prune_config_maps", prune),
+        mock.patch.object(operator, "list_endpoint_zones", return_value={}),
+    ):
+        await operator.monitor_edgelake_operator(
+            body=body,
+            spec=body["spec"],
+            name=body["metadata"]["name"],
+            namespace="default",
+            status=body["status"],
+            logger=handler_logger,
+            patch=patch,
+        )
+    return patch.status
+
+
+@pytest.mark.parametrize("phase", ["Running", "Updating", "Failed"])
+async def test_monitor_prunes_in_any_phase(immutable_body, handler_logger, phase):
+    immutable_body["status"]["phase"] = phase
+    prune = mock.Mock(return_value=[])
+
+    await _monitor(immutable_body, handler_logger, prune)
+
+    prune.assert_called_once()
+
+
+async def test_unapplied_generation_is_not_pruned(immutable_body, handler_logger):
+    # The update handler is between writing the new revision and applying the Deployment
+    immutable_body["metadata"]["generation"] += 1
+    prune = mock.Mock(return_value=[])
+
+    await _monitor(immutable_body, handler_logger, prune)
+
+    prune.assert_not_called()
+
+
+async def test_mutable_configmaps_are_not_pruned(basic_body, create_cr, handler_logger):
+    basic_body["status"] = await create_cr(basic_body)
+    prune = mock.Mock(return_value=[])
+
+    await _monitor(basic_body, handler_logger, prune)
+
+    prune.assert_not_called()
+
+
+async def test_turning_immutability_off_prunes_every_revision(immutable_body, handler_logger):
+    await _update(immutable_body, handler_logger, "advanced", "immutableConfigMaps", False)
+    assert immutable_body["status"]["configMapName"] == "edgelake-operator-basic-config"
+    assert immutable_body["status"]["staleConfigMapRevisions"] is True
+
+    # The Deployment now references the mutable ConfigMap, so every hashed revision goes
+    prune = mock.Mock(return_value=["edgelake-operator-basic-config-0123456789"])
+    patched = await _monitor(immutable_body, handler_logger, prune)
+
+    prune.assert_called_once()
+    assert prune.call_args.args[3] == [
+        "edgelake-operator-basic-config",
+        "edgelake-operator-basic-scripts",
+    ]
+    assert patched["staleConfigMapRevisions"] is None
+
+    # Once pruned, mutable CRs are left alone again
+    immutable_body["status"].update(patched)
+    prune.reset_mock()
+    await _monitor(immutable_body, handler_logger, prune)
+    prune.assert_not_called()
@@ -0,0 +1,259 @@
+"""Tests for rolling the pods when referenced credentials rotate."""
+
+import base64
+import copy
+from unittest import mock
+
+import kopf
+import pytest
+
+from edgelake_operator import operator
+from edgelake_operator.constants import ANNOTATION_CREDENTIALS_HASH, LABEL_CREDENTIALS
+from edgelake_operator.utils.credentials import CredentialRollout
+from edgelake_operator.utils.fleet import FleetCache
+
+from .conftest import load_sample
+
+
+def _encode(value):
+    return base64.b64encode(value.encode()).decode()
+
+
+class Cluster:
+    """Secrets, CRs and their Deployments' pod templates, as the API server holds them."""
+
+    def __init__(self) -> None:
+        self.secrets = {"mqtt-credentials": {"password": _encode("s3cret"), "user": _encode("a")}}
+        self.secret_labels = {}
+        self.crs = {}
+        self.template_annotations = {}
+        self.ready = {}
+        self.rolled = []
+        self.status = {}
+        self.fleet = FleetCache()
+
+    def read_secret_data(self, name, namespace):
+        return copy.deepcopy(self.secrets.get(name))
+
+    def label_secret(self, name, namespace, labels):
+        self.secret_labels.setdefault(name, {}).update(labels)
+        return name in self.secrets
+
+    def get_edgelake_operator(self, name, namespace):
+        return self.crs.get(name)
+
+    def get_pod_template_annotations(self, name, namespace):
+        return copy.deepcopy(self.template_annotations.get(name))
+
+    def annotate_pod_template(self, name, namespace, annotations):
+        self.template_annotations[name].update(annotations)
+        self.ready[name] = False  # The Deployment rolls its pods
+        self.rolled.append(name)
+
+    def check_deployment_ready(self, name, namespace):
+        return self.ready.get(name, False)
+
+    def patch_edgelake_operator_status(self, name, namespace, status):
+        self.status.setdefault(name, {}).update(status)
+
+    async def apply_step(self, name, namespace, journal, step, resource):
+        if resource["kind"] == "Deployment":
+            deployment_name = resource["metadata"]["name"]
+            self.template_annotations[deployment_name] = resource["spec"]["template"]["metadata"][
+                "annotations"
+            ]
+            self.ready[deployment_name] = True
+        return True
+
+    def patch(self):
+        """Route the operator's API calls to this cluster."""
+        return mock.patch.multiple(
+            operator,
+            read_secret_data=self.read_secret_data,
+            label_secret=self.label_secret,
+            get_edgelake_operator=self.get_edgelake_operator,
+            get_pod_template_annotations=self.get_pod_template_annotations,
+            annotate_pod_template=self.annotate_pod_template,
+            check_deployment_ready=self.check_deployment_ready,
+            patch_edgelake_operator_status=self.patch_edgelake_operator_status,
+            apply_step=self.apply_step,
+            fleet_cache=self.fleet,
+        )
+
+    async def create(self, body, handler_logger):
+        """Run the create handler and store the CR as the watch would see it."""
+        patch = kopf.Patch()
+        with self.patch():
+            await operator.create_edgelake_operator(
+                body=body,
+                spec=body["spec"],
+                name=body["metadata"]["name"],
+                namespace=body["metadata"]["namespace"],
+                status=body["status"],
+                logger=handler_logger,
+                patch=patch,
+            )
+        body["status"].update(patch.status)
+        self.crs[body["metadata"]["name"]] = body
+        self.fleet.update(body)
+
+
+@pytest.fixture
+def mqtt_body():
+    """MQTT sample (password in the mqtt-credentials Secret) rolling on rotation."""
+    body = copy.deepcopy(load_sample("mqtt-ingestion.yaml"))
+    body["metadata"].update(uid="9d3e61b2-uid", generation=1)
+    body["spec"]["secrets"] = {"rolloutOnRotation": True}
+    body["status"] = {}
+    return body
+
+
+@pytest.fixture
+async def cluster(mqtt_body, handler_logger):
+    """Cluster after creating the MQTT sample and a second CR sharing its Secret."""
+    cluster = Cluster()
+    await cluster.create(mqtt_body, handler_logger)
+    other = copy.deepcopy(mqtt_body)
+    other["metadata"].update(name="edgelake-operator-mqtt-b", uid="1a2b3c4d-uid")
+    other["status"] = {}
+    await cluster.create(other, handler_logger)
+    return cluster
+
+
+@pytest.fixture
+def rollout():
+    """Empty credential rollout queue, in place of the operator's singleton."""
+    rollout = CredentialRollout()
+    with mock.patch.object(operator, "credential_rollout", rollout):
+        yield rollout
+
+
+async def _secret_event(cluster, secret_name, event_type="MODIFIED"):
+    index = {}
+    for cr in cluster.crs.values():
+        keys = operator.credential_secrets(
+            spec=cr["spec"], name=cr["metadata"]["name"], namespace="iot"
+        )
+        for key, cr_name in keys.items():
+            index.setdefault(key, []).append(cr_name)
+    with cluster.patch():
+        await operator.queue_rotated_credentials(
+            event={"type": event_type},
+            name=secret_name,
+            namespace="iot",
+            credential_secrets=index,
+        )
+
+
+def _tick(cluster, rollout, batch_size=1, interval="0 seconds"):
+    """One pass of the credential rollout loop."""
+    with cluster.patch():
+        for namespace, secret_name, rotation in rollout.rotations():
+            operator._roll_credential_batch(
+                namespace, secret_name, rotation, batch_size, interval
+            )
+
+
+def test_only_referenced_secrets_are_indexed(mqtt_body):
+    index = operator.credential_secrets(
+        spec=mqtt_body["spec"], name="edgelake-operator-mqtt", namespace="iot"
+    )
+    assert index == {("iot", "mqtt-credentials"): "edgelake-operator-mqtt"}
+
+    mqtt_body["spec"]["secrets"]["rolloutOnRotation"] = False
+    assert operator.credential_secrets(spec=mqtt_body["spec"], name="x", namespace="iot") == {}
+
+
+async def test_secret_watch_is_label_selected(cluster):
+    # The Secret watch lists only labelled Secrets; the operator labels the referenced ones
+    assert cluster.secret_labels["mqtt-credentials"] == {LABEL_CREDENTIALS: "true"}
+
+    settings = kopf.OperatorSettings()
+    with (
+        mock.patch.object(operator, "start_metrics_server"),
+        mock.patch.dict("os.environ", {}, clear=True),
+    ):
+        operator.configure(settings=settings)
+    assert settings.watching.label_selectors["", "v1", "secrets"] == LABEL_CREDENTIALS
+
+
+async def test_shared_secret_rolls_in_batches(cluster, rollout):
+    deployments = ["edgelake-operator-mqtt-deployment", "edgelake-operator-mqtt-b-deployment"]
+    created_hash = cluster.template_annotations[deployments[0]][ANNOTATION_CREDENTIALS_HASH]
+
+    # A resync of the unchanged Secret queues nothing
+    await _secret_event(cluster, "mqtt-credentials")
+    assert rollout.rotations() == []
+
+    cluster.secrets["mqtt-credentials"]["password"] = _encode("rotated")
+    await _secret_event(cluster, "mqtt-credentials")
+    # Queued, not rolled: the event handler restarts nothing
+    assert cluster.rolled == []
+    assert cluster.status["edgelake-operator-mqtt"]["credentialRotation"]["queuedAt"]
+
+    _tick(cluster, rollout)
+    assert cluster.rolled == deployments[:1]
+
+    # The first Deployment is still rolling: the second CR waits
+    _tick(cluster, rollout)
+    assert cluster.rolled == deployments[:1]
+
+    cluster.ready[deployments[0]] = True
+    _tick(cluster, rollout)
+    assert cluster.rolled == deployments
+
+    cluster.ready[deployments[1]] = True
+    _tick(cluster, rollout)
+    assert rollout.rotations() == []
+
+    new_hash = cluster.template_annotations[deployments[0]][ANNOTATION_CREDENTIALS_HASH]
+    assert new_hash != created_hash
+    rotation = cluster.status["edgelake-operator-mqtt"]["credentialRotation"]
+    assert rotation["secret"] == "mqtt-credentials"
+    assert rotation["credentialsHash"] == new_hash
+    assert rotation["rolledAt"]
+    # Only the digest is recorded, never the credential
+    assert _encode("rotated") not in str(cluster.template_annotations)
+
+
+async def test_failed_cr_holds_the_rollout(cluster, rollout):
+    cluster.secrets["mqtt-credentials"]["password"] = _encode("rotated")
+    await _secret_event(cluster, "mqtt-credentials")
+    _tick(cluster, rollout)
+
+    first = cluster.crs["edgelake-operator-mqtt"]
+    first["status"]["phase"] = "Failed"
+    cluster.fleet.update(first)
+    _tick(cluster, rollout)
+
+    assert cluster.rolled == ["edgelake-operator-mqtt-deployment"]
+
+
+async def test_interval_spaces_batches(cluster, rollout):
+    cluster.secrets["mqtt-credentials"]["password"] = _encode("rotated")
+    await _secret_event(cluster, "mqtt-credentials")
+    _tick(cluster, rollout, interval="1 hour")
+    cluster.ready["edgelake-operator-mqtt-deployment"] = True
+
+    _tick(cluster, rollout, interval="1 hour")
+
+    assert cluster.rolled == ["edgelake-operator-mqtt-deployment"]
+
+
+async def test_unreferenced_key_does_not_roll(cluster, rollout):
+    cluster.secrets["mqtt-credentials"]["user"] = _encode("b")
+
+    await _secret_event(cluster, "mqtt-credentials")
+
+    assert rollout.rotations() == []
+
+
+async def test_deployment_without_digest_is_left_alone(cluster, rollout):
+    for annotations in cluster.template_annotations.values():
+        del annotations[ANNOTATION_CREDENTIALS_HASH]
+    cluster.secrets["mqtt-credentials"]["password"] = _encode("rotated")
+
+    await _secret_event(cluster, "mqtt-credentials")
+    _tick(cluster, rollout)
+
+    assert cluster.rolled == []
@@ -0,0 +1,105 @@
+"""Tests for coalescing bursts of CR writes into one update."""
+
+import asyncio
+import copy
+from unittest import mock
+
+import kopf
+import pytest
+from prometheus_client import REGISTRY
+
+from edgelake_operator import operator
+from edgelake_operator.utils.debounce import update_debouncer
+
+
+@pytest.fixture
+async def debounced_body(basic_body, create_cr):
+    """Running basic sample holding updates back for a short debounce window."""
+    basic_body["spec"]["reconcile"] = {"debounce": "0.3 seconds", "maxDelay": "1 minute"}
+    basic_body["status"] = await create_cr(basic_body)
+    yield basic_body
+    update_debouncer.forget("default", basic_body["metadata"]["name"])
+
+
+def _coalesced(name):
+    return REGISTRY.get_sample_value(
+        "edgelake_update_writes_coalesced_total", {"namespace": "default", "name": name}
+    ) or 0
+
+
+def _event(body):
+    """A watch event for the CR, as kopf delivers it to every event handler."""
+    operator.record_debounced_write(
+        event={"type": "MODIFIED"},
+        body=copy.deepcopy(body),
+        name=body["metadata"]["name"],
+        namespace="default",
+    )
+
+
+async def _update(body, old_spec, handler_logger):
+    """Run (or retry) the update handler with the diff since the last applied state."""
+    diff = [("change", ("spec", "general", "companyName"), "My Company", "New Company")]
+    with (
+        mock.patch.object(operator, "apply_resource", mock.AsyncMock()),
+        mock.patch.object(operator, "delete_resource", mock.AsyncMock()),
+    ):
+        await operator.update_edgelake_operator(
+            body=body,
+            spec=body["spec"],
+            old={"spec": old_spec, "metadata": {}},
+            new={"spec": body["spec"], "metadata": {}},
+            diff=diff,
+            name=body["metadata"]["name"],
+            namespace="default",
+            status=body["status"],
+            logger=handler_logger,
+            patch=kopf.Patch(),
+        )
+
+
+async def test_writes_during_the_wait_are_counted(debounced_body, handler_logger, caplog):
+    name = debounced_body["metadata"]["name"]
+    before = _coalesced(name)
+    old_spec = copy.deepcopy(debounced_body["spec"])
+
+    # First write: the update handler holds it back
+    debounced_body["spec"]["general"]["companyName"] = "New Company"
+    _event(debounced_body)
+    with pytest.raises(kopf.TemporaryError, match="Coalescing writes"):
+        await _update(debounced_body, old_spec, handler_logger)
+
+    # Three more writes while kopf waits for the retry; only the watch sees them
+    debounced_body["metadata"].setdefault("labels", {})["team"] = "edge"
+    _event(debounced_body)
+    debounced_body["metadata"].setdefault("annotations", {})["owner"] = "ops"
+    _event(debounced_body)
+    debounced_body["spec"]["general"]["companyName"] = "Newer Company"
+    _event(debounced_body)
+    # kopf's progress annotation and status changes are not writes
+    debounced_body["metadata"]["annotations"]["kopf.zalando.org/update_edgelake_operator"] = "{}"
+    debounced_body["status"]["phase"] = "Running"
+    _event(debounced_body)
+
+    await asyncio.sleep(0.35)
+    caplog.set_level("INFO", logger=handler_logger.name)
+    await _update(debounced_body, old_spec, handler_logger)
+
+    assert "Applying 4 coalesced writes" in caplog.text
+    assert _coalesced(name) - before == 3
+
+
+async def test_quiet_period_starts_at_the_last_write(debounced_body, handler_logger):
+    old_spec = copy.deepcopy(debounced_body["spec"])
+    debounced_body["spec"]["general"]["companyName"] = "New Company"
+    with pytest.raises(kopf.TemporaryError):
+        await _update(debounced_body, old_spec, handler_logger)
+
+    await asyncio.sleep(0.2)
+    debounced_body["spec"]["general"]["companyName"] = "Newer Company"
+    _event(debounced_body)
+    await asyncio.sleep(0.15)
+
+    # The window has passed since the first write, but not since the last one
+    with pytest.raises(kopf.TemporaryError, match="Coalescing writes"):
+        await _update(debounced_body, old_spec, handler_logger)
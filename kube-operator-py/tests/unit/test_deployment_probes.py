@@ -0,0 +1,35 @@
+"""Tests for the probes of the EdgeLake Deployment."""
+
+from edgelake_operator.models.spec import EdgeLakeOperatorSpec
+from edgelake_operator.operator import _generate_resource_names
+from edgelake_operator.resources import deployment
+from edgelake_operator.resources.deployment import _override
+
+
+def _container(spec_dict):
+    spec = EdgeLakeOperatorSpec.from_dict(spec_dict)
+    names = _generate_resource_names("n")
+    manifest = deployment.build_deployment("n", "default", spec, names, config_hash="h")
+    return manifest["spec"]["template"]["spec"]["containers"][0]
+
+
+def test_explicit_overrides_are_used(basic_body):
+    basic_body["spec"]["probes"] = {
+        "liveness": {"initialDelaySeconds": 0, "periodSeconds": 7, "failureThreshold": 1},
+        "readiness": {"initialDelaySeconds": 15, "timeoutSeconds": 2},
+    }
+
+    container = _container(basic_body["spec"])
+
+    liveness = container["livenessProbe"]
+    assert liveness["initialDelaySeconds"] == 0
+    assert liveness["periodSeconds"] == 7
+    assert liveness["failureThreshold"] == 1
+    readiness = container["readinessProbe"]
+    assert readiness["initialDelaySeconds"] == 15
+    assert readiness["timeoutSeconds"] == 2
+
+
+def test_zero_is_not_replaced_by_default():
+    assert _override(0, 30) == 0
+    assert _override(None, 30) == 30
@@ -0,0 +1,81 @@
+"""Tests for multi-PLC EtherNet/IP polling in simulator mode."""
+
+import re
+
+import pytest
+
+from edgelake_operator.models.spec import EdgeLakeOperatorSpec
+from edgelake_operator.operator import _generate_resource_names
+from edgelake_operator.resources.configmap import build_configmap
+from edgelake_operator.resources.scripts import has_generated_scripts, render_scripts
+from edgelake_operator.utils.validation import validate_spec
+
+
+@pytest.fixture
+def plcs_spec(basic_body):
+    """Basic operator sample polling two PLCs at different rates in simulator mode."""
+    basic_body["spec"]["etherip"] = {
+        "enabled": True,
+        "simulatorMode": True,
+        "plcs": [
+            {"name": "press-1", "tags": ["Press_Temp", "Press_Speed"], "table": "press"},
+            {"name": "oven-1", "tags": ["Oven_Temp"], "frequency": "10 seconds", "table": "oven"},
+        ],
+    }
+    return basic_body["spec"]
+
+
+def _clients(script):
+    """Parameters of each 'run plc client' in a rendered script."""
+    clients = []
+    for block in re.findall(r"<run plc client where\n(.*?)\n>", script, re.DOTALL):
+        params = {}
+        for param in block.split(" and\n"):
+            key, value = (part.strip() for part in param.split("=", 1))
+            params.setdefault(key, []).append(value.strip('"'))
+        clients.append(params)
+    return clients
+
+
+def test_simulator_mode_targets_local_simulator(plcs_spec):
+    spec = EdgeLakeOperatorSpec.from_dict(plcs_spec)
+    assert validate_spec(spec) == []
+    assert has_generated_scripts(spec)
+
+    clients = _clients(render_scripts(spec)["etherip.al"])
+
+    assert [c["name"] for c in clients] == [["press-1"], ["oven-1"]]
+    assert all(c["url"] == ["127.0.0.1"] and c["type"] == ["etherip"] for c in clients)
+    assert clients[0]["node"] == ["Press_Temp", "Press_Speed"]
+    assert clients[0]["frequency"] == ["1 second"]
+    assert clients[1]["frequency"] == ["10 seconds"]
+    assert clients[1]["dbms"] == [spec.operator.defaultDbms]
+
+
+def test_simulator_mode_keeps_explicit_urls(plcs_spec):
+    plcs_spec["etherip"]["plcs"][1]["url"] = "10.0.4.21"
+    spec = EdgeLakeOperatorSpec.from_dict(plcs_spec)
+
+    clients = _clients(render_scripts(spec)["etherip.al"])
+
+    assert [c["url"] for c in clients] == [["127.0.0.1"], ["10.0.4.21"]]
+
+
+def test_plcs_replace_single_plc_env(plcs_spec):
+    spec = EdgeLakeOperatorSpec.from_dict(plcs_spec)
+    data = build_configmap("basic", "default", spec, _generate_resource_names("basic"))["data"]
+
+    # The generated script starts the clients; the image must not start its own
+    assert data["ENABLE_ETHERIP"] == "false"
+    assert data["SIMULATOR_MODE"] == "true"
+    assert "ETHERIP_URL" not in data
+
+
+def test_url_required_without_simulator_mode(plcs_spec):
+    plcs_spec["etherip"]["simulatorMode"] = False
+    plcs_spec["etherip"]["plcs"][1]["url"] = "10.0.4.21"
+    spec = EdgeLakeOperatorSpec.from_dict(plcs_spec)
+
+    assert validate_spec(spec) == [
+        "spec.etherip.plcs[0].url is required unless simulatorMode is true"
+    ]
@@ -0,0 +1,149 @@
+"""Tests for the fleet summary of CRs as the operator writes their status."""
+
+import argparse
+import asyncio
+import socket
+from unittest import mock
+
+import aiohttp
+import kopf
+import pytest
+
+from edgelake_operator import operator
+from edgelake_operator.__main__ import show_fleet
+from edgelake_operator.utils import fleet
+from edgelake_operator.utils.fleet import FleetCache, start_fleet_server, summarize
+
+
+@pytest.fixture
+async def running_body(basic_body, create_cr):
+    """Basic sample with the status written by the create handler."""
+    basic_body["spec"].setdefault("nodeType", "operator")  # CRD default
+    basic_body["status"] = await create_cr(basic_body)
+    return basic_body
+
+
+async def test_summary_reads_status_written_by_create(running_body):
+    summary = summarize(running_body)
+
+    assert summary["phase"] == "Running"
+    assert summary["upToDate"] is True
+    assert summary["endpoints"] == {
+        "tcp": "edgelake-operator-basic-service.default.svc.cluster.local:32148",
+        "rest": "edgelake-operator-basic-service.default.svc.cluster.local:32149",
+    }
+
+
+async def test_summary_shows_unapplied_generation(running_body):
+    running_body["metadata"]["generation"] = 2
+
+    assert summarize(running_body)["upToDate"] is False
+
+
+async def test_fleet_cli_lists_running_cr(running_body, capsys):
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    cache = FleetCache()
+    cache.update(running_body)
+    with mock.patch.object(fleet, "fleet_cache", cache):
+        runner = await start_fleet_server(port)
+        try:
+            args = argparse.Namespace(
+                url=f"http://127.0.0.1:{port}",
+                cluster=None,
+                namespace=None,
+                phase="Running",
+                health=None,
+                limit=10,
+                all=True,
+                output="table",
+            )
+            await asyncio.to_thread(show_fleet, args)
+        finally:
+            await runner.cleanup()
+
+    header, row = capsys.readouterr().out.splitlines()
+    assert header.split()[:6] == ["NAMESPACE", "NAME", "TYPE", "CLUSTER", "PHASE", "HEALTH"]
+    assert row.split()[:5] == [
+        "default",
+        "edgelake-operator-basic",
+        "operator",
+        "my-company-cluster",
+        "Running",
+    ]
+    assert "edgelake-operator-basic-service.default.svc.cluster.local:32149" in row
+
+
+async def _monitor(body, handler_logger, ready):
+    """One health check of the monitor timer against a Deployment in the given state."""
+    patch = kopf.Patch()
+    with (
+        mock.patch.object(operator, "check_deployment_ready", return_value=ready),
+        mock.patch.object(operator, "list_endpoint_zones", return_value={}),
+    ):
+        await operator.monitor_edgelake_operator(
+            body=body,
+            spec=body["spec"],
+            name=body["metadata"]["name"],
+            namespace="default",
+            status=body["status"],
+            logger=handler_logger,
+            patch=patch,
+        )
+    body["status"].update(patch.status)
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def test_unready_deployment_is_degraded_in_fleet_api(running_body, handler_logger):
+    await _monitor(running_body, handler_logger, ready=True)
+    assert summarize(running_body)["health"] == "Healthy"
+    (ready,) = [c for c in running_body["status"]["conditions"] if c["type"] == "Ready"]
+
+    await _monitor(running_body, handler_logger, ready=False)
+
+    port = _free_port()
+    cache = FleetCache()
+    cache.update(running_body)
+    with mock.patch.object(fleet, "fleet_cache", cache):
+        runner = await start_fleet_server(port)
+        try:
+            async with aiohttp.ClientSession() as session:
+                url = f"http://127.0.0.1:{port}/fleet?health=Degraded"
+                async with session.get(url) as response:
+                    page = await response.json()
+        finally:
+            await runner.cleanup()
+
+    (item,) = page["items"]
+    assert item["name"] == "edgelake-operator-basic"
+    assert item["phase"] == "Running"
+    assert item["health"] == "Degraded"
+    conditions = {condition["type"]: condition for condition in item["conditions"]}
+    assert conditions["Degraded"]["status"] == "True"
+    assert conditions["Degraded"]["reason"] == "DeploymentNotReady"
+    assert conditions["Ready"]["status"] == "False"
+    assert conditions["Ready"]["lastTransitionTime"] != ready["lastTransitionTime"]
+
+
+async def test_conditions_keep_transition_time(running_body, handler_logger):
+    await _monitor(running_body, handler_logger, ready=False)
+    conditions = running_body["status"]["conditions"]
+
+    await _monitor(running_body, handler_logger, ready=False)
+
+    assert running_body["status"]["conditions"] == conditions
+
+
+async def test_rollout_during_update_is_not_degraded(running_body, handler_logger):
+    running_body["status"]["phase"] = "Updating"
+
+    await _monitor(running_body, handler_logger, ready=False)
+
+    assert summarize(running_body)["health"] == "Unknown"
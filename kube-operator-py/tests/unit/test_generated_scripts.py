@@ -0,0 +1,309 @@
+"""Tests for the generated EdgeLake scripts and the validation of the settings they render."""
+
+import pytest
+
+from edgelake_operator.models.spec import EdgeLakeOperatorSpec
+from edgelake_operator.operator import _generate_resource_names
+from edgelake_operator.resources.scripts import build_scripts_configmap, render_scripts
+from edgelake_operator.utils.validation import _mqtt_topics_overlap, validate_spec
+
+_HEADER = "#" + "-" * 79
+
+
+@pytest.mark.parametrize(
+    "first, second, overlap",
+    [
+        ("plant/line1/temp", "plant/line1/temp", True),
+        ("plant/line1/temp", "plant/line2/temp", False),
+        ("plant/+/temp", "plant/line1/temp", True),
+        ("plant/+/temp", "plant/line1/pressure", False),
+        ("plant/+/temp", "plant/+/+", True),
+        ("plant/+", "plant/line1/temp", False),  # '+' matches exactly one level
+        ("plant/#", "plant/line1/temp", True),
+        ("plant/#", "plant", True),  # '#' also matches the parent level
+        ("plant/#", "factory/line1", False),
+        ("#", "anything/at/all", True),
+        ("plant/line1", "plant/line1/temp", False),
+    ],
+)
+def test_mqtt_topics_overlap(first, second, overlap):
+    assert _mqtt_topics_overlap(first, second) is overlap
+    assert _mqtt_topics_overlap(second, first) is overlap
+
+
+def test_overlapping_subscriptions_are_rejected(basic_body):
+    basic_body["spec"]["mqtt"] = {
+        "enabled": True,
+        "broker": "mqtt-broker",
+        "subscriptions": [{"topic": "plant/+/temp"}, {"topic": "plant/line1/#"}],
+    }
+    spec = EdgeLakeOperatorSpec.from_dict(basic_body["spec"])
+
+    assert validate_spec(spec) == [
+        "spec.mqtt.subscriptions topics 'plant/+/temp' and 'plant/line1/#' overlap; "
+        "messages would be ingested twice"
+    ]
+
+
+@pytest.mark.parametrize(
+    "policies, errors",
+    [
+        (
+            [{"table": "*", "keep": 5}, {"table": "readings", "keep": 3}],
+            [],
+        ),
+        (
+            [{"table": "read*"}],
+            [
+                "spec.operator.partitioning.policies[0].table must be a table name or '*' "
+                "(partial wildcards are not supported by EdgeLake), got 'read*'"
+            ],
+        ),
+        (
+            [{"table": "readings", "interval": "3 minutes"}],
+            [
+                "spec.operator.partitioning.policies[0].interval: "
+                "Invalid partition interval: '3 minutes'"
+            ],
+        ),
+        (
+            [{"table": "readings"}, {"table": "readings", "dbms": "my_company"}],
+            [
+                "spec.operator.partitioning.policies[1]: duplicate partitioning policy "
+                "for my_company.readings"
+            ],
+        ),
+        (
+            # Same table in another database is a different policy
+            [{"table": "readings"}, {"table": "readings", "dbms": "archive"}],
+            [],
+        ),
+        (
+            [{"table": "*", "keep": 2}, {"table": "readings", "keep": 7}],
+            [
+                "spec.operator.partitioning.policies: '*' policy for my_company keeps "
+                "2 partitions per table, fewer than the 7 kept for my_company.readings"
+            ],
+        ),
+        (
+            # A '*' policy of another database does not drop this table's partitions
+            [{"table": "*", "dbms": "archive", "keep": 2}, {"table": "readings", "keep": 7}],
+            [],
+        ),
+    ],
+)
+def test_partition_policies(basic_body, policies, errors):
+    basic_body["spec"]["operator"]["partitioning"] = {"policies": policies}
+    spec = EdgeLakeOperatorSpec.from_dict(basic_body["spec"])
+
+    assert validate_spec(spec) == errors
+
+
+def test_partitions_script(basic_body):
+    basic_body["spec"]["operator"]["partitioning"] = {
+        "policies": [
+            {"table": "readings", "interval": "1 day", "keep": 7},
+            {"table": "*", "dbms": "archive", "column": "ts", "sync": "1 hour", "keep": 30},
+        ],
+    }
+    spec = EdgeLakeOperatorSpec.from_dict(basic_body["spec"])
+
+    assert render_scripts(spec)["partitions.al"] == "\n".join(
+        [
+            _HEADER,
+            "# Partitioning policies",
+            _HEADER,
+            "on error ignore",
+            "",
+            "partition my_company readings using insert_timestamp by 1 day",
+            'schedule time = 1 day and name = "Drop Partitions my_company.readings" '
+            "task drop partition where dbms = my_company and table = readings and keep = 7",
+            "",
+            "partition archive * using ts by 14 days",
+            'schedule time = 1 hour and name = "Drop Partitions archive.*" '
+            "task drop partition where dbms = archive and table = * and keep = 30",
+            "",
+        ]
+    )
+
+
+def test_mqtt_script(basic_body):
+    basic_body["spec"]["mqtt"] = {
+        "enabled": True,
+        "broker": "mqtt-broker",
+        "user": "ingest",
+        "password": "s3cret",
+        "sharedGroup": "ingest",
+        "subscriptions": [
+            {
+                "topic": "plant/+/temp",
+                "table": "temperature",
+                "qos": 1,
+                "threads": 4,
+                "columns": [{"name": "celsius", "value": "bring [reading]"}],
+            },
+        ],
+    }
+    spec = EdgeLakeOperatorSpec.from_dict(basic_body["spec"])
+
+    script = render_scripts(spec)["mqtt.al"]
+
+    assert script == "\n".join(
+        [
+            _HEADER,
+            "# MQTT subscriptions",
+            _HEADER,
+            "on error ignore",
+            "",
+            "<run msg client where broker=mqtt-broker and port=1883 and user=ingest and "
+            "password=!mqtt_passwd and log=false and qos=1 and threads=4 and topic=(",
+            "    name=$share/ingest/plant/+/temp and",
+            "    dbms=my_company and",
+            "    table=temperature and",
+            "    column.timestamp.timestamp=bring [timestamp] and",
+            "    column.celsius=(type=float and value=bring [reading])",
+            ")>",
+            "",
+        ]
+    )
+    assert "s3cret" not in script
+
+
+def test_opcua_script(basic_body):
+    basic_body["spec"]["opcua"] = {
+        "enabled": True,
+        "groups": [
+            {"name": "fast", "url": "opc.tcp://plc:4840", "nodes": ["ns=2;i=1"], "table": "fast"},
+            {"name": "slow", "url": "opc.tcp://plc:4840", "browseRoot": "ns=2;s=L", "table": "t"},
+        ],
+    }
+    spec = EdgeLakeOperatorSpec.from_dict(basic_body["spec"])
+
+    assert render_scripts(spec)["opcua.al"] == "\n".join(
+        [
+            _HEADER,
+            "# OPC-UA polling groups",
+            _HEADER,
+            "on error ignore",
+            "",
+            "<run opcua client where",
+            "    name = fast and",
+            "    url = opc.tcp://plc:4840 and",
+            "    frequency = 10 seconds and",
+            "    dbms = my_company and",
+            "    table = fast and",
+            '    node = "ns=2;i=1"',
+            ">",
+            "",
+            "<get opcua struct where",
+            "    name = slow and",
+            "    url = opc.tcp://plc:4840 and",
+            "    frequency = 10 seconds and",
+            "    dbms = my_company and",
+            "    table = t and",
+            '    node = "ns=2;s=L" and',
+            "    class = variable and",
+            "    format = run_client and",
+            "    output = !tmp_dir/opcua_slow.al",
+            ">",
+            "process !tmp_dir/opcua_slow.al",
+            "",
+        ]
+    )
+
+
+def test_etherip_script(basic_body):
+    basic_body["spec"]["etherip"] = {
+        "enabled": True,
+        "plcs": [{"name": "press-1", "url": "10.0.4.20", "tags": ["Temp"], "table": "press"}],
+    }
+    spec = EdgeLakeOperatorSpec.from_dict(basic_body["spec"])
+
+    assert render_scripts(spec)["etherip.al"] == "\n".join(
+        [
+            _HEADER,
+            "# EtherNet/IP PLCs",
+            _HEADER,
+            "on error ignore",
+            "",
+            "<run plc client where",
+            "    type = etherip and",
+            "    name = press-1 and",
+            "    url = 10.0.4.20 and",
+            "    frequency = 1 second and",
+            "    dbms = my_company and",
+            "    table = press and",
+            '    node = "Temp"',
+            ">",
+            "",
+        ]
+    )
+
+
+def test_aggregations_script(basic_body):
+    basic_body["spec"]["aggregations"] = {
+        "enabled": True,
+        "rules": [{"table": "readings", "interval": "5 minutes", "buckets": 12}],
+    }
+    spec = EdgeLakeOperatorSpec.from_dict(basic_body["spec"])
+
+    assert render_scripts(spec)["aggregations.al"] == "\n".join(
+        [
+            _HEADER,
+            "# Aggregation rules",
+            _HEADER,
+            "on error ignore",
+            "",
+            "<set aggregation where",
+            "    dbms = my_company and",
+            "    table = readings and",
+            "    intervals = 12 and",
+            "    time = 5 minutes and",
+            "    time_column = insert_timestamp and",
+            "    value_column = value",
+            ">",
+            "",
+        ]
+    )
+
+
+def test_local_script_processes_every_script_in_order(basic_body):
+    basic_body["spec"]["aggregations"] = {"enabled": True, "rules": [{"table": "readings"}]}
+    basic_body["spec"]["operator"]["partitioning"] = {"policies": [{"table": "readings"}]}
+    spec = EdgeLakeOperatorSpec.from_dict(basic_body["spec"])
+    names = _generate_resource_names("edgelake-operator-basic")
+
+    data = build_scripts_configmap("edgelake-operator-basic", "default", spec, names)["data"]
+
+    assert data["local_script.al"] == "\n".join(
+        [
+            _HEADER,
+            "# Generated by edgelake-kube-operator - do not edit",
+            _HEADER,
+            "process /app/deployment-scripts/generated/partitions.al",
+            "process /app/deployment-scripts/generated/aggregations.al",
+            "",
+        ]
+    )
+
+
+def test_no_scripts_without_rendered_settings(basic_body):
+    spec = EdgeLakeOperatorSpec.from_dict(basic_body["spec"])
+    names = _generate_resource_names("edgelake-operator-basic")
+
+    assert render_scripts(spec) == {}
+    assert build_scripts_configmap("edgelake-operator-basic", "default", spec, names) is None
+
+
+def test_deploy_local_script_conflicts_with_generated_scripts(basic_body):
+    basic_body["spec"]["advanced"] = {"deployLocalScript": True}
+    assert validate_spec(EdgeLakeOperatorSpec.from_dict(basic_body["spec"])) == []
+
+    # The generated local_script.al would be mounted over the hand-written one
+    basic_body["spec"]["aggregations"] = {"enabled": True, "rules": [{"table": "readings"}]}
+    spec = EdgeLakeOperatorSpec.from_dict(basic_body["spec"])
+
+    assert validate_spec(spec) == [
+        "spec.advanced.deployLocalScript cannot be combined with settings rendered "
+        "into generated scripts; its local_script.al would be shadowed"
+    ]
@@ -0,0 +1,153 @@
+"""Tests for pushing live-tunable settings to running nodes over REST."""
+
+import re
+import socket
+from unittest import mock
+
+import kopf
+import pytest
+from aiohttp import web
+
+from edgelake_operator import operator
+from edgelake_operator.models.spec import EdgeLakeOperatorSpec
+from edgelake_operator.utils.hashing import compute_config_hash
+from edgelake_operator.utils.tunables import push_live_tunables
+
+
+class TunableNode:
+    """Runtime settings of a stand-in EdgeLake node, changed by 'set' commands."""
+
+    def __init__(self, query_pool: int = 6, accepts: bool = True) -> None:
+        self.query_pool = query_pool
+        self.buffer_threshold = None
+        self.accepts = accepts
+
+    def set_query_pool(self, command: str) -> str:
+        if not self.accepts:
+            raise web.HTTPBadRequest(text="Command not supported")
+        self.query_pool = int(command.rsplit(" ", 1)[1])
+        return "Query pool set"
+
+    def set_buffer_threshold(self, command: str) -> str:
+        self.buffer_threshold = re.search(r"where (.*)", command).group(1)
+        return "Buffer threshold set"
+
+    def get_query_pool(self, command: str) -> str:
+        return f"Query pool: {self.query_pool} threads"
+
+    def responses(self) -> dict:
+        return {
+            "set query pool": self.set_query_pool,
+            "get query pool": self.get_query_pool,
+            "set buffer threshold": self.set_buffer_threshold,
+        }
+
+
+def _node_port(hosts):
+    """A port in the NodePort range (the spec validates restPort) free on all hosts."""
+    for port in range(32100, 32768):
+        try:
+            for host in hosts:
+                with socket.socket() as sock:
+                    sock.bind((host, port))
+        except OSError:
+            continue
+        return port
+    raise RuntimeError("No free port in the NodePort range")
+
+
+def _spec(body, **advanced):
+    body["spec"].setdefault("advanced", {}).update(advanced)
+    return EdgeLakeOperatorSpec.from_dict(body["spec"])
+
+
+async def test_changes_are_applied_and_verified(basic_body, node_stand_in):
+    node = TunableNode()
+    server = await node_stand_in(node.responses())
+    spec = _spec(basic_body, queryPool=12, thresholdTime="30 seconds", thresholdVolume="20MB")
+    fields = ["advanced.queryPool", "advanced.thresholdTime", "advanced.thresholdVolume"]
+
+    error = await push_live_tunables(spec, fields, "127.0.0.1", server.port)
+
+    assert error is None
+    assert node.query_pool == 12
+    assert node.buffer_threshold.startswith("time = 30 seconds and volume = 20MB")
+    # Both buffer fields share one command, applied once
+    assert [c for m, c in server.requests if m == "POST"] == [
+        "set query pool 12",
+        f"set buffer threshold where {node.buffer_threshold}",
+    ]
+    assert server.requests[-1] == ("GET", "get query pool")
+
+
+async def test_unverified_change_is_reported(basic_body, node_stand_in):
+    node = TunableNode()
+    responses = dict(node.responses(), **{"set query pool": "Query pool set"})
+    server = await node_stand_in(responses)
+    spec = _spec(basic_body, queryPool=12)
+
+    error = await push_live_tunables(spec, ["advanced.queryPool"], "127.0.0.1", server.port)
+
+    assert error == "'get query pool' does not report 12"
+
+
+async def test_update_restarts_only_rejecting_pod(basic_body, node_stand_in, handler_logger):
+    # Two pods on the same REST port, one of which rejects the command
+    nodes = [TunableNode(), TunableNode(accepts=False)]
+    port = _node_port(["127.0.0.1", "127.0.0.2"])
+    await node_stand_in(nodes[0].responses(), host="127.0.0.1", port=port)
+    await node_stand_in(nodes[1].responses(), host="127.0.0.2", port=port)
+    pods = [
+        {"name": "basic-a", "ip": "127.0.0.1", "ready": True},
+        {"name": "basic-b", "ip": "127.0.0.2", "ready": True},
+    ]
+
+    old = {"spec": dict(basic_body["spec"]), "metadata": {}}
+    basic_body["spec"]["advanced"] = {"queryPool": 12}
+    basic_body["spec"]["networking"]["restPort"] = port
+    basic_body["metadata"]["generation"] = 2
+    new = {"spec": basic_body["spec"], "metadata": {}}
+    diff = [("add", ("spec", "advanced", "queryPool"), None, 12)]
+    patch = kopf.Patch()
+
+    apply = mock.AsyncMock()
+    delete_pod = mock.Mock()
+    with (
+        mock.patch.object(operator, "apply_resource", apply),
+        mock.patch.object(operator, "delete_resource", mock.AsyncMock()),
+        mock.patch.object(operator, "list_instance_pods", return_value=pods),
+        mock.patch.object(operator, "delete_pod", delete_pod),
+    ):
+        await operator.update_edgelake_operator(
+            body=basic_body,
+            spec=basic_body["spec"],
+            old=old,
+            new=new,
+            diff=diff,
+            name=basic_body["metadata"]["name"],
+            namespace=basic_body["metadata"]["namespace"],
+            status={"phase": "Running"},
+            logger=handler_logger,
+            patch=patch,
+        )
+
+    # No rollout: only the ConfigMap is written for pods started later
+    assert [c.args[0]["kind"] for c in apply.await_args_list] == ["ConfigMap"]
+    assert nodes[0].query_pool == 12
+    delete_pod.assert_called_once_with("basic-b", "default")
+    pods_status = patch.status["liveTuning"]["pods"]
+    assert pods_status[0] == {"pod": "basic-a", "applied": True}
+    assert pods_status[1]["applied"] is False
+    assert "400" in pods_status[1]["error"]
+    assert patch.status["phase"] == "Running"
+
+
+@pytest.mark.parametrize(
+    "section, field, value",
+    [("advanced", "queryPool", 12), ("mqtt", "log", True), ("networking", "restTimeout", 90)],
+)
+def test_live_fields_do_not_change_config_hash(basic_body, section, field, value):
+    before = compute_config_hash(basic_body["spec"])
+    basic_body["spec"].setdefault(section, {})[field] = value
+
+    assert compute_config_hash(basic_body["spec"]) == before
@@ -0,0 +1,191 @@
+"""Tests for MQTT rate sampling of shared-subscription nodes."""
+
+import copy
+from datetime import datetime, timedelta
+from unittest import mock
+
+import kopf
+import pytest
+
+from edgelake_operator import operator
+from edgelake_operator.models.spec import EdgeLakeOperatorSpec
+from edgelake_operator.resources.scripts import shared_topic
+from edgelake_operator.utils.shared_groups import SharedGroupRates
+
+from .conftest import load_sample
+
+
+def _topic_matches(topic_filter: str, topic: str) -> bool:
+    """MQTT topic filter matching with '+' and '#' wildcards."""
+    levels = topic.split("/")
+    for i, part in enumerate(topic_filter.split("/")):
+        if part == "#":
+            return True
+        if i >= len(levels) or (part != "+" and part != levels[i]):
+            return False
+    return len(topic_filter.split("/")) == len(levels)
+
+
+class BrokerStandIn:
+    """Delivers messages like an MQTT v5 broker with shared subscriptions.
+
+    Plain subscribers get every matching message; the members of a
+    ``$share/<group>/<filter>`` group get them in turn.
+    """
+
+    def __init__(self) -> None:
+        self.received: dict[str, int] = {}
+        self._plain: list[tuple[str, str]] = []
+        self._shared: dict[tuple[str, str], list[str]] = {}
+        self._turn: dict[tuple[str, str], int] = {}
+
+    def subscribe(self, client: str, topic_filter: str) -> None:
+        self.received.setdefault(client, 0)
+        if topic_filter.startswith("$share/"):
+            _, group, shared_filter = topic_filter.split("/", 2)
+            self._shared.setdefault((group, shared_filter), []).append(client)
+        else:
+            self._plain.append((client, topic_filter))
+
+    def publish(self, topic: str, count: int = 1) -> None:
+        for _ in range(count):
+            for client, topic_filter in self._plain:
+                if _topic_matches(topic_filter, topic):
+                    self.received[client] += 1
+            for key, members in self._shared.items():
+                if _topic_matches(key[1], topic):
+                    turn = self._turn.get(key, 0)
+                    self.received[members[turn % len(members)]] += 1
+                    self._turn[key] = turn + 1
+
+
+def _msg_client_output(messages: int) -> str:
+    """'get msg client' output of a node with one subscription."""
+    return (
+        "Subscription: 0001\n"
+        "Broker: mqtt-broker.iot.svc.cluster.local:1883\n\n"
+        "Messages    Success     Errors      Last message time\n"
+        "----------  ----------  ----------  -------------------\n"
+        f"{messages:<10}  {messages:<10}  0           2026-10-19 10:00:00\n"
+    )
+
+
+@pytest.fixture(autouse=True)
+def group_rates():
+    """Fresh shared-group registry for each test."""
+    rates = SharedGroupRates()
+    with mock.patch.object(operator, "shared_group_rates", rates):
+        yield rates
+
+
+@pytest.fixture
+def mqtt_body():
+    """Body of the MQTT sample with a shared subscription group."""
+    body = copy.deepcopy(load_sample("mqtt-ingestion.yaml"))
+    body["metadata"].update(uid="9a2d4e61-uid", generation=1)
+    body["spec"]["mqtt"]["sharedGroup"] = "plant1-ingest"
+    body["status"] = {}
+    return body
+
+
+async def _start_member(name, mqtt_body, broker, node_stand_in, create_cr):
+    """Create a CR whose single pod is a REST stand-in subscribed to the broker."""
+    body = copy.deepcopy(mqtt_body)
+    body["metadata"]["name"] = name
+    spec = EdgeLakeOperatorSpec(**body["spec"])
+    broker.subscribe(name, shared_topic(spec, spec.mqtt.message.topic))
+    node = await node_stand_in(
+        {"get msg client": lambda _: _msg_client_output(broker.received[name])}
+    )
+    body["status"] = await create_cr(body)
+    # The timer reaches pods directly on restPort, so point it at the stand-in
+    body["spec"]["networking"]["restPort"] = node.port
+    return body
+
+
+async def _sample(body, handler_logger):
+    patch = kopf.Patch()
+    name = body["metadata"]["name"]
+    pods = [{"name": f"{name}-0", "ip": "127.0.0.1", "ready": True}]
+    with mock.patch.object(operator, "list_instance_pods", return_value=pods):
+        await operator.sample_mqtt_rates(
+            spec=body["spec"],
+            name=name,
+            namespace=body["metadata"]["namespace"],
+            status=body["status"],
+            logger=handler_logger,
+            patch=patch,
+        )
+    return patch.status.get("mqttIngestion")
+
+
+def _age_samples(status, seconds):
+    """Move the previous samples back in time, as if the timer ran `seconds` ago."""
+    for replica in status["mqttIngestion"]["replicas"]:
+        sampled_at = datetime.fromisoformat(replica["sampledAt"])
+        replica["sampledAt"] = (sampled_at - timedelta(seconds=seconds)).isoformat()
+
+
+async def test_rates_aggregate_per_shared_group(
+    mqtt_body, node_stand_in, create_cr, handler_logger
+):
+    broker = BrokerStandIn()
+    members = [
+        await _start_member(name, mqtt_body, broker, node_stand_in, create_cr)
+        for name in ("ingest-a", "ingest-b")
+    ]
+    assert members[0]["status"]["phase"] == "Running"
+
+    broker.publish("sensors/press-1/data", 600)
+    for body in members:
+        body["status"]["mqttIngestion"] = await _sample(body, handler_logger)
+        _age_samples(body["status"], 60)
+
+    # 1200 messages in 60 seconds, split by the broker across both CRs
+    broker.publish("sensors/press-2/data", 1200)
+    results = [await _sample(body, handler_logger) for body in members]
+
+    for result in results:
+        assert result["sharedGroup"] == "plant1-ingest"
+        assert result["replicas"][0]["count"] == 900
+        assert result["totalRatePerSecond"] == pytest.approx(10, rel=0.01)
+    # The last CR sampled sees the current rate of every member
+    assert results[1]["groupRatePerSecond"] == pytest.approx(20, rel=0.01)
+    assert results[1]["groupShare"] == pytest.approx(0.5, rel=0.01)
+    assert [m["instance"] for m in results[1]["groupMembers"]] == [
+        "iot/ingest-a",
+        "iot/ingest-b",
+    ]
+
+
+async def test_group_is_scoped_to_broker(
+    mqtt_body, node_stand_in, create_cr, handler_logger, group_rates
+):
+    broker = BrokerStandIn()
+    local = await _start_member("ingest-a", mqtt_body, broker, node_stand_in, create_cr)
+    other = await _start_member("ingest-b", mqtt_body, broker, node_stand_in, create_cr)
+    other["spec"]["mqtt"]["broker"] = "mqtt-broker.site2.svc.cluster.local"
+
+    await _sample(other, handler_logger)
+    result = await _sample(local, handler_logger)
+
+    assert [m["instance"] for m in result["groupMembers"]] == ["iot/ingest-a"]
+
+
+async def test_deleted_cr_leaves_group(mqtt_body, group_rates):
+    now = datetime.now()
+    group = ("mqtt-broker.iot.svc.cluster.local:1883", "plant1-ingest")
+    group_rates.record(group, "iot", "ingest-a", 10.0, 1, now)
+    group_rates.record(group, "iot", "ingest-b", 12.0, 1, now)
+
+    with (
+        mock.patch.object(operator, "delete_collection", mock.AsyncMock()),
+        mock.patch.object(operator, "annotate_collection", return_value=[]),
+    ):
+        await operator.delete_edgelake_operator(
+            body=mqtt_body, name="ingest-b", namespace="iot", logger=mock.Mock()
+        )
+
+    assert [m["instance"] for m in group_rates.members(group, now)] == ["iot/ingest-a"]
+    later = now + timedelta(hours=1)
+    assert group_rates.members(group, later) == []
@@ -0,0 +1,118 @@
+"""Tests for the per node type rules of the spec and the ConfigMap each node type gets."""
+
+import pytest
+
+from edgelake_operator.models.spec import EdgeLakeOperatorSpec
+from edgelake_operator.operator import _generate_resource_names
+from edgelake_operator.resources.configmap import build_configmap
+from edgelake_operator.utils.validation import validate_spec
+
+_OPERATOR_KEYS = ["CLUSTER_NAME", "DEFAULT_DBMS", "OPERATOR_THREADS", "PARTITION_KEEP"]
+
+
+def _spec(body, node_type, **changes):
+    """Spec of the basic sample turned into the given node type."""
+    spec = dict(body["spec"], nodeType=node_type, **changes)
+    if node_type != "operator":
+        spec.pop("operator")
+    return spec
+
+
+@pytest.mark.parametrize("node_type", ["operator", "query", "master"])
+def test_node_type_is_valid(basic_body, node_type):
+    spec = EdgeLakeOperatorSpec.from_dict(_spec(basic_body, node_type))
+
+    assert validate_spec(spec) == []
+
+
+@pytest.mark.parametrize(
+    "node_type, changes, errors",
+    [
+        (
+            "publisher",
+            {},
+            ["spec.nodeType must be one of ['operator', 'query', 'master'], got 'publisher'"],
+        ),
+        # Operator nodes need their cluster settings
+        ("operator", {"operator": None}, ["spec.operator is required for operator nodes"]),
+        # Only operator nodes ingest data
+        (
+            "query",
+            {"operator": {"clusterName": "c", "defaultDbms": "d"}},
+            ["spec.operator is only valid for operator nodes, not query"],
+        ),
+        (
+            "master",
+            {"mqtt": {"enabled": True, "broker": "mqtt-broker"}},
+            ["spec.mqtt is only supported on operator nodes"],
+        ),
+        (
+            "query",
+            {"opcua": {"enabled": True, "url": "opc.tcp://plc:4840"}},
+            ["spec.opcua is only supported on operator nodes"],
+        ),
+        (
+            "master",
+            {"etherip": {"enabled": True, "simulatorMode": True}},
+            ["spec.etherip is only supported on operator nodes"],
+        ),
+        (
+            "query",
+            {"aggregations": {"enabled": True}},
+            ["spec.aggregations is only supported on operator nodes"],
+        ),
+        # Only stateless query nodes scale out
+        (
+            "master",
+            {"replicas": 2},
+            ["spec.replicas > 1 is only supported for query nodes; master nodes keep local state"],
+        ),
+        (
+            "operator",
+            {"replicas": 2},
+            [
+                "spec.replicas > 1 is only supported for query nodes; "
+                "operator nodes keep local state"
+            ],
+        ),
+        ("query", {"replicas": 5}, []),
+        ("query", {"advanced": {"queryPool": 0}}, ["spec.advanced.queryPool must be at least 1"]),
+    ],
+)
+def test_node_type_rules(basic_body, node_type, changes, errors):
+    spec = _spec(basic_body, node_type)
+    spec.update(changes)
+
+    assert validate_spec(EdgeLakeOperatorSpec.from_dict(spec)) == errors
+
+
+@pytest.mark.parametrize(
+    "node_type, expected",
+    [
+        ("operator", {"NODE_TYPE": "operator", "SYSTEM_QUERY": "false", "MEMORY": "false"}),
+        # Query nodes always merge results in the in-memory system_query database
+        ("query", {"NODE_TYPE": "query", "SYSTEM_QUERY": "true", "MEMORY": "true"}),
+        ("master", {"NODE_TYPE": "master", "SYSTEM_QUERY": "false", "MEMORY": "false"}),
+    ],
+)
+def test_configmap_per_node_type(basic_body, node_type, expected):
+    spec = EdgeLakeOperatorSpec.from_dict(_spec(basic_body, node_type))
+    names = _generate_resource_names("edgelake-operator-basic")
+
+    data = build_configmap("edgelake-operator-basic", "default", spec, names)["data"]
+
+    assert {key: data[key] for key in expected} == expected
+    if node_type == "operator":
+        assert data["CLUSTER_NAME"] == "my-company-cluster"
+        assert data["DEFAULT_DBMS"] == "my_company"
+    else:
+        assert not set(_OPERATOR_KEYS) & set(data)
+
+
+def test_query_pool_reaches_query_nodes(query_body):
+    spec = EdgeLakeOperatorSpec.from_dict(query_body["spec"])
+    names = _generate_resource_names("edgelake-query")
+
+    data = build_configmap("edgelake-query", "default", spec, names)["data"]
+
+    assert data["QUERY_POOL"] == "12"
@@ -0,0 +1,237 @@
+"""Tests for automatic NodePort allocation."""
+
+import copy
+import json
+from unittest import mock
+
+import kopf
+import pytest
+from kubernetes.client.rest import ApiException
+
+from edgelake_operator import operator
+from edgelake_operator.utils.nodeports import NodePortAllocator
+
+
+@pytest.fixture
+def allocator():
+    """Empty allocator over a small range, in place of the operator's singleton."""
+    allocator = NodePortAllocator(30000, 30009)
+    with mock.patch.object(operator, "node_port_allocator", allocator):
+        yield allocator
+
+
+@pytest.fixture
+def auto_body(basic_body):
+    """Basic sample asking the operator to pick its NodePorts."""
+    basic_body["spec"]["networking"]["autoAllocatePorts"] = True
+    return basic_body
+
+
+def _service_event(name, node_ports, event_type="ADDED", namespace="other"):
+    operator.track_node_ports(
+        event={"type": event_type},
+        body={"spec": {"ports": [{"port": 80, "nodePort": port} for port in node_ports]}},
+        name=name,
+        namespace=namespace,
+    )
+
+
+def _already_allocated(port):
+    error = ApiException(status=422, reason="Unprocessable Entity")
+    error.body = json.dumps(
+        {
+            "kind": "Status",
+            "status": "Failure",
+            "message": (
+                f'Service "edgelake-operator-basic-service" is invalid: spec.ports[0].nodePort: '
+                f"Invalid value: {port}: provided port is already allocated"
+            ),
+            "reason": "Invalid",
+            "code": 422,
+        }
+    )
+    return error
+
+
+async def _update(body, old, diff, handler_logger):
+    """Run the update handler; return the patch and the resources it applied, by kind."""
+    patch = kopf.Patch()
+    applied = {}
+
+    async def apply_resource(resource, namespace):
+        applied[resource["kind"]] = resource
+
+    with (
+        mock.patch.object(operator, "apply_resource", apply_resource),
+        mock.patch.object(operator, "delete_resource", mock.AsyncMock(return_value=False)),
+    ):
+        await operator.update_edgelake_operator(
+            body=body,
+            spec=body["spec"],
+            old=old,
+            new=body,
+            diff=diff,
+            name=body["metadata"]["name"],
+            namespace="default",
+            status=body["status"],
+            logger=handler_logger,
+            patch=patch,
+        )
+    body["status"].update(patch.status)
+    return patch, applied
+
+
+def _node_ports(service):
+    return [port["nodePort"] for port in service["spec"]["ports"]]
+
+
+async def _create(body, handler_logger, apply_step):
+    patch = kopf.Patch()
+    with mock.patch.object(operator, "apply_step", apply_step):
+        try:
+            await operator.create_edgelake_operator(
+                body=body,
+                spec=body["spec"],
+                name=body["metadata"]["name"],
+                namespace="default",
+                status=body["status"],
+                logger=handler_logger,
+                patch=patch,
+            )
+        finally:
+            body["status"].update(patch.status)
+    return patch
+
+
+def test_service_ports_are_released_only_by_their_last_owner(allocator):
+    allocator.reserve("default", "a", {"server": 30000})
+    _service_event("a-service", [30000], namespace="default")
+    _service_event("external", [30001])
+
+    _service_event("a-service", [], event_type="DELETED", namespace="default")
+    assert allocator.allocate("default", "b", ["server"]) == {"server": 30002}
+
+    _service_event("external", [], event_type="DELETED")
+    allocator.release("default", "a")
+    assert allocator.allocate("default", "c", ["server", "rest"]) == {
+        "server": 30000,
+        "rest": 30001,
+    }
+
+
+async def test_allocation_uses_watched_ports(allocator, auto_body, handler_logger):
+    # Seen on the watches, without listing the cluster on create
+    _service_event("external", [30000])
+    operator.track_allocated_ports(
+        event={"type": "ADDED"},
+        body={
+            "spec": {"networking": {"autoAllocatePorts": True}},
+            "status": {"allocatedPorts": {"server": 30001, "rest": 30002, "broker": None}},
+        },
+        name="earlier",
+        namespace="default",
+    )
+
+    patch = await _create(auto_body, handler_logger, mock.AsyncMock(return_value=True))
+
+    assert patch.status["allocatedPorts"] == {"server": 30003, "rest": 30004}
+    # Recorded in the status only; the user's spec is left as written
+    assert "spec" not in patch
+    assert allocator.free() == 5
+
+
+async def test_port_taken_before_service_create_is_reallocated(
+    allocator, auto_body, handler_logger
+):
+    async def apply_step(name, namespace, journal, step, resource):
+        # A concurrent client created a Service on the first port in the meantime
+        if step == "service" and resource["spec"]["ports"][0]["nodePort"] == 30000:
+            raise _already_allocated(30000)
+        return True
+
+    with pytest.raises(kopf.TemporaryError, match="already allocated"):
+        await _create(auto_body, handler_logger, apply_step)
+    assert auto_body["status"]["allocatedPorts"] == {"rest": 30001}
+
+    # The retry keeps the REST port and allocates a new server port
+    patch = await _create(auto_body, handler_logger, apply_step)
+    assert patch.status["allocatedPorts"] == {"rest": 30001, "server": 30002}
+    assert patch.status["phase"] == "Running"
+
+    # The other client's Service shows up on the watch; the port stays in use
+    _service_event("concurrent", [30000])
+    assert allocator.allocate("default", "next", ["server"]) == {"server": 30003}
+
+
+async def test_switching_to_auto_allocation_on_update(
+    allocator, basic_body, create_cr, handler_logger
+):
+    basic_body["status"] = await create_cr(basic_body)
+    old = copy.deepcopy(basic_body)
+    basic_body["spec"]["networking"]["autoAllocatePorts"] = True
+    diff = [("add", ("spec", "networking", "autoAllocatePorts"), None, True)]
+
+    patch, applied = await _update(basic_body, old, diff, handler_logger)
+
+    assert patch.status["allocatedPorts"] == {"server": 30000, "rest": 30001}
+    assert "spec" not in patch
+    assert _node_ports(applied["Service"]) == [30000, 30001]
+    assert applied["ConfigMap"]["data"]["ANYLOG_REST_PORT"] == "30001"
+    assert patch.status["endpoints"]["rest"].endswith(":30001")
+
+    # The next update keeps the ports recorded in the status
+    patch, applied = await _update(basic_body, old, diff, handler_logger)
+    assert "allocatedPorts" not in patch.status
+    assert _node_ports(applied["Service"]) == [30000, 30001]
+    assert allocator.free() == 8
+
+
+async def test_switching_auto_allocation_off_releases_the_ports(
+    allocator, auto_body, create_cr, handler_logger
+):
+    auto_body["status"] = await create_cr(auto_body)
+    assert auto_body["status"]["allocatedPorts"] == {"server": 30000, "rest": 30001}
+    old = copy.deepcopy(auto_body)
+    auto_body["spec"]["networking"]["autoAllocatePorts"] = False
+    diff = [("change", ("spec", "networking", "autoAllocatePorts"), True, False)]
+
+    patch, applied = await _update(auto_body, old, diff, handler_logger)
+
+    # Back to the ports in the spec
+    assert patch.status["allocatedPorts"] is None
+    assert _node_ports(applied["Service"]) == [32148, 32149]
+    assert allocator.free() == 10
+
+
+async def test_dropping_the_broker_frees_its_port(allocator, auto_body, create_cr, handler_logger):
+    auto_body["spec"]["networking"]["brokerPort"] = 1
+    auto_body["status"] = await create_cr(auto_body)
+    allocated = {"server": 30000, "rest": 30001, "broker": 30002}
+    assert auto_body["status"]["allocatedPorts"] == allocated
+    old = copy.deepcopy(auto_body)
+    del auto_body["spec"]["networking"]["brokerPort"]
+    diff = [("remove", ("spec", "networking", "brokerPort"), 1, None)]
+
+    patch, applied = await _update(auto_body, old, diff, handler_logger)
+
+    assert patch.status["allocatedPorts"] == {"broker": None, "server": 30000, "rest": 30001}
+    assert _node_ports(applied["Service"]) == [30000, 30001]
+    assert allocator.free() == 8
+
+
+@pytest.mark.parametrize("event_type, auto_allocate", [("DELETED", True), ("MODIFIED", False)])
+def test_watch_frees_ports_no_longer_allocated(allocator, event_type, auto_allocate):
+    allocated = {"server": 30000, "rest": 30001}
+    allocator.reserve("default", "a", allocated)
+
+    operator.track_allocated_ports(
+        event={"type": event_type},
+        body={
+            "spec": {"networking": {"autoAllocatePorts": auto_allocate}},
+            "status": {"allocatedPorts": allocated},
+        },
+        name="a",
+        namespace="default",
+    )
+
+    assert allocator.free() == 10
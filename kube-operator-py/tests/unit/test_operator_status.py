@@ -0,0 +1,86 @@
+"""Tests for the status written by the create and update handlers."""
+
+from unittest import mock
+
+import kopf
+import pytest
+
+from edgelake_operator import operator
+
+
+async def test_create_writes_root_status(basic_body, patch, handler_logger):
+    with mock.patch.object(operator, "apply_step", mock.AsyncMock(return_value=True)):
+        result = await operator.create_edgelake_operator(
+            body=basic_body,
+            spec=basic_body["spec"],
+            name=basic_body["metadata"]["name"],
+            namespace=basic_body["metadata"]["namespace"],
+            status=basic_body["status"],
+            logger=handler_logger,
+            patch=patch,
+        )
+
+    # A returned value would land in status.create_edgelake_operator and be pruned
+    assert result is None
+    assert patch.status["phase"] == "Running"
+    assert patch.status["deploymentName"] == "edgelake-operator-basic-deployment"
+    assert patch.status["serviceName"] == "edgelake-operator-basic-service"
+    assert patch.status["configMapName"] == "edgelake-operator-basic-config"
+    assert patch.status["observedGeneration"] == 1
+    assert patch.status["endpoints"]["rest"] == (
+        "edgelake-operator-basic-service.default.svc.cluster.local:32149"
+    )
+    assert patch.status["journal"] is None
+
+
+async def test_update_writes_root_status(basic_body, patch, handler_logger):
+    old = {"spec": basic_body["spec"], "metadata": {}}
+    basic_body["spec"] = dict(basic_body["spec"], replicas=1)
+    basic_body["metadata"]["generation"] = 2
+    new = {"spec": basic_body["spec"], "metadata": {}}
+    diff = [("add", ("spec", "replicas"), None, 1)]
+
+    with mock.patch.object(operator, "apply_resource", mock.AsyncMock()):
+        result = await operator.update_edgelake_operator(
+            body=basic_body,
+            spec=basic_body["spec"],
+            old=old,
+            new=new,
+            diff=diff,
+            name=basic_body["metadata"]["name"],
+            namespace=basic_body["metadata"]["namespace"],
+            status={"phase": "Running"},
+            logger=handler_logger,
+            patch=patch,
+        )
+
+    assert result is None
+    assert patch.status["phase"] == "Running"
+    assert patch.status["observedGeneration"] == 2
+    assert patch.status["configMapName"] == "edgelake-operator-basic-config"
+    assert "tcp" in patch.status["endpoints"]
+
+
+@pytest.mark.parametrize("phase", ["Running", "Updating", "Failed"])
+async def test_monitor_publishes_zone_endpoints_in_any_phase(
+    basic_body, create_cr, handler_logger, phase
+):
+    basic_body["status"] = dict(await create_cr(basic_body), phase=phase)
+    patch = kopf.Patch()
+    with (
+        mock.patch.object(operator, "check_deployment_ready", return_value=False),
+        mock.patch.object(operator, "list_endpoint_zones", return_value={"zone-a": ["10.0.0.1"]}),
+    ):
+        await operator.monitor_edgelake_operator(
+            body=basic_body,
+            spec=basic_body["spec"],
+            name=basic_body["metadata"]["name"],
+            namespace="default",
+            status=basic_body["status"],
+            logger=handler_logger,
+            patch=patch,
+        )
+
+    assert patch.status["endpoints"]["zones"] == [
+        {"zone": "zone-a", "tcp": ["10.0.0.1:32148"], "rest": ["10.0.0.1:32149"]}
+    ]
@@ -0,0 +1,109 @@
+"""Tests for retained volumes and the orphan sweeper."""
+
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+import pytest
+from kubernetes import client
+
+from edgelake_operator import operator
+from edgelake_operator.constants import ANNOTATION_RETAINED
+from edgelake_operator.utils import orphans
+from edgelake_operator.utils.orphans import find_orphans, sweep_orphans
+
+NOW = datetime(2026, 10, 19, 12, 0, tzinfo=timezone.utc)
+CREATED = NOW - timedelta(days=2)
+LABELS = {
+    "app.kubernetes.io/instance": "basic",
+    "app.kubernetes.io/managed-by": "edgelake-kube-operator",
+}
+
+
+def _pvc(name, annotations=None):
+    return client.V1PersistentVolumeClaim(
+        metadata=client.V1ObjectMeta(
+            name=name,
+            namespace="default",
+            labels=LABELS,
+            annotations=annotations,
+            creation_timestamp=CREATED,
+        ),
+        spec=client.V1PersistentVolumeClaimSpec(
+            resources=client.V1VolumeResourceRequirements(requests={"storage": "1Gi"})
+        ),
+    )
+
+
+def _snapshot(name, annotations=None):
+    return {
+        "metadata": {
+            "name": name,
+            "namespace": "default",
+            "labels": LABELS,
+            "annotations": annotations or {},
+            "creationTimestamp": CREATED.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }
+    }
+
+
+RETAINED = {ANNOTATION_RETAINED: CREATED.isoformat()}
+
+
+def test_retained_resources_are_not_orphans():
+    items = [_pvc("data-pvc"), _pvc("kept-pvc", RETAINED)]
+    assert [item.metadata.name for item in find_orphans(items, set(), NOW, 600)] == ["data-pvc"]
+
+    snapshots = [_snapshot("seed-1"), _snapshot("seed-2", RETAINED)]
+    assert find_orphans(snapshots, set(), NOW, 600) == [snapshots[0]]
+
+
+def test_resources_of_existing_cr_are_not_orphans():
+    items = [_pvc("data-pvc"), _snapshot("seed-1")]
+    assert find_orphans(items, {("default", "basic")}, NOW, 600) == []
+
+
+async def test_sweep_deletes_orphans_but_keeps_retained():
+    managed = {
+        "PersistentVolumeClaim": [_pvc("failed-create-pvc"), _pvc("kept-pvc", RETAINED)],
+        "Secret": [],
+        "VolumeSnapshot": [_snapshot("seed-1"), _snapshot("seed-2", RETAINED)],
+    }
+    delete = mock.AsyncMock()
+    with (
+        mock.patch.object(orphans, "list_edgelake_operator_keys", return_value=set()),
+        mock.patch.object(orphans, "list_managed_resources", side_effect=managed.get),
+        mock.patch.object(orphans, "delete_resource", delete),
+        mock.patch.object(orphans.asyncio, "sleep", mock.AsyncMock()),
+    ):
+        found = await sweep_orphans(delete=True)
+
+    assert len(found["PersistentVolumeClaim"]) == 1
+    assert [c.args for c in delete.await_args_list] == [
+        ("PersistentVolumeClaim", "failed-create-pvc", "default"),
+        ("VolumeSnapshot", "seed-1", "default"),
+    ]
+
+
+@pytest.mark.parametrize("retain", [True, False])
+async def test_delete_handler_retains_or_removes_volumes(basic_body, handler_logger, retain):
+    basic_body["spec"].setdefault("persistence", {})["retainOnDelete"] = retain
+    delete_collection = mock.AsyncMock()
+    annotate = mock.Mock(return_value=["retained"])
+    with (
+        mock.patch.object(operator, "delete_collection", delete_collection),
+        mock.patch.object(operator, "annotate_collection", annotate),
+    ):
+        await operator.delete_edgelake_operator(
+            body=basic_body, name="basic", namespace="default", logger=handler_logger
+        )
+
+    deleted = [c.args[0] for c in delete_collection.await_args_list]
+    annotated = [c.args[0] for c in annotate.call_args_list]
+    volumes = ["PersistentVolumeClaim", "VolumeSnapshot"]
+    if retain:
+        assert annotated == volumes
+        assert not set(volumes) & set(deleted)
+        assert ANNOTATION_RETAINED in annotate.call_args.args[3]
+    else:
+        assert annotated == []
+        assert deleted[-2:] == volumes
@@ -0,0 +1,83 @@
+"""Tests for the staggered partition drop schedule of each CR."""
+
+import pytest
+
+from edgelake_operator.models.spec import EdgeLakeOperatorSpec
+from edgelake_operator.utils.maintenance import (
+    drop_offset_seconds,
+    is_staggered,
+    maintenance_window_seconds,
+)
+
+
+def _spec(body, **partitioning):
+    body["spec"]["operator"]["partitioning"] = partitioning
+    return EdgeLakeOperatorSpec.from_dict(body["spec"])
+
+
+@pytest.mark.parametrize(
+    "partitioning, staggered",
+    [
+        ({}, False),
+        ({"maintenance": {"stagger": True}}, True),
+        ({"maintenance": {"offset": "10 minutes"}}, True),
+        # An explicit zero offset still pins the schedule
+        ({"maintenance": {"offset": "0 seconds"}}, True),
+        ({"maintenance": {"window": "1 hour"}}, False),
+        ({"enabled": False, "maintenance": {"stagger": True}}, False),
+    ],
+)
+def test_is_staggered(basic_body, partitioning, staggered):
+    assert is_staggered(_spec(basic_body, **partitioning)) is staggered
+
+
+def test_non_operator_nodes_are_not_staggered(query_body):
+    assert is_staggered(EdgeLakeOperatorSpec.from_dict(query_body["spec"])) is False
+
+
+@pytest.mark.parametrize(
+    "partitioning, seconds",
+    [
+        # The single global policy syncs once a day by default
+        ({}, 86400),
+        ({"sync": "6 hours"}, 21600),
+        # The shortest sync period of all policies
+        ({"policies": [{"table": "a", "sync": "1 day"}, {"table": "b", "sync": "2 hours"}]}, 7200),
+        # An explicit window wins over the sync periods
+        ({"sync": "6 hours", "maintenance": {"window": "15 minutes"}}, 900),
+    ],
+)
+def test_maintenance_window_seconds(basic_body, partitioning, seconds):
+    assert maintenance_window_seconds(_spec(basic_body, **partitioning)) == seconds
+
+
+@pytest.mark.parametrize(
+    "maintenance, offset",
+    [
+        ({"offset": "0 seconds"}, 0),
+        ({"offset": "90 seconds"}, 90),
+        ({"offset": "2.5 minutes"}, 150),
+        # Explicit offsets are used as given, even beyond the window
+        ({"offset": "2 hours", "window": "1 hour"}, 7200),
+        # A window of a second (or less) leaves no room to spread the CRs
+        ({"stagger": True, "window": "1 second"}, 0),
+        ({"stagger": True, "window": "0.5 seconds"}, 0),
+    ],
+)
+def test_drop_offset_seconds(basic_body, maintenance, offset):
+    spec = _spec(basic_body, maintenance=maintenance)
+
+    assert drop_offset_seconds(spec, "0b6e5d3c-uid") == offset
+
+
+@pytest.mark.parametrize("window, seconds", [("2 seconds", 2), ("1 hour", 3600), ("1 day", 86400)])
+def test_derived_offsets_stay_inside_the_window(basic_body, window, seconds):
+    spec = _spec(basic_body, maintenance={"stagger": True, "window": window})
+
+    offsets = [drop_offset_seconds(spec, f"uid-{i}") for i in range(200)]
+
+    assert all(0 <= offset < seconds for offset in offsets)
+    # Same CR, same slot on every reconcile
+    assert offsets == [drop_offset_seconds(spec, f"uid-{i}") for i in range(200)]
+    # CRs are spread out rather than piled on one slot
+    assert len(set(offsets)) >= min(seconds, 100)
@@ -0,0 +1,60 @@
+"""Tests for the dedicated performance profile."""
+
+from edgelake_operator.models.spec import EdgeLakeOperatorSpec
+from edgelake_operator.utils.performance import build_resources, thread_counts
+from edgelake_operator.utils.tunables import push_live_tunables
+from edgelake_operator.utils.validation import validate_spec
+
+
+def _dedicated(basic_body, limits, requests):
+    spec = dict(basic_body["spec"], performanceProfile="dedicated")
+    spec["resources"] = {"limits": limits, "requests": requests}
+    return EdgeLakeOperatorSpec.from_dict(spec)
+
+
+def test_guaranteed_spec_is_kept_as_is(basic_body):
+    resources = {"cpu": "4", "memory": "8Gi"}
+    spec = _dedicated(basic_body, resources, resources)
+
+    assert validate_spec(spec) == []
+    assert build_resources(spec) == {"limits": resources, "requests": resources}
+
+
+def test_fractional_cpu_is_rejected(basic_body):
+    resources = {"cpu": "1500m", "memory": "8Gi"}
+    errors = validate_spec(_dedicated(basic_body, resources, resources))
+
+    assert any("limits.cpu must be a whole number of cores" in e for e in errors)
+
+
+def test_mismatched_requests_are_rejected(basic_body):
+    spec = _dedicated(
+        basic_body, {"cpu": "4", "memory": "8Gi"}, {"cpu": "2", "memory": "4Gi"}
+    )
+    errors = validate_spec(spec)
+
+    assert any("requests.cpu must equal limits.cpu" in e for e in errors)
+    assert any("requests.memory must equal limits.memory" in e for e in errors)
+    # Not rewritten to Guaranteed QoS behind the user's back
+    assert build_resources(spec)["requests"] == {"cpu": "2", "memory": "4Gi"}
+
+
+def test_shared_profile_allows_burstable(basic_body):
+    spec = dict(basic_body["spec"])
+    spec["resources"] = {"limits": {"cpu": "1500m"}, "requests": {"cpu": "500m"}}
+
+    assert validate_spec(EdgeLakeOperatorSpec.from_dict(spec)) == []
+
+
+async def test_dedicated_query_pool_is_the_same_at_start_and_live(basic_body, node_stand_in):
+    basic_body["spec"]["advanced"] = {"queryPool": 12}
+    resources = {"cpu": "4", "memory": "8Gi"}
+    spec = _dedicated(basic_body, resources, resources)
+    node = await node_stand_in({"set query pool": "Query pool set", "get query pool": "4"})
+
+    error = await push_live_tunables(spec, ["advanced.queryPool"], "127.0.0.1", node.port)
+
+    # The pinned cores win over queryPool, in the ConfigMap and on the running node
+    assert thread_counts(spec)["QUERY_POOL"] == "4"
+    assert error is None
+    assert node.requests[0] == ("POST", "set query pool 4")
@@ -0,0 +1,152 @@
+"""Tests for fanning a profile change out to its CRs in batches."""
+
+import copy
+from unittest import mock
+
+import kopf
+import pytest
+import yaml
+
+from edgelake_operator import operator
+from edgelake_operator.constants import ANNOTATION_PROFILE_HASH
+from edgelake_operator.utils.fleet import FleetCache
+from edgelake_operator.utils.profiles import profile_store
+
+from .conftest import SAMPLES_DIR
+
+
+class Fleet:
+    """A profile and the CRs using it, with the operator's view of them."""
+
+    def __init__(self, profile, crs) -> None:
+        self.profile = profile
+        self.profile["status"] = {}
+        self.crs = {cr["metadata"]["name"]: cr for cr in crs}
+        self.cache = FleetCache()
+        self.annotated = []
+
+    def annotate(self, name, namespace, annotations):
+        """annotate_edgelake_operator: record the annotation the update handler will see."""
+        cr = self.crs[name]
+        cr["metadata"]["annotations"] = dict(cr["metadata"].get("annotations") or {}, **annotations)
+        self.annotated.append(name)
+        return True
+
+    def refresh(self):
+        """The CR watch feeds the fleet cache."""
+        for cr in self.crs.values():
+            self.cache.update(cr)
+
+    def roll(self, handler_logger):
+        """One tick of roll_profile."""
+        self.refresh()
+        patch = kopf.Patch()
+        with (
+            mock.patch.object(operator, "fleet_cache", self.cache),
+            mock.patch.object(operator, "annotate_edgelake_operator", self.annotate),
+        ):
+            operator.roll_profile(
+                spec=self.profile["spec"],
+                name=self.profile["metadata"]["name"],
+                namespace="default",
+                status=self.profile["status"],
+                logger=handler_logger,
+                patch=patch,
+            )
+        self.profile["status"].update(patch.status)
+
+
+@pytest.fixture
+async def fleet(create_cr, handler_logger):
+    """The shared-profile sample with two Running CRs, rolling one CR per batch."""
+    profile, site_a = yaml.safe_load_all((SAMPLES_DIR / "shared-profile.yaml").read_text())
+    profile["spec"]["rollout"] = {"batchSize": 1, "interval": "0 seconds"}
+    profile_store.update(profile)
+
+    crs = []
+    for suffix in ("a", "b"):
+        cr = copy.deepcopy(site_a)
+        cr["metadata"].update(name=f"edgelake-site-{suffix}", uid=f"{suffix}-uid", generation=1)
+        cr["status"] = {}
+        cr["status"] = await create_cr(cr)
+        crs.append(cr)
+    fleet = Fleet(profile, crs)
+
+    # The profile changes
+    profile["spec"]["advanced"]["queryPool"] = 12
+    profile_store.update(profile)
+    patch = kopf.Patch()
+    operator.start_profile_rollout(
+        spec=profile["spec"],
+        name="site-defaults",
+        namespace="default",
+        status={},
+        profile_users={("default", "site-defaults"): list(fleet.crs)},
+        logger=handler_logger,
+        patch=patch,
+    )
+    profile["status"].update(patch.status)
+    yield fleet
+    profile_store.remove("default", "site-defaults")
+
+
+async def _reconcile(cr, handler_logger, fails=False):
+    """Run the CR's update handler for the annotation roll_profile set."""
+    annotations = cr["metadata"]["annotations"]
+    path = ("metadata", "annotations", ANNOTATION_PROFILE_HASH)
+    diff = [("add", path, None, annotations[ANNOTATION_PROFILE_HASH])]
+    patch = kopf.Patch()
+    apply = mock.AsyncMock(side_effect=RuntimeError("API unavailable") if fails else None)
+    with (
+        mock.patch.object(operator, "apply_resource", apply),
+        mock.patch.object(operator, "delete_resource", mock.AsyncMock()),
+        mock.patch.object(operator, "list_instance_pods", return_value=[]),
+    ):
+        try:
+            await operator.update_edgelake_operator(
+                body=cr,
+                spec=cr["spec"],
+                old={"spec": cr["spec"], "metadata": {}},
+                new={"spec": cr["spec"], "metadata": {"annotations": annotations}},
+                diff=diff,
+                name=cr["metadata"]["name"],
+                namespace="default",
+                status=cr["status"],
+                logger=handler_logger,
+                patch=patch,
+            )
+        except kopf.TemporaryError:
+            pass
+    cr["status"].update(patch.status)
+
+
+async def test_next_batch_waits_for_applied_profile(fleet, handler_logger):
+    assert fleet.profile["status"]["phase"] == "Rolling"
+
+    fleet.roll(handler_logger)
+    assert fleet.annotated == ["edgelake-site-a"]
+
+    # Site A is still Running the old profile: its update handler has not run yet
+    fleet.roll(handler_logger)
+    assert fleet.annotated == ["edgelake-site-a"]
+
+    await _reconcile(fleet.crs["edgelake-site-a"], handler_logger)
+    assert fleet.crs["edgelake-site-a"]["status"]["phase"] == "Running"
+    fleet.roll(handler_logger)
+    assert fleet.annotated == ["edgelake-site-a", "edgelake-site-b"]
+
+    await _reconcile(fleet.crs["edgelake-site-b"], handler_logger)
+    fleet.roll(handler_logger)
+    assert fleet.profile["status"]["phase"] == "Complete"
+    assert fleet.profile["status"]["updated"] == 2
+
+
+async def test_failed_batch_pauses_rollout(fleet, handler_logger):
+    fleet.roll(handler_logger)
+    await _reconcile(fleet.crs["edgelake-site-a"], handler_logger, fails=True)
+
+    fleet.roll(handler_logger)
+
+    assert fleet.profile["status"]["phase"] == "Paused"
+    assert fleet.profile["status"]["failed"] == ["edgelake-site-a"]
+    assert fleet.annotated == ["edgelake-site-a"]
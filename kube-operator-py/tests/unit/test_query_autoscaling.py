@@ -0,0 +1,158 @@
+"""Tests for query node autoscaling under generated query load."""
+
+from unittest import mock
+
+import kopf
+import pytest
+
+from edgelake_operator import operator
+
+# Bucket bounds of EdgeLake's 'get queries time' (seconds), then the overflow
+QUERY_TIME_BOUNDS = (1, 2, 3, 4, 5, 6, 7, 8, 9, 10)
+
+
+class QueryNodeStandIn:
+    """Query statistics of one stand-in query node, as reported over REST."""
+
+    def __init__(self) -> None:
+        self.completed = {bound: 0 for bound in QUERY_TIME_BOUNDS}
+        self.overflow = 0
+        self.in_flight = 0
+
+    def complete(self, seconds: float) -> None:
+        for bound in QUERY_TIME_BOUNDS:
+            if seconds <= bound:
+                self.completed[bound] += 1
+                return
+        self.overflow += 1
+
+    def queries_time(self, command: str) -> str:
+        rows = [f"Up to {bound} seconds: {count}" for bound, count in self.completed.items()]
+        rows.append(f"Over {QUERY_TIME_BOUNDS[-1]} seconds: {self.overflow}")
+        return "\n".join(rows)
+
+    def query_status(self, command: str) -> str:
+        rows = [
+            "Job  ID    Status      Time       Command",
+            "---- ----- ----------  ---------  -------",
+        ]
+        rows += [
+            f"{i:<4} {i:<5} Processing  00:00:0{i % 10}  sql edgelake ..."
+            for i in range(self.in_flight)
+        ]
+        return "\n".join(rows)
+
+
+class LoadGenerator:
+    """Sends queries round-robin to query nodes, like a load balancer would."""
+
+    def __init__(self, nodes: list[QueryNodeStandIn]) -> None:
+        self.nodes = nodes
+        self._next = 0
+
+    def run(self, queries: int, seconds: float) -> None:
+        """Complete a number of queries that each took `seconds`."""
+        for _ in range(queries):
+            self.nodes[self._next % len(self.nodes)].complete(seconds)
+            self._next += 1
+
+    def hold(self, queries: int) -> None:
+        """Keep a number of queries executing, spread over the nodes."""
+        for i, node in enumerate(self.nodes):
+            node.in_flight = queries // len(self.nodes) + (i < queries % len(self.nodes))
+
+
+@pytest.fixture
+def autoscaled_body(query_body):
+    """Query node sample (3 replicas) with latency-driven autoscaling enabled."""
+    query_body["spec"]["autoscaling"] = {"enabled": True, "maxReplicas": 10}
+    return query_body
+
+
+@pytest.fixture
+async def query_pods(autoscaled_body, create_cr, node_stand_in):
+    """Running CR whose three pods are stand-ins sharing the REST port on 127.0.0.x."""
+    autoscaled_body["status"] = await create_cr(autoscaled_body)
+    nodes, pods = [], []
+    port = 0
+    for i in range(autoscaled_body["spec"]["replicas"]):
+        node = QueryNodeStandIn()
+        server = await node_stand_in(
+            {"get queries time": node.queries_time, "query status": node.query_status},
+            host=f"127.0.0.{i + 1}",
+            port=port,
+        )
+        port = server.port
+        nodes.append(node)
+        pods.append({"name": f"query-{i}", "ip": f"127.0.0.{i + 1}", "ready": True})
+    autoscaled_body["spec"]["networking"]["restPort"] = port
+    return LoadGenerator(nodes), pods
+
+
+async def _autoscale(body, pods, handler_logger):
+    patch = kopf.Patch()
+    scale = mock.Mock()
+    with (
+        mock.patch.object(operator, "list_instance_pods", return_value=pods),
+        mock.patch.object(operator, "scale_edgelake_operator", scale),
+    ):
+        await operator.autoscale_query_nodes(
+            spec=body["spec"],
+            name=body["metadata"]["name"],
+            namespace=body["metadata"]["namespace"],
+            status=body["status"],
+            logger=handler_logger,
+            patch=patch,
+        )
+    body["status"]["autoscaling"] = patch.status["autoscaling"]
+    return scale
+
+
+async def test_scales_up_on_p95_latency(autoscaled_body, query_pods, handler_logger):
+    load, pods = query_pods
+    assert autoscaled_body["status"]["phase"] == "Running"
+
+    # Baseline: load at target concurrency (4 in flight per replica), fast queries
+    load.hold(12)
+    load.run(300, 0.5)
+    scale = await _autoscale(autoscaled_body, pods, handler_logger)
+    scale.assert_not_called()
+    assert autoscaled_body["status"]["autoscaling"]["desiredReplicas"] == 3
+
+    # Queries slow down to 5 seconds against a 2 second p95 target
+    load.run(90, 5)
+    scale = await _autoscale(autoscaled_body, pods, handler_logger)
+
+    scale.assert_called_once_with("edgelake-query", "default", 8)
+    autoscaling = autoscaled_body["status"]["autoscaling"]
+    assert autoscaling["p95Seconds"] == 5
+    assert autoscaling["inFlight"] == 12
+    assert autoscaling["lastScaleTime"] is not None
+    assert [s["pod"] for s in autoscaling["samples"]] == ["query-0", "query-1", "query-2"]
+
+
+async def test_scales_up_on_in_flight_queries(autoscaled_body, query_pods, handler_logger):
+    load, pods = query_pods
+    load.hold(12)
+    await _autoscale(autoscaled_body, pods, handler_logger)
+
+    # Fast queries, but twice the target concurrency is queued
+    load.run(60, 1)
+    load.hold(24)
+    scale = await _autoscale(autoscaled_body, pods, handler_logger)
+
+    scale.assert_called_once_with("edgelake-query", "default", 6)
+
+
+async def test_scale_up_waits_for_cooldown(autoscaled_body, query_pods, handler_logger):
+    load, pods = query_pods
+    load.hold(12)
+    await _autoscale(autoscaled_body, pods, handler_logger)
+    load.run(90, 5)
+    await _autoscale(autoscaled_body, pods, handler_logger)
+
+    # Still slow on the next sample, within the 1 minute scale-up cooldown
+    load.run(90, 5)
+    scale = await _autoscale(autoscaled_body, pods, handler_logger)
+
+    scale.assert_not_called()
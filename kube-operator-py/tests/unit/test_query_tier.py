@@ -0,0 +1,109 @@
+"""Tests for stateless query tiers and master nodes next to operator nodes."""
+
+import copy
+from unittest import mock
+
+import kopf
+import pytest
+
+from edgelake_operator import operator
+from edgelake_operator.resources import deployment
+
+
+@pytest.fixture
+def built():
+    """Deployments the handlers build, by name."""
+    deployments = {}
+    build = deployment.build_deployment
+
+    def build_deployment(*args, **kwargs):
+        manifest = build(*args, **kwargs)
+        deployments[manifest["metadata"]["name"]] = manifest
+        return manifest
+
+    with mock.patch.object(deployment, "build_deployment", build_deployment):
+        yield deployments
+
+
+def _as_node_type(body, node_type, name, **changes):
+    """Copy of the basic sample as a CR of another node type, with persistence on."""
+    body = copy.deepcopy(body)
+    body["metadata"].update(name=name, uid=f"{name}-uid")
+    body["spec"].pop("operator")
+    body["spec"].update(nodeType=node_type, persistence={"enabled": True}, **changes)
+    body["spec"]["general"]["nodeName"] = name
+    return body
+
+
+def _volumes(manifest):
+    return {
+        volume["name"]: "persistentVolumeClaim" in volume
+        for volume in manifest["spec"]["template"]["spec"]["volumes"]
+    }
+
+
+async def test_query_tier_is_stateless(basic_body, create_cr, built):
+    query_body = _as_node_type(basic_body, "query", "edgelake-query", replicas=3)
+
+    status = await create_cr(query_body)
+
+    # No PVCs even with persistence enabled: every replica starts from emptyDir
+    assert status["pvcNames"] == []
+    assert status["replicas"] == 3
+    manifest = built["edgelake-query-deployment"]
+    assert manifest["spec"]["replicas"] == 3
+    assert not any(_volumes(manifest).values())
+
+
+async def test_master_keeps_its_state(basic_body, create_cr, built):
+    master_body = _as_node_type(basic_body, "master", "edgelake-master")
+
+    status = await create_cr(master_body)
+
+    assert status["pvcNames"] == [
+        "edgelake-master-anylog-pvc",
+        "edgelake-master-blockchain-pvc",
+        "edgelake-master-data-pvc",
+        "edgelake-master-scripts-pvc",
+    ]
+    manifest = built["edgelake-master-deployment"]
+    assert manifest["spec"]["replicas"] == 1
+    assert all(_volumes(manifest).values())
+
+
+async def test_query_tier_scales_without_touching_operators(
+    basic_body, create_cr, built, handler_logger
+):
+    query_body = _as_node_type(basic_body, "query", "edgelake-query", replicas=3)
+    basic_body["status"] = await create_cr(basic_body)
+    query_body["status"] = await create_cr(query_body)
+    created = built["edgelake-query-deployment"]["spec"]["template"]["metadata"]["annotations"]
+    built.clear()
+
+    old = copy.deepcopy(query_body)
+    query_body["spec"]["replicas"] = 6
+    query_body["metadata"]["generation"] = 2
+    patch = kopf.Patch()
+    with mock.patch.object(operator, "apply_resource", mock.AsyncMock()) as apply_resource:
+        await operator.update_edgelake_operator(
+            body=query_body,
+            spec=query_body["spec"],
+            old=old,
+            new=query_body,
+            diff=[("change", ("spec", "replicas"), 3, 6)],
+            name="edgelake-query",
+            namespace="default",
+            status=query_body["status"],
+            logger=handler_logger,
+            patch=patch,
+        )
+
+    # Only the query Deployment is applied, with the same pod template: no restart
+    applied = [call.args[0] for call in apply_resource.call_args_list]
+    assert [(m["kind"], m["metadata"]["name"]) for m in applied] == [
+        ("Deployment", "edgelake-query-deployment")
+    ]
+    assert applied[0]["spec"]["replicas"] == 6
+    assert applied[0]["spec"]["template"]["metadata"]["annotations"] == created
+    assert patch.status["replicas"] == 6
+    assert "edgelake-operator-basic-deployment" not in built
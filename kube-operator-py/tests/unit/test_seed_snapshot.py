@@ -0,0 +1,159 @@
+"""Tests for scheduled seed VolumeSnapshots."""
+
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+import kopf
+import pytest
+
+from edgelake_operator import operator
+from edgelake_operator.models.spec import EdgeLakeOperatorSpec
+from edgelake_operator.utils.validation import validate_spec
+
+
+@pytest.fixture
+def seed_body(basic_body):
+    basic_body["spec"]["persistence"] = {
+        "enabled": True,
+        "seedSnapshot": {"enabled": True, "interval": "6 hours", "keep": 2},
+    }
+    return basic_body
+
+
+def _snapshots(*names):
+    return [{"metadata": {"name": name}} for name in names]
+
+
+async def _snapshot(body, status, patch, logger, existing):
+    with (
+        mock.patch.object(operator, "apply_resource", mock.AsyncMock()) as apply_resource,
+        mock.patch.object(operator, "delete_resource", mock.AsyncMock()) as delete_resource,
+        mock.patch.object(operator, "list_volume_snapshots", return_value=existing),
+    ):
+        await operator.snapshot_seed_volume(
+            body=body,
+            spec=body["spec"],
+            name=body["metadata"]["name"],
+            namespace=body["metadata"]["namespace"],
+            status=status,
+            logger=logger,
+            patch=patch,
+        )
+    return apply_resource, delete_resource
+
+
+async def test_snapshots_running_cr_and_prunes(seed_body, create_cr, patch, handler_logger):
+    status = await create_cr(seed_body)
+    existing = _snapshots("old-1", "old-2", "new")
+
+    apply_resource, delete_resource = await _snapshot(
+        seed_body, status, patch, handler_logger, existing
+    )
+
+    snapshot = apply_resource.call_args.args[0]
+    assert snapshot["kind"] == "VolumeSnapshot"
+    assert snapshot["spec"]["source"]["persistentVolumeClaimName"] == (
+        "edgelake-operator-basic-blockchain-pvc"
+    )
+    delete_resource.assert_awaited_once_with("VolumeSnapshot", "old-1", "default")
+    assert patch.status["seedSnapshot"]["snapshots"] == ["old-2", "new"]
+
+
+async def test_waits_for_interval(seed_body, create_cr, patch, handler_logger):
+    status = await create_cr(seed_body)
+    recent = datetime.now(timezone.utc) - timedelta(hours=1)
+    status["seedSnapshot"] = {"createdAt": recent.isoformat()}
+
+    apply_resource, _ = await _snapshot(seed_body, status, patch, handler_logger, [])
+
+    apply_resource.assert_not_awaited()
+    assert "seedSnapshot" not in patch.status
+
+
+def _seed_snapshot(name, ready):
+    return {"metadata": {"name": name}, "status": {"readyToUse": ready}}
+
+
+@pytest.fixture
+def restoring_body(basic_body):
+    basic_body["spec"]["persistence"] = {"enabled": True, "blockchain": {"fromSeed": "seed"}}
+    return basic_body
+
+
+async def _create(body, handler_logger, snapshots):
+    applied = {}
+
+    async def apply_step(name, namespace, journal, step, resource):
+        applied[step] = resource
+        return True
+
+    patch = kopf.Patch()
+    with (
+        mock.patch.object(operator, "apply_step", apply_step),
+        mock.patch.object(operator, "list_volume_snapshots", return_value=snapshots) as listed,
+    ):
+        try:
+            await operator.create_edgelake_operator(
+                body=body,
+                spec=body["spec"],
+                name=body["metadata"]["name"],
+                namespace="default",
+                status=body["status"],
+                logger=handler_logger,
+                patch=patch,
+            )
+        finally:
+            body["status"].update(patch.status)
+    return applied, listed
+
+
+async def test_from_seed_restores_newest_ready_snapshot(restoring_body, handler_logger):
+    snapshots = [
+        _seed_snapshot("seed-blockchain-pvc-20261019060000", True),
+        _seed_snapshot("seed-blockchain-pvc-20261019120000", True),
+        _seed_snapshot("seed-blockchain-pvc-20261019180000", False),  # still being cut
+    ]
+
+    applied, listed = await _create(restoring_body, handler_logger, snapshots)
+
+    listed.assert_called_once_with("default", "edgelake.io/seed-snapshot=seed")
+    pvc = applied["pvc/edgelake-operator-basic-blockchain-pvc"]
+    assert pvc["spec"]["dataSource"] == {
+        "apiGroup": "snapshot.storage.k8s.io",
+        "kind": "VolumeSnapshot",
+        "name": "seed-blockchain-pvc-20261019120000",
+    }
+    assert "dataSource" not in applied["pvc/edgelake-operator-basic-data-pvc"]["spec"]
+    assert restoring_body["status"]["restoredSnapshot"] == "seed-blockchain-pvc-20261019120000"
+
+
+async def test_from_seed_waits_for_a_ready_snapshot(restoring_body, handler_logger):
+    with pytest.raises(kopf.TemporaryError, match="No ready seed snapshot"):
+        await _create(restoring_body, handler_logger, [_seed_snapshot("cutting", False)])
+
+    # A retry keeps the snapshot resolved first, so the PVC manifest does not change
+    restoring_body["status"]["restoredSnapshot"] = "seed-blockchain-pvc-20261019120000"
+    applied, listed = await _create(restoring_body, handler_logger, [])
+    listed.assert_not_called()
+    pvc = applied["pvc/edgelake-operator-basic-blockchain-pvc"]
+    assert pvc["spec"]["dataSource"]["name"] == "seed-blockchain-pvc-20261019120000"
+
+
+@pytest.mark.parametrize(
+    "persistence, error",
+    [
+        (
+            {"blockchain": {"fromSeed": "seed", "fromSnapshot": "snap"}},
+            "spec.persistence.blockchain: fromSnapshot and fromSeed are mutually exclusive",
+        ),
+        (
+            {"data": {"fromSeed": "seed"}},
+            "spec.persistence.data.fromSeed is only supported for blockchain",
+        ),
+    ],
+)
+def test_from_seed_validation(basic_body, persistence, error):
+    basic_body["spec"]["persistence"] = {"enabled": True, **persistence}
+    spec = EdgeLakeOperatorSpec.from_dict(basic_body["spec"])
+
+    assert error in validate_spec(spec)
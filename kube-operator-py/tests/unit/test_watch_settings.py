@@ -0,0 +1,20 @@
+"""Tests for the operator's watch settings."""
+
+import kopf
+
+from edgelake_operator import operator
+
+
+def test_pod_watch_is_label_selected(monkeypatch):
+    monkeypatch.delenv("WEBHOOK_HOST", raising=False)
+    monkeypatch.setattr(operator, "start_metrics_server", lambda port: None)
+    settings = kopf.OperatorSettings()
+
+    operator.configure(settings=settings)
+
+    pods = kopf.Resource("", "v1", "pods")
+    selectors = list(settings.watching.label_selectors.collect(pods))
+    assert selectors == ["app.kubernetes.io/name=edgelake-operator,app.kubernetes.io/instance"]
+    # Other resources (e.g. pod metrics) are not affected
+    metrics = kopf.Resource("metrics.k8s.io", "v1beta1", "pods")
+    assert not list(settings.watching.label_selectors.collect(metrics))